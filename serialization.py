@@ -21,6 +21,12 @@ Functions:
         bytes, class ctypes._SimpleCData -> type A
     Bytes2Scalar(Data, CType, BigEndian = None):
         bytes, class ctypes._SimpleCData/, bool OR None/ -> type A
+    Scalars2Bytes(Values, CType, BigEndian = None):
+        seq(type A), class ctypes._SimpleCData/, bool OR None/ -> bytes
+    Bytes2Scalars(Data, CType, BigEndian = None):
+        bytes, class ctypes._SimpleCData/, bool OR None/ -> list(type A)
+    dumpJSONLines(Objects, File):
+        iter(Serializable), file-like /text mode/ -> int >= 0
 
 Classes:
     Serializable
@@ -31,8 +37,8 @@ Classes:
     SerNumber
 """
 
-__version__ = "1.2.0.0"
-__date__ = "11-05-2023"
+__version__ = "1.3.0.0"
+__date__ = "17-10-2026"
 __status__ = "Production"
 
 #imports
@@ -41,14 +47,27 @@ __status__ = "Production"
 
 import os
 import sys
+import io
 import abc
 import json
+import types
 import ctypes
+import struct
+import itertools
+import array
+import keyword
 
 import collections.abc
 
 from typing import Iterator, Optional, Union, List, Dict, Any, NoReturn
-from typing import ClassVar, Tuple, Sequence, Mapping, Type
+from typing import ClassVar, Tuple, Sequence, Mapping, Type, Callable, FrozenSet
+
+#+ 3rd party libraries - optional, only required for the NumPy export
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 #+ custom modules
 
@@ -76,6 +95,67 @@ TSeq = Sequence[Any]
 
 TSimpleC = Type[ctypes._SimpleCData]
 
+TBuffer = Union[bytes, bytearray, memoryview]
+
+TScalarCheck = Tuple[FrozenSet[type], Optional[int], Optional[int],
+                                                            Optional[Callable]]
+
+#globals
+
+#+ format prefixes of the struct module per BigEndian 3-way selector value, all
+#+ using the standard sizes and no alignment padding
+
+_ENDIANNESS_PREFIXES = {None: '=', True: '>', False: '<'}
+
+#+ struct module format characters of the standard size integer types
+
+_SIGNED_CODES = {1: 'b', 2: 'h', 4: 'i', 8: 'q'}
+
+_UNSIGNED_CODES = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+#+ array module type codes of the integer types per item size, which are
+#+ platform dependent, thus resolved at the import time
+
+_SIGNED_ARRAY_CODES = {array.array(Code).itemsize: Code for Code in 'qlihb'}
+
+_UNSIGNED_ARRAY_CODES = {array.array(Code).itemsize: Code for Code in 'QLIHB'}
+
+#+ byte order of the platform, which is always used by the array module
+
+_NATIVE_BIG_ENDIAN = sys.byteorder == 'big'
+
+#+ precompiled struct.Struct objects (or None, if not applicable) per C
+#+ primitive type and byte order, see _getScalarStruct() helper function
+
+_ScalarStructs: Dict[Tuple[type, Optional[bool]],
+                                        Optional[struct.Struct]] = dict()
+
+#+ native Python types acceptable as the values of the integer and of the
+#+ floating point C primitive types by the validators of the JSON data
+
+_INTEGER_TYPES = frozenset((int, bool))
+
+_REAL_TYPES = frozenset((int, bool, float))
+
+#+ precomputed checks (acceptable types, range and conversion) of the native
+#+ values per C primitive type, see _getScalarCheck() helper function
+
+_ScalarChecks: Dict[type, Optional[TScalarCheck]] = dict()
+
+#+ JSON encoder and decoder re-used by the JSON Lines streaming functions, and
+#+ the number of the records written in a single call of the write() method
+
+_JSON_ENCODER = json.JSONEncoder(check_circular = False)
+
+_JSON_DECODER = json.JSONDecoder()
+
+_JSON_LINES_BATCH = 256
+
+#+ maximal length of a nested array of structs / arrays, which elements are
+#+ unrolled by the generated code, the longer ones are processed in a loop
+
+_UNROLL_LIMIT = 8
+
 #helper functions
 
 def IsC_Scalar(Type: Any) -> bool:
@@ -117,8 +197,16 @@ def Scalar2BytesNE(Value: Any, CType: TSimpleC) -> bytes:
         bytes: bytes representation of the passed value as if stored in a
             variable of the respective C data type
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
+    Packer = _ScalarStructs.get((CType, None), False)
+    if Packer is False:
+        Packer = _getScalarStruct(CType, None)
+    if not (Packer is None):
+        try:
+            return Packer.pack(Value)
+        except (struct.error, OverflowError):
+            pass #ctypes conversion rules, e.g. wrapping of the integers
     CValue = CType(Value)
     Length = ctypes.sizeof(CType)
     Pointer = ctypes.addressof(CValue)
@@ -144,8 +232,16 @@ def Scalar2BytesLE(Value: Any, CType: TSimpleC) -> bytes:
         bytes: bytes representation of the passed value as if stored in a
             variable of the respective C data type
     
-    Version 1.1.0.0
+    Version 1.2.0.0
     """
+    Packer = _ScalarStructs.get((CType, False), False)
+    if Packer is False:
+        Packer = _getScalarStruct(CType, False)
+    if not (Packer is None):
+        try:
+            return Packer.pack(Value)
+        except (struct.error, OverflowError):
+            pass #ctypes conversion rules, e.g. wrapping of the integers
     if hasattr(CType, '__ctype_le__'):
         CastType = CType.__ctype_le__
     else:
@@ -175,8 +271,16 @@ def Scalar2BytesBE(Value: Any, CType: TSimpleC) -> bytes:
         bytes: bytes representation of the passed value as if stored in a
             variable of the respective C data type
     
-    Version 1.1.0.0
+    Version 1.2.0.0
     """
+    Packer = _ScalarStructs.get((CType, True), False)
+    if Packer is False:
+        Packer = _getScalarStruct(CType, True)
+    if not (Packer is None):
+        try:
+            return Packer.pack(Value)
+        except (struct.error, OverflowError):
+            pass #ctypes conversion rules, e.g. wrapping of the integers
     if hasattr(CType, '__ctype_be__'):
         CastType = CType.__ctype_be__
     else:
@@ -213,8 +317,15 @@ def Scalar2Bytes(Value: Any, CType: TSimpleC,
         bytes: bytes representation of the passed value as if stored in a
             variable of the respective C data type
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
+    Key = None if BigEndian is None else bool(BigEndian)
+    Packer = _ScalarStructs.get((CType, Key), False)
+    if not ((Packer is False) or (Packer is None)):
+        try:
+            return Packer.pack(Value)
+        except (struct.error, OverflowError):
+            pass #ctypes conversion rules, e.g. wrapping of the integers
     if BigEndian is None:
         Result = Scalar2BytesNE(Value, CType)
     elif BigEndian:
@@ -240,8 +351,16 @@ def Bytes2ScalarNE(Data: bytes, CType: TSimpleC) -> Any:
     Returns:
         type A: native Python scalar type, e.g. int or float
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
+    Unpacker = _ScalarStructs.get((CType, None), False)
+    if Unpacker is False:
+        Unpacker = _getScalarStruct(CType, None)
+    if not (Unpacker is None):
+        try:
+            return Unpacker.unpack_from(Data)[0]
+        except struct.error:
+            pass #too short data - ctypes raises ValueError
     CValue = CType.from_buffer_copy(Data)
     Result = CValue.value
     del CValue
@@ -264,8 +383,16 @@ def Bytes2ScalarLE(Data: bytes, CType: TSimpleC) -> Any:
     Returns:
         type A: native Python scalar type, e.g. int or float
     
-    Version 1.1.0.0
+    Version 1.2.0.0
     """
+    Unpacker = _ScalarStructs.get((CType, False), False)
+    if Unpacker is False:
+        Unpacker = _getScalarStruct(CType, False)
+    if not (Unpacker is None):
+        try:
+            return Unpacker.unpack_from(Data)[0]
+        except struct.error:
+            pass #too short data - ctypes raises ValueError
     if hasattr(CType, '__ctype_le__'):
         CastType = CType.__ctype_le__
     else:
@@ -292,8 +419,16 @@ def Bytes2ScalarBE(Data: bytes, CType: TSimpleC) -> Any:
     Returns:
         type A: native Python scalar type, e.g. int or float
     
-    Version 1.1.0.0
+    Version 1.2.0.0
     """
+    Unpacker = _ScalarStructs.get((CType, True), False)
+    if Unpacker is False:
+        Unpacker = _getScalarStruct(CType, True)
+    if not (Unpacker is None):
+        try:
+            return Unpacker.unpack_from(Data)[0]
+        except struct.error:
+            pass #too short data - ctypes raises ValueError
     if hasattr(CType, '__ctype_be__'):
         CastType = CType.__ctype_be__
     else:
@@ -327,8 +462,15 @@ def Bytes2Scalar(Data: bytes, CType: TSimpleC,
     Returns:
         type A: native Python scalar type, e.g. int or float
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
+    Key = None if BigEndian is None else bool(BigEndian)
+    Unpacker = _ScalarStructs.get((CType, Key), False)
+    if not ((Unpacker is False) or (Unpacker is None)):
+        try:
+            return Unpacker.unpack_from(Data)[0]
+        except struct.error:
+            pass #too short data - ctypes raises ValueError
     if BigEndian is None:
         Result = Bytes2ScalarNE(Data, CType)
     elif BigEndian:
@@ -337,272 +479,4067 @@ def Bytes2Scalar(Data: bytes, CType: TSimpleC,
         Result = Bytes2ScalarLE(Data, CType)
     return Result
 
-#classes
-
-#+ ABC / Prototype / Interface
-class Serializable(abc.ABC):
+def Scalars2Bytes(Values: TSeq, CType: TSimpleC,
+                            BigEndian: Optional[bool] = None) -> bytes:
     """
-    Prototype, ABC for the auto-serializable compound data types, designed
-    without internal state, i.e. as an Interface.
-    
-    The derived classes MUST re-define the public methods getSize(), packBytes()
-    and getNative(), as well as the 'private' class methods _parseBuffer(),
-    _checkObjectContent() and _checkDefinition().
+    Helper function to get the concatenated byte representations of a sequence
+    of native Python scalar values compatible with a specific C data type using
+    the specified endianness, i.e. the bulk version of the function
+    Scalar2Bytes(). The optional argument BigEndian is interpreted either as
+    None or as boolean value regardless of its actual data type.
     
-    It also modifies the access / attribute resolution scheme. The sub-classes
-    might be required to override or walk-around the attribute resolution
-    'magic' methods.
+    Signature:
+        seq(type A), class ctypes._SimpleCData/, bool OR None/ -> bytes
     
-    Class methods:
-        getSize():
-            None -> int >=0 OR None
-        unpackBytes(Data, BigEndian = None):
-            bytes /, bool OR None / -> 'Serializable
-        unpackJSON(Data):
-            str -> 'Serializable
+    Args:
+        Values: seq(type A); native Python scalar values to be converted into
+            bytes representation
+        CType: class ctypes._SimpleCData; class, Python implementation of C
+            primitive data type
+        BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
     
-    Methods:
-        packBytes(BigEndian = None):
-            /bool OR None/ -> bytes
-        packJSON():
-            None -> str
-        getNative():
-            None -> type A
+    Returns:
+        bytes: bytes representations of the passed values as if stored in an
+            array of the respective C data type
     
-    Version 1.0.0.1
+    Version 1.0.0.0
     """
+    Key = None if BigEndian is None else bool(BigEndian)
+    Result = _packScalars(Values, CType, BigEndian = Key)
+    if Result is None:
+        Code = _getStructCode(CType)
+        if not (Code is None):
+            Format = f'{_ENDIANNESS_PREFIXES[Key]}{len(Values)}{Code}'
+            try:
+                Result = struct.pack(Format, *Values)
+            except (struct.error, OverflowError):
+                pass #ctypes conversion rules, e.g. wrapping of the integers
+    if Result is None:
+        Result = b''.join(Scalar2Bytes(Value, CType, BigEndian = Key)
+                                                        for Value in Values)
+    return Result
+
+def Bytes2Scalars(Data: TBuffer, CType: TSimpleC,
+                            BigEndian: Optional[bool] = None) -> TList:
+    """
+    Helper function to get a list of native Python scalar values from a byte
+    string, assuming that the passed data is the concatenated byte
+    representations of the values of the specific C primitive data type using
+    the specified endianness, i.e. the bulk version of the function
+    Bytes2Scalar(). The optional argument BigEndian is interpreted either as
+    None or as boolean value regardless of its actual data type.
     
-    #private methods
-    
-    @classmethod
-    @abc.abstractmethod
-    def _checkObjectContent(cls, Data: Any) -> None:
-        """
-        Prototype for the private class method to check if the extracted JSON
-        object matches the declared data structure of the class.
-        
-        Signature:
-            type A -> None
-        
-        Args:
-            Data: type A; any type data to be checked
-        
-        Raises:
-            UT_TypeError: the type of the passed argument is not compatible with
-                the class
-            UT_ValueError: the internal structure of the passed object does not
-                match the defined class structure
-        
-        Version 1.0.0.0
-        """
-        pass
+    Signature:
+        bytes-like, class ctypes._SimpleCData/, bool OR None/ -> list(type A)
     
-    @classmethod
-    @abc.abstractmethod
-    def _parseBuffer(cls, Data: bytes, BigEndian: Optional[bool] =None) -> None:
-        """
-        Private class method to parse the content of the passed byte string into
-        a native Python object using the class data structure definition.
-        Prototype.
-        
-        Signature:
-            bytes /, bool OR None/ -> None
-        
-        Args:
-            Data: bytes; data to be checked
-            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+    Args:
+        Data: bytes-like; byte representation of the values, the length must
+            be a multiple of the size of the C data type
+        CType: class ctypes._SimpleCData; class, Python implementation of C
+            primitive data type
+        BigEndian: (optional) bool OR None; 3-way selector to indicate the
                 desired endianness - the default value is None, meaning native,
                 passed True value forces big endian format, passed False value
                 forces little endian format.
-        
-        Raises:
-            UT_ValueError: size of the passed bytestring does not match the
-                declared data structure size
-        
-        Version 1.0.0.0
-        """
-        pass
     
-    @classmethod
-    @abc.abstractmethod
-    def _checkDefinition(cls) -> None:
-        """
-        Private class method to check the definition of the data structure of
-        the class. Supposed to be called by all class methods, including the
-        unpacking (constructors), and the initialization instance method.
-        Prototype.
-        
-        Signature:
-            None -> None
-        
-        Raises:
-            UT_TypeError: required class private attributes are missing OR
-                OR they hold wrong type vales OR elements / fields type
-                declaration is incorrect
-        
-        Version 1.0.0.0
-        """
-        pass
+    Returns:
+        list(type A): native Python scalar values, e.g. int or float
     
-    #special methods
+    Raises:
+        UT_ValueError: the length of the data is not a multiple of the size of
+            the C data type
     
-    def __getattribute__(self, name: str) -> Any:
-        """
-        Special method to hook into the read access to the attributes. Prohibs
-        access to any attribute with the name starting with, at least, one
-        underscore, except for the '__class__' and '__name__', which are
-        required for the proper functioning of the custom exceptions.
-        
-        Signature:
-            str -> type A
-        
-        Raises:
-            UT_AttributeError: attribute does not exists, OR its name starts
-                with, at least, one underscore, except for two special cases
-                __name__ and __class__
-        
-        Version 1.0.0.1
-        """
-        if name in ('__class__', ):
-            return object.__getattribute__(self, name)
-        elif name == '__name__':
-            return self.__class__.__name__
-        elif name.startswith('_'):
-            raise UT_AttributeError(self, name, SkipFrames = 1)
-        else:
-            try:
-                Result = object.__getattribute__(self, name)
-                return Result
-            except AttributeError:
-                raise UT_AttributeError(self, name, SkipFrames = 1) from None
+    Version 1.0.0.0
+    """
+    Size = ctypes.sizeof(CType)
+    DataSize = len(Data)
+    if DataSize % Size:
+        raise UT_ValueError(DataSize, f'multiple of {Size} - data length',
+                                                                SkipFrames = 1)
+    Key = None if BigEndian is None else bool(BigEndian)
+    Result = _unpackScalars(Data, CType, BigEndian = Key)
+    if not (Result is None):
+        return Result.tolist()
+    Unpacker = _ScalarStructs.get((CType, Key), False)
+    if Unpacker is False:
+        Unpacker = _getScalarStruct(CType, Key)
+    if not (Unpacker is None):
+        return [Value for Value, in Unpacker.iter_unpack(Data)]
+    return [Bytes2Scalar(Data[Offset : Offset + Size], CType, BigEndian = Key)
+                                    for Offset in range(0, DataSize, Size)]
+
+def dumpJSONLines(Objects: Iterator[Any], File: Any) -> int:
+    """
+    Helper function to serialize a sequence of the instances of any sub-classes
+    of Serializable into the JSON Lines format, i.e. one JSON representation
+    (as returned by the packJSON() method) per line, and to write them into a
+    file-like object. The objects are consumed lazily, and the lines are
+    written in batches, thus the memory usage is bounded for any number of the
+    objects, e.g. passed as a generator. A single JSON encoder is used for all
+    objects. The lines are written as UTF-8 encoded bytes into a file opened
+    in the binary mode (e.g. gzip.open(path, 'wb') or io.BytesIO), and as
+    strings into any other file-like object.
     
-    def __setattr__(self, name: str, value: Any) -> NoReturn:
-        """
-        Special method to hook into the write access to the attributes. Prohibs
-        assignment to any attribute.
-        
-        Signature:
-            str, type A -> None
-        
-        Raises:
-            UT_AttributeError: always raised
-        
-        Version 1.0.0.0
-        """
-        raise UT_AttributeError(self, name, SkipFrames = 1)
+    Signature:
+        iter(Serializable), file-like -> int >= 0
     
-    #public API
+    Args:
+        Objects: iter(Serializable); any iterable of the instances
+        File: file-like; object with the method write(), which accepts either
+            strings or, in the binary mode, bytes
     
-    @classmethod
-    @abc.abstractmethod
-    def getSize(cls) -> TIntNone:
-        """
-        Prototype for the method to obtain the declared size in bytes of the
-        stored data.
-        
-        Signature:
-            None -> int >= 0 OR None
-        
-        Returns:
-            * int >= 0: size in bytes required to store in byte representation
-                the entire declared data structure - for the fixed size objects
-            * None: indication that the instance is not a fixed size object
-        
-        Raises:
-            UT_TypeError: wrong definition of the data structure
-        
-        Version 1.0.0.0
-        """
-        pass
+    Returns:
+        int >= 0: number of the written records
     
-    @classmethod
-    def unpackBytes(cls, Data: bytes, BigEndian: Optional[bool] = None):
-        """
-        Class method responsible for creation of a new instance using the data
-        extracted from the passed bytes packed representation. The optional
-        argument BigEndian is interpreted either as None or as boolean value
-        regardless of its actual data type.
-        
-        Signature:
-            bytes /, bool OR None/ -> 'Serializable
-        
-        Args:
-            Data: bytes; bytes representation of the data
-            BigEndian: (optional) bool OR None; 3-way selector to indicate the
-                desired endianness - the default value is None, meaning native,
-                passed True value forces big endian format, passed False value
-                forces little endian format.
-        
-        Returns:
-            'Serializable: an instance of a sub-class of Serializable, same as
-                the current instance class
-        
-        Raises:
-            UT_TypeError: passed argument is not a byte string OR the class
-                data structure is wrongly defined
-            UT_ValueError: the size of the byte string does not match the size
-                of the declared class data structure
-        
-        Version 1.0.0.1
-        """
-        if not isinstance(Data, bytes):
-            raise UT_TypeError(Data, bytes, SkipFrames = 1)
-        TypeChecker = type.__getattribute__(cls, '_checkDefinition')
-        TypeChecker() #UT_TypeError may be raised
-        Parser = type.__getattribute__(cls, '_parseBuffer')
-        NativeData = Parser(Data, BigEndian = BigEndian)
-        #supposed to raise UT_ValueError if size is wrong
-        return cls(NativeData)
+    Raises:
+        UT_TypeError: the file-like object has no write() method, OR an item
+            of the sequence is not an instance of Serializable; the records
+            preceding the improper item are written
     
-    @classmethod
-    def unpackJSON(cls, Data: str):
-        """
-        Class method responsible for creation of a new instance using the data
-        extracted from the passed JSON encoded string.
-        
-        Signature:
-            str -> 'Serializable
-        
-        Args:
-            Data: str; JSON string data
-        
-        Returns:
-            'Serializable: an instance of a sub-class of Serializable, same as
-                the current instance class
-        
-        Raises:
-            UT_TypeError: passed argument is not a string OR the JSON encoded
-                data type is not compatible with the class OR the class data
+    Version 1.1.0.0
+    """
+    Writer = getattr(File, 'write', None)
+    if not callable(Writer):
+        raise UT_TypeError(File, io.TextIOBase, SkipFrames = 1)
+    Mode = getattr(File, 'mode', None)
+    IsBinary = (isinstance(File, (io.RawIOBase, io.BufferedIOBase)) or
+                (not isinstance(File, io.TextIOBase) and isinstance(Mode, str)
+                                                            and 'b' in Mode))
+    
+    def Flush(Batch: List[str]) -> None:
+        Chunk = '\n'.join(Batch) + '\n'
+        Writer(Chunk.encode('utf-8') if IsBinary else Chunk)
+    
+    Encode = _JSON_ENCODER.encode
+    Count = 0
+    Batch = []
+    for Object in Objects:
+        if not isinstance(Object, Serializable):
+            if len(Batch):
+                Flush(Batch)
+            raise UT_TypeError(Object, Serializable, SkipFrames = 1)
+        Batch.append(Encode(Object.getNative()))
+        if len(Batch) >= _JSON_LINES_BATCH:
+            Flush(Batch)
+            Count += len(Batch)
+            Batch.clear()
+    if len(Batch):
+        Flush(Batch)
+        Count += len(Batch)
+    return Count
+
+def _getStructCode(CType: TSimpleC) -> Optional[str]:
+    """
+    Private helper function to find the struct module format character (with
+    the standard size) matching the byte representation of a C primitive type.
+    
+    Signature:
+        class ctypes._SimpleCData -> str OR None
+    
+    Args:
+        CType: class ctypes._SimpleCData; class, Python implementation of C
+            primitive data type
+    
+    Returns:
+        * str: single character format code
+        * None: the type cannot be represented by the struct module, e.g.
+            c_wchar, c_longdouble or the pointer types
+    
+    Version 1.0.0.0
+    """
+    Code = getattr(CType, '_type_', None)
+    Size = ctypes.sizeof(CType)
+    if Code in ('b', 'h', 'i', 'l', 'q'):
+        Result = _SIGNED_CODES.get(Size, None)
+    elif Code in ('B', 'H', 'I', 'L', 'Q'):
+        Result = _UNSIGNED_CODES.get(Size, None)
+    elif Code in ('f', 'd', '?', 'c') and struct.calcsize(f'={Code}') == Size:
+        Result = Code
+    else:
+        Result = None
+    return Result
+
+def _getScalarStruct(CType: TSimpleC,
+                        BigEndian: Optional[bool]) -> Optional[struct.Struct]:
+    """
+    Private helper function to obtain the precompiled struct.Struct object for
+    a single value of a C primitive type in the specified byte order, which is
+    created on the first request and stored in the module level table.
+    
+    Signature:
+        class ctypes._SimpleCData, bool OR None -> struct.Struct OR None
+    
+    Args:
+        CType: class ctypes._SimpleCData; class, Python implementation of C
+            primitive data type
+        BigEndian: bool OR None; 3-way selector to indicate the desired
+            endianness - None means native, True - big endian, False - little
+            endian
+    
+    Returns:
+        * struct.Struct: compiled format of a single value
+        * None: the type cannot be represented by the struct module, e.g.
+            c_wchar, c_longdouble or the pointer types
+    
+    Version 1.0.0.0
+    """
+    Key = (CType, BigEndian)
+    if Key in _ScalarStructs:
+        return _ScalarStructs[Key]
+    Code = _getStructCode(CType)
+    if Code is None:
+        Result = None
+    else:
+        Result = struct.Struct(_ENDIANNESS_PREFIXES[BigEndian] + Code)
+    _ScalarStructs[Key] = Result
+    return Result
+
+def _getScalarCheck(CType: TSimpleC) -> Optional[TScalarCheck]:
+    """
+    Private helper function to obtain the precomputed check of the native
+    Python values against a C primitive type, which is created on the first
+    request and stored in the module level table. The integer types accept
+    only int (or bool) values within the range of the type, c_bool - only
+    bool values or 0 / 1, and the floating point types - int, bool or float
+    values. The bool values are accepted deliberately, exactly as by the C
+    types and the initialization methods, thus JSON true / false is decoded
+    into an integer field as 1 / 0.
+    
+    Signature:
+        class ctypes._SimpleCData -> tuple(frozenset(type), int OR None,
+            int OR None, callable OR None) OR None
+    
+    Args:
+        CType: class ctypes._SimpleCData; class, Python implementation of C
+            primitive data type
+    
+    Returns:
+        * tuple(frozenset(type), int OR None, int OR None, callable OR None):
+            the acceptable types of the values, the minimal and the maximal
+            acceptable value (None - not checked) and the conversion of an
+            acceptable value into the value as stored by the C type (None -
+            via the C type itself)
+        * None: the type has no precomputed check, e.g. c_char, c_wchar or
+            the pointer types, so the C type itself is to be used
+    
+    Version 1.0.0.0
+    """
+    if CType in _ScalarChecks:
+        return _ScalarChecks[CType]
+    Code = getattr(CType, '_type_', None)
+    Bits = 8 * ctypes.sizeof(CType)
+    if Code in ('b', 'h', 'i', 'l', 'q'):
+        Limit = 1 << (Bits - 1)
+        Result = (_INTEGER_TYPES, - Limit, Limit - 1, int)
+    elif Code in ('B', 'H', 'I', 'L', 'Q'):
+        Result = (_INTEGER_TYPES, 0, (1 << Bits) - 1, int)
+    elif Code == '?':
+        Result = (_INTEGER_TYPES, 0, 1, bool)
+    elif Code == 'd':
+        Result = (_REAL_TYPES, None, None, float)
+    elif Code in ('f', 'g'):
+        Result = (_REAL_TYPES, None, None, None) #rounding / extended precision
+    else:
+        Result = None
+    _ScalarChecks[CType] = Result
+    return Result
+
+def _convertScalar(Value: Any, CType: TSimpleC) -> Any:
+    """
+    Private helper function to check a native Python value against a C
+    primitive type using the precomputed check, and to convert it into the
+    value as stored by the type. Unlike the C type itself, the out of range
+    integer values are rejected instead of being wrapped.
+    
+    Signature:
+        type A, class ctypes._SimpleCData -> type B
+    
+    Args:
+        Value: type A; native Python value to be checked and converted
+        CType: class ctypes._SimpleCData; class, Python implementation of C
+            primitive data type
+    
+    Returns:
+        type B: the converted value
+    
+    Raises:
+        TypeError: the type of the value is not acceptable
+        ValueError: the value is out of the range of the type
+    
+    Version 1.0.0.0
+    """
+    Check = _getScalarCheck(CType)
+    if Check is None:
+        return CType(Value).value
+    Types, Minimum, Maximum, Converter = Check
+    if not (type(Value) in Types):
+        raise TypeError(f'{type(Value).__name__} is not acceptable')
+    if not (Minimum is None) and not (Minimum <= Value <= Maximum):
+        raise ValueError(f'{Value} is out of [{Minimum}, {Maximum}] range')
+    if Converter is None:
+        return CType(Value).value
+    return Converter(Value)
+
+def _castScalar(Value: Any, CType: TSimpleC) -> Any:
+    """
+    Private helper function to convert a trusted native Python value into the
+    value as stored by a C primitive type without the range check, i.e. the
+    out of range integer values are wrapped exactly as by the C type itself.
+    The values acceptable by the precomputed check are converted without the
+    instantiation of the C type.
+    
+    Signature:
+        type A, class ctypes._SimpleCData -> type B
+    
+    Args:
+        Value: type A; native Python value to be converted
+        CType: class ctypes._SimpleCData; class, Python implementation of C
+            primitive data type
+    
+    Returns:
+        type B: the converted value
+    
+    Raises:
+        TypeError: the value is not compatible with the C type
+        OverflowError: the value is too large for the C type
+    
+    Version 1.0.0.0
+    """
+    Check = _getScalarCheck(CType)
+    if not (Check is None):
+        Types, Minimum, Maximum, Converter = Check
+        if (not (Converter is None) and (type(Value) in Types) and
+                    ((Minimum is None) or (Minimum <= Value <= Maximum))):
+            return Converter(Value)
+    return CType(Value).value
+
+def _getArrayCode(CType: TSimpleC) -> Optional[str]:
+    """
+    Private helper function to find the array module type code with the item
+    size matching the byte representation of a numeric C primitive type.
+    
+    Signature:
+        class ctypes._SimpleCData -> str OR None
+    
+    Args:
+        CType: class ctypes._SimpleCData; class, Python implementation of C
+            primitive data type
+    
+    Returns:
+        * str: single character type code
+        * None: the type is not an integer or floating point number type, or
+            it has no array module equivalent, e.g. c_longdouble
+    
+    Version 1.0.0.0
+    """
+    Code = getattr(CType, '_type_', None)
+    Size = ctypes.sizeof(CType)
+    if Code in ('b', 'h', 'i', 'l', 'q'):
+        Result = _SIGNED_ARRAY_CODES.get(Size, None)
+    elif Code in ('B', 'H', 'I', 'L', 'Q'):
+        Result = _UNSIGNED_ARRAY_CODES.get(Size, None)
+    elif Code in ('f', 'd') and array.array(Code).itemsize == Size:
+        Result = Code
+    else:
+        Result = None
+    return Result
+
+def _getNumpyCode(CType: TSimpleC, Prefix: str) -> Optional[str]:
+    """
+    Private helper function to find the NumPy data type string matching the
+    byte representation of a C primitive type.
+    
+    Signature:
+        class ctypes._SimpleCData, str -> str OR None
+    
+    Args:
+        CType: class ctypes._SimpleCData; class, Python implementation of C
+            primitive data type
+        Prefix: str; byte order character - '=', '>' or '<'
+    
+    Returns:
+        * str: NumPy data type string, e.g. '<i2' or '>f8'
+        * None: the type has no NumPy equivalent with the same size, e.g.
+            c_wchar, c_longdouble or the pointer types
+    
+    Version 1.0.0.0
+    """
+    Code = getattr(CType, '_type_', None)
+    Size = ctypes.sizeof(CType)
+    if Code in ('b', 'h', 'i', 'l', 'q'):
+        Result = f'{Prefix}i{Size}'
+    elif Code in ('B', 'H', 'I', 'L', 'Q'):
+        Result = f'{Prefix}u{Size}'
+    elif Code in ('f', 'd'):
+        Result = f'{Prefix}f{Size}'
+    elif Code == '?' and Size == 1:
+        Result = '?'
+    elif Code == 'c':
+        Result = 'S1'
+    else:
+        Result = None
+    return Result
+
+def _getSwappedCType(CType: TSimpleC,
+                            BigEndian: Optional[bool]) -> Optional[TSimpleC]:
+    """
+    Private helper function to find the variant of a C primitive type with the
+    requested byte order, as used for the fields of the ctypes structures.
+    
+    Signature:
+        class ctypes._SimpleCData, bool OR None -> class ctypes._SimpleCData
+            OR None
+    
+    Args:
+        CType: class ctypes._SimpleCData; class, Python implementation of C
+            primitive data type
+        BigEndian: bool OR None; 3-way selector to indicate the desired
+            endianness - None means native, True - big endian, False - little
+            endian
+    
+    Returns:
+        * class ctypes._SimpleCData: the same type for the native byte order
+            and the single byte types, otherwise its swapped variant
+        * None: the type does not support the non-native byte order, e.g.
+            c_wchar, c_longdouble or the pointer types
+    
+    Version 1.0.0.0
+    """
+    if (BigEndian is None) or (BigEndian == _NATIVE_BIG_ENDIAN):
+        Result = CType
+    elif ctypes.sizeof(CType) == 1:
+        Result = CType
+    elif BigEndian:
+        Result = getattr(CType, '__ctype_be__', None)
+    else:
+        Result = getattr(CType, '__ctype_le__', None)
+    return Result
+
+def _packScalars(Values: TSeq, CType: TSimpleC,
+                        BigEndian: Optional[bool] = None) -> Optional[bytes]:
+    """
+    Private helper function to convert a sequence of native Python numbers
+    into the concatenated bytes representation of a numeric C primitive type
+    in bulk, using the array module instead of per element ctypes objects.
+    
+    Signature:
+        seq(int OR float), class ctypes._SimpleCData/, bool OR None/
+            -> bytes OR None
+    
+    Args:
+        Values: seq(int OR float); values to be converted
+        CType: class ctypes._SimpleCData; class, Python implementation of C
+            primitive data type
+        BigEndian: (optional) bool OR None; 3-way selector to indicate the
+            desired endianness - the default value is None, meaning native,
+            passed True value forces big endian format, passed False value
+            forces little endian format.
+    
+    Returns:
+        * bytes: concatenated bytes representations of the values
+        * None: the type has no array module equivalent, or any of the values
+            is not representable by the type without the ctypes style
+            wrapping / conversion, so the per element path is to be used
+    
+    Version 1.1.0.0
+    """
+    Code = _getArrayCode(CType)
+    if Code is None:
+        return None
+    IsSwapped = ((not (BigEndian is None))
+                                    and bool(BigEndian) != _NATIVE_BIG_ENDIAN)
+    if isinstance(Values, array.array) and Values.typecode == Code:
+        if not IsSwapped:
+            return Values.tobytes()
+    try:
+        Buffer = array.array(Code, Values)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if IsSwapped:
+        Buffer.byteswap()
+    return Buffer.tobytes()
+
+def _unpackScalars(Data: bytes, CType: TSimpleC,
+                    BigEndian: Optional[bool] = None) -> Optional[array.array]:
+    """
+    Private helper function to convert a bytes string into an array of native
+    Python numbers of a numeric C primitive type in bulk, using the array
+    module instead of per element ctypes objects.
+    
+    Signature:
+        bytes, class ctypes._SimpleCData/, bool OR None/ -> array.array
+            OR None
+    
+    Args:
+        Data: bytes-like; concatenated bytes representations of the values,
+            the length must be a multiple of the size of the type
+        CType: class ctypes._SimpleCData; class, Python implementation of C
+            primitive data type
+        BigEndian: (optional) bool OR None; 3-way selector to indicate the
+            desired endianness - the default value is None, meaning native,
+            passed True value forces big endian format, passed False value
+            forces little endian format.
+    
+    Returns:
+        * array.array: the extracted values
+        * None: the type has no array module equivalent
+    
+    Version 1.1.0.0
+    """
+    Code = _getArrayCode(CType)
+    if Code is None:
+        return None
+    Buffer = array.array(Code)
+    Buffer.frombytes(Data)
+    if not (BigEndian is None) and bool(BigEndian) != _NATIVE_BIG_ENDIAN:
+        Buffer.byteswap()
+    return Buffer
+
+def _convertScalars(Values: TSeq, CType: TSimpleC) -> Optional[array.array]:
+    """
+    Private helper function to convert a sequence of native Python numbers
+    into the values as stored by a numeric C primitive type in bulk, e.g. to
+    round them to the single precision, using the array module.
+    
+    Signature:
+        seq(int OR float), class ctypes._SimpleCData -> array.array OR None
+    
+    Args:
+        Values: seq(int OR float); values to be converted
+        CType: class ctypes._SimpleCData; class, Python implementation of C
+            primitive data type
+    
+    Returns:
+        * array.array: the converted values
+        * None: the type has no array module equivalent, or any of the values
+            is not representable by the type without the ctypes style
+            wrapping / conversion, so the per element path is to be used
+    
+    Version 1.1.0.0
+    """
+    Code = _getArrayCode(CType)
+    if Code is None:
+        return None
+    try:
+        return array.array(Code, Values)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+def _compactScalars(Values: TSeq,
+                            CType: TSimpleC) -> Union[array.array, TList]:
+    """
+    Private helper function to prepare the storage of the elements of an array
+    of a C primitive type: a typed array of the array module if the type has
+    such equivalent, otherwise a list.
+    
+    Signature:
+        seq(type A), class ctypes._SimpleCData -> array.array OR list(type A)
+    
+    Args:
+        Values: seq(type A); values of the elements, already converted into
+            the type
+        CType: class ctypes._SimpleCData; class, Python implementation of C
+            primitive data type
+    
+    Returns:
+        * array.array: the compact storage of the values
+        * list(type A): the type has no array module equivalent, or any of
+            the values cannot be stored in the typed array
+    
+    Version 1.0.0.0
+    """
+    Code = _getArrayCode(CType)
+    if isinstance(Values, array.array) and Values.typecode == Code:
+        return Values
+    if not (Code is None):
+        try:
+            return array.array(Code, Values)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    if not isinstance(Values, list):
+        Values = list(Values)
+    return Values
+
+def _getByteView(Data: Any) -> Optional[memoryview]:
+    """
+    Private helper function to obtain a flat, unsigned bytes formatted view of
+    any object supporting the buffer protocol, e.g. bytes, bytearray,
+    memoryview or mmap.mmap, without copying of the data.
+    
+    Signature:
+        type A -> memoryview OR None
+    
+    Args:
+        Data: type A; object to be viewed as a byte buffer
+    
+    Returns:
+        * memoryview: 1-dimensional view of the data with the format 'B'
+        * None: the passed object does not support the buffer protocol or it
+            is not C-contiguous
+    
+    Version 1.0.0.0
+    """
+    try:
+        View = memoryview(Data)
+    except TypeError:
+        View = None
+    if not (View is None):
+        if not View.c_contiguous:
+            View.release()
+            View = None
+        elif View.format != 'B' or View.ndim != 1:
+            try:
+                View = View.cast('B')
+            except TypeError:
+                View = None
+    return View
+
+def _getClassCache(Class: type) -> Dict[str, Any]:
+    """
+    Private helper function to obtain the dictionary holding the data compiled
+    from the declared data structure of a class. The cache is stored as the
+    'private' class attribute _ClassCache of that specific class, thus it is
+    not inherited by the sub-classes, and it does not outlive the class. It is
+    dropped when the data structure definition of the class or of any class it
+    depends upon is changed (see _dropClassCaches()).
+    
+    Signature:
+        type -> dict(str -> type A)
+    
+    Args:
+        Class: type; a (sub-) class of Serializable
+    
+    Returns:
+        dict(str -> type A): cache of that specific class, which can be
+            modified in place
+    
+    Version 1.1.0.0
+    """
+    Wrapper = Class.__dict__.get('_ClassCache', None)
+    if Wrapper is None:
+        Cache = dict()
+        type.__setattr__(Class, '_ClassCache', _Hidden('_ClassCache', Cache))
+    else:
+        Cache = Wrapper.Value
+    return Cache
+
+def _getClassPool(Class: type) -> List[Any]:
+    """
+    Private helper function to obtain the pool of the released instances of a
+    class (see Serializable.acquire() and Serializable.release()). The pool is
+    stored as the 'private' class attribute _ClassPool of that specific class,
+    separately from the compiled data cache, thus it is neither inherited nor
+    affected by the changes of the data structure definitions.
+    
+    Signature:
+        type -> list(Serializable)
+    
+    Args:
+        Class: type; a (sub-) class of Serializable
+    
+    Returns:
+        list(Serializable): pool of that specific class, which can be modified
+            in place
+    
+    Version 1.0.0.0
+    """
+    Wrapper = Class.__dict__.get('_ClassPool', None)
+    if Wrapper is None:
+        Pool = list()
+        type.__setattr__(Class, '_ClassPool', _Hidden('_ClassPool', Pool))
+    else:
+        Pool = Wrapper.Value
+    return Pool
+
+def _dropClassCaches(Class: type) -> None:
+    """
+    Private helper function to drop the compiled data caches affected by a
+    change of a class attribute of a serializable class, i.e. the caches of
+    the class itself, of its sub-classes and of all serializable classes using
+    any of them as a field or element type at any depth of nesting. The caches
+    of the unrelated classes and the instance pools are not touched.
+    
+    Signature:
+        type -> None
+    
+    Args:
+        Class: type; a (sub-) class of Serializable, which is modified
+    
+    Version 1.0.0.0
+    """
+    Affected: Dict[type, bool] = dict()
+    
+    def isAffected(Current: type) -> bool:
+        Result = Affected.get(Current, None)
+        if Result is None:
+            Affected[Current] = False #guard against the recursive definitions
+            Result = issubclass(Current, Class)
+            if not Result:
+                Types = [getattr(Current, '_ElementType', None)]
+                Fields = getattr(Current, '_Fields', None)
+                if isinstance(Fields, tuple):
+                    Types.extend(Definition[1] for Definition in Fields
+                                    if isinstance(Definition, tuple)
+                                                    and len(Definition) == 2)
+                Result = any(isAffected(Type) for Type in Types
+                                        if isinstance(Type, _SerializableMeta))
+            Affected[Current] = Result
+        return Result
+    
+    Root = [Base for Base in Class.__mro__
+                                    if isinstance(Base, _SerializableMeta)][-1]
+    Queue = [Root]
+    Visited = {Root}
+    while Queue:
+        Current = Queue.pop()
+        for SubClass in type.__subclasses__(Current):
+            if not (SubClass in Visited):
+                Visited.add(SubClass)
+                Queue.append(SubClass)
+        if ('_ClassCache' in Current.__dict__) and isAffected(Current):
+            type.__delattr__(Current, '_ClassCache')
+
+def _getPackedBytes(Instance: Any,
+                        BigEndian: Optional[bool] = None) -> Optional[bytes]:
+    """
+    Private helper function to look up the cached bytes representation of a
+    serializable instance for the specified endianness.
+    
+    Signature:
+        Serializable/, bool OR None/ -> bytes OR None
+    
+    Args:
+        Instance: Serializable; instance of a serializable class
+        BigEndian: (optional) bool OR None; 3-way selector of the endianness,
+            interpreted as in the method packBytes()
+    
+    Returns:
+        * bytes: the cached bytes representation, or the copy of the packed
+            template image for the same endianness
+        * None: not cached, or the cache is invalidated since
+    
+    Version 1.1.0.0
+    """
+    Cache = _getPackedCache(Instance)
+    if Cache is None:
+        return None
+    Key = None if BigEndian is None else bool(BigEndian)
+    Packed = Cache.Packed
+    if not (Packed is None):
+        Result = Packed.get(Key)
+        if not (Result is None):
+            return Result
+    Template = Cache.Template
+    if (Template is None) or (Template[1] != Key):
+        return None
+    Result = bytes(Template[0])
+    if Packed is None:
+        Cache.Packed = {Key : Result}
+    else:
+        Packed[Key] = Result
+    return Result
+
+def _linkPackedCache(Instance: Any) -> Any:
+    """
+    Private helper function to obtain the packed bytes cache storage of a
+    serializable instance, creating it if required. On the first call per
+    instance the storages of all nested objects, at any depth, are created
+    and linked to the storage of the object enclosing each of them, together
+    with the offset of the nested object, thus any later modification of a
+    nested object can invalidate (or patch) the caches of all enclosing
+    objects. The nested objects of an instance are never replaced, so the
+    linking is done only once.
+    
+    Signature:
+        Serializable -> _PackedCache
+    
+    Args:
+        Instance: Serializable; instance of a serializable class
+    
+    Returns:
+        _PackedCache: the cache storage of the instance
+    
+    Version 1.1.0.0
+    """
+    Cache = _getPackedCache(Instance)
+    if Cache is None:
+        Cache = _PackedCache()
+        _setPackedCache(Instance, Cache)
+    if not Cache.IsLinked:
+        for Offset, Child in type(Instance)._getChildren(Instance):
+            ChildCache = _linkPackedCache(Child)
+            ChildCache.Owner = Cache
+            ChildCache.Offset = Offset
+        Cache.IsLinked = True
+    return Cache
+
+def _storePackedBytes(Instance: Any, Data: bytes,
+                                    BigEndian: Optional[bool] = None) -> None:
+    """
+    Private helper function to cache the bytes representation of a
+    serializable instance for the specified endianness.
+    
+    Signature:
+        Serializable, bytes/, bool OR None/ -> None
+    
+    Args:
+        Instance: Serializable; instance of a serializable class
+        Data: bytes; its bytes representation
+        BigEndian: (optional) bool OR None; 3-way selector of the endianness,
+            interpreted as in the method packBytes()
+    
+    Version 1.0.0.0
+    """
+    Cache = _linkPackedCache(Instance)
+    if Cache.Packed is None:
+        Cache.Packed = dict()
+    Cache.Packed[None if BigEndian is None else bool(BigEndian)] = Data
+
+def _dropPackedBytes(Instance: Any, Key: Any = None,
+                                                    Value: Any = None) -> None:
+    """
+    Private helper function to invalidate the cached bytes representations of
+    a serializable instance after the assignment to one of its C primitive
+    type fields / elements / value, as well as of all objects it is nested
+    into, up to the top level one. The packed template images of these
+    objects are patched in place with the new value instead.
+    
+    Signature:
+        Serializable/, type A, type B/ -> None
+    
+    Args:
+        Instance: Serializable; instance of a serializable class
+        Key: (optional) type A; the name of the field or the index of the
+            element, which is assigned to
+        Value: (optional) type B; the assigned value, already converted by
+            the declared C type
+    
+    Version 1.1.0.0
+    """
+    Cache = _getPackedCache(Instance)
+    Offset = None
+    Shift = 0
+    while not (Cache is None):
+        Cache.Packed = None
+        if not (Cache.Template is None):
+            if Offset is None:
+                Locator = type(Instance)._locateScalar
+                Offset, CType = Locator(Instance, Key)
+            Image, BigEndian = Cache.Template
+            Code = _getStructCode(CType)
+            if Code is None:
+                Data = Scalar2Bytes(Value, CType, BigEndian = BigEndian)
+                Position = Offset + Shift
+                Image[Position : Position + len(Data)] = Data
+            else:
+                struct.pack_into(_ENDIANNESS_PREFIXES[BigEndian] + Code,
+                                                Image, Offset + Shift, Value)
+        Shift += Cache.Offset
+        Cache = Cache.Owner
+
+def _resetPackedBytes(Instance: Any) -> None:
+    """
+    Private helper function to invalidate the cached bytes representations of
+    a serializable instance after its entire content is re-loaded in place,
+    and to re-pack its packed template image, if any. The enclosing objects
+    are not processed.
+    
+    Signature:
+        Serializable -> None
+    
+    Args:
+        Instance: Serializable; instance of a serializable class
+    
+    Version 1.0.0.0
+    """
+    Cache = _getPackedCache(Instance)
+    if not (Cache is None):
+        Cache.Packed = None
+        if not (Cache.Template is None):
+            Template = Cache.Template
+            Cache.Template = None #otherwise the stale image is returned
+            Image, BigEndian = Template
+            Image[:] = Instance.packBytes(BigEndian = BigEndian)
+            Cache.Template = Template
+
+def _updateOwnersPacked(Instance: Any) -> None:
+    """
+    Private helper function to invalidate the cached bytes representations of
+    all objects a serializable instance is nested into, up to the top level
+    one, after the entire content of the instance is re-loaded in place. The
+    respective part of the packed template images of these objects is
+    overwritten by the new bytes representation of the instance instead. A
+    dynamic length object is always the last part of the enclosing objects,
+    thus the tails of their images are replaced.
+    
+    Signature:
+        Serializable -> None
+    
+    Args:
+        Instance: Serializable; instance of a serializable class
+    
+    Version 1.0.0.0
+    """
+    Cache = _getPackedCache(Instance)
+    if Cache is None:
+        return
+    Shift = Cache.Offset
+    Cache = Cache.Owner
+    IsDynamic = type(Instance).getSize() is None
+    while not (Cache is None):
+        Cache.Packed = None
+        if not (Cache.Template is None):
+            Image, BigEndian = Cache.Template
+            Data = Instance.packBytes(BigEndian = BigEndian)
+            if IsDynamic:
+                Image[Shift : ] = Data
+            else:
+                Image[Shift : Shift + len(Data)] = Data
+        Shift += Cache.Offset
+        Cache = Cache.Owner
+
+#classes
+
+#+ helper classes
+
+class _PackedCache:
+    """
+    Storage of the cached bytes representations and of the packed template
+    image of a serializable instance, linked to the same storage of the object
+    the instance is nested into.
+    
+    Version 1.1.0.0
+    """
+    
+    __slots__ = ('Packed', 'Template', 'Owner', 'Offset', 'IsLinked')
+    
+    def __init__(self) -> None:
+        """
+        Initialization.
+        
+        Signature:
+            None -> None
+        
+        Version 1.1.0.0
+        """
+        self.Packed = None #dict(bool OR None -> bytes) OR None if invalidated
+        self.Template = None #(bytearray, bool OR None) - image, endianness
+        self.Owner = None #_PackedCache of the enclosing object OR None
+        self.Offset = 0 #position of the instance within the enclosing object
+        self.IsLinked = False #the nested objects' caches are linked to it
+
+class _GeneratedCode:
+    """
+    Storage of the functions generated for a fixed size class, which 'leaves'
+    are all supported by the struct module, and of their source code. The
+    functions operate on the flattened sequence of the 'leaves' values, as
+    used by the compiled struct codecs, thus they do not depend on the byte
+    order.
+    
+    Version 1.0.0.0
+    """
+    
+    __slots__ = ('Leaves', 'Build', 'Native', 'Count', 'Source')
+    
+    def __init__(self) -> None:
+        """
+        Initialization.
+        
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        self.Leaves = None #function 'Serializable -> tuple(type A)
+        self.Build = None #function tuple(type A) -> 'Serializable
+        self.Native = None #function tuple(type A) -> dict OR list
+        self.Count = 0 #number of the 'leaves'
+        self.Source = '' #source code of the functions
+
+class _CodeGenerator:
+    """
+    Accumulator of the source code lines of the generated functions, which
+    are contributed by the private class methods _generateCode() of the
+    nested classes, and of the constants referred to by this code. Also
+    compiles the validators of the JSON data, see the private class method
+    _generateValidator().
+    
+    Version 1.1.0.0
+    """
+    
+    __slots__ = ('Namespace', 'Constants', 'LeavesLines', 'LeavesItems',
+                                        'BuildLines', 'Index', 'Counter')
+    
+    def __init__(self) -> None:
+        """
+        Initialization.
+        
+        Signature:
+            None -> None
+        
+        Version 1.0.1.0
+        """
+        self.Namespace = {
+            '_getLazyView' : _getLazyView,
+            '_setLazyView' : _setLazyView,
+            '_getArrayData' : _getArrayData,
+            '_setArrayData' : _setArrayData,
+            '_setPackedCache' : _setPackedCache,
+            '_setattr' : _setField,
+            '_getattr' : _getField,
+            '_chain' : itertools.chain.from_iterable,
+            '_array' : array.array
+        }
+        self.Constants = dict() #id(object) -> name in the namespace
+        self.LeavesLines = list() #body of the function Leaves()
+        self.LeavesItems = list() #items of the tuple returned by Leaves()
+        self.BuildLines = list() #body of the function Build()
+        self.Index = 0 #index of the next 'leaf' in the flattened sequence
+        self.Counter = 0 #number of the generated names
+    
+    def getName(self, Prefix: str) -> str:
+        """
+        Generates a new unique local variable name.
+        
+        Signature:
+            str -> str
+        
+        Version 1.0.0.0
+        """
+        self.Counter += 1
+        return f'{Prefix}{self.Counter}'
+    
+    def bind(self, Value: Any) -> str:
+        """
+        Stores an object as a constant of the generated code and returns its
+        name, the same name is returned for the same object.
+        
+        Signature:
+            type A -> str
+        
+        Version 1.0.0.0
+        """
+        Key = id(Value)
+        if not (Key in self.Constants):
+            Name = self.getName('_k')
+            self.Namespace[Name] = Value
+            self.Constants[Key] = Name
+        return self.Constants[Key]
+    
+    def getAttribute(self, Source: str, Field: str) -> str:
+        """
+        Generates the read access expression of a field of a struct.
+        
+        Signature:
+            str, str -> str
+        
+        Version 1.0.0.0
+        """
+        if Field.isidentifier() and not keyword.iskeyword(Field):
+            Result = f'{Source}.{Field}'
+        else:
+            Result = f'_getattr({Source}, {Field!r})'
+        return Result
+    
+    def compile(self, Class: type, BuildName: str,
+                                            NativeExpression: str) -> Any:
+        """
+        Assembles and compiles the source code of the functions.
+        
+        Signature:
+            type, str, str -> _GeneratedCode
+        
+        Version 1.0.0.0
+        """
+        Name = Class.__name__
+        Lines = [f'def leaves_{Name}(obj):']
+        Lines.extend(f'    {Line}' for Line in self.LeavesLines)
+        if len(self.LeavesItems):
+            Lines.append('    return ({}, )'.format(
+                                                ', '.join(self.LeavesItems)))
+        else:
+            Lines.append('    return ()')
+        Lines.append('')
+        Lines.append(f'def build_{Name}(v):')
+        Lines.extend(f'    {Line}' for Line in self.BuildLines)
+        Lines.append(f'    return {BuildName}')
+        Lines.append('')
+        Lines.append(f'def native_{Name}(v):')
+        Lines.append(f'    return {NativeExpression}')
+        Lines.append('')
+        Result = _GeneratedCode()
+        Result.Source = '\n'.join(Lines)
+        Result.Count = self.Index
+        exec(compile(Result.Source, f'<generated {Name}>', 'exec'),
+                                                                self.Namespace)
+        Result.Leaves = self.Namespace[f'leaves_{Name}']
+        Result.Build = self.Namespace[f'build_{Name}']
+        Result.Native = self.Namespace[f'native_{Name}']
+        return Result
+    
+    def checkScalar(self, CType: TSimpleC, Variable: str) -> List[str]:
+        """
+        Generates the lines of the check of a native value against a C
+        primitive type, which return False from the validator if the value
+        is not acceptable, see _getScalarCheck() helper function.
+        
+        Signature:
+            class ctypes._SimpleCData, str -> list(str)
+        
+        Version 1.0.0.0
+        """
+        Check = _getScalarCheck(CType)
+        if Check is None:
+            Lines = ['try:', f'    {self.bind(CType)}({Variable})',
+                        'except (TypeError, ValueError):', '    return False']
+        else:
+            Types, Minimum, Maximum, _ = Check
+            Condition = f'not (type({Variable}) in {self.bind(Types)})'
+            if not (Minimum is None):
+                Condition = '{} or not ({} <= {} <= {})'.format(Condition,
+                                                Minimum, Variable, Maximum)
+            Lines = [f'if {Condition}:', '    return False']
+        return Lines
+    
+    def compileValidator(self, Class: type, Lines: List[str]) -> Callable:
+        """
+        Assembles and compiles the validator of the JSON data of a class
+        from the lines of its body.
+        
+        Signature:
+            type, list(str) -> function type A -> bool
+        
+        Version 1.0.0.0
+        """
+        Name = Class.__name__
+        Source = [f'def valid_{Name}(v):']
+        Source.extend(f'    {Line}' for Line in Lines)
+        Source.append('')
+        exec(compile('\n'.join(Source), f'<validator {Name}>', 'exec'),
+                                                                self.Namespace)
+        return self.Namespace[f'valid_{Name}']
+
+#+ meta-class
+
+class _Hidden:
+    """
+    Descriptor wrapping a 'private' class attribute, i.e. with the name
+    starting with a single underscore, of a serializable class, including the
+    private slots. The wrapped attribute is accessible via the class as usual,
+    whereas the read access via an instance raises UT_AttributeError. The
+    write access via an instance is delegated to the wrapped slot, and it is
+    prohibited for any other attribute. The deletion is always prohibited.
+    
+    Version 1.0.0.0
+    """
+    
+    __slots__ = ('Name', 'Value', 'Getter', 'IsSlot')
+    
+    def __init__(self, Name: str, Value: Any) -> None:
+        """
+        Initialization.
+        
+        Signature:
+            str, type A -> None
+        
+        Args:
+            Name: str; name of the attribute
+            Value: type A; the wrapped attribute
+        
+        Version 1.0.0.0
+        """
+        self.Name = Name
+        self.IsSlot = isinstance(Value, types.MemberDescriptorType)
+        if isinstance(Value, classmethod):
+            self.Getter = Value.__get__ #binding to the owner class
+        else:
+            self.Getter = None
+            if isinstance(Value, staticmethod):
+                Value = Value.__func__
+        self.Value = Value
+    
+    def __get__(self, Instance: Any, Owner: type) -> Any:
+        """
+        Resolves the wrapped attribute for the class access.
+        
+        Signature:
+            type A, type -> type B
+        
+        Raises:
+            UT_AttributeError: accessed via an instance
+        
+        Version 1.0.0.0
+        """
+        if not (Instance is None):
+            raise UT_AttributeError(Instance, self.Name, SkipFrames = 1)
+        if self.Getter is None:
+            return self.Value
+        return self.Getter(None, Owner)
+    
+    def __set__(self, Instance: Any, Value: Any) -> None:
+        """
+        Assigns a value to the wrapped slot of an instance.
+        
+        Signature:
+            type A, type B -> None
+        
+        Raises:
+            UT_AttributeError: not a slot
+        
+        Version 1.0.0.0
+        """
+        if not self.IsSlot:
+            raise UT_AttributeError(Instance, self.Name, SkipFrames = 1)
+        self.Value.__set__(Instance, Value)
+    
+    def __delete__(self, Instance: Any) -> NoReturn:
+        """
+        Prohibits the deletion of the wrapped attribute via an instance.
+        
+        Signature:
+            type A -> None
+        
+        Raises:
+            UT_AttributeError: always raised
+        
+        Version 1.0.0.0
+        """
+        raise UT_AttributeError(Instance, self.Name, SkipFrames = 1)
+
+class _SerializableMeta(abc.ABCMeta):
+    """
+    Meta-class of the serializable classes, which invalidates the affected
+    compiled data structure caches whenever a class attribute is (re-)
+    assigned or deleted, e.g. the data structure definition is changed at the
+    run time. The 'magic' attributes and the ABC machinery are ignored.
+    
+    It also generates the __slots__ of each new class, unless declared
+    explicitly in the class body, from the declared fields, thus the instances
+    do not have __dict__. A field name clashing with a class attribute, e.g.
+    a method, is rejected at the class creation. All 'private' class
+    attributes (including methods and slots) are wrapped into the _Hidden
+    descriptors, thus they are not accessible via the instances, whereas the
+    attribute resolution of the instances remains the default one.
+    
+    Version 1.4.0.0
+    """
+    
+    @staticmethod
+    def _isHidden(name: str) -> bool:
+        """
+        Checks if the attribute must be hidden from the instances, i.e. the
+        name starts with a single underscore, excluding the ABC machinery.
+        
+        Signature:
+            str -> bool
+        
+        Version 1.0.0.0
+        """
+        return (name.startswith('_') and not name.startswith('__')
+                                            and not name.startswith('_abc_'))
+    
+    def __new__(mcls, name: str, bases: Tuple[type, ...], namespace: TDict,
+                                                            **kwargs) -> type:
+        """
+        Special method creating a new class. Generates one slot per field
+        declared in the _Fields class attribute, which is not yet provided by
+        a base class and is a valid identifier; the other fields are stored
+        in the fall-back storage of the instances. The malformed declarations
+        are ignored here, they are reported by the definition check of the
+        class. Wraps the 'private' class attributes.
+        
+        Signature:
+            str, tuple(type), dict(str -> type A)/, **kwargs/ -> type
+        
+        Raises:
+            UT_TypeError: a declared field name clashes with an attribute of
+                the class or of its base classes, which is not a slot
+        
+        Version 1.2.0.0
+        """
+        Names = []
+        Fields = namespace.get('_Fields', None)
+        if isinstance(Fields, tuple):
+            for Definition in Fields:
+                if not (isinstance(Definition, tuple) and len(Definition) == 2
+                                            and isinstance(Definition[0], str)):
+                    continue
+                Name = Definition[0]
+                if Name in namespace:
+                    Attribute = namespace[Name]
+                else:
+                    Attribute = None
+                    for Base in bases:
+                        for Class in Base.__mro__:
+                            if Name in Class.__dict__:
+                                Attribute = Class.__dict__[Name]
+                                break
+                        if not (Attribute is None):
+                            break
+                if not ((Attribute is None) or
+                            isinstance(Attribute, types.MemberDescriptorType)):
+                    Error = UT_TypeError(Attribute, types.MemberDescriptorType,
+                                                                SkipFrames = 1)
+                    Error.setMessage(''.join(['Wrong definition of ', name,
+                            f'._Fields - field {Name!r} clashes with a class',
+                            ' attribute']))
+                    raise Error
+                if (Attribute is None and Name.isidentifier()
+                                                and (not Name.startswith('__'))
+                                                and (not (Name in Names))):
+                    Names.append(Name)
+        if '__slots__' in namespace:
+            Names = []
+        else:
+            namespace['__slots__'] = tuple(Names)
+        Class = super().__new__(mcls, name, bases, namespace, **kwargs)
+        for Name, Value in list(Class.__dict__.items()):
+            if (mcls._isHidden(Name) and not (Name in Names)
+                                        and not isinstance(Value, _Hidden)):
+                type.__setattr__(Class, Name, _Hidden(Name, Value))
+        return Class
+    
+    def __setattr__(cls, name: str, value: Any) -> None:
+        """
+        Special method hooking the assignment to a class attribute. Wraps the
+        'private' class attributes.
+        
+        Signature:
+            str, type A -> None
+        
+        Version 1.2.0.0
+        """
+        if cls._isHidden(name) and not isinstance(value, _Hidden):
+            value = _Hidden(name, value)
+        super().__setattr__(name, value)
+        if not (name.startswith('__') or name.startswith('_abc_')):
+            _dropClassCaches(cls)
+    
+    def __delattr__(cls, name: str) -> None:
+        """
+        Special method hooking the deletion of a class attribute.
+        
+        Signature:
+            str -> None
+        
+        Version 1.1.0.0
+        """
+        super().__delattr__(name)
+        if not (name.startswith('__') or name.startswith('_abc_')):
+            _dropClassCaches(cls)
+
+#+ ABC / Prototype / Interface
+class Serializable(abc.ABC, metaclass = _SerializableMeta):
+    """
+    Prototype, ABC for the auto-serializable compound data types, designed
+    without internal state, i.e. as an Interface, except for the cache of the
+    packed bytes representation, which is managed by the sub-classes.
+    
+    The derived classes MUST re-define the public methods getSize(), packBytes()
+    and getNative(), as well as the 'private' class methods _parseBuffer(),
+    _checkObjectContent() and _checkDefinition(). They may also re-define the
+    'private' class method _unpackObject() in order to create the new instances
+    from the bytes representation directly.
+    
+    It also modifies the access / attribute resolution scheme: the 'private'
+    class attributes are hidden from the instances by the descriptors set by
+    the meta-class, whereas the assignment to and deletion of the instance
+    attributes are prohibited. The sub-classes might be required to override
+    or walk-around the attribute resolution 'magic' methods.
+    
+    Class methods:
+        getSize():
+            None -> int >=0 OR None
+        unpackBytes(Data, BigEndian = None, Trusted = None):
+            bytes-like /, bool OR None, bool OR None/ -> 'Serializable
+        unpackFrom(Buffer, Offset = 0, BigEndian = None):
+            bytes-like /, int >= 0, bool OR None/ -> tuple('Serializable, int)
+        unpackInto(Instance, Data, BigEndian = None):
+            'Serializable, bytes-like /, bool OR None/ -> 'Serializable
+        acquire():
+            None -> 'Serializable
+        release(Instance):
+            'Serializable -> None
+        iterUnpack(Data, BigEndian = None):
+            bytes-like /, bool OR None/ -> iterator('Serializable)
+        unpackMany(Data, BigEndian = None):
+            bytes-like /, bool OR None/ -> list('Serializable)
+        unpackJSON(Data, Trusted = None):
+            str/, bool OR None/ -> 'Serializable
+        loadJSONLines(File, Trusted = None):
+            iter(str OR bytes)/, bool OR None/ -> iterator('Serializable)
+        getNumpyDtype(BigEndian = None):
+            /bool OR None/ -> numpy.dtype
+        unpackNumpy(Data, BigEndian = None):
+            bytes-like /, bool OR None/ -> numpy.ndarray
+        getCType(BigEndian = None):
+            /bool OR None/ -> type
+        mapBuffer(Buffer, Offset = 0, BigEndian = None):
+            bytes-like/, int >= 0, bool OR None/
+                -> ctypes.Structure OR ctypes.Array
+        getGeneratedSource():
+            None -> str OR None
+    
+    Methods:
+        packBytes(BigEndian = None):
+            /bool OR None/ -> bytes
+        packInto(Buffer, Offset, BigEndian = None):
+            bytes-like, int >= 0/, bool OR None/ -> int >= 0
+        packJSON():
+            None -> str
+        getNative():
+            None -> type A
+    
+    Version 1.13.0.0
+    """
+    
+    #private class attributes - de-serialization policy
+    
+    _Trusted: ClassVar[bool] = False
+    #default for the Trusted argument of unpackBytes() and unpackJSON()
+    
+    #private class attributes - re-use of the instances
+    
+    _PoolSize: ClassVar[int] = 0
+    #maximum number of the released instances kept by release() for acquire()
+    
+    #instance storage
+    
+    __slots__ = ('_Packed', ) #_PackedCache OR None - packBytes() results
+    
+    #private methods
+    
+    @classmethod
+    @abc.abstractmethod
+    def _checkObjectContent(cls, Data: Any) -> None:
+        """
+        Prototype for the private class method to check if the extracted JSON
+        object matches the declared data structure of the class.
+        
+        Signature:
+            type A -> None
+        
+        Args:
+            Data: type A; any type data to be checked
+        
+        Raises:
+            UT_TypeError: the type of the passed argument is not compatible with
+                the class
+            UT_ValueError: the internal structure of the passed object does not
+                match the defined class structure
+        
+        Version 1.0.0.0
+        """
+        pass
+    
+    @classmethod
+    @abc.abstractmethod
+    def _parseBuffer(cls, Data: TBuffer,
+                                    BigEndian: Optional[bool] = None) -> None:
+        """
+        Private class method to parse the content of the passed byte string into
+        a native Python object using the class data structure definition.
+        Prototype.
+        
+        Signature:
+            bytes-like /, bool OR None/ -> None
+        
+        Args:
+            Data: bytes-like; data to be checked
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Raises:
+            UT_ValueError: size of the passed bytestring does not match the
+                declared data structure size
+        
+        Version 1.0.0.0
+        """
+        pass
+    
+    @classmethod
+    @abc.abstractmethod
+    def _checkDefinition(cls) -> None:
+        """
+        Private class method to check the definition of the data structure of
+        the class. Supposed to be called by all class methods, including the
+        unpacking (constructors), and the initialization instance method.
+        Prototype.
+        
+        Signature:
+            None -> None
+        
+        Raises:
+            UT_TypeError: required class private attributes are missing OR
+                OR they hold wrong type vales OR elements / fields type
+                declaration is incorrect
+        
+        Version 1.0.0.0
+        """
+        pass
+    
+    @classmethod
+    def _getLeafFormat(cls) -> Optional[str]:
+        """
+        Private class method to obtain the struct module format (without the
+        byte order prefix) of the flattened, i.e. 'leaves' only, data structure
+        of the class. Prototype, the classes without such representation should
+        not re-define it.
+        
+        Signature:
+            None -> str OR None
+        
+        Returns:
+            * str: format string of all 'leaves' in the 'depth first' order
+            * None: the class is not fixed size or it has a 'leaf' of C
+                primitive type not supported by the struct module
+        
+        Version 1.0.0.0
+        """
+        return None
+    
+    @classmethod
+    def _getNumpyFormat(cls, Prefix: str) -> Any:
+        """
+        Private class method to obtain the specification of the NumPy data type
+        equivalent to the data structure of the class. Prototype, the classes
+        without such representation should not re-define it.
+        
+        Signature:
+            str -> type A OR None
+        
+        Args:
+            Prefix: str; byte order character - '=', '>' or '<'
+        
+        Returns:
+            * type A: specification accepted by numpy.dtype(), e.g. a string
+                or a list of the (name, specification) pairs
+            * None: the class is not fixed size or it has a 'leaf' of C
+                primitive type without NumPy equivalent
+        
+        Version 1.0.0.0
+        """
+        return None
+    
+    @classmethod
+    def _buildCType(cls, BigEndian: Optional[bool] = None) -> Optional[type]:
+        """
+        Private class method to create the packed ctypes structure or array
+        type mirroring the data structure of the class. Prototype, the classes
+        without such representation should not re-define it.
+        
+        Signature:
+            /bool OR None/ -> type OR None
+        
+        Args:
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - None means native, True - big endian,
+                False - little endian
+        
+        Returns:
+            * type: sub-class of ctypes.Structure or ctypes.Array
+            * None: the class is not fixed size or it has a 'leaf' of C
+                primitive type not supporting the requested byte order
+        
+        Version 1.0.0.0
+        """
+        return None
+    
+    @classmethod
+    def _getCodec(cls, BigEndian: Optional[bool] = None) -> Optional[
+                                                                struct.Struct]:
+        """
+        Private class method to obtain the compiled struct codec of the entire
+        flattened data structure of the class for the specified endianness. The
+        codec is compiled only once per class and endianness and cached.
+        
+        Signature:
+            /bool OR None/ -> struct.Struct OR None
+        
+        Args:
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            * struct.Struct: compiled codec packing / unpacking all 'leaves'
+            * None: the class cannot be represented by a single codec
+        
+        Version 1.0.0.0
+        """
+        Key = None if BigEndian is None else bool(BigEndian)
+        Codecs = _getClassCache(cls).setdefault('Codecs', dict())
+        if Key in Codecs:
+            Codec = Codecs[Key]
+        else:
+            Format = type.__getattribute__(cls, '_getLeafFormat')()
+            if Format is None:
+                Codec = None
+            else:
+                Codec = struct.Struct(_ENDIANNESS_PREFIXES[Key] + Format)
+            Codecs[Key] = Codec
+        return Codec
+    
+    @classmethod
+    def _getGenerated(cls) -> Optional[_GeneratedCode]:
+        """
+        Private class method to obtain the functions generated specially for
+        the class, which convert an instance into the flattened sequence of
+        the 'leaves' values and back, or into the native Python
+        representation, with all fields and (short) nested arrays unrolled.
+        They are used together with the compiled struct codecs instead of the
+        generic per field / element loops. The code is generated only once per
+        class and cached.
+        
+        Signature:
+            None -> _GeneratedCode OR None
+        
+        Returns:
+            * _GeneratedCode: storage of the generated functions
+            * None: the class cannot be represented by the struct codecs
+        
+        Version 1.0.0.0
+        """
+        Cache = _getClassCache(cls)
+        if 'Generated' in Cache:
+            Result = Cache['Generated']
+        else:
+            Format = type.__getattribute__(cls, '_getLeafFormat')()
+            if Format is None:
+                Result = None
+            else:
+                Generator = _CodeGenerator()
+                CodeGenerator = type.__getattribute__(cls, '_generateCode')
+                BuildName, NativeExpression = CodeGenerator(Generator, 'obj')
+                Result = Generator.compile(cls, BuildName, NativeExpression)
+            Cache['Generated'] = Result
+        return Result
+    
+    @classmethod
+    def _getValidator(cls) -> Callable:
+        """
+        Private class method to obtain the validator of the JSON data of the
+        class, i.e. the function generated specially for the class, which
+        checks the structure of the passed native Python object and all its
+        values in one call, using the precomputed checks of the C primitive
+        types instead of their instantiation. The validators of the nested
+        classes are called directly. The code is generated only once per class
+        and cached.
+        
+        Signature:
+            None -> function type A -> bool
+        
+        Returns:
+            function type A -> bool: validator returning True if the passed
+                object matches the declared data structure, False otherwise
+        
+        Version 1.0.0.0
+        """
+        Cache = _getClassCache(cls)
+        if 'Validator' in Cache:
+            Result = Cache['Validator']
+        else:
+            Generator = _CodeGenerator()
+            ValidatorGenerator = type.__getattribute__(cls,
+                                                        '_generateValidator')
+            Result = Generator.compileValidator(cls,
+                                                ValidatorGenerator(Generator))
+            Cache['Validator'] = Result
+        return Result
+    
+    @classmethod
+    def _generateValidator(cls, Generator: _CodeGenerator) -> List[str]:
+        """
+        Private class method to generate the lines of the body of the validator
+        of the JSON data 'v' of the class. Generic implementation via the
+        _checkObjectContent() method, which the sub-classes may re-define.
+        
+        Signature:
+            _CodeGenerator -> list(str)
+        
+        Args:
+            Generator: _CodeGenerator; accumulator of the generated code
+        
+        Returns:
+            list(str): source code lines of the function body
+        
+        Version 1.0.0.0
+        """
+        Checker = Generator.bind(type.__getattribute__(cls,
+                                                        '_checkObjectContent'))
+        return ['try:', f'    {Checker}(v)', 'except (TypeError, ValueError):',
+                                            '    return False', 'return True']
+    
+    @classmethod
+    def _getCType(cls, BigEndian: Optional[bool] = None) -> Optional[type]:
+        """
+        Private class method to obtain the ctypes type mirroring the data
+        structure of the class for the specified endianness. The type is
+        created only once per class and endianness and cached, thus the nested
+        classes are represented by the same types in all structures.
+        
+        Signature:
+            /bool OR None/ -> type OR None
+        
+        Args:
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            * type: sub-class of ctypes.Structure or ctypes.Array
+            * None: the class cannot be represented by a ctypes type
+        
+        Version 1.0.0.0
+        """
+        Key = None if BigEndian is None else bool(BigEndian)
+        CTypes = _getClassCache(cls).setdefault('CTypes', dict())
+        if Key in CTypes:
+            Result = CTypes[Key]
+        else:
+            Result = type.__getattribute__(cls, '_buildCType')(Key)
+            CTypes[Key] = Result
+        return Result
+    
+    @classmethod
+    def _getRecordSize(cls, Data: memoryview) -> int:
+        """
+        Private class method to check that the passed buffer can be split into
+        a whole number of back-to-back records of the class, which must be of
+        a fixed, non-zero size.
+        
+        Signature:
+            memoryview -> int > 0
+        
+        Args:
+            Data: memoryview; flat bytes view of the buffer
+        
+        Returns:
+            int > 0: size of a single record in bytes
+        
+        Raises:
+            UT_TypeError: the class data structure is wrongly defined OR the
+                class is not of fixed, non-zero size
+            UT_ValueError: the length of the buffer is not a multiple of the
+                size of the declared class data structure
+        
+        Version 1.0.0.0
+        """
+        TypeChecker = type.__getattribute__(cls, '_checkDefinition')
+        TypeChecker() #UT_TypeError may be raised
+        Size = cls.getSize()
+        if not Size:
+            Error = UT_TypeError(1, int, SkipFrames = 2)
+            Error.setMessage(
+                        f'{cls.__name__} is not a fixed, non-zero size class')
+            raise Error
+        DataSize = len(Data)
+        if DataSize % Size:
+            raise UT_ValueError(DataSize,
+                        f'multiple of {Size} - buffer length', SkipFrames = 2)
+        return Size
+    
+    @classmethod
+    def _unpackObject(cls, Data: TBuffer, BigEndian: Optional[bool] = None):
+        """
+        Private class method to create a new instance from the bytes
+        representation of the data, without the check of the class definition.
+        Generic implementation via the _parseBuffer() and _buildFromNative()
+        methods, which the sub-classes may re-define in order to build the
+        nested objects directly.
+        
+        Signature:
+            bytes-like /, bool OR None/ -> 'Serializable
+        
+        Args:
+            Data: bytes-like; bytes representation of the data
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            'Serializable: an instance of the same class
+        
+        Raises:
+            UT_ValueError: the size of the byte string does not match the size
+                of the declared class data structure
+        
+        Version 1.1.0.0
+        """
+        Parser = type.__getattribute__(cls, '_parseBuffer')
+        Builder = type.__getattribute__(cls, '_buildFromNative')
+        return Builder(Parser(Data, BigEndian = BigEndian))
+    
+    @classmethod
+    def _buildFromNative(cls, Data: Any, Trusted: bool = True):
+        """
+        Private class method to create a new instance from the native Python
+        representation of the data. The structure of the data is always
+        checked, whereas the values are checked only if they are not trusted.
+        Generic implementation via the _checkObjectContent() method and the
+        initialization, which the sub-classes may re-define in order to check
+        and convert each value only once.
+        
+        Signature:
+            type A/, bool/ -> 'Serializable
+        
+        Args:
+            Data: type A; native Python representation of the data
+            Trusted: (optional) bool; flag to skip the check of the values,
+                defaults to True
+        
+        Returns:
+            'Serializable: an instance of the same class
+        
+        Raises:
+            UT_TypeError: the type of the passed argument is not compatible with
+                the class
+            UT_ValueError: the internal structure of the passed object does not
+                match the defined class structure
+        
+        Version 1.1.0.0
+        """
+        if not Trusted:
+            ContentChecker = type.__getattribute__(cls, '_checkObjectContent')
+            ContentChecker(Data)
+        return cls(Data)
+    
+    def _packInto(self, Buffer: memoryview, Offset: int,
+                                    BigEndian: Optional[bool] = None) -> int:
+        """
+        Private method to write the bytes representation of the stored data
+        directly into a writable buffer at the specified position. Generic
+        implementation via the packBytes() method, which the sub-classes may
+        re-define.
+        
+        Signature:
+            memoryview, int >= 0/, bool OR None/ -> int >= 0
+        
+        Args:
+            Buffer: memoryview; writable, flat byte view of the buffer
+            Offset: int >= 0; position in the buffer to start writing at
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            int >= 0: number of the written bytes
+        
+        Raises:
+            UT_ValueError: the data does not fit into the buffer
+        
+        Version 1.0.0.0
+        """
+        Data = self.packBytes(BigEndian = BigEndian)
+        Size = len(Data)
+        Available = len(Buffer) - Offset
+        if Size > Available:
+            raise UT_ValueError(Available, f'>= {Size} - free buffer length',
+                                                                SkipFrames = 3)
+        Buffer[Offset : Offset + Size] = Data
+        return Size
+    
+    def _getChildren(self) -> Iterator[Tuple[int, Any]]:
+        """
+        Private method to iterate over the nested serializable objects, e.g.
+        the struct fields or the array elements, which are not C primitives,
+        together with their offsets in the bytes representation. The generic
+        implementation has none; the compound sub-classes should re-define it.
+        
+        Signature:
+            None -> iter(tuple(int >= 0, 'Serializable))
+        
+        Version 1.1.0.0
+        """
+        return iter(())
+    
+    def _unpackIntoObject(self, Data: TBuffer,
+                                    BigEndian: Optional[bool] = None) -> None:
+        """
+        Private method to re-load the entire content of the instance in place
+        from the bytes representation of the data. Generic implementation,
+        which passes the result of the _parseBuffer() method into the
+        initialization method of the instance; the sub-classes holding nested
+        objects should re-define it such, that the nested objects are re-used.
+        
+        Signature:
+            bytes-like /, bool OR None/ -> None
+        
+        Args:
+            Data: bytes-like; bytes representation of the data
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Raises:
+            UT_ValueError: the size of the byte string does not match the size
+                of the declared class data structure
+        
+        Version 1.0.0.0
+        """
+        Parser = type(self)._parseBuffer
+        type(self).__init__(self, Parser(Data, BigEndian = BigEndian))
+    
+    #special methods
+    
+    def __getattr__(self, name: str) -> Any:
+        """
+        Special method called if the normal attribute resolution has failed,
+        including the read access to any attribute with the name starting with
+        a single underscore, which are hidden from the instances by the
+        meta-class. The only special case is __name__, which is required for
+        the proper functioning of the custom exceptions.
+        
+        Signature:
+            str -> type A
+        
+        Raises:
+            UT_AttributeError: attribute does not exists, OR its name starts
+                with, at least, one underscore, except for the special case
+                __name__
+        
+        Version 2.0.0.0
+        """
+        if name == '__name__':
+            return self.__class__.__name__
+        raise UT_AttributeError(self, name, SkipFrames = 1)
+    
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        """
+        Special method to hook into the write access to the attributes. Prohibs
+        assignment to any attribute.
+        
+        Signature:
+            str, type A -> None
+        
+        Raises:
+            UT_AttributeError: always raised
+        
+        Version 1.0.0.0
+        """
+        raise UT_AttributeError(self, name, SkipFrames = 1)
+    
+    def __delattr__(self, name: str) -> NoReturn:
+        """
+        Special method to hook into the deletion of the attributes. Prohibs
+        deletion of any attribute, including the fields.
+        
+        Signature:
+            str -> None
+        
+        Raises:
+            UT_AttributeError: always raised
+        
+        Version 1.0.0.0
+        """
+        raise UT_AttributeError(self, name, SkipFrames = 1)
+    
+    #public API
+    
+    @classmethod
+    @abc.abstractmethod
+    def getSize(cls) -> TIntNone:
+        """
+        Prototype for the method to obtain the declared size in bytes of the
+        stored data.
+        
+        Signature:
+            None -> int >= 0 OR None
+        
+        Returns:
+            * int >= 0: size in bytes required to store in byte representation
+                the entire declared data structure - for the fixed size objects
+            * None: indication that the instance is not a fixed size object
+        
+        Raises:
+            UT_TypeError: wrong definition of the data structure
+        
+        Version 1.0.0.0
+        """
+        pass
+    
+    @classmethod
+    def getNumpyDtype(cls, BigEndian: Optional[bool] = None) -> Any:
+        """
+        Class method to obtain the NumPy data type (structured or sub-array)
+        with the same memory layout as the bytes representation of the class,
+        i.e. without the alignment padding. The data type is created only once
+        per class and endianness and cached. The optional argument BigEndian
+        is interpreted either as None or as boolean value regardless of its
+        actual data type.
+        
+        Signature:
+            /bool OR None/ -> numpy.dtype
+        
+        Args:
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            numpy.dtype: the equivalent NumPy data type
+        
+        Raises:
+            ImportError: NumPy is not installed
+            UT_TypeError: the class data structure is wrongly defined OR the
+                class is not of fixed size OR it has a 'leaf' of C primitive
+                type without NumPy equivalent
+        
+        Version 1.0.0.0
+        """
+        if numpy is None:
+            raise ImportError('NumPy is required for the NumPy export')
+        TypeChecker = type.__getattribute__(cls, '_checkDefinition')
+        TypeChecker() #UT_TypeError may be raised
+        Key = None if BigEndian is None else bool(BigEndian)
+        Dtypes = _getClassCache(cls).setdefault('Dtypes', dict())
+        if Key in Dtypes:
+            Result = Dtypes[Key]
+        else:
+            Getter = type.__getattribute__(cls, '_getNumpyFormat')
+            Format = Getter(_ENDIANNESS_PREFIXES[Key])
+            if Format is None:
+                Result = None
+            else:
+                Result = numpy.dtype(Format)
+            Dtypes[Key] = Result
+        if Result is None:
+            Error = UT_TypeError(1, int, SkipFrames = 1)
+            Error.setMessage(f'{cls.__name__} has no NumPy equivalent')
+            raise Error
+        return Result
+    
+    @classmethod
+    def getCType(cls, BigEndian: Optional[bool] = None) -> type:
+        """
+        Class method to obtain the packed ctypes structure (or array) type with
+        the same memory layout as the bytes representation of the class, i.e.
+        without the alignment padding. The nested structs and arrays are
+        represented by the nested structures and arrays, and the 'leaves' by
+        the C primitive types of the requested byte order. The type is created
+        only once per class and endianness and cached. The optional argument
+        BigEndian is interpreted either as None or as boolean value regardless
+        of its actual data type.
+        
+        Signature:
+            /bool OR None/ -> type
+        
+        Args:
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            type: sub-class of ctypes.Structure or ctypes.Array
+        
+        Raises:
+            UT_TypeError: the class data structure is wrongly defined OR the
+                class is not of fixed size OR it has a 'leaf' of C primitive
+                type not supporting the requested byte order
+        
+        Version 1.0.0.0
+        """
+        TypeChecker = type.__getattribute__(cls, '_checkDefinition')
+        TypeChecker() #UT_TypeError may be raised
+        Result = type.__getattribute__(cls, '_getCType')(BigEndian)
+        if Result is None:
+            Error = UT_TypeError(1, int, SkipFrames = 1)
+            Error.setMessage(f'{cls.__name__} has no ctypes equivalent')
+            raise Error
+        return Result
+    
+    @classmethod
+    def getGeneratedSource(cls) -> Optional[str]:
+        """
+        Class method to obtain the source code of the functions generated
+        specially for the class, which are used together with the compiled
+        struct codecs for (de-) serialization, e.g. for debugging. The code is
+        generated only once per class and cached.
+        
+        Signature:
+            None -> str OR None
+        
+        Returns:
+            * str: source code of the generated functions
+            * None: the class is not fixed size or it has a 'leaf' of C
+                primitive type not supported by the struct module, thus it is
+                processed by the generic code
+        
+        Raises:
+            UT_TypeError: the class data structure is wrongly defined
+        
+        Version 1.0.0.0
+        """
+        TypeChecker = type.__getattribute__(cls, '_checkDefinition')
+        TypeChecker() #UT_TypeError may be raised
+        Generated = type.__getattribute__(cls, '_getGenerated')()
+        if Generated is None:
+            Result = None
+        else:
+            Result = Generated.Source
+        return Result
+    
+    @classmethod
+    def unpackBytes(cls, Data: TBuffer, BigEndian: Optional[bool] = None,
+                                            Trusted: Optional[bool] = None):
+        """
+        Class method responsible for creation of a new instance using the data
+        extracted from the passed bytes packed representation. The optional
+        argument BigEndian is interpreted either as None or as boolean value
+        regardless of its actual data type.
+        
+        Any object supporting the buffer protocol (bytes, bytearray, memoryview,
+        mmap.mmap, etc.) is accepted. The data is parsed via a memoryview, i.e.
+        without intermediate copies of its parts.
+        
+        In the trusted mode the check of the class definition is skipped, and
+        the decoded values are not validated, whereas the size of the data is
+        still checked.
+        
+        Signature:
+            bytes-like /, bool OR None, bool OR None/ -> 'Serializable
+        
+        Args:
+            Data: bytes-like; bytes representation of the data
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+            Trusted: (optional) bool OR None; flag to use the trusted mode, the
+                default value is None, meaning the class default, i.e. the
+                value of the class attribute _Trusted
+        
+        Returns:
+            'Serializable: an instance of a sub-class of Serializable, same as
+                the current instance class
+        
+        Raises:
+            UT_TypeError: passed argument is not a bytes-like object OR the
+                class data structure is wrongly defined
+            UT_ValueError: the size of the byte string does not match the size
+                of the declared class data structure
+        
+        Version 1.3.0.0
+        """
+        View = _getByteView(Data)
+        if View is None:
+            raise UT_TypeError(Data, (bytes, bytearray, memoryview),
+                                                                SkipFrames = 1)
+        if Trusted is None:
+            Trusted = type.__getattribute__(cls, '_Trusted')
+        with View:
+            if not Trusted:
+                TypeChecker = type.__getattribute__(cls, '_checkDefinition')
+                TypeChecker() #UT_TypeError may be raised
+            Unpacker = type.__getattribute__(cls, '_unpackObject')
+            Result = Unpacker(View, BigEndian = BigEndian)
+            #supposed to raise UT_ValueError if size is wrong
+        return Result
+    
+    @classmethod
+    def unpackInto(cls, Instance: Any, Data: TBuffer,
+                                        BigEndian: Optional[bool] = None):
+        """
+        Class method to re-load the entire content of an existing instance of
+        the class in place from the bytes representation of the data, i.e.
+        without creation of a new object tree. The nested structs and arrays
+        of the instance are re-used; only the elements added to a dynamic
+        length array are created. The optional argument BigEndian is
+        interpreted either as None or as boolean value regardless of its
+        actual data type.
+        
+        The instance is not modified if the size of the data does not match.
+        
+        Signature:
+            'Serializable, bytes-like /, bool OR None/ -> 'Serializable
+        
+        Args:
+            Instance: 'Serializable; instance of exactly this class
+            Data: bytes-like; bytes representation of the data
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            'Serializable: the same instance
+        
+        Raises:
+            UT_TypeError: passed instance is not of this class OR the data is
+                not a bytes-like object OR the class data structure is
+                wrongly defined
+            UT_ValueError: the size of the byte string does not match the size
+                of the declared class data structure
+        
+        Version 1.0.0.0
+        """
+        if not (type(Instance) is cls):
+            raise UT_TypeError(Instance, cls, SkipFrames = 1)
+        View = _getByteView(Data)
+        if View is None:
+            raise UT_TypeError(Data, (bytes, bytearray, memoryview),
+                                                                SkipFrames = 1)
+        with View:
+            TypeChecker = type.__getattribute__(cls, '_checkDefinition')
+            TypeChecker() #UT_TypeError may be raised
+            Loader = type.__getattribute__(cls, '_unpackIntoObject')
+            Loader(Instance, View, BigEndian = BigEndian)
+            #supposed to raise UT_ValueError if size is wrong
+        _updateOwnersPacked(Instance)
+        return Instance
+    
+    @classmethod
+    def acquire(cls):
+        """
+        Class method to obtain an instance of the class for the re-use, e.g.
+        as the target of the method unpackInto(). Returns the most recently
+        released instance from the per class pool, if any, otherwise a new
+        instance with the default content. Note that the content of a pooled
+        instance is arbitrary.
+        
+        Signature:
+            None -> 'Serializable
+        
+        Returns:
+            'Serializable: an instance of the class
+        
+        Raises:
+            UT_TypeError: the class data structure is wrongly defined
+        
+        Version 1.0.1.0
+        """
+        Pool = _getClassPool(cls)
+        if Pool:
+            return Pool.pop()
+        return cls()
+    
+    @classmethod
+    def release(cls, Instance: Any) -> None:
+        """
+        Class method to return an instance of the class, which is no longer
+        used, into the per class pool for the re-use via the method
+        acquire(). The size of the pool is limited by the 'private' class
+        attribute _PoolSize (default is 0, i.e. no pooling); the instances in
+        excess are simply dropped. The pool is kept separately from the
+        compiled data cache, thus it survives the class definition changes.
+        
+        Signature:
+            'Serializable -> None
+        
+        Args:
+            Instance: 'Serializable; instance of exactly this class
+        
+        Raises:
+            UT_TypeError: passed instance is not of this class
+            UT_ValueError: passed instance is known to be a nested object of
+                another one, i.e. the enclosing object has been packed
+        
+        Version 1.0.1.0
+        """
+        if not (type(Instance) is cls):
+            raise UT_TypeError(Instance, cls, SkipFrames = 1)
+        Cache = _getPackedCache(Instance)
+        if not ((Cache is None) or (Cache.Owner is None)):
+            raise UT_ValueError(Instance, 'not nested object', SkipFrames = 1)
+        Pool = _getClassPool(cls)
+        if len(Pool) < type.__getattribute__(cls, '_PoolSize'):
+            Pool.append(Instance)
+    
+    @classmethod
+    def unpackFrom(cls, Buffer: TBuffer, Offset: int = 0,
+                    BigEndian: Optional[bool] = None) -> Tuple[Any, int]:
+        """
+        Class method responsible for creation of a new instance using the data
+        extracted from a part of the passed buffer starting at the specified
+        position. A fixed size class consumes exactly getSize() bytes, whereas
+        a dynamic length class consumes all remaining bytes of the buffer. The
+        optional argument BigEndian is interpreted either as None or as boolean
+        value regardless of its actual data type.
+        
+        Signature:
+            bytes-like/, int >= 0, bool OR None/ -> tuple('Serializable, int)
+        
+        Args:
+            Buffer: bytes-like; any C-contiguous object supporting the buffer
+                protocol, containing the bytes representation of the data
+            Offset: (optional) int >= 0; position of the first byte of the
+                data in the buffer, defaults to 0
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            tuple('Serializable, int): an instance of the same class and the
+                number of the consumed bytes
+        
+        Raises:
+            UT_TypeError: passed buffer is not a bytes-like object OR offset is
+                not an integer OR the class data structure is wrongly defined
+            UT_ValueError: the offset is outside the buffer OR the remaining
+                part of the buffer is too short / not matching the size of the
+                declared class data structure
+        
+        Version 1.1.0.0
+        """
+        View = _getByteView(Buffer)
+        if View is None:
+            raise UT_TypeError(Buffer, (bytes, bytearray, memoryview),
+                                                                SkipFrames = 1)
+        with View:
+            if not isinstance(Offset, int):
+                raise UT_TypeError(Offset, int, SkipFrames = 1)
+            DataSize = len(View)
+            if (Offset < 0) or (Offset > DataSize):
+                raise UT_ValueError(Offset,
+                        f'in range [0, {DataSize}] - offset', SkipFrames = 1)
+            TypeChecker = type.__getattribute__(cls, '_checkDefinition')
+            TypeChecker() #UT_TypeError may be raised
+            Size = cls.getSize()
+            if Size is None:
+                End = DataSize
+            else:
+                End = Offset + Size
+                if End > DataSize:
+                    raise UT_ValueError(DataSize - Offset,
+                        f'>= {Size} - remaining buffer length', SkipFrames = 1)
+            Unpacker = type.__getattribute__(cls, '_unpackObject')
+            with View[Offset : End] as Chunk:
+                Result = Unpacker(Chunk, BigEndian = BigEndian)
+        return Result, End - Offset
+    
+    @classmethod
+    def iterUnpack(cls, Data: TBuffer,
+                    BigEndian: Optional[bool] = None) -> Iterator[Any]:
+        """
+        Class method to lazily de-serialize a buffer consisting of a number of
+        back-to-back bytes representations of the same fixed size class into
+        a sequence of new instances of this class. The buffer is checked, and
+        its length must be a multiple of the class size, before the first
+        instance is created. The optional argument BigEndian is interpreted
+        either as None or as boolean value regardless of its actual data type.
+        
+        The flattened records are decoded using the cached struct codec of the
+        class, if available, otherwise by parsing each record's memoryview
+        slice in turn. The buffer is not locked by the returned iterator until
+        the first instance is requested, and it must not be resized from then
+        on until the iterator is exhausted or closed; its length is checked
+        again at that moment.
+        
+        Signature:
+            bytes-like /, bool OR None/ -> iterator('Serializable)
+        
+        Args:
+            Data: bytes-like; concatenated bytes representations of records
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            iterator('Serializable): generator of the instances of the same
+                class, one per record
+        
+        Raises:
+            UT_TypeError: passed argument is not a bytes-like object OR the
+                class data structure is wrongly defined OR the class is not of
+                fixed, non-zero size
+            UT_ValueError: the length of the buffer is not a multiple of the
+                size of the declared class data structure
+        
+        Version 1.2.1.0
+        """
+        View = _getByteView(Data)
+        if View is None:
+            raise UT_TypeError(Data, (bytes, bytearray, memoryview),
+                                                                SkipFrames = 1)
+        with View:
+            Size = type.__getattribute__(cls, '_getRecordSize')(View)
+        Codec = type.__getattribute__(cls, '_getCodec')(BigEndian)
+        
+        def Generator() -> Iterator[Any]:
+            View = _getByteView(Data)
+            with View:
+                type.__getattribute__(cls, '_getRecordSize')(View)
+                DataSize = len(View)
+                if not (Codec is None):
+                    Generated = type.__getattribute__(cls, '_getGenerated')()
+                    yield from map(Generated.Build, Codec.iter_unpack(View))
+                else:
+                    Unpacker = type.__getattribute__(cls, '_unpackObject')
+                    for Offset in range(0, DataSize, Size):
+                        with View[Offset : Offset + Size] as Chunk:
+                            Result = Unpacker(Chunk, BigEndian = BigEndian)
+                        yield Result
+        
+        return Generator()
+    
+    @classmethod
+    def unpackMany(cls, Data: TBuffer,
+                        BigEndian: Optional[bool] = None) -> List[Any]:
+        """
+        Class method to de-serialize a buffer consisting of a number of
+        back-to-back bytes representations of the same fixed size class into
+        a list of new instances of this class in a single pass. The optional
+        argument BigEndian is interpreted either as None or as boolean value
+        regardless of its actual data type.
+        
+        Signature:
+            bytes-like /, bool OR None/ -> list('Serializable)
+        
+        Args:
+            Data: bytes-like; concatenated bytes representations of records
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            list('Serializable): instances of the same class, one per record
+        
+        Raises:
+            UT_TypeError: passed argument is not a bytes-like object OR the
+                class data structure is wrongly defined OR the class is not of
+                fixed, non-zero size
+            UT_ValueError: the length of the buffer is not a multiple of the
+                size of the declared class data structure
+        
+        Version 1.0.0.0
+        """
+        return list(cls.iterUnpack(Data, BigEndian = BigEndian))
+    
+    @classmethod
+    def unpackNumpy(cls, Data: TBuffer,
+                                BigEndian: Optional[bool] = None) -> Any:
+        """
+        Class method to interpret a buffer consisting of a number of
+        back-to-back bytes representations of the same fixed size class as a
+        NumPy array of records, without copying of the data. The array shares
+        the memory with the buffer, thus it is read-only for the immutable
+        buffers, e.g. bytes. The optional argument BigEndian is interpreted
+        either as None or as boolean value regardless of its actual data type.
+        
+        Signature:
+            bytes-like /, bool OR None/ -> numpy.ndarray
+        
+        Args:
+            Data: bytes-like; concatenated bytes representations of records
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            numpy.ndarray: view of the buffer, one element per record for the
+                structs and one row per record for the arrays
+        
+        Raises:
+            ImportError: NumPy is not installed
+            UT_TypeError: passed argument is not a bytes-like object OR the
+                class data structure is wrongly defined OR the class is not of
+                fixed, non-zero size OR it has no NumPy equivalent
+            UT_ValueError: the length of the buffer is not a multiple of the
+                size of the declared class data structure
+        
+        Version 1.0.0.0
+        """
+        Dtype = cls.getNumpyDtype(BigEndian = BigEndian)
+        View = _getByteView(Data)
+        if View is None:
+            raise UT_TypeError(Data, (bytes, bytearray, memoryview),
+                                                                SkipFrames = 1)
+        try:
+            type.__getattribute__(cls, '_getRecordSize')(View)
+        except (UT_TypeError, UT_ValueError):
+            View.release()
+            raise
+        return numpy.frombuffer(View, dtype = Dtype)
+    
+    @classmethod
+    def mapBuffer(cls, Buffer: TBuffer, Offset: int = 0,
+                                    BigEndian: Optional[bool] = None) -> Any:
+        """
+        Class method to map the bytes representation of the class at the
+        specified position of a writable buffer onto an instance of the ctypes
+        type returned by the getCType() method, without copying of the data.
+        Thus, the fields are read and assigned directly in the buffer at the C
+        speed. The buffer cannot be resized while the instance exists. The
+        optional argument BigEndian is interpreted either as None or as boolean
+        value regardless of its actual data type.
+        
+        Signature:
+            bytes-like/, int >= 0, bool OR None/ -> ctypes.Structure
+                OR ctypes.Array
+        
+        Args:
+            Buffer: bytes-like; writable C-contiguous object supporting the
+                buffer protocol, e.g. bytearray or memoryview of it
+            Offset: (optional) int >= 0; position of the data in the buffer,
+                defaults to 0
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            ctypes.Structure OR ctypes.Array: instance sharing the memory with
+                the buffer
+        
+        Raises:
+            UT_TypeError: passed buffer is not a writable bytes-like object OR
+                offset is not an integer OR the class data structure is wrongly
+                defined OR the class has no ctypes equivalent
+            UT_ValueError: the offset is outside the buffer OR the remaining
+                part of the buffer is too short
+        
+        Version 1.0.0.0
+        """
+        CType = cls.getCType(BigEndian = BigEndian)
+        View = _getByteView(Buffer)
+        if (View is None) or View.readonly:
+            if not (View is None):
+                View.release()
+            raise UT_TypeError(Buffer, (bytearray, memoryview), SkipFrames = 1)
+        if not isinstance(Offset, int):
+            View.release()
+            raise UT_TypeError(Offset, int, SkipFrames = 1)
+        MaxOffset = len(View) - ctypes.sizeof(CType)
+        if (Offset < 0) or (Offset > MaxOffset):
+            View.release()
+            raise UT_ValueError(Offset,
+                        f'in range [0, {MaxOffset}] - offset', SkipFrames = 1)
+        return CType.from_buffer(View, Offset)
+    
+    @classmethod
+    def unpackJSON(cls, Data: str, Trusted: Optional[bool] = None):
+        """
+        Class method responsible for creation of a new instance using the data
+        extracted from the passed JSON encoded string.
+        
+        In the trusted mode the checks of the class definition and of the
+        range of the decoded values are skipped, i.e. the values are converted
+        into the declared C types as by the types themselves, whereas the
+        structure of the data (keys of the structs and lengths of the fixed
+        length arrays) is still checked.
+        
+        Signature:
+            str/, bool OR None/ -> 'Serializable
+        
+        Args:
+            Data: str; JSON string data
+            Trusted: (optional) bool OR None; flag to use the trusted mode, the
+                default value is None, meaning the class default, i.e. the
+                value of the class attribute _Trusted
+        
+        Returns:
+            'Serializable: an instance of a sub-class of Serializable, same as
+                the current instance class
+        
+        Raises:
+            UT_TypeError: passed argument is not a string OR the JSON encoded
+                data type is not compatible with the class OR the class data
                 structure is wrongly defined
             UT_ValueError: the passed string is not a JSON object, or its
                 internal structure does not match the defined class structure
         
-        Version 1.0.0.1
+        Version 1.2.1.0
+        """
+        if not isinstance(Data, str):
+            raise UT_TypeError(Data, str, SkipFrames = 1)
+        try:
+            NativeData = json.loads(Data)
+        except ValueError as err:
+            raise UT_ValueError(Data, 'not a valid JSON string',
+                                                    SkipFrames = 1) from None
+        if Trusted is None:
+            Trusted = type.__getattribute__(cls, '_Trusted')
+        if not Trusted:
+            TypeChecker = type.__getattribute__(cls, '_checkDefinition')
+            TypeChecker() #UT_TypeError may be raised
+        Builder = type.__getattribute__(cls, '_buildFromNative')
+        #supposed to raise UT_TypeError or UT_ValueError
+        #+ if type / structure does not meet class definition
+        return Builder(NativeData, Trusted = Trusted)
+    
+    @classmethod
+    def loadJSONLines(cls, File: Iterator[Union[str, bytes]],
+                        Trusted: Optional[bool] = None) -> Iterator[Any]:
+        """
+        Class method to lazily de-serialize the records in the JSON Lines
+        format, i.e. one JSON representation of the class data per line, read
+        from a file-like object (or any other iterable of the lines) into a
+        sequence of new instances of this class. The lines are read one by one
+        as the instances are requested, thus the memory usage is bounded for
+        any number of the records. The empty lines are skipped. The lines may
+        be either strings or UTF-8 encoded bytes (binary mode files).
+        
+        The class definition is checked only once (unless in the trusted
+        mode), before the first line is read, and a single JSON decoder is used
+        for all lines. Each record is checked and converted in the same way as
+        by the unpackJSON() method, see the Trusted argument.
+        
+        Signature:
+            iter(str OR bytes)/, bool OR None/ -> iterator('Serializable)
+        
+        Args:
+            File: iter(str OR bytes); file-like object or any other iterable
+                of the JSON strings
+            Trusted: (optional) bool OR None; flag to use the trusted mode, the
+                default value is None, meaning the class default, i.e. the
+                value of the class attribute _Trusted
+        
+        Returns:
+            iterator('Serializable): generator of the instances of the same
+                class, one per non-empty line
+        
+        Raises:
+            UT_TypeError: passed argument is not iterable OR the class data
+                structure is wrongly defined; upon iteration - a line is not
+                a string OR the JSON encoded data type of a line is not
+                compatible with the class
+            UT_ValueError: upon iteration - a line is not a valid JSON string,
+                or its internal structure does not match the defined class
+                structure; the number of the line is added to the message
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(File, collections.abc.Iterable):
+            raise UT_TypeError(File, collections.abc.Iterable, SkipFrames = 1)
+        if Trusted is None:
+            Trusted = type.__getattribute__(cls, '_Trusted')
+        if not Trusted:
+            TypeChecker = type.__getattribute__(cls, '_checkDefinition')
+            TypeChecker() #UT_TypeError may be raised
+        Builder = type.__getattribute__(cls, '_buildFromNative')
+        Decode = _JSON_DECODER.decode
+        
+        def Generator() -> Iterator[Any]:
+            for Index, Line in enumerate(File, 1):
+                if not isinstance(Line, (str, bytes, bytearray)):
+                    raise UT_TypeError(Line, (str, bytes), SkipFrames = 1)
+                if not Line or Line.isspace():
+                    continue
+                try:
+                    if not isinstance(Line, str):
+                        Line = Line.decode('utf-8')
+                    NativeData = Decode(Line)
+                except ValueError:
+                    raise UT_ValueError(Line,
+                                    f'a valid JSON string - line {Index}',
+                                                    SkipFrames = 1) from None
+                try:
+                    Result = Builder(NativeData, Trusted = Trusted)
+                except (UT_TypeError, UT_ValueError) as err:
+                    err.appendMessage(f'- line {Index}')
+                    raise
+                yield Result
+        
+        return Generator()
+    
+    @abc.abstractmethod
+    def packBytes(self, BigEndian: Optional[bool] = None) -> bytes:
+        """
+        Prototype method for serialization of the stored data into bytes. The
+        optional argument BigEndian is interpreted either as None or as boolean
+        value regardless of its actual data type.
+        
+        Signature:
+            /bool OR None/ -> bytes
+        
+        Args:
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            bytes: bytestring representing the entire stored data
+        
+        Version 1.0.0.0
+        """
+        pass
+    
+    def packInto(self, Buffer: TBuffer, Offset: int,
+                                    BigEndian: Optional[bool] = None) -> int:
+        """
+        Method for serialization of the stored data directly into a writable,
+        pre-allocated buffer (e.g. bytearray) starting at the specified
+        position. The optional argument BigEndian is interpreted either as None
+        or as boolean value regardless of its actual data type.
+        
+        Signature:
+            bytes-like, int >= 0/, bool OR None/ -> int >= 0
+        
+        Args:
+            Buffer: bytes-like; writable C-contiguous object supporting the
+                buffer protocol, e.g. bytearray or memoryview of it
+            Offset: int >= 0; position in the buffer to start writing at
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            int >= 0: number of the written bytes
+        
+        Raises:
+            UT_TypeError: passed buffer is not a writable bytes-like object OR
+                offset is not an integer
+            UT_ValueError: the offset is outside the buffer OR the data does
+                not fit into the remaining part of the buffer
+        
+        Version 1.0.0.0
+        """
+        View = _getByteView(Buffer)
+        if (View is None) or View.readonly:
+            raise UT_TypeError(Buffer, (bytearray, memoryview), SkipFrames = 1)
+        with View:
+            if not isinstance(Offset, int):
+                raise UT_TypeError(Offset, int, SkipFrames = 1)
+            DataSize = len(View)
+            if (Offset < 0) or (Offset > DataSize):
+                raise UT_ValueError(Offset,
+                        f'in range [0, {DataSize}] - offset', SkipFrames = 1)
+            Writer = type(self)._packInto
+            Result = Writer(self, View, Offset, BigEndian = BigEndian)
+        return Result
+    
+    def packJSON(self) -> str:
+        """
+        Instance method responsible for the serialization of the stored data
+        into JSON format string.
+        
+        Signature:
+            None -> str
+        
+        Returns:
+            str: JSON representation of the stored data
+        
+        Version 1.0.0.1
+        """
+        NativeData = self.getNative()
+        JSON_Data = json.dumps(NativeData)
+        return JSON_Data
+    
+    @abc.abstractmethod
+    def getNative(self) -> Any:
+        """
+        Prototype method for convertion of the stored data into native Python
+        data type.
+        
+        Signature:
+            None -> type A
+        
+        Returns:
+            type A: native Python type representation of the stored data
+        
+        Version 1.0.0.0
+        """
+        pass
+
+
+#++ new data type!
+
+TElement = Union[TSimpleC, Serializable]
+
+#+ main classes
+class SerNULL(Serializable):
+    """
+    Implements auto-serilizable and de-serializable object representing NULL /
+    None empty response or data load. Can be instantiated without an argument or
+    with a single optional argument, which is simply ignored.
+    
+    Class methods:
+        getSize():
+            None -> int = 0
+        unpackBytes(Data, BigEndian = None, Trusted = None):
+            bytes-like /, bool OR None, bool OR None/ -> SerNULL
+        unpackFrom(Buffer, Offset = 0, BigEndian = None):
+            bytes-like /, int >= 0, bool OR None/ -> tuple(SerNULL, int)
+        unpackInto(Instance, Data, BigEndian = None):
+            SerNULL, bytes-like /, bool OR None/ -> SerNULL
+        acquire():
+            None -> SerNULL
+        release(Instance):
+            SerNULL -> None
+        unpackJSON(Data, Trusted = None):
+            str/, bool OR None/ -> SerNULL
+        loadJSONLines(File, Trusted = None):
+            iter(str OR bytes)/, bool OR None/ -> iterator(SerNULL)
+    
+    Methods:
+        packBytes(BigEndian = None):
+            /bool OR None/ -> bytes
+        packInto(Buffer, Offset, BigEndian = None):
+            bytes-like, int >= 0/, bool OR None/ -> int >= 0
+        packJSON():
+            None -> str
+        getNative():
+            None -> None
+    
+    Version 1.3.0.0
+    """
+    
+    #special methods
+    
+    def __init__(self, Data: Any = None) -> None:
+        """
+        Initialization method. Only prepares the empty cache of the bytes
+        representation. Added for the consistent signature.
+        
+        Signature:
+            /type A/ -> None
+        
+        Args:
+            Data: (optional) type A; simply ignored even if provided
+        
+        Version 1.0.1.0
+        """
+        _setPackedCache(self, None)
+    
+    #private methods
+    
+    @classmethod
+    def _checkObjectContent(cls, Data: None) -> None:
+        """
+        Private class method to check if the extracted JSON object matches the
+        declared data structure of the class. Only None value is acceptable.
+        
+        Signature:
+            None-> None
+        
+        Args:
+            Data: None; any other value is an error
+        
+        Raises:
+            UT_TypeError: any value but None is recieved
+        
+        Version 1.0.0.0
+        """
+        if not (Data is None):
+            raise UT_TypeError(Data, type(None), SkipFrames = 2)
+    
+    @classmethod
+    def _parseBuffer(cls, Data: TBuffer,
+                                    BigEndian: Optional[bool] = None) -> None:
+        """
+        Private class method to parse the content of the passed byte string into
+        a native Python object using the class data structure definition. Only
+        an empty bytestring is allowed.
+        
+        Signature:
+            bytes-like /, bool OR None/ -> None
+        
+        Args:
+            Data: bytes-like; only an empty bytestring is acceptable
+            BigEndian: (optional) bool OR None; ignored
+        
+        Raises:
+            UT_ValueError: size of the passed 
+        
+        Version 1.0.0.0
+        """
+        if len(Data):
+            raise UT_ValueError(repr(bytes(Data)), 'empty bytestring',
+                                                                SkipFrames = 2)
+    
+    @classmethod
+    def _checkDefinition(cls) -> None:
+        """
+        Private class method to check the definition of the data structure of
+        the class. Supposed to be called by all class methods, including the
+        unpacking (constructors), and the initialization instance method.
+        Does nothing.
+        
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        pass
+    
+    #public API
+    
+    @classmethod
+    def getSize(cls) -> int:
+        """
+        Method to obtain the declared size in bytes of the stored data.
+        
+        Signature:
+            None -> int = 0
+        
+        Returns:
+            int = 0: always zero value is returned
+        
+        Version 1.0.0.0
+        """
+        return 0
+    
+    def getNative(self) -> None:
+        """
+        Method for convertion of the stored data into native Python data type.
+        
+        Signature:
+            None -> None
+        
+        Returns:
+            None: native Python type representation of the stored data
+        
+        Version 1.0.0.0
+        """
+        return None
+    
+    def packBytes(self, BigEndian: Optional[bool] = None) -> bytes:
+        """
+        Method for serialization of the stored data into bytes.
+        
+        Signature:
+            /bool OR None/ -> bytes
+        
+        Args:
+            BigEndian: (optional) bool OR None; ignored
+        
+        Returns:
+            bytes: an empty bytestring
+        
+        Version 1.0.0.0
+        """
+        return b''
+
+class SerStruct(Serializable):
+    """
+    Implements auto-serilizable and de-serializable object representing C-struct
+    like structured data storage. Can be instantiate without an argument or
+    with a single optional argument of a mapping type or another structure.
+    
+    Sub-classes must define their fields in the private class attribute
+    _Fields as a tuple of 2-tuples ('name': type), where type might be either
+    a ctypes primitive type or SerStruct, SerArray or SerDynamicArray. The
+    dynamic length object is allowed only as the last field!
+    
+    Class methods:
+        getSize():
+            None -> int >= 0 OR None
+        unpackBytes(Data, BigEndian = None, Trusted = None):
+            bytes-like /, bool OR None, bool OR None/ -> 'SerStruct
+        unpackFrom(Buffer, Offset = 0, BigEndian = None):
+            bytes-like /, int >= 0, bool OR None/ -> tuple('SerStruct, int)
+        unpackInto(Instance, Data, BigEndian = None):
+            'SerStruct, bytes-like /, bool OR None/ -> 'SerStruct
+        acquire():
+            None -> 'SerStruct
+        release(Instance):
+            'SerStruct -> None
+        iterUnpack(Data, BigEndian = None):
+            bytes-like /, bool OR None/ -> iterator('SerStruct)
+        unpackMany(Data, BigEndian = None):
+            bytes-like /, bool OR None/ -> list('SerStruct)
+        unpackJSON(Data, Trusted = None):
+            str/, bool OR None/ -> 'SerStruct
+        loadJSONLines(File, Trusted = None):
+            iter(str OR bytes)/, bool OR None/ -> iterator('SerStruct)
+        getNumpyDtype(BigEndian = None):
+            /bool OR None/ -> numpy.dtype
+        unpackNumpy(Data, BigEndian = None):
+            bytes-like /, bool OR None/ -> numpy.ndarray
+        getCType(BigEndian = None):
+            /bool OR None/ -> type
+        mapBuffer(Buffer, Offset = 0, BigEndian = None):
+            bytes-like/, int >= 0, bool OR None/
+                -> ctypes.Structure OR ctypes.Array
+        getGeneratedSource():
+            None -> str OR None
+        getMinSize():
+            None -> int >= 0
+        view(Data, BigEndian = None):
+            bytes-like /, bool OR None/ -> 'SerStruct
+        decodeColumns(Data, BigEndian = None):
+            bytes-like /, bool OR None/
+                -> dict(str -> array.array OR list(type A))
+        decodeNumpyColumns(Data, BigEndian = None):
+            bytes-like /, bool OR None/ -> dict(str -> numpy.ndarray)
+        getFieldOffsets():
+            None -> dict(str -> tuple(int >= 0, int > 0 OR None))
+        peekField(Buffer, Path, BigEndian = None):
+            bytes-like, str/, bool OR None/ -> type A
+        patchField(Buffer, Path, Value, BigEndian = None):
+            bytes-like, str, type A/, bool OR None/ -> None
+    
+    Methods:
+        packBytes(BigEndian = None):
+            /bool OR None/ -> bytes
+        packInto(Buffer, Offset, BigEndian = None):
+            bytes-like, int >= 0/, bool OR None/ -> int >= 0
+        packJSON():
+            None -> str
+        getNative():
+            None -> dict(str -> type A)
+        getCurrentSize():
+            None -> int >= 0
+        enableTemplate(BigEndian = None):
+            /bool OR None/ -> None
+        disableTemplate():
+            None -> None
+    
+    Version 1.15.3.0
+    """
+    
+    #private class attributes - data structure definition
+    
+    _Fields: ClassVar[Tuple[Tuple[str, TElement], ...]] = tuple()
+    #must be a tuple(tuple(str, type A)), where type A is either C primitive
+    #+ or a serializable structure / array
+    
+    #instance storage - the fields' slots are generated by the meta-class
+    
+    __slots__ = (
+        '_LazyView', #(buffer view, endianness) of a lazy view
+        '_Extra' #dict(str -> type A) of the fields without own slots
+    )
+    
+    #special methods
+    
+    def __getattr__(self, name: str) -> Any:
+        """
+        Special method called if the normal attribute resolution has failed.
+        Reads a field without own slot from the fall-back storage, decodes a
+        not yet accessed field of a lazy view, otherwise behaves as the method
+        of the super class.
+        
+        Signature:
+            str -> type A
+        
+        Raises:
+            UT_AttributeError: attribute does not exist, OR its name starts
+                with, at least, one underscore
+        
+        Version 1.2.0.0
+        """
+        try:
+            return _getExtraFields(self)[name]
+        except (AttributeError, KeyError):
+            pass
+        if not name.startswith('_'):
+            try:
+                return type(self)._loadField(self, name)
+            except AttributeError:
+                pass
+        elif name == '__name__':
+            return self.__class__.__name__
+        raise UT_AttributeError(self, name, SkipFrames = 1)
+    
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        """
+        Special method to hook into the write access to the attributes. Prohibs
+        assignment to any attribute except the declared fields, from which only
+        the C primitive type fields can be assigned to and only if the value
+        is compatible with the declared type. The assignment invalidates the
+        cached bytes representation of the instance and of all objects it is
+        nested into.
+        
+        Signature:
+            str, type A -> None
+        
+        Raises:
+            UT_AttributeError: assignment to a not declared C privite type field
+            UT_TypeError: value is incompatible with the declared type of the
+                field
+        
+        Version 1.2.1.0
+        """
+        FieldsTypes = type(self)._getFieldsTypes()
+        if (name in FieldsTypes) and (IsC_Scalar(FieldsTypes[name])):
+            try:
+                NewValue = FieldsTypes[name](value)
+            except (TypeError, ValueError):
+                Error = UT_TypeError(value, FieldsTypes[name], SkipFrames = 1)
+                Error.appendMessage('type compatible')
+                raise Error from None
+            Value = NewValue.value
+            del NewValue
+            _setField(self, name, Value)
+            _dropPackedBytes(self, name, Value)
+        elif not (name in FieldsTypes):
+            raise UT_AttributeError(self, name, SkipFrames = 1)
+        else:
+            Error = UT_TypeError(FieldsTypes[name], ctypes._SimpleCData,
+                                                                 SkipFrames = 1)
+            Error.appendMessage('- immutable field')
+            raise Error
+    
+    def __init__(self, Data: Optional[Union[TMap, Serializable]]=None) -> None:
+        """
+        Initialization method - copies the data from the same named keys /
+        fields of the passed object into the respective fields of the created
+        instance.
+        
+        Signature:
+            /dict(str -> type A) OR SerStruct/ -> None
+        
+        Args:
+            Data: (optional) dict(str -> type A) OR SerStruct; dictionary or
+                another instance of SerStruct class
+        
+        Raises:
+            UT_TypeError: passed argument is not a mapping type or an instance
+                of sub-class of SerStruct OR the data structure of the class
+                is not defined properly
+            UT_ValueError: not matching data type in one of the key:value pairs,
+                concerning the declared data type for this field
+        
+        Version 1.1.1.0
+        """
+        TypeChecker = type(self)._checkDefinition
+        TypeChecker() #UT_TypeError may be raised
+        if not (Data is None):
+            if not isinstance(Data, (collections.abc.Mapping, SerStruct)):
+                raise UT_TypeError(Data, (collections.abc.Mapping, SerStruct),
+                                                                SkipFrames = 1)
+            Source = Data
+        else:
+            Source = dict()
+        FieldsTable = type(self)._getFieldsTable()
+        FieldsContent = dict()
+        for Field, DataType, IsScalar, _, _ in FieldsTable:
+            IsFound = False
+            if (isinstance(Source, collections.abc.Mapping)
+                                                        and (Field in Source)):
+                PassedValue = Source[Field]
+                IsFound = True
+            elif isinstance(Source, SerStruct) and hasattr(Source, Field):
+                PassedValue = getattr(Source, Field)
+                IsFound = True
+            if IsFound:
+                try:
+                    FieldValue = DataType(PassedValue)
+                except (ValueError, TypeError):
+                    ErrorMessage='being compatible with {} for field {}'.format(
+                                                    DataType.__name__, Field)
+
+                    raise UT_ValueError(PassedValue, ErrorMessage,
+                                                    SkipFrames = 1) from None
+            else:
+                FieldValue = DataType()
+            if IsScalar:
+                FieldsContent[Field] = FieldValue.value
+                del FieldValue
+            else:
+                FieldsContent[Field] = FieldValue
+        _setLazyView(self, None)
+        _setPackedCache(self, None)
+        for Field, Value in FieldsContent.items():
+            _setField(self, Field, Value)
+    
+    #private methods
+    
+    @classmethod
+    def _checkObjectContent(cls, Data: TDict) -> None:
+        """
+        Private class method to check if the extracted JSON object matches the
+        declared data structure of the class. The check is performed by the
+        generated validator of the class, the fields are looked through one
+        by one only to locate the first mismatch for the error message.
+        
+        Signature:
+            dict(str -> type A) -> None
+        
+        Args:
+            Data: dict(str -> type A); data to be checked
+        
+        Raises:
+            UT_TypeError: the type of the passed argument is not compatible with
+                the class
+            UT_ValueError: the internal structure of the passed object does not
+                match the defined class structure
+        
+        Version 1.1.0.0
+        """
+        if type.__getattribute__(cls, '_getValidator')()(Data):
+            return
+        if not isinstance(Data, dict):
+            raise UT_TypeError(Data, dict, SkipFrames = 2)
+        Fields = type.__getattribute__(cls, '_Fields')
+        DeclaredFields = []
+        for Field, FieldType in Fields:
+            DeclaredFields.append(Field)
+            if not (Field in Data):
+                raise UT_ValueError(Field, 'key being present in data',
+                                                                SkipFrames= 2)
+            Value = Data[Field]
+            if IsC_Scalar(FieldType):
+                try:
+                    _convertScalar(Value, FieldType)
+                    IsValid = True
+                except (TypeError, ValueError):
+                    IsValid = False
+            else:
+                Validator = type.__getattribute__(FieldType, '_getValidator')
+                IsValid = Validator()(Value)
+            if not IsValid:
+                raise UT_ValueError(Value,
+                    f'compatible with {FieldType.__name__} type at key {Field}',
+                        SkipFrames= 2)
+        for Key in Data:
+            if not (Key in DeclaredFields):
+                raise UT_ValueError(Key, 'being declared field', SkipFrames= 2)
+    
+    @classmethod
+    def _generateValidator(cls, Generator: _CodeGenerator) -> List[str]:
+        """
+        Private class method to generate the lines of the body of the validator
+        of the JSON data 'v' of the class: the check of the type and of the
+        number of the keys of the dictionary, and the unrolled checks of all
+        declared fields. The validators of the nested classes are called.
+        
+        Signature:
+            _CodeGenerator -> list(str)
+        
+        Args:
+            Generator: _CodeGenerator; accumulator of the generated code
+        
+        Returns:
+            list(str): source code lines of the function body
+        
+        Version 1.0.0.0
+        """
+        Fields = type.__getattribute__(cls, '_Fields')
+        Lines = [f'if not isinstance(v, dict) or len(v) != {len(Fields)}:',
+                                                            '    return False']
+        if len(Fields):
+            Lines.append('try:')
+            for Field, FieldType in Fields:
+                Lines.append(f'    x = v[{Field!r}]')
+                if IsC_Scalar(FieldType):
+                    Lines.extend(f'    {Line}'
+                            for Line in Generator.checkScalar(FieldType, 'x'))
+                else:
+                    Validator = type.__getattribute__(FieldType,
+                                                            '_getValidator')()
+                    Lines.append(f'    if not {Generator.bind(Validator)}(x):')
+                    Lines.append('        return False')
+            Lines.extend(['except KeyError:', '    return False'])
+        Lines.append('return True')
+        return Lines
+    
+    @classmethod
+    def _parseBuffer(cls, Data: TBuffer,
+                                    BigEndian: Optional[bool] = None) -> TDict:
+        """
+        Private class method to parse the content of the passed byte string into
+        a native Python object using the class data structure definition.
+        
+        Signature:
+            bytes-like /, bool OR None/ -> dict(str -> type A)
+        
+        Args:
+            Data: bytes-like; data to be checked
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Raises:
+            UT_ValueError: size of the passed bytestring does not match the
+                declared data structure size
+        
+        Version 1.4.0.0
+        """
+        Size = cls.getSize()
+        DataSize = len(Data)
+        if Size is None:
+            MinSize = cls.getMinSize()
+            if DataSize < MinSize:
+                raise UT_ValueError(DataSize, f'> {MinSize} - string length',
+                                                                SkipFrames = 2)
+        elif DataSize != Size:
+            raise UT_ValueError(DataSize, f'= {Size} - string length',
+                                                                SkipFrames = 2)
+        Codec = type.__getattribute__(cls, '_getCodec')(BigEndian)
+        if not (Codec is None):
+            Generated = type.__getattribute__(cls, '_getGenerated')()
+            return Generated.Native(Codec.unpack(Data))
+        FieldsTable = type.__getattribute__(cls, '_getFieldsTable')()
+        NewValues = dict()
+        for Field, FieldType, IsScalar, Offset, ElementSize in FieldsTable[:-1]:
+            DataSlice = Data[Offset : Offset + ElementSize]
+            if IsScalar:
+                NewValues[Field] = Bytes2Scalar(DataSlice, FieldType,
+                                                        BigEndian = BigEndian)
+            else:
+                Parser = type.__getattribute__(FieldType, '_parseBuffer')
+                NewValues[Field] = Parser(DataSlice, BigEndian = BigEndian)
+        LastField, LastType, IsScalar, ProcessedBytes, _ = FieldsTable[-1]
+        DataSlice = Data[ProcessedBytes : ]
+        if IsScalar:
+            NewValues[LastField] = Bytes2Scalar(DataSlice, LastType,
+                                                        BigEndian = BigEndian)
+        else:
+            try:
+                Parser = type.__getattribute__(LastType, '_parseBuffer')
+                NewValues[LastField] = Parser(DataSlice, BigEndian = BigEndian)
+            except UT_ValueError as err:
+                BytesRemain = DataSize - ProcessedBytes
+                Message = 'byte size for type {} of field {} - {}'.format(
+                                LastType.__name__, LastField, err.getMessage())
+                Error = UT_ValueError(BytesRemain, Message, SkipFrames = 1)
+                raise Error from None
+        return NewValues
+    
+    @classmethod
+    def _getLeafFormat(cls) -> Optional[str]:
+        """
+        Private class method to obtain the struct module format (without the
+        byte order prefix) of the flattened, i.e. 'leaves' only, data structure
+        of the class.
+        
+        Signature:
+            None -> str OR None
+        
+        Returns:
+            * str: format string of all 'leaves' in the 'depth first' order
+            * None: the class is not fixed size or it has a 'leaf' of C
+                primitive type not supported by the struct module
+        
+        Raises:
+            UT_TypeError: wrong definition of the data structure
+        
+        Version 1.0.0.0
+        """
+        if cls.getSize() is None:
+            return None
+        FieldsTable = type.__getattribute__(cls, '_getFieldsTable')()
+        Codes = []
+        for _, FieldType, IsScalar, _, _ in FieldsTable:
+            if IsScalar:
+                Code = _getStructCode(FieldType)
+            else:
+                Code = type.__getattribute__(FieldType, '_getLeafFormat')()
+            if Code is None:
+                return None
+            Codes.append(Code)
+        return ''.join(Codes)
+    
+    @classmethod
+    def _getNumpyFormat(cls, Prefix: str) -> Optional[List[Tuple[str, Any]]]:
+        """
+        Private class method to obtain the specification of the NumPy
+        structured data type equivalent to the data structure of the class.
+        
+        Signature:
+            str -> list(tuple(str, type A)) OR None
+        
+        Args:
+            Prefix: str; byte order character - '=', '>' or '<'
+        
+        Returns:
+            * list(tuple(str, type A)): pairs of the field name and the
+                specification of its data type, in the declaration order
+            * None: the class is not fixed size or it has a 'leaf' of C
+                primitive type without NumPy equivalent
+        
+        Raises:
+            UT_TypeError: wrong definition of the data structure
+        
+        Version 1.0.0.0
+        """
+        if cls.getSize() is None:
+            return None
+        FieldsTable = type.__getattribute__(cls, '_getFieldsTable')()
+        Result = []
+        for Field, FieldType, IsScalar, _, _ in FieldsTable:
+            if IsScalar:
+                Format = _getNumpyCode(FieldType, Prefix)
+            else:
+                Getter = type.__getattribute__(FieldType, '_getNumpyFormat')
+                Format = Getter(Prefix)
+            if Format is None:
+                return None
+            Result.append((Field, Format))
+        return Result
+    
+    @classmethod
+    def _buildCType(cls, BigEndian: Optional[bool] = None) -> Optional[type]:
+        """
+        Private class method to create the packed ctypes structure type
+        mirroring the data structure of the class. The fields of the C
+        primitive types are declared with the types of the requested byte
+        order, so the native ctypes.Structure is used as the base class.
+        
+        Signature:
+            /bool OR None/ -> type OR None
+        
+        Args:
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - None means native, True - big endian,
+                False - little endian
+        
+        Returns:
+            * type: sub-class of ctypes.Structure
+            * None: the class is not fixed size or it has a 'leaf' of C
+                primitive type not supporting the requested byte order
+        
+        Raises:
+            UT_TypeError: wrong definition of the data structure
+        
+        Version 1.0.0.0
+        """
+        if cls.getSize() is None:
+            return None
+        FieldsTable = type.__getattribute__(cls, '_getFieldsTable')()
+        Fields = []
+        for Field, FieldType, IsScalar, _, _ in FieldsTable:
+            if IsScalar:
+                CType = _getSwappedCType(FieldType, BigEndian)
+            else:
+                CType = type.__getattribute__(FieldType, '_getCType')(BigEndian)
+            if CType is None:
+                return None
+            Fields.append((Field, CType))
+        #_layout_ is required along with _pack_ by the newer Python versions
+        Attributes = {'_pack_' : 1, '_layout_' : 'ms', '_fields_' : Fields,
+                                                '__module__' : cls.__module__}
+        return type(cls.__name__, (ctypes.Structure, ), Attributes)
+    
+    @classmethod
+    def _generateCode(cls, Generator: _CodeGenerator,
+                                                Source: str) -> Tuple[str, str]:
+        """
+        Private class method to contribute the unrolled code of the class into
+        the functions being generated: the extraction of the 'leaves' values of
+        the instance referred to by the passed variable name, the building of
+        a new instance, and the building of its native Python representation
+        from the flattened 'leaves' sequence 'v'.
+        
+        Signature:
+            _CodeGenerator, str -> tuple(str, str)
+        
+        Args:
+            Generator: _CodeGenerator; accumulator of the generated code
+            Source: str; name of the variable referring to the instance
+        
+        Returns:
+            tuple(str, str): the name of the variable referring to the built
+                instance, and the expression of the native representation
+        
+        Version 1.0.0.0
+        """
+        FieldsTable = type.__getattribute__(cls, '_getFieldsTable')()
+        Loader = Generator.bind(type.__getattribute__(cls, '_loadAll'))
+        Generator.LeavesLines.append(
+                                    f'if not (_getLazyView({Source}) is None):')
+        Generator.LeavesLines.append(f'    {Loader}({Source})')
+        Target = Generator.getName('r')
+        Class = Generator.bind(cls)
+        Generator.BuildLines.append(f'{Target} = {Class}.__new__({Class})')
+        Generator.BuildLines.append(f'_setLazyView({Target}, None)')
+        Generator.BuildLines.append(f'_setPackedCache({Target}, None)')
+        NativeItems = list()
+        for Field, FieldType, IsScalar, _, _ in FieldsTable:
+            Getter = Generator.getAttribute(Source, Field)
+            if IsScalar:
+                Generator.LeavesItems.append(Getter)
+                Value = f'v[{Generator.Index}]'
+                Native = Value
+                Generator.Index += 1
+            else:
+                Nested = Generator.getName('n')
+                Generator.LeavesLines.append(f'{Nested} = {Getter}')
+                CodeGenerator = type.__getattribute__(FieldType,
+                                                            '_generateCode')
+                Value, Native = CodeGenerator(Generator, Nested)
+            Slot = None
+            for Class in cls.__mro__:
+                if Field in Class.__dict__:
+                    Slot = Class.__dict__[Field]
+                    break
+            if isinstance(Slot, types.MemberDescriptorType):
+                Setter = Generator.bind(Slot.__set__)
+                Generator.BuildLines.append(f'{Setter}({Target}, {Value})')
+            else:
+                Generator.BuildLines.append(
+                                    f'_setattr({Target}, {Field!r}, {Value})')
+            NativeItems.append(f'{Field!r} : {Native}')
+        return Target, '{{{}}}'.format(', '.join(NativeItems))
+    
+    @classmethod
+    def _unpackObject(cls, Data: TBuffer, BigEndian: Optional[bool] = None):
+        """
+        Private class method to create a new instance from the bytes
+        representation of the data in a single pass, i.e. the nested structs
+        and arrays are created directly from the respective parts of the data,
+        without the intermediate native Python representation.
+        
+        Signature:
+            bytes-like /, bool OR None/ -> 'SerStruct
+        
+        Args:
+            Data: bytes-like; bytes representation of the data
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            'SerStruct: an instance of the same class
+        
+        Raises:
+            UT_ValueError: the size of the byte string does not match the size
+                of the declared class data structure
+        
+        Version 1.1.0.0
+        """
+        Size = cls.getSize()
+        DataSize = len(Data)
+        if Size is None:
+            MinSize = cls.getMinSize()
+            if DataSize < MinSize:
+                raise UT_ValueError(DataSize, f'> {MinSize} - string length',
+                                                                SkipFrames = 2)
+        elif DataSize != Size:
+            raise UT_ValueError(DataSize, f'= {Size} - string length',
+                                                                SkipFrames = 2)
+        Codec = type.__getattribute__(cls, '_getCodec')(BigEndian)
+        if not (Codec is None):
+            Generated = type.__getattribute__(cls, '_getGenerated')()
+            return Generated.Build(Codec.unpack(Data))
+        FieldsTable = type.__getattribute__(cls, '_getFieldsTable')()
+        Result = cls.__new__(cls)
+        _setLazyView(Result, None)
+        _setPackedCache(Result, None)
+        for Field, FieldType, IsScalar, Offset, ElementSize in FieldsTable[:-1]:
+            DataSlice = Data[Offset : Offset + ElementSize]
+            if IsScalar:
+                Value = Bytes2Scalar(DataSlice, FieldType, BigEndian=BigEndian)
+            else:
+                Unpacker = type.__getattribute__(FieldType, '_unpackObject')
+                Value = Unpacker(DataSlice, BigEndian = BigEndian)
+            _setField(Result, Field, Value)
+        LastField, LastType, IsScalar, ProcessedBytes, _ = FieldsTable[-1]
+        DataSlice = Data[ProcessedBytes : ]
+        if IsScalar:
+            Value = Bytes2Scalar(DataSlice, LastType, BigEndian = BigEndian)
+        else:
+            try:
+                Unpacker = type.__getattribute__(LastType, '_unpackObject')
+                Value = Unpacker(DataSlice, BigEndian = BigEndian)
+            except UT_ValueError as err:
+                BytesRemain = DataSize - ProcessedBytes
+                Message = 'byte size for type {} of field {} - {}'.format(
+                                LastType.__name__, LastField, err.getMessage())
+                Error = UT_ValueError(BytesRemain, Message, SkipFrames = 1)
+                raise Error from None
+        _setField(Result, LastField, Value)
+        return Result
+    
+    @classmethod
+    def _buildFromNative(cls, Data: TDict, Trusted: bool = True):
+        """
+        Private class method to create a new instance from the native Python
+        representation of the data in a single pass. The structure of the data
+        is always checked, and the values are always converted into the
+        declared C types, whereas the trusted values are not range checked,
+        i.e. they are wrapped as by the C types themselves.
+        
+        Signature:
+            dict(str -> type A)/, bool/ -> 'SerStruct
+        
+        Args:
+            Data: dict(str -> type A); native Python representation of the data
+            Trusted: (optional) bool; flag to skip the check of the values,
+                defaults to True
+        
+        Returns:
+            'SerStruct: an instance of the same class
+        
+        Raises:
+            UT_TypeError: the type of the passed argument is not compatible with
+                the class
+            UT_ValueError: the keys of the passed dictionary do not match the
+                declared fields OR a value is not compatible with the declared
+                type of the field
+        
+        Version 1.2.0.0
+        """
+        if not isinstance(Data, dict):
+            raise UT_TypeError(Data, dict, SkipFrames = 2)
+        FieldsTable = type.__getattribute__(cls, '_getFieldsTable')()
+        Result = cls.__new__(cls)
+        _setLazyView(Result, None)
+        _setPackedCache(Result, None)
+        for Field, FieldType, IsScalar, _, _ in FieldsTable:
+            if not (Field in Data):
+                raise UT_ValueError(Field, 'key being present in data',
+                                                                SkipFrames = 2)
+            Value = Data[Field]
+            try:
+                if not IsScalar:
+                    Builder = type.__getattribute__(FieldType,
+                                                            '_buildFromNative')
+                    Value = Builder(Value, Trusted = Trusted)
+                elif Trusted:
+                    Value = _castScalar(Value, FieldType)
+                else:
+                    Value = _convertScalar(Value, FieldType)
+            except (TypeError, ValueError, OverflowError):
+                raise UT_ValueError(Value,
+                    f'compatible with {FieldType.__name__} type at key {Field}',
+                        SkipFrames= 2) from None
+            _setField(Result, Field, Value)
+        if len(Data) != len(FieldsTable):
+            FieldsTypes = type.__getattribute__(cls, '_getFieldsTypes')()
+            for Key in Data:
+                if not (Key in FieldsTypes):
+                    raise UT_ValueError(Key, 'being declared field',
+                                                                SkipFrames = 2)
+        return Result
+    
+    def _getChildren(self) -> Iterator[Tuple[int, Serializable]]:
+        """
+        Private method to iterate over the values of the nested struct and
+        array fields together with their offsets. The not yet decoded fields
+        of a lazy view are decoded.
+        
+        Signature:
+            None -> iter(tuple(int >= 0, 'Serializable))
+        
+        Version 1.1.0.0
+        """
+        if not (_getLazyView(self) is None):
+            type(self)._loadAll(self)
+        FieldsTable = type(self)._getFieldsTable()
+        for Field, _, IsScalar, Offset, _ in FieldsTable:
+            if not IsScalar:
+                yield Offset, _getField(self, Field)
+    
+    def _locateScalar(self, Name: str) -> Tuple[int, TSimpleC]:
+        """
+        Private method to obtain the offset and the declared type of a C
+        primitive type field.
+        
+        Signature:
+            str -> tuple(int >= 0, class ctypes._SimpleCData)
+        
+        Args:
+            Name: str; name of the field
+        
+        Version 1.0.0.0
+        """
+        FieldType, Offset, _ = type(self)._getNodesTable()[Name]
+        return Offset, FieldType
+    
+    def _assignLeaves(self, Leaves: Iterator[Any]) -> None:
+        """
+        Private method to overwrite the stored data in place with the values
+        from the flattened sequence of the 'leaves', e.g. as returned by the
+        compiled struct codec, re-using the nested objects. The in place
+        counterpart of the generated Build() function of the class.
+        
+        Signature:
+            iter(type A) -> None
+        
+        Args:
+            Leaves: iter(type A); iterator over the 'leaves' values in the
+                'depth first' order, it is advanced by the number of the
+                'leaves' of the class
+        
+        Version 1.0.0.1
+        """
+        if not (_getLazyView(self) is None):
+            type(self)._loadAll(self)
+        FieldsTable = type.__getattribute__(type(self), '_getFieldsTable')()
+        for Field, FieldType, IsScalar, _, _ in FieldsTable:
+            if IsScalar:
+                _setField(self, Field, next(Leaves))
+            else:
+                Assigner = type.__getattribute__(FieldType, '_assignLeaves')
+                Assigner(_getField(self, Field), Leaves)
+        _resetPackedBytes(self)
+    
+    def _unpackIntoObject(self, Data: TBuffer,
+                                    BigEndian: Optional[bool] = None) -> None:
+        """
+        Private method to re-load the entire content of the instance in place
+        from the bytes representation of the data, re-using the nested
+        objects. The dynamic length tail field (if any) is processed first,
+        thus the instance is not modified if its size does not match.
+        
+        Signature:
+            bytes-like /, bool OR None/ -> None
+        
+        Args:
+            Data: bytes-like; bytes representation of the data
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Raises:
+            UT_ValueError: the size of the byte string does not match the size
+                of the declared class data structure
+        
+        Version 1.0.0.0
+        """
+        Size = type(self).getSize()
+        DataSize = len(Data)
+        if Size is None:
+            MinSize = type(self).getMinSize()
+            if DataSize < MinSize:
+                raise UT_ValueError(DataSize, f'> {MinSize} - string length',
+                                                                SkipFrames = 2)
+        elif DataSize != Size:
+            raise UT_ValueError(DataSize, f'= {Size} - string length',
+                                                                SkipFrames = 2)
+        Codec = type.__getattribute__(type(self), '_getCodec')(BigEndian)
+        if not (Codec is None):
+            type(self)._assignLeaves(self, iter(Codec.unpack(Data)))
+            return
+        if not (_getLazyView(self) is None):
+            type(self)._loadAll(self)
+        FieldsTable = type(self)._getFieldsTable()
+        LastField, LastType, IsScalar, ProcessedBytes, _ = FieldsTable[-1]
+        DataSlice = Data[ProcessedBytes : ]
+        if IsScalar:
+            _setField(self, LastField, Bytes2Scalar(DataSlice,
+                                            LastType, BigEndian = BigEndian))
+        else:
+            try:
+                LastType._unpackIntoObject(
+                                    _getField(self, LastField),
+                                            DataSlice, BigEndian = BigEndian)
+            except UT_ValueError as err:
+                BytesRemain = DataSize - ProcessedBytes
+                Message = 'byte size for type {} of field {} - {}'.format(
+                                LastType.__name__, LastField, err.getMessage())
+                Error = UT_ValueError(BytesRemain, Message, SkipFrames = 1)
+                raise Error from None
+        for Field, FieldType, IsScalar, Offset, ElementSize in FieldsTable[:-1]:
+            DataSlice = Data[Offset : Offset + ElementSize]
+            if IsScalar:
+                _setField(self, Field, Bytes2Scalar(DataSlice,
+                                            FieldType, BigEndian = BigEndian))
+            else:
+                Nested = _getField(self, Field)
+                FieldType._unpackIntoObject(Nested, DataSlice,
+                                                        BigEndian = BigEndian)
+        _resetPackedBytes(self)
+    
+    def _packInto(self, Buffer: memoryview, Offset: int,
+                                    BigEndian: Optional[bool] = None) -> int:
+        """
+        Private method to write the bytes representation of the stored data
+        directly into a writable buffer at the specified position, using the
+        compiled codec if possible, otherwise - per field.
+        
+        Signature:
+            memoryview, int >= 0/, bool OR None/ -> int >= 0
+        
+        Args:
+            Buffer: memoryview; writable, flat byte view of the buffer
+            Offset: int >= 0; position in the buffer to start writing at
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            int >= 0: number of the written bytes
+        
+        Raises:
+            UT_ValueError: the data does not fit into the buffer
+        
+        Version 1.1.0.0
+        """
+        Codec = type(self)._getCodec(BigEndian)
+        if not (Codec is None):
+            Size = Codec.size
+        else:
+            Size = self.getCurrentSize()
+        Available = len(Buffer) - Offset
+        if Size > Available:
+            raise UT_ValueError(Available, f'>= {Size} - free buffer length',
+                                                                SkipFrames = 3)
+        if not (Codec is None):
+            Leaves = type(self)._getGenerated().Leaves(self)
+            Codec.pack_into(Buffer, Offset, *Leaves)
+        else:
+            if not (_getLazyView(self) is None):
+                type(self)._loadAll(self)
+            FieldsTable = type(self)._getFieldsTable()
+            Position = Offset
+            for Field, FieldType, IsScalar, _, FieldSize in FieldsTable:
+                Value = _getField(self, Field)
+                if IsScalar:
+                    Buffer[Position : Position + FieldSize] = Scalar2Bytes(
+                                        Value, FieldType, BigEndian = BigEndian)
+                    Position += FieldSize
+                else:
+                    Position += FieldType._packInto(Value, Buffer,
+                                                Position, BigEndian = BigEndian)
+        return Size
+    
+    @classmethod
+    def _checkDefinition(cls) -> None:
+        """
+        Private class method to check the definition of the data structure of
+        the class. Supposed to be called by all class methods, including the
+        unpacking (constructors), and the initialization instance method.
+        
+        Signature:
+            None -> None
+        
+        Raises:
+            UT_TypeError: required class private attributes are missing OR
+                OR they hold wrong type vales OR fields type declaration is
+                incorrect
+        
+        Version 1.3.0.0
+        """
+        Cache = _getClassCache(cls)
+        if Cache.get('IsChecked', False):
+            return
+        for Name in ('_Fields', ):
+            try:
+                type.__getattribute__(cls, Name)
+            except AttributeError:
+                Error = UT_TypeError(1, int, SkipFrames = 2)
+                ErrorMessage = 'Wrong definition of {} - {} is missing'.format(
+                                                        cls.__name__, Name)
+                Error.setMessage(ErrorMessage)
+                raise Error from None
+        #check _Field attribute 
+        Fields = type.__getattribute__(cls, '_Fields')
+        if not isinstance(Fields, tuple):
+            Error = UT_TypeError(Fields, tuple, SkipFrames = 2)
+            ErrorMessage = 'Wrong definition of {}._Fields - {}'.format(
+                                            cls.__name__, Error.getMessage())
+            Error.setMessage(ErrorMessage)
+            raise Error
+        LastPosition = len(Fields) - 1
+        for Index, Definition in enumerate(Fields):
+            BaseMessage = ''.join(['Wrong definition of ', cls.__name__,
+                            f'._Fields - {Definition} at position {Index} '])
+            if (not isinstance(Definition, tuple)) or len(Definition) !=2:
+                Error = UT_TypeError(Definition, tuple, SkipFrames = 2)
+                Message = f'{BaseMessage} {Error.getMessage()} of size 2'
+                Error.setMessage(Message)
+                raise Error
+            #check field declaration
+            FieldName = Definition[0]
+            if not isinstance(FieldName, str):
+                Error = UT_TypeError(FieldName, str, SkipFrames = 2)
+                Message = f'{BaseMessage} {Error.getMessage()}'
+                Error.setMessage(Message)
+                raise Error
+            Storage = None
+            for Class in cls.__mro__:
+                if FieldName in Class.__dict__:
+                    Storage = Class.__dict__[FieldName]
+                    break
+            if not ((Storage is None) or
+                            isinstance(Storage, types.MemberDescriptorType)):
+                #clashes with a class attribute, e.g. added in the run-time
+                Error = UT_TypeError(Storage, types.MemberDescriptorType,
+                                                                SkipFrames = 2)
+                Message = f'{BaseMessage} - field clashes with class attribute'
+                Error.setMessage(Message)
+                raise Error
+            ElementType = Definition[1]
+            if not IsC_Scalar(ElementType):
+                try:
+                    IsSubClass = issubclass(ElementType, (SerArray, SerStruct))
+                except TypeError: #built-in data type
+                    Error = UT_TypeError(ElementType,
+                                    (ctypes._SimpleCData, SerArray, SerStruct),
+                                                                SkipFrames = 2)
+                    Message = f'{BaseMessage} {Error.getMessage()}'
+                    Error.setMessage(Message)
+                    raise Error from None
+                if (IsSubClass and (ElementType.getSize() is None) and 
+                                                        Index != LastPosition):
+                    #dynamic not in final position
+                    Error = UT_TypeError(1, int, SkipFrames = 2)
+                    Message = '{} - dynamic {} not in final position'.format(
+                                            BaseMessage, ElementType.__name__)
+                    Error.setMessage(Message)
+                    raise Error
+                elif not IsSubClass:
+                    Error = UT_TypeError(ElementType,
+                                    (ctypes._SimpleCData, SerArray, SerStruct),
+                                                                SkipFrames = 2)
+                    Message = f'{BaseMessage} {Error.getMessage()}'
+                    Error.setMessage(Message)
+                    raise Error
+        Cache['IsChecked'] = True
+    
+    @classmethod
+    def _getFieldsTable(cls) -> Tuple[Tuple[str, TElement, bool, int,
+                                                            TIntNone], ...]:
+        """
+        Private class method to obtain the pre-computed per field data of the
+        declared data structure. The table is computed only once per class and
+        cached.
+        
+        Signature:
+            None -> tuple(tuple(str, type A, bool, int >= 0, int >= 0 OR None))
+        
+        Returns:
+            tuple(tuple(str, type A, bool, int >= 0, int >= 0 OR None)): per
+                field - its name, declared type, C primitive type flag, offset
+                in bytes and size in bytes (None for the dynamic length field)
+        
+        Raises:
+            UT_TypeError: wrong definition of the data structure
+        
+        Version 1.0.0.0
         """
-        if not isinstance(Data, str):
-            raise UT_TypeError(Data, str, SkipFrames = 1)
-        try:
-            NativeData = json.loads(Data)
-        except ValueError as err:
-            raise UT_ValueError(Data, 'not a valid JSON string',
-                                                    SkipFrames = 1) from None
-        TypeChecker = type.__getattribute__(cls, '_checkDefinition')
-        TypeChecker() #UT_TypeError may be raised
-        ContentChecker = type.__getattribute__(cls, '_checkObjectContent')
-        ContentChecker(NativeData)
-        #supposed to raise UT_TypeError or UT_ValueError
-        #+ if type / structure does not meet class definition
-        return cls(NativeData)
+        Cache = _getClassCache(cls)
+        FieldsTable = Cache.get('FieldsTable', None)
+        if FieldsTable is None:
+            Checker = type.__getattribute__(cls, '_checkDefinition')
+            Checker() #UT_TypeError may be raised
+            Rows = []
+            Offset = 0
+            for Field, FieldType in type.__getattribute__(cls, '_Fields'):
+                IsScalar = IsC_Scalar(FieldType)
+                if IsScalar:
+                    Size = ctypes.sizeof(FieldType)
+                else:
+                    Size = FieldType.getSize()
+                Rows.append((Field, FieldType, IsScalar, Offset, Size))
+                if not (Size is None):
+                    Offset += Size
+            FieldsTable = tuple(Rows)
+            Cache['FieldsTable'] = FieldsTable
+        return FieldsTable
+    
+    def _loadField(self, Name: str) -> Any:
+        """
+        Private method to decode a single field from the buffer wrapped by a
+        lazy view and to store its value in the instance.
+        
+        Signature:
+            str -> type A
+        
+        Args:
+            Name: str; name of the field
+        
+        Returns:
+            type A: value of the field
+        
+        Raises:
+            AttributeError: the instance is not a lazy view OR the field is
+                not declared in its class
+            UT_ValueError: size of the dynamic length tail field does not match
+                its declared data structure
+        
+        Version 1.1.0.0
+        """
+        Pending = _getLazyView(self)
+        if Pending is None:
+            raise AttributeError(Name)
+        View, BigEndian = Pending
+        FieldsTable = type(self)._getFieldsTable()
+        for Field, FieldType, IsScalar, Offset, Size in FieldsTable:
+            if Field == Name:
+                break
+        else:
+            raise AttributeError(Name)
+        if Size is None:
+            DataSlice = View[Offset : ]
+        else:
+            DataSlice = View[Offset : Offset + Size]
+        if IsScalar:
+            Value = Bytes2Scalar(DataSlice, FieldType, BigEndian = BigEndian)
+        elif issubclass(FieldType, SerStruct):
+            Value = FieldType.view(DataSlice, BigEndian = BigEndian)
+        else:
+            Value = FieldType.unpackBytes(DataSlice, BigEndian = BigEndian)
+        _setField(self, Name, Value)
+        return Value
     
-    @abc.abstractmethod
-    def packBytes(self, BigEndian: Optional[bool] = None) -> bytes:
+    def _loadAll(self) -> None:
         """
-        Prototype method for serialization of the stored data into bytes. The
-        optional argument BigEndian is interpreted either as None or as boolean
-        value regardless of its actual data type.
+        Private method to decode all not yet accessed fields of a lazy view
+        and to drop the reference to the wrapped buffer. Does nothing for the
+        normal instances.
         
         Signature:
-            /bool OR None/ -> bytes
+            None -> None
+        
+        Version 1.1.0.1
+        """
+        if not (_getLazyView(self) is None):
+            Loader = type(self)._loadField
+            FieldsTable = type(self)._getFieldsTable()
+            for Field, _, _, _, _ in FieldsTable:
+                try:
+                    _getField(self, Field)
+                except AttributeError:
+                    Loader(self, Field)
+            _setLazyView(self, None)
+    
+    @classmethod
+    def _getLeavesTable(cls) -> Tuple[Tuple[str, TSimpleC, int], ...]:
+        """
+        Private class method to obtain the flattened, i.e. 'leaves' only, data
+        structure of a fixed size class in the 'depth first' order. The names
+        of the nested fields / elements are joined with dots. The table is
+        computed only once per class and cached.
+        
+        Signature:
+            None -> tuple(tuple(str, class ctypes._SimpleCData, int >= 0))
+        
+        Returns:
+            tuple(tuple(str, class ctypes._SimpleCData, int >= 0)): per
+                'leaf' - its dotted name, C primitive type and offset in bytes
+        
+        Raises:
+            UT_TypeError: wrong definition of the data structure
+        
+        Version 1.0.0.0
+        """
+        Cache = _getClassCache(cls)
+        LeavesTable = Cache.get('LeavesTable', None)
+        if LeavesTable is None:
+            FieldsTable = type.__getattribute__(cls, '_getFieldsTable')()
+            Rows = []
+            for Field, FieldType, IsScalar, Offset, _ in FieldsTable:
+                if IsScalar:
+                    Rows.append((Field, FieldType, Offset))
+                else:
+                    Getter = type.__getattribute__(FieldType,
+                                                            '_getLeavesTable')
+                    Rows.extend((f'{Field}.{Name}', CType, Offset + Position)
+                                        for Name, CType, Position in Getter())
+            LeavesTable = tuple(Rows)
+            Cache['LeavesTable'] = LeavesTable
+        return LeavesTable
+    
+    @classmethod
+    def _getColumnCodecs(cls, BigEndian: Optional[bool] = None) -> Tuple[
+                    Tuple[str, TSimpleC, int, Optional[struct.Struct]], ...]:
+        """
+        Private class method to obtain the per 'leaf' strided struct codecs for
+        the specified endianness, each of which skips the entire record except
+        for the single value of that 'leaf', so a column is decoded by a single
+        iter_unpack() pass over the buffer. The codecs are compiled only once
+        per class and endianness and cached.
+        
+        Signature:
+            /bool OR None/ -> tuple(tuple(str, class ctypes._SimpleCData,
+                int >= 0, struct.Struct OR None))
         
         Args:
             BigEndian: (optional) bool OR None; 3-way selector to indicate the
@@ -611,982 +4548,1648 @@ class Serializable(abc.ABC):
                 forces little endian format.
         
         Returns:
-            bytes: bytestring representing the entire stored data
+            tuple(tuple(str, class ctypes._SimpleCData, int >= 0,
+                struct.Struct OR None)): per 'leaf' - its dotted name, C
+                primitive type, offset in bytes and the strided codec (None
+                for a type, which cannot be represented by the struct module)
+        
+        Raises:
+            UT_TypeError: wrong definition of the data structure
         
         Version 1.0.0.0
         """
-        pass
+        Key = None if BigEndian is None else bool(BigEndian)
+        Codecs = _getClassCache(cls).setdefault('ColumnCodecs', dict())
+        if Key in Codecs:
+            Result = Codecs[Key]
+        else:
+            Size = cls.getSize()
+            Prefix = _ENDIANNESS_PREFIXES[Key]
+            Rows = []
+            for Name, CType, Offset in type.__getattribute__(cls,
+                                                        '_getLeavesTable')():
+                Code = _getStructCode(CType)
+                if Code is None:
+                    Codec = None
+                else:
+                    Padding = Size - Offset - ctypes.sizeof(CType)
+                    Codec = struct.Struct(
+                                    f'{Prefix}{Offset}x{Code}{Padding}x')
+                Rows.append((Name, CType, Offset, Codec))
+            Result = tuple(Rows)
+            Codecs[Key] = Result
+        return Result
     
-    def packJSON(self) -> str:
+    @classmethod
+    def _getNodesTable(cls) -> Dict[str, Tuple[TElement, int, TIntNone]]:
         """
-        Instance method responsible for the serialization of the stored data
-        into JSON format string.
+        Private class method to obtain the look-up table of all fields,
+        including the nested fields / elements at any depth, by their dotted
+        names, e.g. 'c', 'c.a' or 'd.0.a'. The table is computed only once per
+        class and cached.
         
         Signature:
-            None -> str
+            None -> dict(str -> tuple(type A, int >= 0, int >= 0 OR None))
         
         Returns:
-            str: JSON representation of the stored data
+            dict(str -> tuple(type A, int >= 0, int >= 0 OR None)): per field
+                - its declared type, offset in bytes and size in bytes (None
+                for the dynamic length field)
         
-        Version 1.0.0.1
+        Raises:
+            UT_TypeError: wrong definition of the data structure
+        
+        Version 1.0.0.0
         """
-        NativeData = self.getNative()
-        JSON_Data = json.dumps(NativeData)
-        return JSON_Data
+        Cache = _getClassCache(cls)
+        NodesTable = Cache.get('NodesTable', None)
+        if NodesTable is None:
+            FieldsTable = type.__getattribute__(cls, '_getFieldsTable')()
+            NodesTable = dict()
+            for Field, FieldType, IsScalar, Offset, Size in FieldsTable:
+                NodesTable[Field] = (FieldType, Offset, Size)
+                if not IsScalar:
+                    Getter = type.__getattribute__(FieldType, '_getNodesTable')
+                    for Name, (NodeType, Position, NodeSize) in (
+                                                            Getter().items()):
+                        NodesTable[f'{Field}.{Name}'] = (NodeType,
+                                                    Offset + Position, NodeSize)
+            Cache['NodesTable'] = NodesTable
+        return NodesTable
     
-    @abc.abstractmethod
-    def getNative(self) -> Any:
+    @classmethod
+    def _getFieldsTypes(cls) -> Dict[str, TElement]:
         """
-        Prototype method for convertion of the stored data into native Python
-        data type.
+        Private class method to obtain the cached look-up table of the declared
+        types of the fields by their names.
         
         Signature:
-            None -> type A
+            None -> dict(str -> type A)
+        
+        Version 1.0.0.0
+        """
+        Cache = _getClassCache(cls)
+        FieldsTypes = Cache.get('FieldsTypes', None)
+        if FieldsTypes is None:
+            Fields = type.__getattribute__(cls, '_Fields')
+            FieldsTypes = {Key : Type_ for Key, Type_ in Fields}
+            Cache['FieldsTypes'] = FieldsTypes
+        return FieldsTypes
+    
+    #public API
+    
+    @classmethod
+    def getSize(cls) -> TIntNone:
+        """
+        Method to obtain the full declared size in bytes of the stored data.
+        
+        Signature:
+            None -> int > 0 OR None
         
         Returns:
-            type A: native Python type representation of the stored data
+            * int > 0: size in bytes required to store in byte representation
+                the entire declared data structure - for the fixed size objects
+            * None: indication that the instance is not a fixed size object
         
-        Version 1.0.0.0
+        Raises:
+            UT_TypeError: wrong definition of the data structure
+        
+        Version 1.2.0.0
         """
-        pass
-
-
-#++ new data type!
-
-TElement = Union[TSimpleC, Serializable]
-
-#+ main classes
-class SerNULL(Serializable):
-    """
-    Implements auto-serilizable and de-serializable object representing NULL /
-    None empty response or data load. Can be instantiated without an argument or
-    with a single optional argument, which is simply ignored.
+        Cache = _getClassCache(cls)
+        if 'Size' in Cache:
+            return Cache['Size']
+        FieldsTable = type.__getattribute__(cls, '_getFieldsTable')()
+        if not len(FieldsTable):
+            Size = 0
+        else:
+            _, _, _, Offset, LastSize = FieldsTable[-1]
+            if LastSize is None:
+                Size = None
+            else:
+                Size = Offset + LastSize
+        Cache['Size'] = Size
+        return Size
     
-    Class methods:
-        getSize():
-            None -> int = 0
-        unpackBytes(Data, BigEndian = None):
-            bytes /, bool OR None/ -> SerNULL
-        unpackJSON(Data):
-            str -> SerNULL
+    @classmethod
+    def getMinSize(cls) -> int:
+        """
+        Method to obtain the minimal number of bytes required to represent the
+        declared size in bytes of the stored data, excluding the (optional)
+        dynamic length array as the last element.
+        
+        Signature:
+            None -> int >= 0
+        
+        Returns:
+            int >= 0: size in bytes required to store in byte representation
+                of the fixed size part
+        
+        Raises:
+            UT_TypeError: wrong definition of the data structure
+        
+        Version 1.1.0.0
+        """
+        Cache = _getClassCache(cls)
+        if 'MinSize' in Cache:
+            return Cache['MinSize']
+        FieldsTable = type.__getattribute__(cls, '_getFieldsTable')()
+        Size = 0
+        if len(FieldsTable):
+            _, LastType, _, Offset, LastSize = FieldsTable[-1]
+            if LastSize is None:
+                Size = Offset
+                if hasattr(LastType, 'getMinSize'):
+                    Size += LastType.getMinSize()
+            else:
+                Size = Offset + LastSize
+        Cache['MinSize'] = Size
+        return Size
     
-    Methods:
-        packBytes(BigEndian = None):
-            /bool OR None/ -> bytes
-        packJSON():
-            None -> str
-        getNative():
-            None -> None
+    @classmethod
+    def view(cls, Data: TBuffer, BigEndian: Optional[bool] = None):
+        """
+        Class method responsible for creation of a new instance, which wraps
+        the passed bytes representation of the data and decodes each field only
+        on its first read access, caching the result. The nested structs become
+        lazy views themselves, the nested arrays are decoded entirely on the
+        first access. The optional argument BigEndian is interpreted either as
+        None or as boolean value regardless of its actual data type.
+        
+        The buffer is not copied, thus a bytearray cannot be resized whilst
+        the view holds a reference to it, i.e. until all fields are decoded
+        via getNative() or packing. Only the total size of the data is checked
+        at the creation; a mismatch of the dynamic length tail field is
+        reported on the access to that field.
+        
+        Signature:
+            bytes-like /, bool OR None/ -> 'SerStruct
+        
+        Args:
+            Data: bytes-like; bytes representation of the data
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            'SerStruct: an instance of the same class
+        
+        Raises:
+            UT_TypeError: passed argument is not a bytes-like object OR the
+                class data structure is wrongly defined
+            UT_ValueError: the size of the byte string does not match the size
+                of the declared class data structure
+        
+        Version 1.0.1.0
+        """
+        View = _getByteView(Data)
+        if View is None:
+            raise UT_TypeError(Data, (bytes, bytearray, memoryview),
+                                                                SkipFrames = 1)
+        TypeChecker = type.__getattribute__(cls, '_checkDefinition')
+        TypeChecker() #UT_TypeError may be raised
+        Size = cls.getSize()
+        DataSize = len(View)
+        if Size is None:
+            MinSize = cls.getMinSize()
+            if DataSize < MinSize:
+                raise UT_ValueError(DataSize, f'> {MinSize} - string length',
+                                                                SkipFrames = 1)
+        elif DataSize != Size:
+            raise UT_ValueError(DataSize, f'= {Size} - string length',
+                                                                SkipFrames = 1)
+        Result = cls.__new__(cls)
+        _setLazyView(Result, (View, BigEndian))
+        _setPackedCache(Result, None)
+        return Result
     
-    Version 1.0.0.0
-    """
+    @classmethod
+    def decodeColumns(cls, Data: TBuffer, BigEndian: Optional[bool] = None
+                                    ) -> Dict[str, Union[array.array, TList]]:
+        """
+        Class method to de-serialize a buffer consisting of a number of
+        back-to-back bytes representations of the same fixed size class into
+        columns, i.e. one sequence of values per 'leaf' field, without creation
+        of the per record instances. The names of the nested fields / elements
+        are joined with dots, e.g. 'c.a' or 'd.0'. The optional argument
+        BigEndian is interpreted either as None or as boolean value regardless
+        of its actual data type.
+        
+        The integer and floating point columns are returned as array.array
+        objects of the matching item size, the columns of other C primitive
+        types (c_bool, c_char, c_wchar, etc.) - as lists. Each column is
+        decoded directly from the buffer by a cached strided struct codec of
+        its 'leaf', if available, otherwise value by value.
+        
+        Signature:
+            bytes-like /, bool OR None/
+                -> dict(str -> array.array OR list(type A))
+        
+        Args:
+            Data: bytes-like; concatenated bytes representations of records
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            dict(str -> array.array OR list(type A)): 'leaf' field name to all
+                its values in the order of the records
+        
+        Raises:
+            UT_TypeError: passed argument is not a bytes-like object OR the
+                class data structure is wrongly defined OR the class is not of
+                fixed size
+            UT_ValueError: the length of the buffer is not a multiple of the
+                size of the declared class data structure
+        
+        Version 1.1.0.0
+        """
+        View = _getByteView(Data)
+        if View is None:
+            raise UT_TypeError(Data, (bytes, bytearray, memoryview),
+                                                                SkipFrames = 1)
+        Result = dict()
+        with View:
+            Size = type.__getattribute__(cls, '_getRecordSize')(View)
+            Getter = type.__getattribute__(cls, '_getColumnCodecs')
+            DataSize = len(View)
+            for Name, CType, Offset, Codec in Getter(BigEndian):
+                Code = _getArrayCode(CType)
+                Column = list() if Code is None else array.array(Code)
+                if not DataSize:
+                    pass
+                elif not (Codec is None):
+                    Column.extend(itertools.chain.from_iterable(
+                                                    Codec.iter_unpack(View)))
+                else:
+                    ItemSize = ctypes.sizeof(CType)
+                    Column.extend(Bytes2Scalar(View[Start : Start + ItemSize],
+                                                CType, BigEndian = BigEndian)
+                                for Start in range(Offset, DataSize, Size))
+                Result[Name] = Column
+        return Result
     
-    #special methods
+    @classmethod
+    def decodeNumpyColumns(cls, Data: TBuffer,
+                        BigEndian: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Class method to interpret a buffer consisting of a number of
+        back-to-back bytes representations of the same fixed size class as
+        columns, i.e. one NumPy array per 'leaf' field, without copying of the
+        data. The columns are strided views of the buffer, thus they are
+        read-only for the immutable buffers, e.g. bytes. The names of the
+        nested fields / elements are joined with dots, e.g. 'c.a' or 'd.0',
+        exactly as by the method decodeColumns(). The optional argument
+        BigEndian is interpreted either as None or as boolean value regardless
+        of its actual data type.
+        
+        Signature:
+            bytes-like /, bool OR None/ -> dict(str -> numpy.ndarray)
+        
+        Args:
+            Data: bytes-like; concatenated bytes representations of records
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            dict(str -> numpy.ndarray): 'leaf' field name to the 1-dimensional
+                view of all its values in the order of the records
+        
+        Raises:
+            ImportError: NumPy is not installed
+            UT_TypeError: passed argument is not a bytes-like object OR the
+                class data structure is wrongly defined OR the class is not of
+                fixed, non-zero size OR it has no NumPy equivalent
+            UT_ValueError: the length of the buffer is not a multiple of the
+                size of the declared class data structure
+        
+        Version 1.0.0.0
+        """
+        Records = cls.unpackNumpy(Data, BigEndian = BigEndian)
+        LeavesTable = type.__getattribute__(cls, '_getLeavesTable')()
+        Result = dict()
+        for Name, _, _ in LeavesTable:
+            Column = Records
+            for Part in Name.split('.'):
+                if Column.ndim > 1:
+                    Column = Column[:, int(Part)]
+                else:
+                    Column = Column[Part]
+            Result[Name] = Column
+        return Result
     
-    def __init__(self, Data: Any = None) -> None:
+    @classmethod
+    def getFieldOffsets(cls) -> Dict[str, Tuple[int, TIntNone]]:
         """
-        Initialization method. Does nothing. Added for the consistent signature.
+        Class method to obtain the byte offsets and sizes of all fields within
+        the bytes representation of the class, including the nested fields /
+        elements at any depth under their dotted names, e.g. 'c', 'c.a' or
+        'd.0.a'. The elements of the dynamic length arrays are not included.
         
         Signature:
-            /type A/ -> None
+            None -> dict(str -> tuple(int >= 0, int > 0 OR None))
         
-        Args:
-            Data: (optional) type A; simply ignored even if provided
+        Returns:
+            dict(str -> tuple(int >= 0, int > 0 OR None)): per field - its
+                offset in bytes and size in bytes (None for the dynamic length
+                field), in the 'depth first' order
+        
+        Raises:
+            UT_TypeError: wrong definition of the data structure
         
         Version 1.0.0.0
         """
-        pass
-    
-    #private methods
+        NodesTable = type.__getattribute__(cls, '_getNodesTable')()
+        return {Name : (Offset, Size)
+                        for Name, (_, Offset, Size) in NodesTable.items()}
     
     @classmethod
-    def _checkObjectContent(cls, Data: None) -> None:
+    def _getNode(cls, Path: str) -> Tuple[TElement, int, TIntNone]:
         """
-        Private class method to check if the extracted JSON object matches the
-        declared data structure of the class. Only None value is acceptable.
+        Private class method to look-up a field by its dotted name.
         
         Signature:
-            None-> None
+            str -> tuple(type A, int >= 0, int > 0 OR None)
         
         Args:
-            Data: None; any other value is an error
+            Path: str; dotted name of the field, e.g. 'c.a' or 'd.0'
+        
+        Returns:
+            tuple(type A, int >= 0, int > 0 OR None): declared type, offset in
+                bytes and size in bytes (None for the dynamic length field)
         
         Raises:
-            UT_TypeError: any value but None is recieved
+            UT_TypeError: wrong definition of the data structure OR the path
+                is not a string
+            UT_AttributeError: the field is not found
         
         Version 1.0.0.0
         """
-        if not (Data is None):
-            raise UT_TypeError(Data, type(None), SkipFrames = 2)
+        if not isinstance(Path, str):
+            raise UT_TypeError(Path, str, SkipFrames = 2)
+        NodesTable = type.__getattribute__(cls, '_getNodesTable')()
+        Node = NodesTable.get(Path, None)
+        if Node is None:
+            raise UT_AttributeError(cls, Path, SkipFrames = 2)
+        return Node
     
     @classmethod
-    def _parseBuffer(cls, Data: bytes, BigEndian: Optional[bool] =None) -> None:
+    def peekField(cls, Buffer: TBuffer, Path: str,
+                                    BigEndian: Optional[bool] = None) -> Any:
         """
-        Private class method to parse the content of the passed byte string into
-        a native Python object using the class data structure definition. Only
-        an empty bytestring is allowed.
+        Class method to read a single (nested) field directly from the bytes
+        representation of the class without de-serialization of the entire
+        struct. Only the bytes of that field are parsed, and the buffer must be
+        only long enough to hold the field. The optional argument BigEndian is
+        interpreted either as None or as boolean value regardless of its
+        actual data type.
         
         Signature:
-            bytes /, bool OR None/ -> None
+            bytes-like, str/, bool OR None/ -> type A
         
         Args:
-            Data: bytes; only an empty bytestring is acceptable
-            BigEndian: (optional) bool OR None; ignored
+            Buffer: bytes-like; (starting part of) the bytes representation
+            Path: str; dotted name of the field, e.g. 'c.a' or 'd.0'
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            type A: native Python value for the C primitive type fields,
+                otherwise a new instance of the declared type of the field;
+                the dynamic length field consumes the rest of the buffer
         
         Raises:
-            UT_ValueError: size of the passed 
+            UT_TypeError: passed buffer is not a bytes-like object OR the path
+                is not a string OR the class data structure is wrongly defined
+            UT_AttributeError: the field is not found
+            UT_ValueError: the buffer is too short to hold the field OR the
+                size of the dynamic length field is not matching
         
         Version 1.0.0.0
         """
-        if len(Data):
-            raise UT_ValueError(repr(Data), 'empty bytestring', SkipFrames = 2)
+        FieldType, Offset, Size = type.__getattribute__(cls, '_getNode')(Path)
+        View = _getByteView(Buffer)
+        if View is None:
+            raise UT_TypeError(Buffer, (bytes, bytearray, memoryview),
+                                                                SkipFrames = 1)
+        with View:
+            DataSize = len(View)
+            End = DataSize if Size is None else Offset + Size
+            if (Offset > DataSize) or (End > DataSize):
+                raise UT_ValueError(DataSize,
+                            f'>= {max(Offset, End)} - buffer length',
+                                                                SkipFrames = 1)
+            IsScalar = IsC_Scalar(FieldType)
+            Code = _getStructCode(FieldType) if IsScalar else None
+            if not (Code is None):
+                Key = None if BigEndian is None else bool(BigEndian)
+                Format = _ENDIANNESS_PREFIXES[Key] + Code
+                return struct.unpack_from(Format, View, Offset)[0]
+            with View[Offset : End] as Chunk:
+                if IsScalar:
+                    Result = Bytes2Scalar(Chunk, FieldType,
+                                                        BigEndian = BigEndian)
+                else:
+                    Unpacker = type.__getattribute__(FieldType,
+                                                            '_unpackObject')
+                    Result = Unpacker(Chunk, BigEndian = BigEndian)
+        return Result
     
     @classmethod
-    def _checkDefinition(cls) -> None:
+    def patchField(cls, Buffer: TBuffer, Path: str, Value: Any,
+                                    BigEndian: Optional[bool] = None) -> None:
         """
-        Private class method to check the definition of the data structure of
-        the class. Supposed to be called by all class methods, including the
-        unpacking (constructors), and the initialization instance method.
-        Does nothing.
+        Class method to overwrite a single (nested) field directly in the bytes
+        representation of the class held by a writable buffer without
+        de-serialization and serialization of the entire struct. The buffer
+        must be only long enough to hold the field. The optional argument
+        BigEndian is interpreted either as None or as boolean value regardless
+        of its actual data type.
         
         Signature:
-            None -> None
+            bytes-like, str, type A/, bool OR None/ -> None
+        
+        Args:
+            Buffer: bytes-like; writable C-contiguous object supporting the
+                buffer protocol, e.g. bytearray or memoryview of it
+            Path: str; dotted name of the field, e.g. 'c.a' or 'd.0'
+            Value: type A; new value of the field, compatible with its declared
+                type - a native Python value or an instance of a serializable
+                class for the nested structs and arrays
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Raises:
+            UT_TypeError: passed buffer is not a writable bytes-like object OR
+                the path is not a string OR the class data structure is wrongly
+                defined OR the value is not compatible with the declared type
+                of the field
+            UT_AttributeError: the field is not found
+            UT_ValueError: the buffer is too short to hold the field OR the
+                size of the new value of the dynamic length field does not
+                match the rest of the buffer OR an element of the value is not
+                compatible with the declared type
         
         Version 1.0.0.0
         """
-        pass
-    
-    #public API
+        FieldType, Offset, Size = type.__getattribute__(cls, '_getNode')(Path)
+        if IsC_Scalar(FieldType):
+            try:
+                Data = Scalar2Bytes(Value, FieldType, BigEndian = BigEndian)
+            except (TypeError, ValueError):
+                Error = UT_TypeError(Value, FieldType, SkipFrames = 1)
+                Error.appendMessage('type compatible')
+                raise Error from None
+        else:
+            if not isinstance(Value, FieldType):
+                Value = FieldType(Value)
+            Data = Value.packBytes(BigEndian = BigEndian)
+        View = _getByteView(Buffer)
+        if (View is None) or View.readonly:
+            if not (View is None):
+                View.release()
+            raise UT_TypeError(Buffer, (bytearray, memoryview), SkipFrames = 1)
+        with View:
+            DataSize = len(View)
+            End = Offset + len(Data)
+            if (Size is None) and (End != DataSize):
+                raise UT_ValueError(len(Data),
+                            f'= {DataSize - Offset} - field length',
+                                                                SkipFrames = 1)
+            if End > DataSize:
+                raise UT_ValueError(DataSize, f'>= {End} - buffer length',
+                                                                SkipFrames = 1)
+            View[Offset : End] = Data
     
-    @classmethod
-    def getSize(cls) -> int:
+    def getCurrentSize(self) -> int:
         """
-        Method to obtain the declared size in bytes of the stored data.
+        Method to obtain the total size of the currently stored data in bytes.
         
         Signature:
-            None -> int = 0
-        
-        Returns:
-            int = 0: always zero value is returned
+            None -> int >= 0
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        return 0
+        FieldsTable = type(self)._getFieldsTable()
+        Size = 0
+        if len(FieldsTable):
+            LastName, LastType, _, Offset, LastSize = FieldsTable[-1]
+            Size = Offset
+            if not (LastSize is None):
+                Size += LastSize
+            elif hasattr(LastType, 'getCurrentSize'):
+                Size += getattr(self, LastName).getCurrentSize()
+            else:
+                Size += (len(getattr(self, LastName)) *
+                                                    LastType.getElementSize())
+        return Size
     
-    def getNative(self) -> None:
+    def getNative(self) -> TDict:
         """
         Method for convertion of the stored data into native Python data type.
         
         Signature:
-            None -> None
+            None -> dict(str -> type A)
         
         Returns:
-            None: native Python type representation of the stored data
+            dict(str -> type A): native Python type representation of the stored
+                data
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        return None
+        if not (_getLazyView(self) is None):
+            type(self)._loadAll(self)
+        Result = dict()
+        FieldsTable = type(self)._getFieldsTable()
+        for strName, _, IsScalar, _, _ in FieldsTable:
+            gItem = _getField(self, strName)
+            if IsScalar:
+                Result[strName] = gItem
+            else:
+                Result[strName] = gItem.getNative()
+        return Result
     
     def packBytes(self, BigEndian: Optional[bool] = None) -> bytes:
         """
-        Method for serialization of the stored data into bytes.
+        Method for serialization of the stored data into bytes. The optional
+        argument BigEndian is interpreted either as None or as boolean value
+        regardless of its actual data type. The result is cached per byte
+        order until the stored data, including the nested objects, is
+        modified.
         
         Signature:
             /bool OR None/ -> bytes
         
         Args:
-            BigEndian: (optional) bool OR None; ignored
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
         
         Returns:
-            bytes: an empty bytestring
+            bytes: bytestring representing the entire stored data
+        
+        Version 1.4.0.0
+        """
+        Result = _getPackedBytes(self, BigEndian)
+        if not (Result is None):
+            return Result
+        Codec = type(self)._getCodec(BigEndian)
+        if not (Codec is None):
+            Leaves = type(self)._getGenerated().Leaves(self)
+            Result = Codec.pack(*Leaves)
+        else:
+            if not (_getLazyView(self) is None):
+                type(self)._loadAll(self)
+            FieldsTable = type(self)._getFieldsTable()
+            RawValues = list()
+            for Field, FieldType, IsScalar, _, _ in FieldsTable:
+                Value = _getField(self, Field)
+                if IsScalar:
+                    RawValues.append(Scalar2Bytes(Value, FieldType,
+                                                        BigEndian = BigEndian))
+                else:
+                    RawValues.append(Value.packBytes(BigEndian = BigEndian))
+            Result = b''.join(RawValues)
+        _storePackedBytes(self, Result, BigEndian)
+        return Result
+    
+    def enableTemplate(self, BigEndian: Optional[bool] = None) -> None:
+        """
+        Method to switch on the packed template mode for the specified byte
+        order. The instance keeps a persistent bytearray image of its bytes
+        representation, and any later assignment to a C primitive type field
+        or element, at any nesting level, overwrites only the respective bytes
+        of the image. The method packBytes() called with the same byte order
+        returns a copy of the image instead of re-packing the data. Only one
+        byte order is supported at a time; the template for the other byte
+        order is replaced.
+        
+        Signature:
+            /bool OR None/ -> None
+        
+        Args:
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
         
         Version 1.0.0.0
         """
-        return b''
+        Key = None if BigEndian is None else bool(BigEndian)
+        Image = bytearray(self.packBytes(BigEndian = Key))
+        _linkPackedCache(self).Template = (Image, Key)
+    
+    def disableTemplate(self) -> None:
+        """
+        Method to switch off the packed template mode and to drop the image.
+        Does nothing if the mode is not on.
+        
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        Cache = _getPackedCache(self)
+        if not (Cache is None):
+            Cache.Template = None
 
-class SerStruct(Serializable):
+class SerArray(Serializable):
     """
-    Implements auto-serilizable and de-serializable object representing C-struct
+    Implements auto-serilizable and de-serializable object representing C-array
     like structured data storage. Can be instantiate without an argument or
-    with a single optional argument of a mapping type or another structure.
-    
-    Sub-classes must define their fields in the private class attribute
-    _Fields as a tuple of 2-tuples ('name': type), where type might be either
-    a ctypes primitive type or SerStruct, SerArray or SerDynamicArray. The
-    dynamic length object is allowed only as the last field!
+    with a single optional argument of a sequence type or another array.
     
     Class methods:
         getSize():
             None -> int >= 0 OR None
-        unpackBytes(Data, BigEndian = None):
-            bytes /, bool OR None/ -> 'SerStruct
-        unpackJSON(Data):
-            str -> 'SerStruct
-        getMinSize():
-            None -> int >= 0
+        unpackBytes(Data, BigEndian = None, Trusted = None):
+            bytes-like /, bool OR None, bool OR None/ -> 'SerArray
+        unpackFrom(Buffer, Offset = 0, BigEndian = None):
+            bytes-like /, int >= 0, bool OR None/ -> tuple('SerArray, int)
+        unpackInto(Instance, Data, BigEndian = None):
+            'SerArray, bytes-like /, bool OR None/ -> 'SerArray
+        acquire():
+            None -> 'SerArray
+        release(Instance):
+            'SerArray -> None
+        iterUnpack(Data, BigEndian = None):
+            bytes-like /, bool OR None/ -> iterator('SerArray)
+        unpackMany(Data, BigEndian = None):
+            bytes-like /, bool OR None/ -> list('SerArray)
+        unpackJSON(Data, Trusted = None):
+            str/, bool OR None/ -> 'SerArray
+        loadJSONLines(File, Trusted = None):
+            iter(str OR bytes)/, bool OR None/ -> iterator('SerArray)
+        getNumpyDtype(BigEndian = None):
+            /bool OR None/ -> numpy.dtype
+        unpackNumpy(Data, BigEndian = None):
+            bytes-like /, bool OR None/ -> numpy.ndarray
+        getCType(BigEndian = None):
+            /bool OR None/ -> type
+        mapBuffer(Buffer, Offset = 0, BigEndian = None):
+            bytes-like/, int >= 0, bool OR None/
+                -> ctypes.Structure OR ctypes.Array
+        getGeneratedSource():
+            None -> str OR None
     
     Methods:
         packBytes(BigEndian = None):
             /bool OR None/ -> bytes
+        packInto(Buffer, Offset, BigEndian = None):
+            bytes-like, int >= 0/, bool OR None/ -> int >= 0
         packJSON():
             None -> str
         getNative():
-            None -> dict(str -> type A)
-        getCurrentSize():
-            None -> int >= 0
+            None -> list(type A)
     
-    Version 1.0.1.1
+    Version 1.15.1.0
     """
     
     #private class attributes - data structure definition
     
-    _Fields: ClassVar[Tuple[Tuple[str, TElement], ...]] = tuple()
-    #must be a tuple(tuple(str, type A)), where type A is either C primitive
-    #+ or a serializable structure / array
+    _ElementType: ClassVar[TElement] = ctypes.c_int32
+    
+    _Length: ClassVar[int] = 0 #number of elements, must be > 0
+    
+    #instance storage
+    
+    __slots__ = ('_Data', ) #list OR array.array of the elements
     
     #special methods
     
-    def __setattr__(self, name: str, value: Any) -> NoReturn:
+    def __len__(self) -> int:
         """
-        Special method to hook into the write access to the attributes. Prohibs
-        assignment to any attribute except the declared fields, from which only
-        the C primitive type fields can be assigned to and only if the value
-        is compatible with the declared type.
+        Magic method to implement the support for the built-in len() function,
+        in order to get the length of the array.
+        
+        Signature:
+            None -> int >= 0
+        
+        Returns:
+            int >= 0: the current length of the array
+        
+        Version 1.0.0.0
+        """
+        return len(_getArrayData(self))
+    
+    def __getitem__(self, Index: int) -> Any:
+        """
+        Magic method implementing the read access to an element of the array by
+        its index. For the C primitive declared data type of the elements the
+        returned value is a native Python scalar type (int, float, etc.),
+        otherwise the stored object (reference to) is returned.
+        
+        Signature:
+            int -> type A
+        
+        Args:
+            iIndex: int; the index of the element to be accesed
+        
+        Raises:
+            UT_IndexError: the value of the index is outside the range OR it is
+                not an integer number
+        
+        Version 1.0.0.1
+        """
+        if not isinstance(Index, int):
+            raise UT_IndexError(self.__name__, Index, SkipFrames = 1)
+        Data = _getArrayData(self)
+        Length = len(Data)
+        if (Index > (Length - 1)) or (Index < (- Length)):
+            raise UT_IndexError(self.__name__, Index, SkipFrames = 1)
+        return Data[Index]
+    
+    def __setitem__(self, Index: int, Value: Any) -> None:
+        """
+        Magic method implementing the write access to an element of the array by
+        its index. Assignment is allowed only if the declared type of the
+        elements is C primitive and the passed value is compatible with the
+        declared type. The assignment invalidates the cached bytes
+        representation of the array and of all objects it is nested into.
+        
+        Signature:
+            int, type A -> None
+        
+        Args:
+            Index: int; the index of the element to be accesed
+            Value: type A; value to be assigned to that element
+        
+        Raises:
+            UT_TypeError: the passed value's type is not compatible with the
+                declared type of the elements OR the declared data type is not C
+                primitive
+            UT_IndexError: the value of the index is outside the range OR it is
+                not an integer number
+        
+        Version 1.1.1.0
+        """
+        if not isinstance(Index, int):
+            raise UT_IndexError(self.__name__, Index, SkipFrames = 1)
+        Data = _getArrayData(self)
+        Length = len(Data)
+        if (Index > (Length - 1)) or (Index < (- Length)):
+            raise UT_IndexError(self.__name__, Index, SkipFrames = 1)
+        ElementType = type(self)._ElementType
+        if not IsC_Scalar(ElementType):
+            Error = UT_TypeError(ElementType, ctypes._SimpleCData,
+                                                                SkipFrames = 1)
+            Error.appendMessage('- immutable elements')
+            raise Error
+        try:
+            NewValue = ElementType(Value)
+        except (TypeError, ValueError):
+            Error = UT_TypeError(Value, ElementType, SkipFrames = 1)
+            Error.appendMessage('type compatible')
+            raise Error from None
+        Data[Index] = NewValue.value
+        del NewValue
+        _dropPackedBytes(self, Index, Data[Index])
+    
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Magic method to implement iteration over the content of the array as in
+        the construction 'for ... in ..'.
         
         Signature:
-            str, type A -> None
-        
-        Raises:
-            UT_AttributeError: assignment to a not declared C privite type field
-            UT_TypeError: value is incompatible with the declared type of the
-                field
+            None -> iter(type A)
         
-        Version 1.0.0.1
+        Version 1.0.0.0
         """
-        Fields = object.__getattribute__(self, '_Fields')
-        FiledsTypes = {Key : Type_ for Key, Type_ in Fields}
-        if (name in FiledsTypes) and (IsC_Scalar(FiledsTypes[name])):
-            try:
-                NewValue = FiledsTypes[name](value)
-            except (TypeError, ValueError):
-                Error = UT_TypeError(value, FiledsTypes[name], SkipFrames = 1)
-                Error.appendMessage('type compatible')
-                raise Error from None
-            object.__setattr__(self, name, NewValue.value)
-            del NewValue
-        elif not (name in FiledsTypes):
-            raise UT_AttributeError(self, name, SkipFrames = 1)
-        else:
-            Error = UT_TypeError(FiledsTypes[name], ctypes._SimpleCData,
-                                                                 SkipFrames = 1)
-            Error.appendMessage('- immutable field')
-            raise Error
-        del FiledsTypes
+        return iter(_getArrayData(self))
     
-    def __init__(self, Data: Optional[Union[TMap, Serializable]]=None) -> None:
+    def __init__(self, Data: Optional[Union[TSeq, Serializable]]=None) -> None:
         """
-        Initialization method - copies the data from the same named keys /
-        fields of the passed object into the respective fields of the created
-        instance.
+        Initialization method - copies the data from the passed sequence per
+        element. If the length of the passed sequence equals to or exceeds the
+        declared length of the array N, only the those N first elements are
+        copied, and the rest is ignored. Otherwise, all elements of the passed
+        sequence / array are copied into the first elements of the array being
+        created, and the remaining tailing elements are filled with the default
+        values for the declared data type of the elements.
         
         Signature:
-            /dict(str -> type A) OR SerStruct/ -> None
+            /seq(str -> type A) OR 'SerArray/ -> None
         
         Args:
-            Data: (optional) dict(str -> type A) OR SerStruct; dictionary or
-                another instance of SerStruct class
+            Data: (optional) seq(str -> type A) OR 'SerArray; sequence or an
+                instance of SerArray (sub-) class
         
         Raises:
-            UT_TypeError: passed argument is not a mapping type or an instance
-                of sub-class of SerStruct OR the data structure of the class
-                is not defined properly
-            UT_ValueError: not matching data type in one of the key:value pairs,
-                concerning the declared data type for this field
+            UT_TypeError: passed argument is not a sequence type or an instance
+                of sub-class of SerArray or SerDynamicArray OR the data
+                structure of the class is improperly defined
+            UT_ValueError: not matching data type in one of the elements,
+                concerning the declared data type for the array elements
         
-        Version 1.0.0.1
+        Version 1.2.1.0
         """
-        TypeChecker = object.__getattribute__(self, '_checkDefinition')
-        TypeChecker() #UT_TypeError may be raised
+        Checker = type(self)._checkDefinition
+        Checker() #UT_TypeError may be raised
         if not (Data is None):
-            if not isinstance(Data, (collections.abc.Mapping, SerStruct)):
-                raise UT_TypeError(Data, (collections.abc.Mapping, SerStruct),
+            Cond1 = not isinstance(Data, (collections.abc.Sequence, SerArray))
+            Cond2 = isinstance(Data, (str, bytes))
+            if Cond1 or Cond2:
+                raise UT_TypeError(Data, (collections.abc.Sequence, SerArray),
                                                                 SkipFrames = 1)
-            Source = Data
+            InputLength = len(Data)
         else:
-            Source = dict()
-        Fields = object.__getattribute__(self, '_Fields')
-        FieldsContent = dict()
-        for Field, DataType in Fields:
-            IsFound = False
-            if (isinstance(Source, collections.abc.Mapping)
-                                                        and (Field in Source)):
-                PassedValue = Source[Field]
-                IsFound = True
-            elif isinstance(Source, SerStruct) and hasattr(Source, Field):
-                PassedValue = getattr(Source, Field)
-                IsFound = True
-            if IsFound:
+            InputLength = 0
+        ElementType = type(self)._ElementType
+        Length = type(self)._Length
+        if InputLength and IsC_Scalar(ElementType):
+            if isinstance(Data, SerArray):
+                Values = _getArrayData(Data)[:Length]
+            else:
+                Values = list(itertools.islice(Data, Length))
+            Elements = _convertScalars(Values, ElementType)
+            if not (Elements is None):
+                if InputLength < Length:
+                    Elements.extend(
+                        [ElementType().value] * (Length - InputLength))
+                _setArrayData(self, Elements)
+                _setPackedCache(self, None)
+                return
+        Elements = []
+        for Index in range(Length):
+            if Index < InputLength:
                 try:
-                    FieldValue = DataType(PassedValue)
+                    NewElement = ElementType(Data[Index])
                 except (ValueError, TypeError):
-                    ErrorMessage='being compatible with {} for field {}'.format(
-                                                    DataType.__name__, Field)
-
-                    raise UT_ValueError(PassedValue, ErrorMessage,
+                    Message = 'being compatible with {} at index {}'.format(
+                                                    ElementType.__name__, Index)
+                    
+                    raise UT_ValueError(Data[Index], Message,
                                                     SkipFrames = 1) from None
             else:
-                FieldValue = DataType()
-            if IsC_Scalar(DataType):
-                FieldsContent[Field] = FieldValue.value
-                del FieldValue
+                NewElement = ElementType()
+            if IsC_Scalar(ElementType):
+                Elements.append(NewElement.value)
+                del NewElement
             else:
-                FieldsContent[Field] = FieldValue
-            for Field, Value in FieldsContent.items():
-                object.__setattr__(self, Field, Value)
+                Elements.append(NewElement)
+        if IsC_Scalar(ElementType):
+            Elements = _compactScalars(Elements, ElementType)
+        _setArrayData(self, Elements)
+        _setPackedCache(self, None)
     
     #private methods
     
     @classmethod
-    def _checkObjectContent(cls, Data: TDict) -> None:
+    def _checkObjectContent(cls, Data: TList) -> None:
         """
         Private class method to check if the extracted JSON object matches the
-        declared data structure of the class.
-        
-        Signature:
-            dict(str -> type A) -> None
-        
-        Args:
-            Data: dict(str -> type A); data to be checked
-        
-        Raises:
-            UT_TypeError: the type of the passed argument is not compatible with
-                the class
-            UT_ValueError: the internal structure of the passed object does not
-                match the defined class structure
-        
-        Version 1.0.0.1
-        """
-        if not isinstance(Data, dict):
-            raise UT_TypeError(Data, dict, SkipFrames = 2)
-        Fields = type.__getattribute__(cls, '_Fields')
-        DeclaredFields = []
-        for Field, FieldType in Fields:
-            DeclaredFields.append(Field)
-            if not (Field in Data):
-                raise UT_ValueError(Field, 'key being present in data',
-                                                                SkipFrames= 2)
-            Value = Data[Field]
-            IsScalar = IsC_Scalar(FieldType)
-            try:
-                if IsScalar:
-                    Temp = FieldType(Value)
-                    del Temp
-                else:
-                    Checker = type.__getattribute__(FieldType,
-                                                        '_checkObjectContent')
-                    Checker(Value)
-            except (TypeError, ValueError):
-                raise UT_ValueError(Value,
-                    f'compatible with {FieldType.__name__} type at key {Field}',
-                        SkipFrames= 2) from None
-        for Key in Data:
-            if not (Key in DeclaredFields):
-                raise UT_ValueError(Key, 'being declared field', SkipFrames= 2)
-    
-    @classmethod
-    def _parseBuffer(cls, Data: bytes,
-                                    BigEndian: Optional[bool] = None) -> TDict:
-        """
-        Private class method to parse the content of the passed byte string into
-        a native Python object using the class data structure definition.
+        declared data structure of the class. The length of the passed list
+        is checked only for the fixed length arrays. The check is performed by
+        the generated validator of the class, the elements are looked through
+        one by one only to locate the first mismatch for the error message.
         
         Signature:
-            bytes /, bool OR None/ -> dict(str -> type A)
+            list(type A) -> None
         
         Args:
-            Data: bytes; data to be checked
-            BigEndian: (optional) bool OR None; 3-way selector to indicate the
-                desired endianness - the default value is None, meaning native,
-                passed True value forces big endian format, passed False value
-                forces little endian format.
-        
-        Raises:
-            UT_ValueError: size of the passed bytestring does not match the
-                declared data structure size
-        
-        Version 1.0.0.1
-        """
-        Size = cls.getSize()
-        DataSize = len(Data)
-        if Size is None:
-            MinSize = cls.getMinSize()
-            if DataSize < MinSize:
-                raise UT_ValueError(DataSize, f'> {MinSize} - string length',
-                                                                SkipFrames = 2)
-        elif DataSize != Size:
-            raise UT_ValueError(DataSize, f'= {Size} - string length',
-                                                                SkipFrames = 2)
-        Fields = type.__getattribute__(cls, '_Fields')
-        NewValues = dict()
-        ProcessedBytes = 0
-        for Field, FieldType in Fields[:-1]:
-            if IsC_Scalar(FieldType):
-                ElementSize = ctypes.sizeof(FieldType)
-                DataSlice = Data[ProcessedBytes : ProcessedBytes + ElementSize]
-                NewValues[Field] = Bytes2Scalar(DataSlice, FieldType,
-                                                        BigEndian = BigEndian)
-            else:
-                ElementSize = FieldType.getSize()
-                DataSlice = Data[ProcessedBytes : ProcessedBytes + ElementSize]
-                Temp = FieldType.unpackBytes(DataSlice, BigEndian= BigEndian)
-                NewValues[Field] = Temp.getNative()
-                del Temp
-            ProcessedBytes += ElementSize
-        DataSlice = Data[ProcessedBytes : ]
-        LastField, LastType = Fields[-1]
-        if IsC_Scalar(LastType):
-            NewValues[LastField] = Bytes2Scalar(DataSlice, LastType,
-                                                        BigEndian = BigEndian)
-        else:
-            try:
-                Temp = LastType.unpackBytes(DataSlice, BigEndian= BigEndian)
-                NewValues[LastField] = Temp.getNative()
-                del Temp
-            except UT_ValueError as err:
-                BytesRemain = DataSize - ProcessedBytes
-                Message = 'byte size for type {} of field {} - {}'.format(
-                                LastType.__name__, LastField, err.getMessage())
-                Error = UT_ValueError(BytesRemain, Message, SkipFrames = 1)
-                raise Error from None
-        return NewValues
-    
-    @classmethod
-    def _checkDefinition(cls) -> None:
-        """
-        Private class method to check the definition of the data structure of
-        the class. Supposed to be called by all class methods, including the
-        unpacking (constructors), and the initialization instance method.
-        
-        Signature:
-            None -> None
+            Data: list(type A); data to be checked
         
         Raises:
-            UT_TypeError: required class private attributes are missing OR
-                OR they hold wrong type vales OR fields type declaration is
-                incorrect
-        
-        Version 1.0.0.1
-        """
-        for Name in ('_Fields', ):
-            try:
-                type.__getattribute__(cls, Name)
-            except AttributeError:
-                Error = UT_TypeError(1, int, SkipFrames = 2)
-                ErrorMessage = 'Wrong definition of {} - {} is missing'.format(
-                                                        cls.__name__, Name)
-                Error.setMessage(ErrorMessage)
-                raise Error from None
-        #check _Field attribute 
-        Fields = type.__getattribute__(cls, '_Fields')
-        if not isinstance(Fields, tuple):
-            Error = UT_TypeError(Fields, tuple, SkipFrames = 2)
-            ErrorMessage = 'Wrong definition of {}._Fields - {}'.format(
-                                            cls.__name__, Error.getMessage())
-            Error.setMessage(ErrorMessage)
-            raise Error
-        LastPosition = len(Fields) - 1
-        for Index, Definition in enumerate(Fields):
-            BaseMessage = ''.join(['Wrong definition of ', cls.__name__,
-                            f'._Fields - {Definition} at position {Index} '])
-            if (not isinstance(Definition, tuple)) or len(Definition) !=2:
-                Error = UT_TypeError(Definition, tuple, SkipFrames = 2)
-                Message = f'{BaseMessage} {Error.getMessage()} of size 2'
-                Error.setMessage(Message)
-                raise Error
-            #check field declaration
-            FieldName = Definition[0]
-            if not isinstance(FieldName, str):
-                Error = UT_TypeError(FieldName, str, SkipFrames = 2)
-                Message = f'{BaseMessage} {Error.getMessage()}'
-                Error.setMessage(Message)
-                raise Error
-            ElementType = Definition[1]
-            if not IsC_Scalar(ElementType):
-                try:
-                    IsSubClass = issubclass(ElementType, (SerArray, SerStruct))
-                except TypeError: #built-in data type
-                    Error = UT_TypeError(ElementType,
-                                    (ctypes._SimpleCData, SerArray, SerStruct),
-                                                                SkipFrames = 2)
-                    Message = f'{BaseMessage} {Error.getMessage()}'
-                    Error.setMessage(Message)
-                    raise Error from None
-                if (IsSubClass and (ElementType.getSize() is None) and 
-                                                        Index != LastPosition):
-                    #dynamic not in final position
-                    Error = UT_TypeError(1, int, SkipFrames = 2)
-                    Message = '{} - dynamic {} not in final position'.format(
-                                            BaseMessage, ElementType.__name__)
-                    Error.setMessage(Message)
-                    raise Error
-                elif not IsSubClass:
-                    Error = UT_TypeError(ElementType,
-                                    (ctypes._SimpleCData, SerArray, SerStruct),
-                                                                SkipFrames = 2)
-                    Message = f'{BaseMessage} {Error.getMessage()}'
-                    Error.setMessage(Message)
-                    raise Error
-    
-    #public API
+            UT_TypeError: the type of the passed argument is not compatible with
+                the class
+            UT_ValueError: the internal structure of the passed object does not
+                match the defined class structure
+        
+        Version 1.1.0.0
+        """
+        if type.__getattribute__(cls, '_getValidator')()(Data):
+            return
+        if not isinstance(Data, list):
+            raise UT_TypeError(Data, list, SkipFrames = 2)
+        if not (cls.getSize() is None):
+            Length = type.__getattribute__(cls, '_Length')
+            DataLength = len(Data)
+            if Length != DataLength:
+                raise UT_ValueError(DataLength,
+                        '= {} - array length'.format(Length), SkipFrames = 2)
+        ElementsType = type.__getattribute__(cls, '_ElementType')
+        IsScalar = IsC_Scalar(ElementsType)
+        if not IsScalar:
+            Validator = type.__getattribute__(ElementsType, '_getValidator')()
+        for Index, Element in enumerate(Data):
+            if IsScalar:
+                try:
+                    _convertScalar(Element, ElementsType)
+                    IsValid = True
+                except (TypeError, ValueError):
+                    IsValid = False
+            else:
+                IsValid = Validator(Element)
+            if not IsValid:
+                raise UT_ValueError(Element,
+                        'compatible with {} type at index {}'.format(
+                        ElementsType.__name__, Index), SkipFrames = 2)
     
     @classmethod
-    def getSize(cls) -> TIntNone:
+    def _generateValidator(cls, Generator: _CodeGenerator) -> List[str]:
         """
-        Method to obtain the full declared size in bytes of the stored data.
+        Private class method to generate the lines of the body of the validator
+        of the JSON data 'v' of the class: the check of the type (and of the
+        length, unless the array is dynamic) of the list, and the check of the
+        elements. The elements of a C primitive type are checked in bulk by
+        the types of the values and by their minimal and maximal values, and
+        the validator of the nested class is mapped onto the elements.
         
         Signature:
-            None -> int > 0 OR None
+            _CodeGenerator -> list(str)
         
-        Returns:
-            * int > 0: size in bytes required to store in byte representation
-                the entire declared data structure - for the fixed size objects
-            * None: indication that the instance is not a fixed size object
+        Args:
+            Generator: _CodeGenerator; accumulator of the generated code
         
-        Raises:
-            UT_TypeError: wrong definition of the data structure
+        Returns:
+            list(str): source code lines of the function body
         
-        Version 1.1.0.1
+        Version 1.0.0.0
         """
-        Checker = type.__getattribute__(cls, '_checkDefinition')
-        Checker() #UT_TypeError may be raised
-        Fields = type.__getattribute__(cls, '_Fields')
-        if not len(Fields):
-            Size = 0
+        if cls.getSize() is None:
+            Lines = ['if not isinstance(v, list):', '    return False']
         else:
-            LastType = Fields[-1][1]
-            if not IsC_Scalar(LastType) and (LastType.getSize() is None):
-                Size = None
+            Length = type.__getattribute__(cls, '_Length')
+            Lines = [f'if not isinstance(v, list) or len(v) != {Length}:',
+                                                            '    return False']
+        ElementsType = type.__getattribute__(cls, '_ElementType')
+        if not IsC_Scalar(ElementsType):
+            Validator = type.__getattribute__(ElementsType, '_getValidator')()
+            Lines.append(f'return all(map({Generator.bind(Validator)}, v))')
+            return Lines
+        Check = _getScalarCheck(ElementsType)
+        if Check is None:
+            Lines.append('for x in v:')
+            Lines.extend(f'    {Line}'
+                        for Line in Generator.checkScalar(ElementsType, 'x'))
+            Lines.append('return True')
+        else:
+            Types, Minimum, Maximum, _ = Check
+            Lines.append(
+                    f'if not {Generator.bind(Types)}.issuperset(map(type, v)):')
+            Lines.append('    return False')
+            if Minimum is None:
+                Lines.append('return True')
             else:
-                Size = 0
-                for _, ElementType in Fields:
-                    if IsC_Scalar(ElementType):
-                        Size += ctypes.sizeof(ElementType)
-                    else:
-                        Size += ElementType.getSize()
-        return Size
+                Lines.append('return not v or ({} <= min(v) and {} >= max(v))'
+                                                .format(Minimum, Maximum))
+        return Lines
     
     @classmethod
-    def getMinSize(cls) -> int:
+    def _parseBuffer(cls, Data: TBuffer,
+                                    BigEndian: Optional[bool] = None) -> TList:
         """
-        Method to obtain the minimal number of bytes required to represent the
-        declared size in bytes of the stored data, excluding the (optional)
-        dynamic length array as the last element.
+        Private class method to parse the content of the passed byte string into
+        a native Python object using the class data structure definition.
         
         Signature:
-            None -> int >= 0
+            bytes-like /, bool OR None/ -> list(type A)
+        
+        Args:
+            Data: bytes-like; data to be checked
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
         
         Returns:
-            int >= 0: size in bytes required to store in byte representation
-                of the fixed size part
+            list(type A): a native Python list containing only native Python
+                data type elements, compatible with the declared array elements
+                type
         
         Raises:
-            UT_TypeError: wrong definition of the data structure
+            UT_ValueError: size of the passed bytestring does not match the
+                declared data structure size
         
-        Version 1.0.0.1
+        Version 1.3.0.0
         """
-        Checker = type.__getattribute__(cls, '_checkDefinition')
-        Checker() #UT_TypeError may be raised
-        Fields = type.__getattribute__(cls, '_Fields')
-        Size = 0
-        if len(Fields):
-            LastType = Fields[-1][1]
-            if not IsC_Scalar(LastType):
-                if LastType.getSize() is None:
-                    CheckFields = Fields[:-1]
-                    if hasattr(LastType, 'getMinSize'):
-                        Size += LastType.getMinSize()
-                else:
-                    CheckFields = Fields
-            else:
-                CheckFields = Fields
-            for _, ElementType in CheckFields:
-                if IsC_Scalar(ElementType):
-                    Size += ctypes.sizeof(ElementType)
-                else:
-                    Size += ElementType.getSize()
-        return Size
+        Size = cls.getSize()
+        Length = type.__getattribute__(cls, '_Length')
+        DataSize = len(Data)
+        if DataSize != Size:
+            raise UT_ValueError(DataSize, '= {} - string length'.format(Size),
+                                                                SkipFrames = 2)
+        Codec = type.__getattribute__(cls, '_getCodec')(BigEndian)
+        if not (Codec is None):
+            Generated = type.__getattribute__(cls, '_getGenerated')()
+            return Generated.Native(Codec.unpack(Data))
+        ElementsType = type.__getattribute__(cls, '_ElementType')
+        if IsC_Scalar(ElementsType):
+            ElementSize = ctypes.sizeof(ElementsType)
+            Result = [Bytes2Scalar(
+                        Data[Index * ElementSize : (Index + 1) * ElementSize],
+                                            ElementsType, BigEndian = BigEndian)
+                                                    for Index in range(Length)]
+        else:
+            ElementSize = ElementsType.getSize()
+            Parser = type.__getattribute__(ElementsType, '_parseBuffer')
+            Result = []
+            for Index in range(Length):
+                DataSplice =  Data[Index * ElementSize : (Index+1)*ElementSize]
+                Result.append(Parser(DataSplice, BigEndian = BigEndian))
+        return Result
     
-    def getCurrentSize(self) -> int:
+    @classmethod
+    def _getLeafFormat(cls) -> Optional[str]:
         """
-        Method to obtain the total size of the currently stored data in bytes.
+        Private class method to obtain the struct module format (without the
+        byte order prefix) of the flattened, i.e. 'leaves' only, data structure
+        of the class.
         
         Signature:
-            None -> int >= 0
+            None -> str OR None
+        
+        Returns:
+            * str: format string of all 'leaves' in the 'depth first' order
+            * None: the elements type is a C primitive type not supported by
+                the struct module, or it has such a 'leaf'
+        
+        Raises:
+            UT_TypeError: wrong definition of the data structure
         
         Version 1.0.0.0
         """
-        Fields = object.__getattribute__(self, '_Fields')
-        Size = 0
-        if len(Fields):
-            LastName, LastType = Fields[-1]
-            for _, ElementType in Fields[:-1]:
-                if IsC_Scalar(ElementType):
-                    Size += ctypes.sizeof(ElementType)
-                else:
-                    Size += ElementType.getSize()
-            if IsC_Scalar(LastType):
-                Size += ctypes.sizeof(LastType)
-            else:
-                LastSize = LastType.getSize()
-                if not (LastSize is None):
-                    Size += LastSize
-                elif hasattr(LastType, 'getCurrentSize'):
-                    Size += getattr(self, LastName).getCurrentSize()
-                else:
-                    Size += (len(getattr(self, LastName)) *
-                                                    LastType.getElementSize())
-        return Size
+        Checker = type.__getattribute__(cls, '_checkDefinition')
+        Checker() #UT_TypeError may be raised
+        ElementsType = type.__getattribute__(cls, '_ElementType')
+        Length = type.__getattribute__(cls, '_Length')
+        if IsC_Scalar(ElementsType):
+            Code = _getStructCode(ElementsType)
+            if not (Code is None):
+                Code = f'{Length}{Code}'
+        else:
+            Code = type.__getattribute__(ElementsType, '_getLeafFormat')()
+            if not (Code is None):
+                Code = Code * Length
+        return Code
     
-    def getNative(self) -> TDict:
+    @classmethod
+    def _getNumpyFormat(cls, Prefix: str) -> Optional[Tuple[Any, Tuple[int]]]:
         """
-        Method for convertion of the stored data into native Python data type.
+        Private class method to obtain the specification of the NumPy
+        sub-array data type equivalent to the data structure of the class.
         
         Signature:
-            None -> dict(str -> type A)
+            str -> tuple(type A, tuple(int > 0)) OR None
+        
+        Args:
+            Prefix: str; byte order character - '=', '>' or '<'
         
         Returns:
-            dict(str -> type A): native Python type representation of the stored
-                data
+            * tuple(type A, tuple(int > 0)): specification of the elements
+                data type and the shape of the array
+            * None: the elements type is a C primitive type without NumPy
+                equivalent, or it has such a 'leaf'
         
-        Version 1.0.0.1
+        Raises:
+            UT_TypeError: wrong definition of the data structure
+        
+        Version 1.0.0.0
         """
-        Result = dict()
-        Data = object.__getattribute__(self, '__dict__')
-        for strName, gItem in Data.items():
-            if hasattr(gItem, 'getNative'):
-                Result[strName] = gItem.getNative()
-            else:
-                Result[strName] = gItem
-        return Result
+        Checker = type.__getattribute__(cls, '_checkDefinition')
+        Checker() #UT_TypeError may be raised
+        Getter = type.__getattribute__(cls, '_getElementNumpyFormat')
+        Format = Getter(Prefix)
+        if not (Format is None):
+            Format = (Format, (type.__getattribute__(cls, '_Length'), ))
+        return Format
     
-    def packBytes(self, BigEndian: Optional[bool] = None) -> bytes:
+    @classmethod
+    def _buildCType(cls, BigEndian: Optional[bool] = None) -> Optional[type]:
         """
-        Method for serialization of the stored data into bytes. The optional
-        argument BigEndian is interpreted either as None or as boolean value
-        regardless of its actual data type.
+        Private class method to create the ctypes array type mirroring the data
+        structure of the class.
         
         Signature:
-            /bool OR None/ -> bytes
+            /bool OR None/ -> type OR None
         
         Args:
             BigEndian: (optional) bool OR None; 3-way selector to indicate the
-                desired endianness - the default value is None, meaning native,
-                passed True value forces big endian format, passed False value
-                forces little endian format.
+                desired endianness - None means native, True - big endian,
+                False - little endian
         
         Returns:
-            bytes: bytestring representing the entire stored data
+            * type: sub-class of ctypes.Array
+            * None: the class is not fixed size or the elements type is a C
+                primitive type not supporting the requested byte order, or it
+                has such a 'leaf'
         
-        Version 1.1.0.0
+        Raises:
+            UT_TypeError: wrong definition of the data structure
+        
+        Version 1.0.0.0
         """
-        Data = object.__getattribute__(self, '__dict__')
-        Fields = object.__getattribute__(self, '_Fields')
-        RawValues = list()
-        for Field, FieldType in Fields:
-            if IsC_Scalar(FieldType):
-                RawValues.append(Scalar2Bytes(Data[Field], FieldType,
-                                                        BigEndian = BigEndian))
-            else:
-                RawValues.append(Data[Field].packBytes(BigEndian = BigEndian))
-        Result = b''.join(RawValues)
-        return Result
-
-class SerArray(Serializable):
-    """
-    Implements auto-serilizable and de-serializable object representing C-array
-    like structured data storage. Can be instantiate without an argument or
-    with a single optional argument of a sequence type or another array.
-    
-    Class methods:
-        getSize():
-            None -> int >= 0 OR None
-        unpackBytes(Data, BigEndian = None):
-            bytes /, bool OR None/ -> 'SerArray
-        unpackJSON(Data):
-            str -> 'SerArray
-    
-    Methods:
-        packBytes(BigEndian = None):
-            /bool OR None/ -> bytes
-        packJSON():
-            None -> str
-        getNative():
-            None -> list(type A)
-    
-    Version 1.0.0.1
-    """
-    
-    #private class attributes - data structure definition
-    
-    _ElementType: ClassVar[TElement] = ctypes.c_int32
-    
-    _Length: ClassVar[int] = 0 #number of elements, must be > 0
-    
-    #special methods
+        if cls.getSize() is None:
+            return None
+        ElementsType = type.__getattribute__(cls, '_ElementType')
+        if IsC_Scalar(ElementsType):
+            CType = _getSwappedCType(ElementsType, BigEndian)
+        else:
+            CType = type.__getattribute__(ElementsType, '_getCType')(BigEndian)
+        if CType is None:
+            return None
+        return CType * type.__getattribute__(cls, '_Length')
     
-    def __len__(self) -> int:
+    @classmethod
+    def _getElementNumpyFormat(cls, Prefix: str) -> Any:
         """
-        Magic method to implement the support for the built-in len() function,
-        in order to get the length of the array.
+        Private class method to obtain the specification of the NumPy data
+        type equivalent to the declared type of the elements.
         
         Signature:
-            None -> int >= 0
+            str -> type A OR None
+        
+        Args:
+            Prefix: str; byte order character - '=', '>' or '<'
         
         Returns:
-            int >= 0: the current length of the array
+            * type A: specification accepted by numpy.dtype()
+            * None: the elements type is a C primitive type without NumPy
+                equivalent, or it has such a 'leaf'
         
         Version 1.0.0.0
         """
-        return len(object.__getattribute__(self, '_Data'))
+        ElementsType = type.__getattribute__(cls, '_ElementType')
+        if IsC_Scalar(ElementsType):
+            Format = _getNumpyCode(ElementsType, Prefix)
+        else:
+            Getter = type.__getattribute__(ElementsType, '_getNumpyFormat')
+            Format = Getter(Prefix)
+        return Format
     
-    def __getitem__(self, Index: int) -> Any:
+    @classmethod
+    def _getLeavesTable(cls) -> Tuple[Tuple[str, TSimpleC, int], ...]:
         """
-        Magic method implementing the read access to an element of the array by
-        its index. For the C primitive declared data type of the elements the
-        returned value is a native Python scalar type (int, float, etc.),
-        otherwise the stored object (reference to) is returned.
+        Private class method to obtain the flattened, i.e. 'leaves' only, data
+        structure of the class in the 'depth first' order. The elements are
+        named by their indexes, and the names of the nested fields / elements
+        are joined with dots. The table is computed only once per class and
+        cached.
         
         Signature:
-            int -> type A
+            None -> tuple(tuple(str, class ctypes._SimpleCData, int >= 0))
         
-        Args:
-            iIndex: int; the index of the element to be accesed
+        Returns:
+            tuple(tuple(str, class ctypes._SimpleCData, int >= 0)): per
+                'leaf' - its dotted name, C primitive type and offset in bytes
         
         Raises:
-            UT_IndexError: the value of the index is outside the range OR it is
-                not an integer number
+            UT_TypeError: wrong definition of the data structure
         
-        Version 1.0.0.1
+        Version 1.0.0.0
         """
-        if not isinstance(Index, int):
-            raise UT_IndexError(self.__name__, Index, SkipFrames = 1)
-        Data = object.__getattribute__(self, '_Data')
-        Length = len(Data)
-        if (Index > (Length - 1)) or (Index < (- Length)):
-            raise UT_IndexError(self.__name__, Index, SkipFrames = 1)
-        return Data[Index]
+        Cache = _getClassCache(cls)
+        LeavesTable = Cache.get('LeavesTable', None)
+        if LeavesTable is None:
+            Checker = type.__getattribute__(cls, '_checkDefinition')
+            Checker() #UT_TypeError may be raised
+            ElementsType = type.__getattribute__(cls, '_ElementType')
+            Length = type.__getattribute__(cls, '_Length')
+            if IsC_Scalar(ElementsType):
+                ElementSize = ctypes.sizeof(ElementsType)
+                LeavesTable = tuple((str(Index), ElementsType,
+                                        Index * ElementSize)
+                                                for Index in range(Length))
+            else:
+                ElementSize = ElementsType.getSize()
+                Getter = type.__getattribute__(ElementsType, '_getLeavesTable')
+                ElementLeaves = Getter()
+                LeavesTable = tuple((f'{Index}.{Name}', CType,
+                                        Index * ElementSize + Position)
+                                    for Index in range(Length)
+                                    for Name, CType, Position in ElementLeaves)
+            Cache['LeavesTable'] = LeavesTable
+        return LeavesTable
     
-    def __setitem__(self, Index: int, Value: Any) -> None:
+    @classmethod
+    def _getNodesTable(cls) -> Dict[str, Tuple[TElement, int, TIntNone]]:
         """
-        Magic method implementing the write access to an element of the array by
-        its index. Assignment is allowed only if the declared type of the
-        elements is C primitive and the passed value is compatible with the
-        declared type.
+        Private class method to obtain the look-up table of all elements,
+        including the nested fields / elements at any depth, by their dotted
+        names, e.g. '0', '0.a' or '1.0'. The elements of the dynamic length
+        arrays are not included. The table is computed only once per class and
+        cached.
         
         Signature:
-            int, type A -> None
+            None -> dict(str -> tuple(type A, int >= 0, int >= 0 OR None))
         
-        Args:
-            Index: int; the index of the element to be accesed
-            Value: type A; value to be assigned to that element
+        Returns:
+            dict(str -> tuple(type A, int >= 0, int >= 0 OR None)): per
+                element - its declared type, offset in bytes and size in bytes
+                (None for the dynamic length field of a nested struct)
         
         Raises:
-            UT_TypeError: the passed value's type is not compatible with the
-                declared type of the elements OR the declared data type is not C
-                primitive
-            UT_IndexError: the value of the index is outside the range OR it is
-                not an integer number
+            UT_TypeError: wrong definition of the data structure
         
-        Version 1.0.0.1
+        Version 1.0.0.0
         """
-        if not isinstance(Index, int):
-            raise UT_IndexError(self.__name__, Index, SkipFrames = 1)
-        Data = object.__getattribute__(self, '_Data')
-        Length = len(Data)
-        if (Index > (Length - 1)) or (Index < (- Length)):
-            raise UT_IndexError(self.__name__, Index, SkipFrames = 1)
-        ElementType = object.__getattribute__(self, '_ElementType')
-        if not IsC_Scalar(ElementType):
-            Error = UT_TypeError(ElementType, ctypes._SimpleCData,
-                                                                SkipFrames = 1)
-            Error.appendMessage('- immutable elements')
-            raise Error
-        try:
-            NewValue = ElementType(Value)
-        except (TypeError, ValueError):
-            Error = UT_TypeError(Value, ElementType, SkipFrames = 1)
-            Error.appendMessage('type compatible')
-            raise Error from None
-        Data[Index] = NewValue.value
-        del NewValue
+        Cache = _getClassCache(cls)
+        NodesTable = Cache.get('NodesTable', None)
+        if NodesTable is None:
+            NodesTable = dict()
+            if not (cls.getSize() is None):
+                ElementsType = type.__getattribute__(cls, '_ElementType')
+                Length = type.__getattribute__(cls, '_Length')
+                if IsC_Scalar(ElementsType):
+                    ElementSize = ctypes.sizeof(ElementsType)
+                    ElementNodes = dict()
+                else:
+                    ElementSize = ElementsType.getSize()
+                    Getter = type.__getattribute__(ElementsType,
+                                                            '_getNodesTable')
+                    ElementNodes = Getter()
+                for Index in range(Length):
+                    Offset = Index * ElementSize
+                    NodesTable[str(Index)] = (ElementsType, Offset,
+                                                                ElementSize)
+                    for Name, (NodeType, Position, NodeSize) in (
+                                                        ElementNodes.items()):
+                        NodesTable[f'{Index}.{Name}'] = (NodeType,
+                                                    Offset + Position, NodeSize)
+            Cache['NodesTable'] = NodesTable
+        return NodesTable
     
-    def __iter__(self) -> Iterator[Any]:
+    @classmethod
+    def _generateCode(cls, Generator: _CodeGenerator,
+                                                Source: str) -> Tuple[str, str]:
         """
-        Magic method to implement iteration over the content of the array as in
-        the construction 'for ... in ..'.
+        Private class method to contribute the code of the class into the
+        functions being generated: the extraction of the 'leaves' values of
+        the instance referred to by the passed variable name, the building of
+        a new instance, and the building of its native Python representation
+        from the flattened 'leaves' sequence 'v'. The nested elements are
+        unrolled if there are not more than _UNROLL_LIMIT of them, otherwise
+        the functions generated for the elements type are called in a loop.
         
         Signature:
-            None -> iter(type A)
+            _CodeGenerator, str -> tuple(str, str)
+        
+        Args:
+            Generator: _CodeGenerator; accumulator of the generated code
+            Source: str; name of the variable referring to the instance
+        
+        Returns:
+            tuple(str, str): the name of the variable referring to the built
+                instance, and the expression of the native representation
         
         Version 1.0.0.0
         """
-        return iter(object.__getattribute__(self, '_Data'))
+        ElementsType = type.__getattribute__(cls, '_ElementType')
+        Length = type.__getattribute__(cls, '_Length')
+        Elements = Generator.getName('d')
+        Generator.LeavesLines.append(f'{Elements} = _getArrayData({Source})')
+        Start = Generator.Index
+        if IsC_Scalar(ElementsType):
+            Generator.LeavesItems.append(f'*{Elements}')
+            Generator.Index += Length
+            Values = f'v[{Start} : {Generator.Index}]'
+            Code = _getArrayCode(ElementsType)
+            if Code is None:
+                Storage = f'list({Values})'
+            else:
+                Storage = f'_array({Code!r}, {Values})'
+            Native = f'list({Values})'
+        elif Length <= _UNROLL_LIMIT:
+            CodeGenerator = type.__getattribute__(ElementsType,
+                                                            '_generateCode')
+            Names = list()
+            NativeItems = list()
+            for Index in range(Length):
+                Element = Generator.getName('e')
+                Generator.LeavesLines.append(
+                                        f'{Element} = {Elements}[{Index}]')
+                Value, NativeItem = CodeGenerator(Generator, Element)
+                Names.append(Value)
+                NativeItems.append(NativeItem)
+            Storage = '[{}]'.format(', '.join(Names))
+            Native = '[{}]'.format(', '.join(NativeItems))
+        else:
+            Generated = type.__getattribute__(ElementsType, '_getGenerated')()
+            Count = Generated.Count
+            Leaves = Generator.bind(Generated.Leaves)
+            Generator.LeavesItems.append(f'*_chain(map({Leaves}, {Elements}))')
+            Generator.Index += Length * Count
+            Loop = 'for i in range({}, {}, {})'.format(Start, Generator.Index,
+                                                                        Count)
+            Builder = Generator.bind(Generated.Build)
+            Storage = f'[{Builder}(v[i : i + {Count}]) {Loop}]'
+            Builder = Generator.bind(Generated.Native)
+            Native = f'[{Builder}(v[i : i + {Count}]) {Loop}]'
+        Target = Generator.getName('r')
+        Class = Generator.bind(cls)
+        Generator.BuildLines.append(f'{Target} = {Class}.__new__({Class})')
+        Generator.BuildLines.append(f'_setArrayData({Target}, {Storage})')
+        Generator.BuildLines.append(f'_setPackedCache({Target}, None)')
+        return Target, Native
     
-    def __init__(self, Data: Optional[Union[TSeq, Serializable]]=None) -> None:
+    @classmethod
+    def _unpackObject(cls, Data: TBuffer, BigEndian: Optional[bool] = None):
         """
-        Initialization method - copies the data from the passed sequence per
-        element. If the length of the passed sequence equals to or exceeds the
-        declared length of the array N, only the those N first elements are
-        copied, and the rest is ignored. Otherwise, all elements of the passed
-        sequence / array are copied into the first elements of the array being
-        created, and the remaining tailing elements are filled with the default
-        values for the declared data type of the elements.
+        Private class method to create a new instance from the bytes
+        representation of the data in a single pass, i.e. the nested elements
+        are created directly from the respective parts of the data, without the
+        intermediate native Python representation.
         
         Signature:
-            /seq(str -> type A) OR 'SerArray/ -> None
+            bytes-like /, bool OR None/ -> 'SerArray
         
         Args:
-            Data: (optional) seq(str -> type A) OR 'SerArray; sequence or an
-                instance of SerArray (sub-) class
+            Data: bytes-like; bytes representation of the data
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            'SerArray: an instance of the same class
         
         Raises:
-            UT_TypeError: passed argument is not a sequence type or an instance
-                of sub-class of SerArray or SerDynamicArray OR the data
-                structure of the class is improperly defined
-            UT_ValueError: not matching data type in one of the elements,
-                concerning the declared data type for the array elements
+            UT_ValueError: the size of the byte string does not match the size
+                of the declared class data structure
         
-        Version 1.0.0.1
+        Version 1.2.0.0
         """
-        Checker = object.__getattribute__(self, '_checkDefinition')
-        Checker() #UT_TypeError may be raised
-        if not (Data is None):
-            Cond1 = not isinstance(Data, (collections.abc.Sequence, SerArray))
-            Cond2 = isinstance(Data, (str, bytes))
-            if Cond1 or Cond2:
-                raise UT_TypeError(Data, (collections.abc.Sequence, SerArray),
-                                                                SkipFrames = 1)
-            InputLength = len(Data)
+        Size = cls.getSize()
+        DataSize = len(Data)
+        if DataSize != Size:
+            raise UT_ValueError(DataSize, '= {} - string length'.format(Size),
+                                                                SkipFrames = 2)
+        Codec = type.__getattribute__(cls, '_getCodec')(BigEndian)
+        if not (Codec is None):
+            Generated = type.__getattribute__(cls, '_getGenerated')()
+            return Generated.Build(Codec.unpack(Data))
+        ElementsType = type.__getattribute__(cls, '_ElementType')
+        Length = type.__getattribute__(cls, '_Length')
+        if IsC_Scalar(ElementsType):
+            ElementSize = ctypes.sizeof(ElementsType)
+            Elements = _compactScalars([Bytes2Scalar(
+                        Data[Index * ElementSize : (Index + 1) * ElementSize],
+                                            ElementsType, BigEndian = BigEndian)
+                                    for Index in range(Length)], ElementsType)
         else:
-            InputLength = 0
-        ElementType = object.__getattribute__(self, '_ElementType')
-        Length = object.__getattribute__(self, '_Length')
-        Elements = []
-        for Index in range(Length):
-            if Index < InputLength:
-                try:
-                    NewElement = ElementType(Data[Index])
-                except (ValueError, TypeError):
-                    Message = 'being compatible with {} at index {}'.format(
-                                                    ElementType.__name__, Index)
-                    
-                    raise UT_ValueError(Data[Index], Message,
-                                                    SkipFrames = 1) from None
-            else:
-                NewElement = ElementType()
-            if IsC_Scalar(ElementType):
-                Elements.append(NewElement.value)
-                del NewElement
-            else:
-                Elements.append(NewElement)
-        object.__setattr__(self, '_Data', Elements)
-    
-    #private methods
+            ElementSize = ElementsType.getSize()
+            Unpacker = type.__getattribute__(ElementsType, '_unpackObject')
+            Elements = [Unpacker(
+                        Data[Index * ElementSize : (Index + 1) * ElementSize],
+                                                        BigEndian = BigEndian)
+                                                    for Index in range(Length)]
+        Result = cls.__new__(cls)
+        _setArrayData(Result, Elements)
+        _setPackedCache(Result, None)
+        return Result
     
     @classmethod
-    def _checkObjectContent(cls, Data: TList) -> None:
+    def _buildFromNative(cls, Data: TList, Trusted: bool = True):
         """
-        Private class method to check if the extracted JSON object matches the
-        declared data structure of the class.
+        Private class method to create a new instance from the native Python
+        representation of the data in a single pass. The structure of the data
+        is always checked, and the values are always converted into the
+        declared C type, whereas the trusted values are not range checked,
+        i.e. they are wrapped as by the C type itself. The length of the
+        passed list is checked only for the fixed length arrays.
         
         Signature:
-            list(type A) -> None
+            list(type A)/, bool/ -> 'SerArray
         
         Args:
-            Data: list(type A); data to be checked
+            Data: list(type A); native Python representation of the data
+            Trusted: (optional) bool; flag to skip the check of the values,
+                defaults to True
+        
+        Returns:
+            'SerArray: an instance of the same class
         
         Raises:
             UT_TypeError: the type of the passed argument is not compatible with
                 the class
-            UT_ValueError: the internal structure of the passed object does not
-                match the defined class structure
+            UT_ValueError: the length of the passed list does not match the
+                declared length of the array, OR an element is not compatible
+                with the declared elements type
         
-        Version 1.0.0.1
+        Version 1.4.0.0
         """
         if not isinstance(Data, list):
             raise UT_TypeError(Data, list, SkipFrames = 2)
+        if not (cls.getSize() is None):
+            Length = type.__getattribute__(cls, '_Length')
+            DataLength = len(Data)
+            if Length != DataLength:
+                raise UT_ValueError(DataLength,
+                        '= {} - array length'.format(Length), SkipFrames = 2)
         ElementsType = type.__getattribute__(cls, '_ElementType')
         IsScalar = IsC_Scalar(ElementsType)
-        Length = type.__getattribute__(cls, '_Length')
-        DataLength = len(Data)
-        if Length != DataLength:
-            raise UT_ValueError(DataLength,
-                        '= {} - array length'.format(Length), SkipFrames = 2)
-        for Index, Element in enumerate(Data):
-            try:
-                if IsScalar:
-                    Temp = ElementsType(Element)
-                    del Temp
-                else:
-                    Checker = type.__getattribute__(ElementsType,
-                                                        '_checkObjectContent')
-                    Checker(Element)
-            except (TypeError, ValueError):
-                raise UT_ValueError(Element,
+        if not IsScalar:
+            Builder = type.__getattribute__(ElementsType, '_buildFromNative')
+        else:
+            Converter = _castScalar if Trusted else _convertScalar
+        try:
+            if not IsScalar:
+                Elements = [Builder(Element, Trusted = Trusted)
+                                                        for Element in Data]
+            else:
+                Elements = _convertScalars(Data, ElementsType)
+                if Elements is None:
+                    Elements = _compactScalars([Converter(Element,
+                            ElementsType) for Element in Data], ElementsType)
+        except (TypeError, ValueError, OverflowError):
+            #locate the first incompatible element for the error message
+            for Index, Element in enumerate(Data):
+                try:
+                    if IsScalar:
+                        Converter(Element, ElementsType)
+                    else:
+                        Builder(Element, Trusted = Trusted)
+                except (TypeError, ValueError, OverflowError):
+                    raise UT_ValueError(Element,
                         'compatible with {} type at index {}'.format(
                         ElementsType.__name__, Index), SkipFrames = 2) from None
+            raise
+        Result = cls.__new__(cls)
+        _setArrayData(Result, Elements)
+        _setPackedCache(Result, None)
+        return Result
     
-    @classmethod
-    def _parseBuffer(cls, Data: bytes,
-                                    BigEndian: Optional[bool] = None) -> TList:
+    def _getChildren(self) -> Iterator[Tuple[int, Serializable]]:
         """
-        Private class method to parse the content of the passed byte string into
-        a native Python object using the class data structure definition.
+        Private method to iterate over the elements together with their
+        offsets, if they are nested structs or arrays.
+        
+        Signature:
+            None -> iter(tuple(int >= 0, 'Serializable))
+        
+        Version 1.1.0.0
+        """
+        ElementsType = type(self)._ElementType
+        if IsC_Scalar(ElementsType):
+            return iter(())
+        ElementSize = ElementsType.getSize()
+        return ((Index * ElementSize, Element)
+                        for Index, Element in enumerate(_getArrayData(self)))
+    
+    def _locateScalar(self, Index: int) -> Tuple[int, TSimpleC]:
+        """
+        Private method to obtain the offset and the declared type of an
+        element of a C primitive type.
+        
+        Signature:
+            int -> tuple(int >= 0, class ctypes._SimpleCData)
+        
+        Args:
+            Index: int; index of the element, which may be negative
+        
+        Version 1.0.0.0
+        """
+        ElementsType = type(self)._ElementType
+        if Index < 0:
+            Index += len(_getArrayData(self))
+        return Index * ctypes.sizeof(ElementsType), ElementsType
+    
+    def _assignLeaves(self, Leaves: Iterator[Any]) -> None:
+        """
+        Private method to overwrite the stored data in place with the values
+        from the flattened sequence of the 'leaves', e.g. as returned by the
+        compiled struct codec, re-using the nested objects. The in place
+        counterpart of the generated Build() function of the class.
+        
+        Signature:
+            iter(type A) -> None
+        
+        Args:
+            Leaves: iter(type A); iterator over the 'leaves' values in the
+                'depth first' order, it is advanced by the number of the
+                'leaves' of the class
+        
+        Version 1.0.0.1
+        """
+        ElementsType = type.__getattribute__(type(self), '_ElementType')
+        Length = type.__getattribute__(type(self), '_Length')
+        if IsC_Scalar(ElementsType):
+            _setArrayData(self, _compactScalars(
+                        list(itertools.islice(Leaves, Length)), ElementsType))
+        else:
+            Assigner = type.__getattribute__(ElementsType, '_assignLeaves')
+            for Element in _getArrayData(self):
+                Assigner(Element, Leaves)
+        _resetPackedBytes(self)
+    
+    def _unpackIntoObject(self, Data: TBuffer,
+                                    BigEndian: Optional[bool] = None) -> None:
+        """
+        Private method to re-load the entire content of the instance in place
+        from the bytes representation of the data, re-using the nested
+        elements.
         
         Signature:
-            bytes/, bool OR None/ -> list(type A)
+            bytes-like /, bool OR None/ -> None
         
         Args:
-            Data: bytes; data to be checked
+            Data: bytes-like; bytes representation of the data
             BigEndian: (optional) bool OR None; 3-way selector to indicate the
                 desired endianness - the default value is None, meaning native,
                 passed True value forces big endian format, passed False value
                 forces little endian format.
         
-        Returns:
-            list(type A): a native Python list containing only native Python
-                data type elements, compatible with the declared array elements
-                type
-        
         Raises:
-            UT_ValueError: size of the passed bytestring does not match the
-                declared data structure size
+            UT_ValueError: the size of the byte string does not match the size
+                of the declared class data structure
         
         Version 1.0.0.0
         """
-        Size = cls.getSize()
-        Length = type.__getattribute__(cls, '_Length')
+        Size = type(self).getSize()
         DataSize = len(Data)
         if DataSize != Size:
             raise UT_ValueError(DataSize, '= {} - string length'.format(Size),
                                                                 SkipFrames = 2)
-        ElementsType = type.__getattribute__(cls, '_ElementType')
+        Codec = type.__getattribute__(type(self), '_getCodec')(BigEndian)
+        if not (Codec is None):
+            type(self)._assignLeaves(self, iter(Codec.unpack(Data)))
+            return
+        ElementsType = type(self)._ElementType
         if IsC_Scalar(ElementsType):
-            ElementSize = ctypes.sizeof(ElementsType)
-            Result = [Bytes2Scalar(
-                        Data[Index * ElementSize : (Index + 1) * ElementSize],
+            Elements = _unpackScalars(Data, ElementsType,
+                                                        BigEndian = BigEndian)
+            if Elements is None:
+                ElementSize = ctypes.sizeof(ElementsType)
+                Elements = _compactScalars([Bytes2Scalar(
+                                    Data[Offset : Offset + ElementSize],
                                             ElementsType, BigEndian = BigEndian)
-                                                    for Index in range(Length)]
+                            for Offset in range(0, DataSize, ElementSize)],
+                                                                ElementsType)
+            _setArrayData(self, Elements)
         else:
             ElementSize = ElementsType.getSize()
-            Result = []
-            for Index in range(Length):
-                DataSplice =  Data[Index * ElementSize : (Index+1)*ElementSize]
-                NewObject = ElementsType.unpackBytes(DataSplice,
+            for Index, Element in enumerate(_getArrayData(self)):
+                Offset = Index * ElementSize
+                ElementsType._unpackIntoObject(Element,
+                                    Data[Offset : Offset + ElementSize],
                                                         BigEndian = BigEndian)
-                Result.append(NewObject.getNative())
-                del NewObject
-        return Result
+        _resetPackedBytes(self)
+    
+    def _packInto(self, Buffer: memoryview, Offset: int,
+                                    BigEndian: Optional[bool] = None) -> int:
+        """
+        Private method to write the bytes representation of the stored data
+        directly into a writable buffer at the specified position, using the
+        compiled codec if possible, otherwise - per element.
+        
+        Signature:
+            memoryview, int >= 0/, bool OR None/ -> int >= 0
+        
+        Args:
+            Buffer: memoryview; writable, flat byte view of the buffer
+            Offset: int >= 0; position in the buffer to start writing at
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            int >= 0: number of the written bytes
+        
+        Raises:
+            UT_ValueError: the data does not fit into the buffer
+        
+        Version 1.2.0.0
+        """
+        ElementsType = type(self)._ElementType
+        Data = _getArrayData(self)
+        IsScalar = IsC_Scalar(ElementsType)
+        if IsScalar:
+            ElementSize = ctypes.sizeof(ElementsType)
+        else:
+            ElementSize = ElementsType.getSize()
+        Size = len(Data) * ElementSize
+        Available = len(Buffer) - Offset
+        if Size > Available:
+            raise UT_ValueError(Available, f'>= {Size} - free buffer length',
+                                                                SkipFrames = 3)
+        Codec = type(self)._getCodec(BigEndian)
+        if not (Codec is None):
+            Leaves = type(self)._getGenerated().Leaves(self)
+            Codec.pack_into(Buffer, Offset, *Leaves)
+        elif IsScalar:
+            Packed = _packScalars(Data, ElementsType, BigEndian = BigEndian)
+            if not (Packed is None):
+                Buffer[Offset : Offset + Size] = Packed
+            else:
+                for Index, Element in enumerate(Data):
+                    Position = Offset + Index * ElementSize
+                    Buffer[Position : Position + ElementSize] = Scalar2Bytes(
+                                Element, ElementsType, BigEndian = BigEndian)
+        else:
+            for Index, Element in enumerate(Data):
+                ElementsType._packInto(Element, Buffer,
+                        Offset + Index * ElementSize, BigEndian = BigEndian)
+        return Size
     
     @classmethod
     def _checkDefinition(cls) -> None:
@@ -1603,8 +6206,11 @@ class SerArray(Serializable):
                 OR they hold wrong type vales OR elements type declaration is
                 incorrect
         
-        Version 1.0.0.1
+        Version 1.1.0.0
         """
+        Cache = _getClassCache(cls)
+        if Cache.get('IsChecked', False):
+            return
         #check presence of the required private class attributes
         for Name in ('_ElementType', '_Length'):
             try:
@@ -1656,6 +6262,7 @@ class SerArray(Serializable):
             Error = UT_TypeError(1, int, SkipFrames = 2)
             Error.setMessage(Message)
             raise Error
+        Cache['IsChecked'] = True
     
     #public API
     
@@ -1674,8 +6281,11 @@ class SerArray(Serializable):
         Raises:
             UT_TypeError: wrong definition of the data structure
         
-        Version 1.0.0.1
+        Version 1.1.0.0
         """
+        Cache = _getClassCache(cls)
+        if 'Size' in Cache:
+            return Cache['Size']
         Checker = type.__getattribute__(cls, '_checkDefinition')
         Checker() #UT_TypeError may be raised
         ElementType = type.__getattribute__(cls, '_ElementType')
@@ -1684,7 +6294,9 @@ class SerArray(Serializable):
         else:
             ElementSize = ctypes.sizeof(ElementType)
         Length = type.__getattribute__(cls, '_Length')
-        return Length * ElementSize
+        Size = Length * ElementSize
+        Cache['Size'] = Size
+        return Size
     
     def getNative(self) -> TList:
         """
@@ -1698,9 +6310,9 @@ class SerArray(Serializable):
         
         Version 1.0.0.1
         """
-        ElementType = object.__getattribute__(self, '_ElementType')
+        ElementType = type(self)._ElementType
         IsScalar = IsC_Scalar(ElementType)
-        Data = object.__getattribute__(self, '_Data')
+        Data = _getArrayData(self)
         if IsScalar:
             Result = list(Data)
         else:
@@ -1711,7 +6323,9 @@ class SerArray(Serializable):
         """
         Method for serialization of the stored data into bytes. The optional
         argument BigEndian is interpreted either as None or as boolean value
-        regardless of its actual data type.
+        regardless of its actual data type. The result is cached per byte
+        order until the stored data, including the nested objects, is
+        modified.
         
         Signature:
             /bool OR None/ -> bytes
@@ -1725,19 +6339,30 @@ class SerArray(Serializable):
         Returns:
             bytes: bytestring representing the entire stored data
         
-        Version 1.0.0.0
+        Version 1.4.0.0
         """
-        ElementsType = object.__getattribute__(self, '_ElementType')
-        Data = object.__getattribute__(self, '_Data')
-        if len(Data):
+        Result = _getPackedBytes(self, BigEndian)
+        if not (Result is None):
+            return Result
+        Codec = type(self)._getCodec(BigEndian)
+        ElementsType = type(self)._ElementType
+        Data = _getArrayData(self)
+        if not (Codec is None):
+            Leaves = type(self)._getGenerated().Leaves(self)
+            Result = Codec.pack(*Leaves)
+        elif len(Data):
             if IsC_Scalar(ElementsType):
-                Result = b''.join(Scalar2Bytes(Element, ElementsType,
+                Result = _packScalars(Data, ElementsType,
+                                                        BigEndian = BigEndian)
+                if Result is None:
+                    Result = b''.join(Scalar2Bytes(Element, ElementsType,
                                     BigEndian = BigEndian) for Element in Data)
             else:
                 Result = b''.join(Element.packBytes(BigEndian = BigEndian)
                                                         for Element in Data)
         else:
             Result = b''
+        _storePackedBytes(self, Result, BigEndian)
         return Result
 
 class SerDynamicArray(SerArray):
@@ -1749,22 +6374,44 @@ class SerDynamicArray(SerArray):
     Class methods:
         getSize():
             None -> int >= 0 OR None
-        unpackBytes(Data, BigEndian = None):
-            bytes /, bool OR None/ -> 'SerDynamicArray
-        unpackJSON(Data):
-            str -> 'SerDynamicArray
+        unpackBytes(Data, BigEndian = None, Trusted = None):
+            bytes-like /, bool OR None, bool OR None/ -> 'SerDynamicArray
+        unpackFrom(Buffer, Offset = 0, BigEndian = None):
+            bytes-like /, int >= 0, bool OR None/
+                -> tuple('SerDynamicArray, int)
+        unpackInto(Instance, Data, BigEndian = None):
+            'SerDynamicArray, bytes-like /, bool OR None/ -> 'SerDynamicArray
+        acquire():
+            None -> 'SerDynamicArray
+        release(Instance):
+            'SerDynamicArray -> None
+        unpackJSON(Data, Trusted = None):
+            str/, bool OR None/ -> 'SerDynamicArray
+        loadJSONLines(File, Trusted = None):
+            iter(str OR bytes)/, bool OR None/ -> iterator('SerDynamicArray)
         getElementSize():
             None -> int > 0
+        getNumpyDtype(BigEndian = None):
+            /bool OR None/ -> numpy.dtype
+        unpackNumpy(Data, BigEndian = None):
+            bytes-like /, bool OR None/ -> numpy.ndarray
+        iterFromStream(File, ChunkSize = 65536, BigEndian = None):
+            file-like /binary mode/ /, int > 0, bool OR None/
+                -> iterator(type A)
     
     Methods:
         packBytes(BigEndian = None):
             /bool OR None/ -> bytes
+        packInto(Buffer, Offset, BigEndian = None):
+            bytes-like, int >= 0/, bool OR None/ -> int >= 0
+        writeToStream(File, ChunkSize = 65536, BigEndian = None):
+            file-like /binary mode/ /, int > 0, bool OR None/ -> int >= 0
         packJSON():
             None -> str
         getNative():
             None -> list(type A)
     
-    Version 1.0.0.1
+    Version 1.11.1.0
     """
     
     #special methods
@@ -1789,9 +6436,9 @@ class SerDynamicArray(SerArray):
             UT_ValueError: not matching data type in one of the elements,
                 concerning the declared data type for the array elements
         
-        Version 1.0.0.1
+        Version 1.2.1.0
         """
-        Checker = object.__getattribute__(self, '_checkDefinition')
+        Checker = type(self)._checkDefinition
         Checker() #UT_TypeError may be raised
         if not (Data is None):
             Cond1 = not isinstance(Data, (collections.abc.Sequence, SerArray))
@@ -1802,7 +6449,17 @@ class SerDynamicArray(SerArray):
             InputLength = len(Data)
         else:
             InputLength = 0
-        ElementType = object.__getattribute__(self, '_ElementType')
+        ElementType = type(self)._ElementType
+        if InputLength and IsC_Scalar(ElementType):
+            if isinstance(Data, SerArray):
+                Values = _getArrayData(Data)
+            else:
+                Values = Data
+            Elements = _convertScalars(Values, ElementType)
+            if not (Elements is None):
+                _setArrayData(self, Elements)
+                _setPackedCache(self, None)
+                return
         Elements = []
         for Index in range(InputLength):
             try:
@@ -1818,104 +6475,173 @@ class SerDynamicArray(SerArray):
                 del NewElement
             else:
                 Elements.append(NewElement)
-        object.__setattr__(self, '_Data', Elements)
+        if IsC_Scalar(ElementType):
+            Elements = _compactScalars(Elements, ElementType)
+        _setArrayData(self, Elements)
+        _setPackedCache(self, None)
     
     #private methods
     
     @classmethod
-    def _checkObjectContent(cls, Data: Any) -> None:
+    def _parseBuffer(cls, Data: TBuffer,
+                                    BigEndian: Optional[bool] = None) -> TList:
         """
-        Private class method to check if the extracted JSON object matches the
-        declared data structure of the class.
+        Private class method to parse the content of the passed byte string into
+        a native Python object using the class data structure definition.
         
         Signature:
-            type A -> None
+            /bool OR None/ -> list(type A)
         
         Args:
-            Data: type A; any type data to be checked
+            Data: bytes-like; data to be checked
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            list(type A): a native Python list containing only native Python
+                data type elements, compatible with the declared array elements
+                type
         
         Raises:
-            UT_TypeError: the type of the passed argument is not compatible with
-                the class
-            UT_ValueError: the internal structure of the passed object does not
-                match the defined class structure
+            UT_ValueError: size of the passed bytestring does not match the
+                declared data structure size
         
-        Version 1.0.0.1
+        Version 1.2.0.1
         """
-        if not isinstance(Data, list):
-            raise UT_TypeError(Data, list, SkipFrames = 2)
+        DataSize = len(Data)
         ElementsType = type.__getattribute__(cls, '_ElementType')
-        IsScalar = IsC_Scalar(ElementsType)
-        for Index, Element in enumerate(Data):
-            try:
-                if IsScalar:
-                    Temp = ElementsType(Element)
-                    del Temp
+        if IsC_Scalar(ElementsType):
+            ElementSize = ctypes.sizeof(ElementsType)
+        else:
+            ElementSize = ElementsType.getSize()
+        Length = DataSize // ElementSize
+        Remainder = DataSize % ElementSize
+        if Remainder:
+            raise UT_ValueError(DataSize,
+                                f'multiple of {ElementSize} - string length',
+                                                                SkipFrames = 2)
+        Result = []
+        if Length:
+            if IsC_Scalar(ElementsType):
+                Result = _unpackScalars(Data, ElementsType,
+                                                        BigEndian = BigEndian)
+                if not (Result is None):
+                    Result = Result.tolist()
                 else:
-                    Checker = type.__getattribute__(ElementsType,
-                                                        '_checkObjectContent')
-                    Checker(Element)
-            except (TypeError, ValueError):
-                raise UT_ValueError(Element,
-                        'compatible with {} type at index {}'.format(
-                        ElementsType.__name__, Index), SkipFrames = 2) from None
+                    Result = [Bytes2Scalar(
+                        Data[Index * ElementSize : (Index + 1) * ElementSize],
+                                            ElementsType, BigEndian = BigEndian)
+                                                    for Index in range(Length)]
+            else:
+                Parser = type.__getattribute__(ElementsType, '_parseBuffer')
+                for Index in range(Length):
+                    DataSplice = Data[Index*ElementSize : (Index+1)*ElementSize]
+                    Result.append(Parser(DataSplice, BigEndian = BigEndian))
+        return Result
     
     @classmethod
-    def _parseBuffer(cls, Data: bytes,
-                                    BigEndian: Optional[bool] = None) -> TList:
+    def _unpackObject(cls, Data: TBuffer, BigEndian: Optional[bool] = None):
         """
-        Private class method to parse the content of the passed byte string into
-        a native Python object using the class data structure definition.
+        Private class method to create a new instance from the bytes
+        representation of the data in a single pass, i.e. the nested elements
+        are created directly from the respective parts of the data, using the
+        compiled struct codec of the elements type if possible.
         
         Signature:
-            /bool OR None/ -> list(type A)
+            bytes-like /, bool OR None/ -> 'SerDynamicArray
         
         Args:
-            Data: bytes; data to be checked
+            Data: bytes-like; bytes representation of the data
             BigEndian: (optional) bool OR None; 3-way selector to indicate the
                 desired endianness - the default value is None, meaning native,
                 passed True value forces big endian format, passed False value
                 forces little endian format.
         
         Returns:
-            list(type A): a native Python list containing only native Python
-                data type elements, compatible with the declared array elements
-                type
+            'SerDynamicArray: an instance of the same class
         
         Raises:
-            UT_ValueError: size of the passed bytestring does not match the
-                declared data structure size
+            UT_ValueError: the size of the byte string is not a multiple of the
+                size of the declared elements type
         
-        Version 1.0.0.1
+        Version 1.2.0.0
         """
-        DataSize = len(Data)
         ElementsType = type.__getattribute__(cls, '_ElementType')
+        DataSize = len(Data)
         if IsC_Scalar(ElementsType):
             ElementSize = ctypes.sizeof(ElementsType)
         else:
             ElementSize = ElementsType.getSize()
-        Length = DataSize // ElementSize
-        Remainder = DataSize % ElementSize
-        if Remainder:
+        if DataSize % ElementSize:
             raise UT_ValueError(DataSize,
                                 f'multiple of {ElementSize} - string length',
                                                                 SkipFrames = 2)
-        Result = []
-        if Length:
-            if IsC_Scalar(ElementsType):
-                Result = [Bytes2Scalar(
-                        Data[Index * ElementSize : (Index + 1) * ElementSize],
-                                            ElementsType, BigEndian = BigEndian)
-                                                    for Index in range(Length)]
+        if IsC_Scalar(ElementsType):
+            Elements = _unpackScalars(Data, ElementsType,
+                                                        BigEndian = BigEndian)
+            if Elements is None:
+                Parser = type.__getattribute__(cls, '_parseBuffer')
+                Elements = Parser(Data, BigEndian = BigEndian)
+        else:
+            Codec = type.__getattribute__(ElementsType, '_getCodec')(BigEndian)
+            if not (Codec is None):
+                Generated = type.__getattribute__(ElementsType,
+                                                            '_getGenerated')()
+                Elements = list(map(Generated.Build, Codec.iter_unpack(Data)))
             else:
-                for Index in range(Length):
-                    DataSplice = Data[Index*ElementSize : (Index+1)*ElementSize]
-                    NewObject = ElementsType.unpackBytes(DataSplice,
+                Unpacker = type.__getattribute__(ElementsType, '_unpackObject')
+                Elements = [Unpacker(Data[Offset : Offset + ElementSize],
                                                         BigEndian = BigEndian)
-                    Result.append(NewObject.getNative())
-                    del NewObject
+                                for Offset in range(0, DataSize, ElementSize)]
+        Result = cls.__new__(cls)
+        _setArrayData(Result, Elements)
+        _setPackedCache(Result, None)
         return Result
     
+    @classmethod
+    def _getLeafFormat(cls) -> None:
+        """
+        Private class method to obtain the struct module format of the
+        flattened data structure of the class. The dynamic length arrays do not
+        have such representation.
+        
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        return None
+    
+    @classmethod
+    def _getNumpyFormat(cls, Prefix: str) -> Any:
+        """
+        Private class method to obtain the specification of the NumPy data
+        type equivalent to the declared type of the elements, since the
+        dynamic length arrays are represented by the 1-dimensional NumPy
+        arrays of the elements.
+        
+        Signature:
+            str -> type A OR None
+        
+        Args:
+            Prefix: str; byte order character - '=', '>' or '<'
+        
+        Returns:
+            * type A: specification accepted by numpy.dtype()
+            * None: the elements type is a C primitive type without NumPy
+                equivalent, or it has such a 'leaf'
+        
+        Raises:
+            UT_TypeError: wrong definition of the data structure
+        
+        Version 1.0.0.0
+        """
+        Checker = type.__getattribute__(cls, '_checkDefinition')
+        Checker() #UT_TypeError may be raised
+        return type.__getattribute__(cls, '_getElementNumpyFormat')(Prefix)
+    
     @classmethod
     def _checkDefinition(cls) -> None:
         """
@@ -1931,8 +6657,11 @@ class SerDynamicArray(SerArray):
                 OR they hold wrong type vales OR elements type declaration is
                 incorrect
         
-        Version 1.0.0.1
+        Version 1.1.0.0
         """
+        Cache = _getClassCache(cls)
+        if Cache.get('IsChecked', False):
+            return
         #check presence of the required private class attributes
         for strName in ('_ElementType', ):
             try:
@@ -1976,6 +6705,86 @@ class SerDynamicArray(SerArray):
                                         'SerStruct)'])
                 Error.setMessage(Message)
                 raise Error
+        Cache['IsChecked'] = True
+    
+    def _unpackIntoObject(self, Data: TBuffer,
+                                    BigEndian: Optional[bool] = None) -> None:
+        """
+        Private method to re-load the entire content of the instance in place
+        from the bytes representation of the data. The already existing nested
+        elements are re-used, the missing ones are created, and the surplus
+        ones are removed.
+        
+        Signature:
+            bytes-like /, bool OR None/ -> None
+        
+        Args:
+            Data: bytes-like; bytes representation of the data
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Raises:
+            UT_ValueError: the size of the byte string is not a multiple of the
+                size of the declared elements type
+        
+        Version 1.0.1.0
+        """
+        ElementsType = type(self)._ElementType
+        DataSize = len(Data)
+        if IsC_Scalar(ElementsType):
+            ElementSize = ctypes.sizeof(ElementsType)
+        else:
+            ElementSize = ElementsType.getSize()
+        if DataSize % ElementSize:
+            raise UT_ValueError(DataSize,
+                                f'multiple of {ElementSize} - string length',
+                                                                SkipFrames = 2)
+        if IsC_Scalar(ElementsType):
+            Elements = _unpackScalars(Data, ElementsType,
+                                                        BigEndian = BigEndian)
+            if Elements is None:
+                Elements = type(self)._parseBuffer(Data, BigEndian = BigEndian)
+            _setArrayData(self, Elements)
+        else:
+            Length = DataSize // ElementSize
+            Storage = _getArrayData(self)
+            OldLength = len(Storage)
+            Reused = Storage[ : Length]
+            Codec = ElementsType._getCodec(BigEndian)
+            if not (Codec is None):
+                Records = Codec.iter_unpack(Data)
+                #zip() must exhaust the re-used elements first, otherwise the
+                #first surplus record is lost
+                Assigner = type.__getattribute__(ElementsType, '_assignLeaves')
+                for Element, Leaves in zip(Reused, Records):
+                    Assigner(Element, iter(Leaves))
+                Generated = type.__getattribute__(ElementsType,
+                                                            '_getGenerated')()
+                Storage.extend(map(Generated.Build, Records))
+            else:
+                for Index, Element in enumerate(Reused):
+                    Offset = Index * ElementSize
+                    ElementsType._unpackIntoObject(Element,
+                                    Data[Offset : Offset + ElementSize],
+                                                        BigEndian = BigEndian)
+                Unpacker = ElementsType._unpackObject
+                Storage.extend(Unpacker(Data[Offset : Offset + ElementSize],
+                                                        BigEndian = BigEndian)
+                        for Offset in range(OldLength * ElementSize, DataSize,
+                                                                ElementSize))
+            for Element in Storage[Length : ]:
+                ElementCache = _getPackedCache(Element)
+                if not (ElementCache is None):
+                    ElementCache.Owner = None
+            del Storage[Length : ]
+            Cache = _getPackedCache(self)
+            if (Length != OldLength) and not (Cache is None):
+                if Cache.IsLinked:
+                    Cache.IsLinked = False
+                    _linkPackedCache(self)
+        _resetPackedBytes(self)
     
     #public API
     
@@ -2014,8 +6823,11 @@ class SerDynamicArray(SerArray):
         Raises:
             UT_TypeError: wrong definition of the data structure
         
-        Version 1.0.0.1
+        Version 1.1.0.0
         """
+        Cache = _getClassCache(cls)
+        if 'ElementSize' in Cache:
+            return Cache['ElementSize']
         Checker = type.__getattribute__(cls, '_checkDefinition')
         Checker() #UT_TypeError may be raised
         ElementType = type.__getattribute__(cls, '_ElementType')
@@ -2023,7 +6835,221 @@ class SerDynamicArray(SerArray):
             Size = ctypes.sizeof(ElementType)
         else:
             Size = ElementType.getSize()
+        Cache['ElementSize'] = Size
         return Size
+    
+    @classmethod
+    def unpackNumpy(cls, Data: TBuffer,
+                                BigEndian: Optional[bool] = None) -> Any:
+        """
+        Class method to interpret the bytes representation of a single dynamic
+        length array as a 1-dimensional NumPy array of the elements, without
+        copying of the data. The array shares the memory with the buffer, thus
+        it is read-only for the immutable buffers, e.g. bytes. The optional
+        argument BigEndian is interpreted either as None or as boolean value
+        regardless of its actual data type.
+        
+        Signature:
+            bytes-like /, bool OR None/ -> numpy.ndarray
+        
+        Args:
+            Data: bytes-like; bytes representation of the array
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            numpy.ndarray: view of the buffer, one element per array element
+        
+        Raises:
+            ImportError: NumPy is not installed
+            UT_TypeError: passed argument is not a bytes-like object OR the
+                class data structure is wrongly defined OR the elements type
+                has no NumPy equivalent
+            UT_ValueError: the length of the buffer is not a multiple of the
+                size of the declared elements type
+        
+        Version 1.0.0.0
+        """
+        Dtype = cls.getNumpyDtype(BigEndian = BigEndian)
+        View = _getByteView(Data)
+        if View is None:
+            raise UT_TypeError(Data, (bytes, bytearray, memoryview),
+                                                                SkipFrames = 1)
+        DataSize = len(View)
+        ElementSize = cls.getElementSize()
+        if DataSize % ElementSize:
+            View.release()
+            raise UT_ValueError(DataSize,
+                                f'multiple of {ElementSize} - string length',
+                                                                SkipFrames = 1)
+        return numpy.frombuffer(View, dtype = Dtype)
+    
+    @classmethod
+    def iterFromStream(cls, File: Any, ChunkSize: int = 65536,
+                        BigEndian: Optional[bool] = None) -> Iterator[Any]:
+        """
+        Class method to lazily de-serialize the bytes representation of a
+        single dynamic length array read from a file-like object (opened in
+        the binary mode) into a sequence of its elements, i.e. the values of
+        a C primitive type or the instances of the nested struct / array
+        type. The data is read in chunks, which are decoded as the elements
+        are requested, thus the memory usage is bounded by the chunk size for
+        any length of the array. The stream is read until its end. The class
+        definition and the arguments are checked before the first chunk is
+        read. The optional argument BigEndian is interpreted either as None or
+        as boolean value regardless of its actual data type.
+        
+        Signature:
+            file-like /binary mode/ /, int > 0, bool OR None/
+                -> iterator(type A)
+        
+        Args:
+            File: file-like /binary mode/; object with the method read(),
+                which returns bytes-like objects, an empty one at the end
+            ChunkSize: (optional) int > 0; number of bytes to read at once,
+                rounded down to a multiple of the element size (at least one
+                element), defaults to 64 KiB
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            iterator(type A): generator of the elements, same as returned by
+                the index access to an instance of the class
+        
+        Raises:
+            UT_TypeError: the file-like object has no read() method or it is
+                opened in the text mode OR the chunk size is not an integer OR
+                the class data structure is wrongly defined
+            UT_ValueError: the chunk size is not positive; upon iteration -
+                the length of the stream is not a multiple of the size of the
+                declared elements type (raised after all complete elements are
+                yielded)
+        
+        Version 1.0.1.0
+        """
+        Reader = getattr(File, 'read', None)
+        if not callable(Reader) or isinstance(File, io.TextIOBase):
+            raise UT_TypeError(File, io.BufferedIOBase, SkipFrames = 1)
+        if not isinstance(ChunkSize, int) or isinstance(ChunkSize, bool):
+            raise UT_TypeError(ChunkSize, int, SkipFrames = 1)
+        if ChunkSize <= 0:
+            raise UT_ValueError(ChunkSize, '> 0 - chunk size', SkipFrames = 1)
+        ElementSize = cls.getElementSize() #UT_TypeError may be raised
+        ReadSize = max(1, ChunkSize // ElementSize) * ElementSize
+        ElementsType = type.__getattribute__(cls, '_ElementType')
+        IsScalar = IsC_Scalar(ElementsType)
+        if not IsScalar:
+            Codec = type.__getattribute__(ElementsType, '_getCodec')(BigEndian)
+            if not (Codec is None):
+                Builder = type.__getattribute__(ElementsType,
+                                                        '_getGenerated')().Build
+            else:
+                Unpacker = type.__getattribute__(ElementsType, '_unpackObject')
+        
+        def Generator() -> Iterator[Any]:
+            Pending = b''
+            while True:
+                Data = Reader(ReadSize - len(Pending))
+                if not Data:
+                    break
+                if len(Pending):
+                    Data = Pending + Data
+                DataSize = len(Data)
+                Size = DataSize - DataSize % ElementSize
+                if Size < DataSize:
+                    Pending = bytes(Data[Size : ])
+                    Data = Data[ : Size]
+                else:
+                    Pending = b''
+                if not Size:
+                    continue
+                if IsScalar:
+                    yield from Bytes2Scalars(Data, ElementsType,
+                                                        BigEndian = BigEndian)
+                elif not (Codec is None):
+                    yield from map(Builder, Codec.iter_unpack(Data))
+                else:
+                    for Offset in range(0, Size, ElementSize):
+                        yield Unpacker(Data[Offset : Offset + ElementSize],
+                                                        BigEndian = BigEndian)
+            if len(Pending):
+                raise UT_ValueError(len(Pending),
+                            f'multiple of {ElementSize} - stream tail length',
+                                                                SkipFrames = 1)
+        
+        return Generator()
+    
+    def writeToStream(self, File: Any, ChunkSize: int = 65536,
+                                    BigEndian: Optional[bool] = None) -> int:
+        """
+        Method to write the bytes representation of the stored data (same as
+        returned by the packBytes() method) into a file-like object (opened in
+        the binary mode) in chunks, without building the entire bytestring,
+        thus the additional memory usage is bounded by the chunk size for any
+        length of the array. If the bytes representation in the requested
+        byte order is already cached, it is written at once. The optional
+        argument BigEndian is interpreted either as None or as boolean value
+        regardless of its actual data type.
+        
+        Signature:
+            file-like /binary mode/ /, int > 0, bool OR None/ -> int >= 0
+        
+        Args:
+            File: file-like /binary mode/; object with the method write(),
+                which accepts bytes-like objects
+            ChunkSize: (optional) int > 0; number of bytes to write at once,
+                rounded down to a multiple of the element size (at least one
+                element), defaults to 64 KiB
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Returns:
+            int >= 0: number of the written bytes
+        
+        Raises:
+            UT_TypeError: the file-like object has no write() method or it is
+                opened in the text mode OR the chunk size is not an integer
+            UT_ValueError: the chunk size is not positive
+        
+        Version 1.0.1.0
+        """
+        Writer = getattr(File, 'write', None)
+        if not callable(Writer) or isinstance(File, io.TextIOBase):
+            raise UT_TypeError(File, io.BufferedIOBase, SkipFrames = 1)
+        if not isinstance(ChunkSize, int) or isinstance(ChunkSize, bool):
+            raise UT_TypeError(ChunkSize, int, SkipFrames = 1)
+        if ChunkSize <= 0:
+            raise UT_ValueError(ChunkSize, '> 0 - chunk size', SkipFrames = 1)
+        Cached = _getPackedBytes(self, BigEndian)
+        if not (Cached is None):
+            Writer(Cached)
+            return len(Cached)
+        ElementSize = type(self).getElementSize()
+        Count = max(1, ChunkSize // ElementSize)
+        ElementsType = type.__getattribute__(type(self), '_ElementType')
+        Elements = _getArrayData(self)
+        Length = len(Elements)
+        if IsC_Scalar(ElementsType):
+            for Start in range(0, Length, Count):
+                Writer(Scalars2Bytes(Elements[Start : Start + Count],
+                                        ElementsType, BigEndian = BigEndian))
+        else:
+            Packer = type.__getattribute__(ElementsType, '_packInto')
+            Buffer = bytearray(min(Count, Length) * ElementSize)
+            with memoryview(Buffer) as View:
+                for Start in range(0, Length, Count):
+                    Offset = 0
+                    for Element in Elements[Start : Start + Count]:
+                        Offset += Packer(Element, View, Offset,
+                                                        BigEndian = BigEndian)
+                    Writer(Buffer[ : Offset])
+        return Length * ElementSize
 
 class SerNumber(Serializable):
     """
@@ -2043,22 +7069,42 @@ class SerNumber(Serializable):
     Class methods:
         getSize():
             None -> int > 0
-        unpackBytes(Data, BigEndian = None):
-            bytes /, bool OR None / -> 'SerNumber
-        unpackJSON(Data):
-            str -> 'SerNumber
+        unpackBytes(Data, BigEndian = None, Trusted = None):
+            bytes-like /, bool OR None, bool OR None/ -> 'SerNumber
+        unpackFrom(Buffer, Offset = 0, BigEndian = None):
+            bytes-like /, int >= 0, bool OR None/ -> tuple('SerNumber, int)
+        unpackInto(Instance, Data, BigEndian = None):
+            'SerNumber, bytes-like /, bool OR None/ -> 'SerNumber
+        acquire():
+            None -> 'SerNumber
+        release(Instance):
+            'SerNumber -> None
+        iterUnpack(Data, BigEndian = None):
+            bytes-like /, bool OR None/ -> iterator('SerNumber)
+        unpackMany(Data, BigEndian = None):
+            bytes-like /, bool OR None/ -> list('SerNumber)
+        unpackJSON(Data, Trusted = None):
+            str/, bool OR None/ -> 'SerNumber
+        loadJSONLines(File, Trusted = None):
+            iter(str OR bytes)/, bool OR None/ -> iterator('SerNumber)
     
     Methods:
         packBytes(BigEndian = None):
             /bool OR None/ -> bytes
+        packInto(Buffer, Offset, BigEndian = None):
+            bytes-like, int >= 0/, bool OR None/ -> int >= 0
         packJSON():
             None -> str
         getNative():
             None -> type A
     
-    Version 1.0.0.0
+    Version 1.6.2.0
     """
     
+    #instance storage
+    
+    __slots__ = ('_Value', )
+    
     #special methods
     
     def __init_subclass__(cls, *, BaseType: ctypes._SimpleCData,
@@ -2105,18 +7151,20 @@ class SerNumber(Serializable):
                 it holds improper value, not a C-type, OR the value of the
                 passed argument is not compatible with the declared C-type
             
-        Version 1.0.0.0
+        Version 1.0.1.0
         """
-        Checker = object.__getattribute__(self, '_checkDefinition')
+        Checker = type(self)._checkDefinition
         Checker()
-        Checker = object.__getattribute__(self, '_checkObjectContent')
+        Checker = type(self)._checkObjectContent
         Checker(Value)
         CastValue = self.BaseType(Value).value
-        object.__setattr__(self, '_Value', CastValue)
+        _setNumberValue(self, CastValue)
+        _setPackedCache(self, None)
     
     def __setattr__(self, name: str, value: Any) -> None:
         """
         Special, magic method hooking the assignment to an attribute access.
+        The assignment invalidates the cached bytes representation.
         
         Signature:
             str, type A -> None
@@ -2131,14 +7179,15 @@ class SerNumber(Serializable):
             UT_TypeError: value to be assigned to Value is not compatible with
                 the declared C-type of the class
         
-        Version 1.0.0.0
+        Version 1.1.1.0
         """
         if name != 'Value':
             raise UT_AttributeError(self, name, SkipFrames = 1)
-        Checker = object.__getattribute__(self, '_checkObjectContent')
+        Checker = type(self)._checkObjectContent
         Checker(value)
         CastValue = self.BaseType(value).value
-        object.__setattr__(self, '_Value', CastValue)
+        _setNumberValue(self, CastValue)
+        _dropPackedBytes(self, None, CastValue)
     
     #private helper methods
     
@@ -2169,16 +7218,17 @@ class SerNumber(Serializable):
             raise Error
     
     @classmethod
-    def _parseBuffer(cls, Data: bytes, BigEndian: Optional[bool] = None) -> Any:
+    def _parseBuffer(cls, Data: TBuffer,
+                                    BigEndian: Optional[bool] = None) -> Any:
         """
         Private class method to parse the content of the passed byte string into
         a native Python object using the class data structure definition.
         
         Signature:
-            bytes /, bool OR None/ -> type A
+            bytes-like /, bool OR None/ -> type A
         
         Args:
-            Data: bytes; data to be checked
+            Data: bytes-like; data to be checked
             BigEndian: (optional) bool OR None; 3-way selector to indicate the
                 desired endianness - the default value is None, meaning native,
                 passed True value forces big endian format, passed False value
@@ -2198,6 +7248,51 @@ class SerNumber(Serializable):
         Result = Bytes2Scalar(Data, cls.BaseType, BigEndian = BigEndian)
         return Result
     
+    @classmethod
+    def _buildFromNative(cls, Data: Any, Trusted: bool = True):
+        """
+        Private class method to create a new instance from the native Python
+        scalar value, which is always converted into the declared C type. The
+        not trusted value must be of an acceptable type and within the range
+        of the C type, whereas the trusted value is only converted, i.e. an
+        out of range integer is wrapped exactly as by the C type itself.
+        
+        Signature:
+            type A/, bool/ -> 'SerNumber
+        
+        Args:
+            Data: type A; native Python value
+            Trusted: (optional) bool; flag to skip the check of the value,
+                defaults to True
+        
+        Returns:
+            'SerNumber: an instance of the same class
+        
+        Raises:
+            UT_TypeError: the value is not compatible with the declared C type
+            UT_ValueError: the not trusted value is out of the range of the
+                declared C type
+        
+        Version 1.3.0.0
+        """
+        try:
+            if Trusted:
+                Data = _castScalar(Data, cls.BaseType)
+            else:
+                Data = _convertScalar(Data, cls.BaseType)
+        except ValueError:
+            Message = f'being within the range of {cls.BaseType.__name__}'
+            raise UT_ValueError(Data, Message, SkipFrames = 2) from None
+        except Exception as err:
+            Message = f'- value incompatible with the class - {err.args[0]}'
+            Error = UT_TypeError(Data, cls.BaseType, SkipFrames = 2)
+            Error.appendMessage(Message)
+            raise Error from None
+        Result = cls.__new__(cls)
+        _setNumberValue(Result, Data)
+        _setPackedCache(Result, None)
+        return Result
+    
     @classmethod
     def _checkDefinition(cls) -> None:
         """
@@ -2212,8 +7307,11 @@ class SerNumber(Serializable):
             UT_TypeError: required class attributes are missing OR they hold
             wrong type vales
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
+        Cache = _getClassCache(cls)
+        if Cache.get('IsChecked', False):
+            return
         if not hasattr(cls, 'BaseType'):
             Error = UT_TypeError(1, int, SkipFrames = 2)
             Message= f'Wrong definition of {cls.__name__} - BaseType is missing'
@@ -2230,6 +7328,48 @@ class SerNumber(Serializable):
         if not IsC_ScalarType:
             raise Error
         del Error
+        Cache['IsChecked'] = True
+    
+    def _locateScalar(self, Key: Any = None) -> Tuple[int, TSimpleC]:
+        """
+        Private method to obtain the offset and the declared type of the
+        stored value, i.e. always 0 and the base type.
+        
+        Signature:
+            /type A/ -> tuple(int = 0, class ctypes._SimpleCData)
+        
+        Args:
+            Key: (optional) type A; ignored
+        
+        Version 1.0.0.0
+        """
+        return 0, self.BaseType
+    
+    def _unpackIntoObject(self, Data: TBuffer,
+                                    BigEndian: Optional[bool] = None) -> None:
+        """
+        Private method to re-load the stored value in place from the bytes
+        representation of the data.
+        
+        Signature:
+            bytes-like /, bool OR None/ -> None
+        
+        Args:
+            Data: bytes-like; bytes representation of the data
+            BigEndian: (optional) bool OR None; 3-way selector to indicate the
+                desired endianness - the default value is None, meaning native,
+                passed True value forces big endian format, passed False value
+                forces little endian format.
+        
+        Raises:
+            UT_ValueError: the size of the byte string does not match the size
+                of the declared base type
+        
+        Version 1.0.0.0
+        """
+        _setNumberValue(self, type(self)._parseBuffer(Data,
+                                                        BigEndian = BigEndian))
+        _resetPackedBytes(self)
     
     #public API
     
@@ -2246,7 +7386,7 @@ class SerNumber(Serializable):
         
         Version 1.0.0.0
         """
-        return object.__getattribute__(self, '_Value')
+        return _getNumberValue(self)
     
     #+ class methods
     
@@ -2263,10 +7403,13 @@ class SerNumber(Serializable):
             UT_TypeError: the class definition lacks the BaseType attribute or
                 it holds improper value, not a C-type
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        cls._checkDefinition()
-        return ctypes.sizeof(cls.BaseType)
+        Cache = _getClassCache(cls)
+        if not ('Size' in Cache):
+            cls._checkDefinition()
+            Cache['Size'] = ctypes.sizeof(cls.BaseType)
+        return Cache['Size']
     
     #+ instance methods
     
@@ -2289,7 +7432,9 @@ class SerNumber(Serializable):
         """
         Method for serialization of the stored data into bytes. The optional
         argument BigEndian is interpreted either as None or as boolean value
-        regardless of its actual data type.
+        regardless of its actual data type. The result is cached per byte
+        order until the stored data, including the nested objects, is
+        modified.
         
         Signature:
             /bool OR None/ -> bytes
@@ -2303,6 +7448,94 @@ class SerNumber(Serializable):
         Returns:
             bytes: bytestring representing the entire stored data
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        return Scalar2Bytes(self.Value, self.BaseType, BigEndian = BigEndian)
+        Result = _getPackedBytes(self, BigEndian)
+        if Result is None:
+            Result = Scalar2Bytes(self.Value, self.BaseType,
+                                                        BigEndian = BigEndian)
+            _storePackedBytes(self, Result, BigEndian)
+        return Result
+
+#+ direct accessors of the hidden instance storage slots for the internal use,
+#+ bypassing the _Hidden descriptors
+
+_getLazyView = SerStruct.__dict__['_LazyView'].Value.__get__
+
+_setLazyView = SerStruct.__dict__['_LazyView'].Value.__set__
+
+_getArrayData = SerArray.__dict__['_Data'].Value.__get__
+
+_setArrayData = SerArray.__dict__['_Data'].Value.__set__
+
+_getNumberValue = SerNumber.__dict__['_Value'].Value.__get__
+
+_setNumberValue = SerNumber.__dict__['_Value'].Value.__set__
+
+_getPackedCache = Serializable.__dict__['_Packed'].Value.__get__
+
+_setPackedCache = Serializable.__dict__['_Packed'].Value.__set__
+
+_getExtraFields = SerStruct.__dict__['_Extra'].Value.__get__
+
+_setExtraFields = SerStruct.__dict__['_Extra'].Value.__set__
+
+#+ access to the fields of the struct instances, including the fields without
+#+ own slots, e.g. not valid identifiers or added after the class creation
+
+def _getField(Object: SerStruct, Name: str) -> Any:
+    """
+    Private helper function to read a field of a struct instance either from
+    its own slot or from the fall-back storage of the fields without slots,
+    bypassing the special method __getattr__().
+    
+    Signature:
+        SerStruct, str -> type A
+    
+    Args:
+        Object: SerStruct; instance of a struct
+        Name: str; name of the field
+    
+    Returns:
+        type A: value of the field
+    
+    Raises:
+        AttributeError: the field is not assigned yet, e.g. a not yet decoded
+            field of a lazy view
+    
+    Version 1.0.0.0
+    """
+    try:
+        return object.__getattribute__(Object, Name)
+    except AttributeError:
+        try:
+            return _getExtraFields(Object)[Name]
+        except (AttributeError, KeyError):
+            raise AttributeError(Name) from None
+
+def _setField(Object: SerStruct, Name: str, Value: Any) -> None:
+    """
+    Private helper function to store the value of a field of a struct instance
+    either in its own slot or in the fall-back storage of the fields without
+    slots, which is created on demand, bypassing the special method
+    __setattr__().
+    
+    Signature:
+        SerStruct, str, type A -> None
+    
+    Args:
+        Object: SerStruct; instance of a struct
+        Name: str; name of the field
+        Value: type A; value of the field
+    
+    Version 1.0.0.0
+    """
+    try:
+        object.__setattr__(Object, Name, Value)
+    except AttributeError:
+        try:
+            Extra = _getExtraFields(Object)
+        except AttributeError:
+            Extra = dict()
+            _setExtraFields(Object, Extra)
+        Extra[Name] = Value
@@ -26,7 +26,21 @@ import types
 import unittest
 import ctypes
 import json
+import collections.abc
 import random
+import array
+import mmap
+import io
+import itertools
+import gzip
+import tempfile
+
+#+ 3rd party libraries - optional
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 #+ my libraries
 
@@ -40,7 +54,9 @@ if not (ROOT_FOLDER in sys.path):
 #++ module to be tested
 
 from com_lib.serialization import SerNULL, SerArray, SerDynamicArray, SerStruct
-from com_lib.serialization import SerNumber
+from com_lib.serialization import SerNumber, Scalar2Bytes
+from com_lib.serialization import Bytes2Scalar, Scalars2Bytes, Bytes2Scalars
+from com_lib.serialization import dumpJSONLines
 
 #classes
 
@@ -111,6 +127,21 @@ class DynamicArrayArray(SerDynamicArray):
 
     _ElementType = BaseArray
 
+class WideCharStruct(SerStruct): #not representable by the struct module
+    
+    _Fields = (
+        ('a', ctypes.c_short),
+        ('b', ctypes.c_wchar)
+    )
+
+class DeepStruct(SerStruct):
+    
+    _Fields = (
+        ('a', ctypes.c_short),
+        ('b', NestedStruct),
+        ('c', NestedArray)
+    )
+
 #+ bad declaration
 
 class BadStruct1(SerStruct): #not string key
@@ -257,8 +288,12 @@ class Test_Basis(unittest.TestCase):
             ('getSize', types.MethodType),
             ('unpackBytes', types.MethodType),
             ('unpackJSON', types.MethodType),
+            ('unpackFrom', types.MethodType),
+            ('iterUnpack', types.MethodType),
+            ('unpackMany', types.MethodType),
             ('packBytes', types.FunctionType),
             ('packJSON', types.FunctionType),
+            ('packInto', types.FunctionType),
             ('getNative', types.FunctionType)
         )
         cls.CheckAttributes = ('__dict__', '_Fields', '_ElementType', '_Length')
@@ -2415,6 +2450,38 @@ class Test_BytesSerialization(unittest.TestCase):
         self.assertListEqual(gTest, self.listArrayArray)
         del objTest
 
+    def test_unpack_Buffers(self):
+        """
+        Checks the bytes unpacking from any C-contiguous object supporting the
+        buffer protocol, and that the buffer is released afterwards.
+        
+        Test ID: TEST-T-362
+        
+        Covers requirement: REQ-FUN-362
+        
+        Version 1.0.0.0
+        """
+        Buffer = bytearray(self.bsStuct2LE)
+        for Data in (Buffer, memoryview(Buffer),
+                                    memoryview(Buffer + b'\x00\x00')[:-2]):
+            objTest = ComplexStruct.unpackBytes(Data, BigEndian = False)
+            self.assertDictEqual(objTest.getNative(), self.dictStruct2)
+            del objTest
+        Buffer.extend(b'\x00\x00') #not locked by a view
+        Buffer = mmap.mmap(-1, len(self.bsNestedArrayBE))
+        Buffer.write(self.bsNestedArrayBE)
+        objTest = NestedArray.unpackBytes(Buffer, BigEndian = True)
+        self.assertListEqual(objTest.getNative(), self.listNestedArray)
+        del objTest
+        Buffer.close()
+        Data = array.array('h', self.listBaseArray)
+        objTest = BaseDynamicArray.unpackBytes(Data)
+        self.assertListEqual(objTest.getNative(), self.listBaseArray)
+        del objTest
+        Data = memoryview(self.bsArrayArrayLE)[::2] #not contiguous
+        with self.assertRaises(TypeError):
+            BaseDynamicArray.unpackBytes(Data)
+
 class Test_SerNumber(Test_Basis):
     """
     Test suite for the SerNumber class in serialization module.
@@ -2624,18 +2691,26 @@ class Test_SerNumber(Test_Basis):
     
     def test_unpackJSON(self):
         """
-        Checks the de-serialization from JSON string.
+        Checks the de-serialization from JSON string. The out of range values
+        are rejected, unless trusted, in which case they are wrapped.
         
         Test ID: TEST-T-350
         Covers requirements: REQ-FUN-350
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         for _ in range(100000):
             TestValue = random.randint(-100000, 100000)
             CastValue = self.BaseType(TestValue).value
             CheckValue = f'{TestValue}'
-            TestResult = self.TestClass.unpackJSON(CheckValue)
+            if CastValue == TestValue:
+                TestResult = self.TestClass.unpackJSON(CheckValue)
+                self.assertIsInstance(TestResult, self.TestClass)
+                self.assertEqual(TestResult.Value, CastValue)
+            else:
+                with self.assertRaises(ValueError):
+                    self.TestClass.unpackJSON(CheckValue)
+            TestResult = self.TestClass.unpackJSON(CheckValue, Trusted = True)
             self.assertIsInstance(TestResult, self.TestClass)
             self.assertEqual(TestResult.Value, CastValue)
             del TestResult
@@ -2719,6 +2794,2839 @@ class Test_SerNumber(Test_Basis):
             with self.assertRaises(ValueError):
                 self.TestClass.unpackBytes(Input)
 
+class Test_CompiledCodec(unittest.TestCase):
+    """
+    Test the compiled struct codecs of the fixed size classes.
+    
+    Test ID: TEST-T-360
+    
+    Covers requirement: REQ-FUN-360
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        cls.FixedClasses = (BaseStruct, BaseArray, NestedStruct, NestedArray,
+                                                                    ArrayArray)
+        cls.DynamicClasses = (BaseDynamicArray, NestedDynamicStruct,
+                                        NestedDynamicArray, ComplexStruct)
+        cls.Native = {'a' : 1, 'b' : 1.0, 'c' : [2, -3]}
+    
+    def test_Codec(self):
+        """
+        Checks that the codecs are compiled only for the fixed size classes,
+        and they are cached per endianness.
+        
+        Version 1.0.0.0
+        """
+        for TestClass in self.FixedClasses:
+            for BigEndian in (None, True, False):
+                Codec = TestClass._getCodec(BigEndian)
+                self.assertEqual(Codec.size, TestClass.getSize())
+                self.assertIs(TestClass._getCodec(BigEndian), Codec)
+        for TestClass in self.DynamicClasses:
+            for BigEndian in (None, True, False):
+                self.assertIsNone(TestClass._getCodec(BigEndian))
+        for BigEndian in (None, True, False):
+            self.assertIsNone(WideCharStruct._getCodec(BigEndian))
+    
+    def test_RoundTrip(self):
+        """
+        Checks that the codec and the per field packing / unpacking produce
+        the same results.
+        
+        Version 1.0.0.0
+        """
+        objTest = NestedStruct(self.Native)
+        for BigEndian in (None, True, False):
+            Data = objTest.packBytes(BigEndian = BigEndian)
+            self.assertEqual(Data, b''.join([
+                Scalar2Bytes(1, ctypes.c_short, BigEndian = BigEndian),
+                Scalar2Bytes(1.0, ctypes.c_float, BigEndian = BigEndian),
+                Scalar2Bytes(2, ctypes.c_short, BigEndian = BigEndian),
+                Scalar2Bytes(-3, ctypes.c_short, BigEndian = BigEndian)]))
+            objNew = NestedStruct.unpackBytes(Data, BigEndian = BigEndian)
+            self.assertDictEqual(objNew.getNative(), self.Native)
+        objTest = WideCharStruct({'a' : 1, 'b' : 'x'})
+        for BigEndian in (None, True, False):
+            Data = objTest.packBytes(BigEndian = BigEndian)
+            objNew = WideCharStruct.unpackBytes(Data, BigEndian = BigEndian)
+            self.assertDictEqual(objNew.getNative(), {'a' : 1, 'b' : 'x'})
+    
+    def test_Redefinition(self):
+        """
+        Checks that the cached codec is dropped when the class definition is
+        changed.
+        
+        Version 1.0.0.0
+        """
+        class TempArray(SerArray):
+            _ElementType = ctypes.c_short
+            _Length = 2
+        
+        self.assertEqual(TempArray._getCodec().size, 4)
+        TempArray._Length = 3
+        self.assertEqual(TempArray._getCodec().size, 6)
+        self.assertEqual(len(TempArray.unpackBytes(b'\x00' * 6)), 3)
+
+class Test_DefinitionCache(unittest.TestCase):
+    """
+    Test the per class caching of the data structure definition checks and
+    the computed sizes.
+    
+    Test ID: TEST-T-361
+    
+    Covers requirement: REQ-FUN-361
+    
+    Version 1.0.0.0
+    """
+    
+    def test_Sizes(self):
+        """
+        Checks that the cached sizes and fields offsets are consistent with
+        the declared data structure.
+        
+        Version 1.0.0.0
+        """
+        for _ in range(2): #computed, then cached
+            self.assertEqual(BaseStruct.getSize(), 6)
+            self.assertEqual(NestedStruct.getSize(), 10)
+            self.assertIsNone(ComplexStruct.getSize())
+            self.assertEqual(ComplexStruct.getMinSize(), 12)
+            self.assertEqual(DynamicArrayArray.getElementSize(), 4)
+            self.assertEqual(T_UINT16.getSize(), 2)
+        self.assertEqual(tuple(Row[3] for Row in
+                                    NestedStruct._getFieldsTable()), (0, 2, 6))
+        self.assertEqual(tuple(Row[3] for Row in
+                                    ComplexStruct._getFieldsTable()), (0, 2, 6))
+        self.assertIsNone(ComplexStruct._getFieldsTable()[-1][-1])
+    
+    def test_Redefinition(self):
+        """
+        Checks that the cached data is dropped if a nested class is re-defined,
+        and that the sub-classes do not share the cache of the parent class.
+        
+        Version 1.0.0.0
+        """
+        class TempArray(SerArray):
+            _ElementType = ctypes.c_short
+            _Length = 2
+        
+        class TempStruct(SerStruct):
+            _Fields = (
+                ('a', ctypes.c_int),
+                ('b', TempArray)
+            )
+        
+        class TempChild(TempStruct):
+            _Fields = (
+                ('a', ctypes.c_int),
+            )
+        
+        self.assertEqual(TempStruct.getSize(), 8)
+        self.assertEqual(TempChild.getSize(), 4)
+        TempArray._Length = 4
+        self.assertEqual(TempStruct.getSize(), 12)
+        self.assertEqual(len(TempStruct().b), 4)
+        TempArray._Length = 0
+        with self.assertRaises(TypeError):
+            TempStruct.getSize()
+        with self.assertRaises(TypeError):
+            TempStruct()
+        TempArray._Length = 1
+        self.assertEqual(TempStruct.getSize(), 6)
+
+    def test_Isolation(self):
+        """
+        Checks that only the caches of the re-defined class, of its sub-classes
+        and of the classes depending on them are dropped, whereas the caches of
+        the unrelated classes survive the definition of new classes and the
+        changes of the unrelated classes.
+        
+        Version 1.0.0.0
+        """
+        class TempArray(SerArray):
+            _ElementType = ctypes.c_short
+            _Length = 2
+        
+        class TempStruct(SerStruct):
+            _Fields = (
+                ('a', ctypes.c_int),
+                ('b', TempArray)
+            )
+        
+        class TempOuter(SerDynamicArray):
+            _ElementType = TempStruct
+        
+        Codecs = [Class._getCodec(None) for Class in (BaseStruct, NestedArray,
+                                        TempArray, TempStruct, TempOuter)]
+        self.assertIsNotNone(Codecs[0])
+        
+        class TempNumber(SerNumber, BaseType = ctypes.c_ushort):
+            pass
+        
+        class TempChild(BaseStruct):
+            pass
+        
+        TempNumber._Unused = 1
+        del TempNumber._Unused
+        for Class, Codec in zip((BaseStruct, NestedArray, TempArray,
+                                            TempStruct, TempOuter), Codecs):
+            self.assertIs(Class._getCodec(None), Codec)
+        TempArray._Length = 3
+        self.assertIs(BaseStruct._getCodec(None), Codecs[0])
+        self.assertIs(NestedArray._getCodec(None), Codecs[1])
+        self.assertIsNot(TempArray._getCodec(None), Codecs[2])
+        self.assertIsNot(TempStruct._getCodec(None), Codecs[3])
+        self.assertEqual(TempStruct.getSize(), 10)
+        self.assertEqual(TempOuter.getElementSize(), 10)
+        self.assertEqual(TempChild.getSize(), 6)
+
+class Test_BufferAPI(unittest.TestCase):
+    """
+    Test the packing into and unpacking from a part of a shared buffer.
+    
+    Test ID: TEST-T-363
+    
+    Covers requirement: REQ-FUN-363
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        cls.Objects = (
+            SerNULL(),
+            T_UINT16(5),
+            BaseStruct({'a' : 1, 'b' : 2.0}),
+            NestedArray([{'a' : 3, 'b' : 4.0}, {'a' : 5, 'b' : 6.0}]),
+            WideCharStruct({'a' : 7, 'b' : 'x'}),
+            ArrayArray([[1, 2], [3, 4], [5, 6]]),
+            NestedDynamicArray([{'a' : 8, 'b' : 9.0}])
+        )
+    
+    def test_Records(self):
+        """
+        Checks that concatenated records can be assembled in a pre-allocated
+        buffer and walked through, the dynamic length object being the last.
+        
+        Version 1.0.0.0
+        """
+        for BigEndian in (None, True, False):
+            Expected = b''.join(Item.packBytes(BigEndian = BigEndian)
+                                                    for Item in self.Objects)
+            Buffer = bytearray(len(Expected))
+            Offset = 0
+            for Item in self.Objects:
+                Offset += Item.packInto(Buffer, Offset, BigEndian = BigEndian)
+            self.assertEqual(Offset, len(Expected))
+            self.assertEqual(bytes(Buffer), Expected)
+            Offset = 0
+            for Item in self.Objects:
+                objTest, Consumed = Item.__class__.unpackFrom(Buffer, Offset,
+                                                        BigEndian = BigEndian)
+                self.assertIsInstance(objTest, Item.__class__)
+                self.assertEqual(objTest.getNative(), Item.getNative())
+                Offset += Consumed
+            self.assertEqual(Offset, len(Buffer))
+            Buffer.append(0) #the buffer is not locked
+    
+    def test_TypeError(self):
+        """
+        Checks that non-buffer, read-only buffer or non-integer offset are not
+        acceptable.
+        
+        Version 1.0.0.0
+        """
+        objTest = BaseStruct()
+        for Buffer in (b'\x00' * 6, '123456', [0] * 6, 6):
+            with self.assertRaises(TypeError):
+                objTest.packInto(Buffer, 0)
+        for Buffer in ('123456', [0] * 6, 6):
+            with self.assertRaises(TypeError):
+                BaseStruct.unpackFrom(Buffer)
+        for Offset in (1.0, '1', None):
+            with self.assertRaises(TypeError):
+                objTest.packInto(bytearray(6), Offset)
+            with self.assertRaises(TypeError):
+                BaseStruct.unpackFrom(b'\x00' * 6, Offset)
+    
+    def test_ValueError(self):
+        """
+        Checks that the offset outside the buffer or too short remaining part
+        of the buffer are detected.
+        
+        Version 1.0.0.0
+        """
+        objTest = BaseStruct()
+        for Offset in (-1, 1, 7):
+            with self.assertRaises(ValueError):
+                objTest.packInto(bytearray(6), Offset)
+            with self.assertRaises(ValueError):
+                BaseStruct.unpackFrom(b'\x00' * 6, Offset)
+        with self.assertRaises(ValueError):
+            BaseDynamicArray.unpackFrom(b'\x00' * 6, 1)
+
+class Test_BatchUnpack(unittest.TestCase):
+    """
+    Test the de-serialization of a number of back-to-back records of the same
+    fixed size class at once.
+    
+    Test ID: TEST-T-364
+    
+    Covers requirement: REQ-FUN-364
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        cls.Records = {
+            T_UINT16 : [1, 2, 65535],
+            BaseStruct : [{'a' : Index, 'b' : Index / 2} for Index in range(5)],
+            NestedArray : [[{'a' : Index, 'b' : 1.0}, {'a' : 2, 'b' : 0.5}]
+                                                        for Index in range(3)],
+            WideCharStruct : [{'a' : -1, 'b' : 'a'}, {'a' : 1, 'b' : 'z'}],
+            ArrayArray : [[[Index, 2], [3, 4], [5, Index]]
+                                                        for Index in range(4)]
+        }
+    
+    def test_unpackMany(self):
+        """
+        Checks that the records are decoded in the correct order, both via the
+        compiled codec and by the fall-back parsing, with any endianness.
+        
+        Version 1.0.0.0
+        """
+        for Class, Records in self.Records.items():
+            for BigEndian in (None, True, False):
+                Data = b''.join(Class(Item).packBytes(BigEndian = BigEndian)
+                                                        for Item in Records)
+                for Buffer in (Data, bytearray(Data), memoryview(Data)):
+                    Result = Class.unpackMany(Buffer, BigEndian = BigEndian)
+                    self.assertIsInstance(Result, list)
+                    self.assertEqual(len(Result), len(Records))
+                    for objTest, Item in zip(Result, Records):
+                        self.assertIsInstance(objTest, Class)
+                        self.assertEqual(objTest.getNative(), Item)
+                self.assertEqual(Class.unpackMany(b''), [])
+    
+    def test_iterUnpack(self):
+        """
+        Checks that the lazy version yields the same instances one by one, and
+        that the buffer is not locked by an unstarted or abandoned iterator,
+        and it is released once the iterator is exhausted.
+        
+        Version 1.1.0.0
+        """
+        for Class, Records in self.Records.items():
+            Buffer = bytearray(b''.join(Class(Item).packBytes()
+                                                        for Item in Records))
+            Result = Class.iterUnpack(Buffer)
+            Buffer.extend(Buffer)
+            del Buffer[len(Buffer) // 2 :]
+            Result = Class.iterUnpack(Buffer)
+            next(Result)
+            Result.close()
+            Buffer.append(0)
+            Buffer.pop()
+            Result = Class.iterUnpack(Buffer)
+            self.assertIsInstance(Result, collections.abc.Iterator)
+            objTest = next(Result)
+            self.assertEqual(objTest.getNative(), Records[0])
+            self.assertEqual([Item.getNative() for Item in Result],
+                                                                Records[1:])
+            Buffer.append(0)
+    
+    def test_TypeError(self):
+        """
+        Checks that only the fixed, non-zero size classes are supported, and
+        that non-buffer data is not acceptable.
+        
+        Version 1.0.0.0
+        """
+        for Class in (SerNULL, BaseDynamicArray, NestedDynamicArray,
+                                                                ComplexStruct):
+            with self.assertRaises(TypeError):
+                Class.unpackMany(b'\x00' * 12)
+            with self.assertRaises(TypeError):
+                Class.iterUnpack(b'\x00' * 12)
+        for Data in ('123456', [0] * 6, 6, None):
+            with self.assertRaises(TypeError):
+                BaseStruct.unpackMany(Data)
+            with self.assertRaises(TypeError):
+                BaseStruct.iterUnpack(Data)
+    
+    def test_ValueError(self):
+        """
+        Checks that the length of the buffer must be a multiple of the class
+        size, and that the buffer is not locked after the check fails.
+        
+        Version 1.0.0.0
+        """
+        Size = BaseStruct.getSize()
+        for Length in (1, Size - 1, Size + 1, 3 * Size + 2):
+            Buffer = bytearray(Length)
+            with self.assertRaises(ValueError):
+                BaseStruct.unpackMany(Buffer)
+            with self.assertRaises(ValueError):
+                BaseStruct.iterUnpack(Buffer)
+            Buffer.append(0)
+
+class Test_Columns(unittest.TestCase):
+    """
+    Test the columnar de-serialization of a number of back-to-back records of
+    the same fixed size struct.
+    
+    Test ID: TEST-T-365
+    
+    Covers requirement: REQ-FUN-365
+    
+    Version 1.0.0.0
+    """
+    
+    def test_Columns(self):
+        """
+        Checks the flattened names, the data types of the columns and the
+        values, both via the compiled codec and by the fall-back parsing, with
+        any endianness.
+        
+        Version 1.0.0.0
+        """
+        for BigEndian in (None, True, False):
+            Records = [{'a' : Index, 'b' : Index / 4} for Index in range(-2, 3)]
+            Data = b''.join(BaseStruct(Item).packBytes(BigEndian = BigEndian)
+                                                        for Item in Records)
+            Result = BaseStruct.decodeColumns(bytearray(Data),
+                                                        BigEndian = BigEndian)
+            self.assertEqual(list(Result.keys()), ['a', 'b'])
+            for Column in Result.values():
+                self.assertIsInstance(Column, array.array)
+            self.assertEqual(Result['a'].itemsize, 2)
+            self.assertEqual(Result['b'].itemsize, 4)
+            self.assertEqual(list(Result['a']), list(range(-2, 3)))
+            self.assertEqual(list(Result['b']),
+                                        [Index / 4 for Index in range(-2, 3)])
+            Records = [{'a' : -1, 'b' : 'a'}, {'a' : 2, 'b' : 'z'}]
+            Data = b''.join(WideCharStruct(Item).packBytes(BigEndian= BigEndian)
+                                                        for Item in Records)
+            Result = WideCharStruct.decodeColumns(Data, BigEndian = BigEndian)
+            self.assertIsInstance(Result['a'], array.array)
+            self.assertEqual(list(Result['a']), [-1, 2])
+            self.assertEqual(Result['b'], ['a', 'z'])
+    
+    def test_Nested(self):
+        """
+        Checks that the nested structs and arrays are flattened into the dotted
+        names of the 'leaves' in the declaration order.
+        
+        Version 1.0.0.0
+        """
+        Record = {'a' : 1, 'b' : {'a' : 2, 'b' : 0.5, 'c' : [3, 4]},
+                        'c' : [{'a' : 5, 'b' : 1.5}, {'a' : 6, 'b' : 2.5}]}
+        Data = DeepStruct(Record).packBytes() * 3
+        Result = DeepStruct.decodeColumns(Data)
+        self.assertEqual(list(Result.keys()), ['a', 'b.a', 'b.b', 'b.c.0',
+                                'b.c.1', 'c.0.a', 'c.0.b', 'c.1.a', 'c.1.b'])
+        self.assertEqual(list(Result['b.b']), [0.5, 0.5, 0.5])
+        self.assertEqual(list(Result['b.c.1']), [4, 4, 4])
+        self.assertEqual(list(Result['c.1.b']), [2.5, 2.5, 2.5])
+        Result = DeepStruct.decodeColumns(b'')
+        self.assertEqual(len(Result), 9)
+        for Column in Result.values():
+            self.assertEqual(len(Column), 0)
+    
+    def test_Errors(self):
+        """
+        Checks that only the fixed size structs and the buffers of the length
+        multiple of the struct size are acceptable.
+        
+        Version 1.0.0.0
+        """
+        for Data in ('123456', [0] * 6, 6, None):
+            with self.assertRaises(TypeError):
+                BaseStruct.decodeColumns(Data)
+        with self.assertRaises(TypeError):
+            ComplexStruct.decodeColumns(b'\x00' * 12)
+        with self.assertRaises(ValueError):
+            BaseStruct.decodeColumns(b'\x00' * 7)
+    
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_Numpy(self):
+        """
+        Checks that the NumPy columns are the views of the buffer with the same
+        names and values as the array.array / list columns.
+        
+        Version 1.0.0.0
+        """
+        Record = {'a' : 1, 'b' : {'a' : 2, 'b' : 0.5, 'c' : [3, 4]},
+                        'c' : [{'a' : 5, 'b' : 1.5}, {'a' : 6, 'b' : 2.5}]}
+        for BigEndian in (None, True, False):
+            Data = bytearray(DeepStruct(Record).packBytes(BigEndian = BigEndian)
+                                                                        * 3)
+            Expected = DeepStruct.decodeColumns(Data, BigEndian = BigEndian)
+            Result = DeepStruct.decodeNumpyColumns(Data, BigEndian = BigEndian)
+            self.assertEqual(list(Result.keys()), list(Expected.keys()))
+            for Name, Column in Result.items():
+                self.assertIsInstance(Column, numpy.ndarray)
+                self.assertEqual(Column.ndim, 1)
+                self.assertEqual(Column.tolist(), list(Expected[Name]))
+            Result['c.1.a'][1] = 7
+            self.assertEqual(DeepStruct.decodeColumns(Data,
+                                    BigEndian = BigEndian)['c.1.a'],
+                                                array.array('h', [6, 7, 6]))
+        with self.assertRaises(TypeError):
+            WideCharStruct.decodeNumpyColumns(b'')
+        with self.assertRaises(ValueError):
+            BaseStruct.decodeNumpyColumns(b'\x00' * 7)
+
+class Test_LazyView(unittest.TestCase):
+    """
+    Test the lazy views of the structs decoding the fields on the first access.
+    
+    Test ID: TEST-T-366
+    
+    Covers requirement: REQ-FUN-366
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        cls.Objects = (
+            BaseStruct({'a' : 1, 'b' : 2.0}),
+            NestedStruct({'a' : 1, 'b' : 2.0, 'c' : [3, 4]}),
+            WideCharStruct({'a' : 7, 'b' : 'x'}),
+            DeepStruct({'a' : 1, 'b' : {'a' : 2, 'b' : 0.5, 'c' : [3, 4]},
+                        'c' : [{'a' : 5, 'b' : 1.5}, {'a' : 6, 'b' : 2.5}]}),
+            ComplexStruct({'a' : 1, 'b' : 1.0,
+                                'c' : {'a' : 2, 'b' : 1.0, 'c' : [3, 4, 5]}})
+        )
+    
+    def test_Equivalence(self):
+        """
+        Checks that a view is an instance of the class, which holds the same
+        data as the eagerly de-serialized instance.
+        
+        Version 1.0.0.0
+        """
+        for Item in self.Objects:
+            Class = Item.__class__
+            for BigEndian in (None, True, False):
+                Data = Item.packBytes(BigEndian = BigEndian)
+                objTest = Class.view(Data, BigEndian = BigEndian)
+                self.assertIsInstance(objTest, Class)
+                self.assertEqual(objTest.getNative(), Item.getNative())
+                self.assertEqual(objTest.packBytes(BigEndian = BigEndian),
+                                                                        Data)
+                self.assertEqual(objTest.getCurrentSize(), len(Data))
+                objTest = Class.view(Data, BigEndian = BigEndian)
+                self.assertEqual(Class(objTest).getNative(), Item.getNative())
+    
+    def test_Lazy(self):
+        """
+        Checks that the fields are decoded on the first access only, that the
+        nested structs are views themselves, and that the fields can be
+        assigned to.
+        
+        Version 1.0.0.0
+        """
+        Item = self.Objects[3]
+        Buffer = bytearray(Item.packBytes())
+        objTest = DeepStruct.view(Buffer)
+        self.assertEqual(objTest.a, 1)
+        Buffer[0 : 2] = Scalar2Bytes(10, ctypes.c_short)
+        Buffer[2 : 4] = Scalar2Bytes(20, ctypes.c_short)
+        self.assertEqual(objTest.a, 1) #cached
+        objNested = objTest.b
+        self.assertIsInstance(objNested, NestedStruct)
+        self.assertEqual(objNested.a, 20) #decoded after the change
+        objTest.a = 30
+        self.assertEqual(objTest.a, 30)
+        self.assertEqual(objTest.c[1].a, 6)
+        objTest.c[1].a = 40
+        Expected = Item.getNative()
+        Expected['a'] = 30
+        Expected['b']['a'] = 20
+        Expected['c'][1]['a'] = 40
+        self.assertEqual(objTest.getNative(), Expected)
+        self.assertEqual(objTest.packBytes(),
+                                        DeepStruct(Expected).packBytes())
+        Buffer.append(0) #the buffer is released after complete decoding
+        with self.assertRaises(AttributeError):
+            objTest.z
+        with self.assertRaises(AttributeError):
+            objTest._LazyView
+        with self.assertRaises(TypeError):
+            objTest.b = Expected['b']
+    
+    def test_Errors(self):
+        """
+        Checks that non-buffer data and data of a wrong size are detected at
+        the creation of a view.
+        
+        Version 1.0.0.0
+        """
+        for Data in ('123456', [0] * 6, 6, None):
+            with self.assertRaises(TypeError):
+                BaseStruct.view(Data)
+        for Data in (b'', b'\x00' * 5, b'\x00' * 7):
+            with self.assertRaises(ValueError):
+                BaseStruct.view(Data)
+        with self.assertRaises(ValueError):
+            ComplexStruct.view(b'\x00' * 5)
+
+class Test_Slots(unittest.TestCase):
+    """
+    Test the slots based storage of the instances.
+    
+    Test ID: TEST-T-367
+    
+    Covers requirement: REQ-FUN-367
+    
+    Version 1.0.0.0
+    """
+    
+    def test_NoDict(self):
+        """
+        Checks that the instances of all types do not have __dict__, and that
+        the fields are stored in the generated slots.
+        
+        Version 1.0.0.0
+        """
+        for Class in (SerNULL, BaseStruct, NestedStruct, ComplexStruct,
+                        DeepStruct, BaseArray, NestedArray, BaseDynamicArray,
+                        NestedDynamicArray, T_UINT16):
+            objTest = Class()
+            with self.assertRaises(AttributeError):
+                object.__getattribute__(objTest, '__dict__')
+        self.assertEqual(BaseStruct.__slots__, ('a', 'b'))
+        
+        class TempChild(BaseStruct):
+            _Fields = (
+                ('a', ctypes.c_short),
+                ('b', ctypes.c_float),
+                ('c', ctypes.c_int)
+            )
+        
+        self.assertEqual(TempChild.__slots__, ('c', ))
+        objTest = TempChild({'a' : 1, 'b' : 2.0, 'c' : 3})
+        self.assertEqual(objTest.getNative(), {'a' : 1, 'b' : 2.0, 'c' : 3})
+        with self.assertRaises(AttributeError):
+            object.__getattribute__(objTest, '__dict__')
+    
+    def test_Redefinition(self):
+        """
+        Checks that the fields can be added to a struct after the class
+        creation, as well as removed or re-typed, and that the added fields
+        are stored without __dict__.
+        
+        Version 1.1.0.0
+        """
+        
+        class TempStruct(SerStruct):
+            _Fields = (
+                ('a', ctypes.c_short),
+                ('b', ctypes.c_float)
+            )
+        
+        TempStruct._Fields = (('b', ctypes.c_int), )
+        objTest = TempStruct({'b' : 2})
+        self.assertEqual(objTest.getNative(), {'b' : 2})
+        TempStruct._Fields = (('a', ctypes.c_short), ('c', ctypes.c_int))
+        objTest = TempStruct({'a' : 1, 'c' : 3})
+        self.assertEqual(objTest.c, 3)
+        objTest.c = 4
+        self.assertEqual(objTest.getNative(), {'a' : 1, 'c' : 4})
+        Data = objTest.packBytes()
+        self.assertEqual(len(Data), TempStruct.getSize())
+        self.assertEqual(TempStruct.unpackBytes(Data).getNative(),
+                                                        {'a' : 1, 'c' : 4})
+        self.assertEqual(TempStruct.view(Data).c, 4)
+        self.assertEqual(TempStruct.unpackJSON('{"a" : 1, "c" : 4}').c, 4)
+        with self.assertRaises(AttributeError):
+            object.__getattribute__(objTest, '__dict__')
+        TempStruct._Fields = (('a', ctypes.c_short), ('getSize', ctypes.c_int))
+        with self.assertRaises(TypeError):
+            TempStruct()
+    
+    def test_Names(self):
+        """
+        Checks that the fields with names, which are not valid identifiers,
+        are stored in the fall-back storage, whereas the field names clashing
+        with a class attribute are rejected at the class creation.
+        
+        Version 1.0.0.0
+        """
+        
+        class TempStruct(SerStruct):
+            _Fields = (
+                ('x y', ctypes.c_short),
+                ('1a', ctypes.c_int),
+                ('b', ctypes.c_float)
+            )
+        
+        self.assertEqual(TempStruct.__slots__, ('b', ))
+        Native = {'x y' : 1, '1a' : -2, 'b' : 0.5}
+        objTest = TempStruct(Native)
+        self.assertEqual(getattr(objTest, 'x y'), 1)
+        setattr(objTest, '1a', 3)
+        Native['1a'] = 3
+        self.assertEqual(objTest.getNative(), Native)
+        Data = objTest.packBytes()
+        self.assertEqual(TempStruct.unpackBytes(Data).getNative(), Native)
+        self.assertEqual(getattr(TempStruct.view(Data), '1a'), 3)
+        self.assertEqual(TempStruct.decodeColumns(Data)['x y'],
+                                                        array.array('h', [1]))
+        with self.assertRaises(AttributeError):
+            object.__getattribute__(objTest, '__dict__')
+        for Name in ('getSize', 'packBytes', '_LazyView', '_Fields'):
+            with self.assertRaises(TypeError):
+                
+                class BadStruct(SerStruct):
+                    _Fields = ((Name, ctypes.c_int), )
+        
+        with self.assertRaises(TypeError):
+            
+            class BadStruct(BaseStruct): #clashes with the class body
+                _Fields = (('a', ctypes.c_short), ('c', ctypes.c_int))
+                
+                def c(self):
+                    pass
+
+class Test_AttributeAccess(unittest.TestCase):
+    """
+    Test the descriptors based protection of the 'private' attributes.
+    
+    Test ID: TEST-T-368
+    
+    Covers requirement: REQ-FUN-368
+    
+    Version 1.0.0.0
+    """
+    
+    def test_Private(self):
+        """
+        Checks that the 'private' attributes, including methods and the data
+        storage slots, are not readable via the instances, whereas they are
+        accessible via the classes.
+        
+        Version 1.0.0.0
+        """
+        objTest = BaseStruct({'a' : 1, 'b' : 2.0})
+        for Name in ('_Fields', '_checkDefinition', '_getFieldsTable',
+                        '_parseBuffer', '_LazyView', '_loadAll'):
+            with self.assertRaises(AttributeError):
+                getattr(objTest, Name)
+            self.assertIsNotNone(getattr(BaseStruct, Name))
+        self.assertIsInstance(BaseStruct._Fields, tuple)
+        self.assertEqual(BaseStruct._getFieldsTypes(),
+                                    {'a' : ctypes.c_short, 'b' : ctypes.c_float})
+        objTest = BaseArray([1, 2])
+        for Name in ('_Data', '_ElementType', '_Length', '_checkDefinition'):
+            with self.assertRaises(AttributeError):
+                getattr(objTest, Name)
+        self.assertIs(BaseArray._ElementType, ctypes.c_short)
+        objTest = T_UINT16(5)
+        for Name in ('_Value', '_checkDefinition'):
+            with self.assertRaises(AttributeError):
+                getattr(objTest, Name)
+        for Name in ('_Data', '_Value', '_Fields', '_ElementType', '_Length'):
+            with self.assertRaises(AttributeError):
+                setattr(objTest, Name, 1)
+            with self.assertRaises(AttributeError):
+                delattr(objTest, Name)
+        self.assertEqual(objTest.Value, 5)
+    
+    def test_Public(self):
+        """
+        Checks the read access to the fields and the public methods, as well
+        as to the special attribute __name__ and non-existing attributes.
+        
+        Version 1.0.0.0
+        """
+        objTest = BaseStruct({'a' : 1, 'b' : 2.0})
+        self.assertEqual(objTest.a, 1)
+        self.assertEqual(objTest.packBytes(), BaseStruct.unpackBytes(
+                                        objTest.packBytes()).packBytes())
+        self.assertEqual(objTest.__name__, 'BaseStruct')
+        self.assertEqual(BaseArray().__name__, 'BaseArray')
+        self.assertEqual(T_UINT16().__name__, 'T_UINT16')
+        for Name in ('c', 'Value', 'x_y'):
+            with self.assertRaises(AttributeError):
+                getattr(objTest, Name)
+        for Name in ('a', 'b'):
+            with self.assertRaises(AttributeError):
+                delattr(objTest, Name)
+        self.assertEqual(objTest.getNative(), {'a' : 1, 'b' : 2.0})
+    
+    def test_Redefinition(self):
+        """
+        Checks that the 'private' class attributes assigned in the run-time are
+        also hidden from the instances, and that they are used by the class.
+        
+        Version 1.0.0.0
+        """
+        
+        class TempArray(SerArray):
+            _ElementType = ctypes.c_int
+            _Length = 2
+        
+        self.assertEqual(len(TempArray()), 2)
+        TempArray._Length = 3
+        objTest = TempArray([1, 2, 3])
+        self.assertEqual(len(objTest), 3)
+        self.assertEqual(TempArray._Length, 3)
+        with self.assertRaises(AttributeError):
+            getattr(objTest, '_Length')
+        TempArray._Extra = 1
+        self.assertEqual(TempArray._Extra, 1)
+        with self.assertRaises(AttributeError):
+            getattr(objTest, '_Extra')
+
+class Test_NestedUnpack(unittest.TestCase):
+    """
+    Test the single pass construction of the nested objects during the
+    de-serialization.
+    
+    Test ID: TEST-T-369
+    
+    Covers requirement: REQ-FUN-369
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 1.0.0.0
+        """
+        
+        class WideNestedStruct(SerStruct):
+            _Fields = (
+                ('a', ctypes.c_short),
+                ('b', WideCharStruct),
+                ('c', NestedArray)
+            )
+        
+        class WideDynamicArray(SerDynamicArray):
+            _ElementType = WideCharStruct
+        
+        cls.Samples = (
+            (DeepStruct, {'a' : 1, 'b' : {'a' : 2, 'b' : 0.5, 'c' : [3, 4]},
+                'c' : [{'a' : 5, 'b' : 1.5}, {'a' : 6, 'b' : -2.0}]}),
+            (NestedArray, [{'a' : 1, 'b' : 1.0}, {'a' : -1, 'b' : 2.5}]),
+            (ArrayArray, [[1, 2], [3, 4], [5, 6]]),
+            (NestedDynamicArray, [{'a' : 1, 'b' : 1.0}, {'a' : 2, 'b' : 2.0},
+                                                    {'a' : 3, 'b' : 3.0}]),
+            (DynamicArrayArray, [[1, 2], [-3, 4]]),
+            (ComplexStruct, {'a' : 1, 'b' : 2.0,
+                                'c' : {'a' : 3, 'b' : 4.0, 'c' : [5, 6, 7]}}),
+            (WideNestedStruct, {'a' : 1, 'b' : {'a' : 2, 'b' : 'x'},
+                'c' : [{'a' : 5, 'b' : 1.5}, {'a' : 6, 'b' : -2.0}]}),
+            (WideDynamicArray, [{'a' : 1, 'b' : 'y'}, {'a' : 2, 'b' : 'z'}])
+        )
+    
+    def test_Equivalence(self):
+        """
+        Checks that the directly constructed objects are equivalent to the
+        objects created from the native Python representation, for both
+        endiannesses.
+        
+        Version 1.0.0.0
+        """
+        for Class, Native in self.Samples:
+            Expected = Class(Native)
+            for BigEndian in (None, False, True):
+                Data = Expected.packBytes(BigEndian = BigEndian)
+                objTest = Class.unpackBytes(Data, BigEndian = BigEndian)
+                self.assertIsInstance(objTest, Class)
+                self.assertEqual(objTest.getNative(), Expected.getNative())
+                self.assertEqual(objTest.getNative(), Native)
+                self.assertEqual(objTest.packBytes(BigEndian = BigEndian),
+                                                                        Data)
+                objTest, Size = Class.unpackFrom(b'\x00' + Data, 1,
+                                                        BigEndian = BigEndian)
+                self.assertEqual(Size, len(Data))
+                self.assertEqual(objTest.getNative(), Native)
+    
+    def test_NestedObjects(self):
+        """
+        Checks the types and the independence of the directly constructed
+        nested objects, and that they remain modifiable.
+        
+        Version 1.0.0.0
+        """
+        Data = DeepStruct({'a' : 1, 'b' : {'a' : 2, 'b' : 0.5, 'c' : [3, 4]},
+            'c' : [{'a' : 5, 'b' : 1.5}, {'a' : 6, 'b' : -2.0}]}).packBytes()
+        objTest = DeepStruct.unpackBytes(Data)
+        self.assertIsInstance(objTest.b, NestedStruct)
+        self.assertIsInstance(objTest.b.c, BaseArray)
+        self.assertIsInstance(objTest.c, NestedArray)
+        self.assertIsInstance(objTest.c[0], BaseStruct)
+        self.assertIsNot(objTest.c[0], objTest.c[1])
+        objTest.b.c[0] = 10
+        objTest.c[1].a = 20
+        self.assertEqual(objTest.b.c.getNative(), [10, 4])
+        self.assertEqual(objTest.c[1].getNative(), {'a' : 20, 'b' : -2.0})
+        objOther = DeepStruct.unpackBytes(Data)
+        self.assertEqual(objOther.b.c.getNative(), [3, 4])
+        self.assertEqual(objOther.c[1].a, 6)
+        with self.assertRaises(TypeError):
+            objTest.b = NestedStruct()
+        objTest = NestedDynamicArray.unpackBytes(NestedDynamicArray(
+                                    [{'a' : 1, 'b' : 1.0}] * 3).packBytes())
+        self.assertEqual(len(objTest), 3)
+        self.assertIsNot(objTest[0], objTest[2])
+        for objItem in DeepStruct.iterUnpack(Data * 2):
+            self.assertIsInstance(objItem.c[1], BaseStruct)
+            self.assertEqual(objItem.c[1].a, 6)
+    
+    def test_Errors(self):
+        """
+        Checks that the size mismatches are still detected at any nesting level.
+        
+        Version 1.0.0.0
+        """
+        for Class, Native in self.Samples:
+            Data = Class(Native).packBytes()
+            with self.assertRaises(ValueError):
+                Class.unpackBytes(Data[:-1])
+        Data = ComplexStruct({'a' : 1, 'b' : 2.0,
+                            'c' : {'a' : 3, 'b' : 4.0, 'c' : [5]}}).packBytes()
+        with self.assertRaises(ValueError):
+            ComplexStruct.unpackBytes(Data + b'\x00')
+        with self.assertRaises(ValueError):
+            NestedDynamicArray.unpackBytes(b'\x00' * 7)
+
+class Test_Trusted(unittest.TestCase):
+    """
+    Test the trusted mode of the de-serialization.
+    
+    Test ID: TEST-T-36A
+    
+    Covers requirement: REQ-FUN-36A
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 1.0.0.0
+        """
+        
+        class TrustedStruct(DeepStruct):
+            _Trusted = True
+        
+        cls.TrustedStruct = TrustedStruct
+        cls.Samples = (
+            (DeepStruct, {'a' : 1, 'b' : {'a' : 2, 'b' : 0.5, 'c' : [3, 4]},
+                'c' : [{'a' : 5, 'b' : 1.5}, {'a' : 6, 'b' : -2.0}]}),
+            (NestedDynamicArray, [{'a' : 1, 'b' : 1.0}, {'a' : 2, 'b' : 2.0}]),
+            (DynamicArrayArray, [[1, 2], [-3, 4]]),
+            (ComplexStruct, {'a' : 1, 'b' : 2.0,
+                                'c' : {'a' : 3, 'b' : 4.0, 'c' : [5, 6, 7]}}),
+            (WideCharStruct, {'a' : 1, 'b' : 'x'}),
+            (T_UINT16, 5),
+            (SerNULL, None)
+        )
+    
+    def test_Equivalence(self):
+        """
+        Checks that the trusted mode produces the same objects from the valid
+        data.
+        
+        Version 1.0.0.0
+        """
+        for Class, Native in self.Samples:
+            objSource = Class(Native)
+            Data = objSource.packBytes()
+            objTest = Class.unpackBytes(Data, Trusted = True)
+            self.assertIsInstance(objTest, Class)
+            self.assertEqual(objTest.getNative(), Native)
+            objTest = Class.unpackBytes(Data, BigEndian = True, Trusted = True)
+            self.assertEqual(objTest.packBytes(BigEndian = True), Data)
+            Data = objSource.packJSON()
+            objTest = Class.unpackJSON(Data, Trusted = True)
+            self.assertIsInstance(objTest, Class)
+            self.assertEqual(objTest.getNative(), Native)
+            self.assertEqual(objTest.packBytes(), objSource.packBytes())
+        objTest = DeepStruct.unpackJSON(self.Samples[0][0](
+                            self.Samples[0][1]).packJSON(), Trusted = True)
+        self.assertIsInstance(objTest.c[1], BaseStruct)
+        objTest.c[1].a = 10
+        self.assertEqual(objTest.c[1].a, 10)
+    
+    def test_Values(self):
+        """
+        Checks that the range of the values is not validated in the trusted
+        mode, whereas it is in the default mode, and the per class default.
+        
+        Version 1.1.0.0
+        """
+        Data = json.dumps({'a' : 70000, 'b' : 1.0})
+        with self.assertRaises(ValueError):
+            BaseStruct.unpackJSON(Data)
+        with self.assertRaises(ValueError):
+            BaseStruct.unpackJSON(Data, Trusted = False)
+        objTest = BaseStruct.unpackJSON(Data, Trusted = True)
+        self.assertEqual(objTest.a, 4464)
+        Data = json.dumps({'a' : 70000, 'b' : {'a' : 2, 'b' : 0.5,
+            'c' : [3, 4]}, 'c' : [{'a' : 5, 'b' : 1.5}, {'a' : 6, 'b' : -2.0}]})
+        with self.assertRaises(ValueError):
+            DeepStruct.unpackJSON(Data)
+        objTest = self.TrustedStruct.unpackJSON(Data)
+        self.assertEqual(objTest.a, 4464)
+        with self.assertRaises(ValueError):
+            self.TrustedStruct.unpackJSON(Data, Trusted = False)
+        self.assertFalse(DeepStruct._Trusted)
+        self.assertTrue(self.TrustedStruct._Trusted)
+    
+    def test_Structure(self):
+        """
+        Checks that the structure mismatches are detected in the trusted mode.
+        
+        Version 1.0.0.0
+        """
+        for Class, Native in self.Samples[:-1]:
+            Data = Class(Native).packBytes()
+            with self.assertRaises(ValueError):
+                Class.unpackBytes(Data[:-1], Trusted = True)
+            with self.assertRaises(ValueError):
+                Class.unpackBytes(Data + b'\x00' * 3, Trusted = True)
+        for Data in ({'a' : 1}, {'a' : 1, 'b' : 2.0, 'c' : 3}):
+            with self.assertRaises(ValueError):
+                BaseStruct.unpackJSON(json.dumps(Data), Trusted = True)
+        for Data in ([1, 2], [[1, 2], [1]], 1.5):
+            with self.assertRaises((TypeError, ValueError)):
+                BaseStruct.unpackJSON(json.dumps(Data), Trusted = True)
+        with self.assertRaises(ValueError):
+            ArrayArray.unpackJSON(json.dumps([[1, 2], [3, 4]]), Trusted = True)
+        with self.assertRaises(ValueError):
+            ArrayArray.unpackJSON(json.dumps([[1, 2], [3, 4], [5]]),
+                                                                Trusted = True)
+        with self.assertRaises(ValueError):
+            NestedDynamicArray.unpackJSON(json.dumps([[1, 2]]), Trusted = True)
+        with self.assertRaises(TypeError):
+            NestedDynamicArray.unpackJSON(json.dumps({'a' : 1}), Trusted = True)
+    
+    def test_Conversion(self):
+        """
+        Checks that the trusted values are converted into the declared C types
+        as by the types themselves, i.e. with the wrapping of the out of range
+        integers, and that the incompatible values are still rejected.
+        
+        Version 1.0.0.0
+        """
+        objTest = BaseStruct.unpackJSON('{"a" : 70000, "b" : 1}',
+                                                                Trusted = True)
+        self.assertEqual(objTest.a, 4464)
+        self.assertIs(type(objTest.b), float)
+        self.assertEqual(objTest.packBytes(), BaseStruct({'a' : 4464,
+                                                    'b' : 1.0}).packBytes())
+        objTest = BaseStruct.unpackJSON('{"a" : true, "b" : 1}',
+                                                                Trusted = True)
+        self.assertIs(type(objTest.a), int)
+        self.assertEqual(objTest.a, 1)
+        objTest = BaseDynamicArray.unpackJSON('[70000, -1, true]',
+                                                                Trusted = True)
+        self.assertEqual(objTest.getNative(), [4464, -1, 1])
+        self.assertEqual(objTest.packBytes(),
+                            BaseDynamicArray([4464, -1, 1]).packBytes())
+        objTest = BaseArray.unpackJSON('[70000, 1]', Trusted = True)
+        self.assertEqual(objTest.getNative(), [4464, 1])
+        objTest = T_UINT16.unpackJSON('70000', Trusted = True)
+        self.assertEqual(objTest.Value, 4464)
+        self.assertEqual(objTest.packBytes(), T_UINT16(4464).packBytes())
+        for Class, Data in ((BaseStruct, '{"a" : "x", "b" : 1}'),
+                            (BaseArray, '[1, "x"]'),
+                            (BaseDynamicArray, '[1, 1.5]'),
+                            (WideCharStruct, '{"a" : 1, "b" : "xy"}'),
+                            (NestedArray, '[{"a" : 1, "b" : 1.0}, '
+                                                    '{"a" : 1.5, "b" : 1.0}]')):
+            with self.assertRaises(ValueError):
+                Class.unpackJSON(Data, Trusted = True)
+        with self.assertRaises(TypeError):
+            T_UINT16.unpackJSON('"x"', Trusted = True)
+
+class Test_JSONBuild(unittest.TestCase):
+    """
+    Test the single pass check and construction of the objects during the
+    de-serialization from JSON.
+    
+    Test ID: TEST-T-36B
+    
+    Covers requirement: REQ-FUN-36B
+    
+    Version 1.0.0.0
+    """
+    
+    def test_Conversion(self):
+        """
+        Checks that the values are converted into the declared C types exactly
+        as by the initialization method.
+        
+        Version 1.0.2.0
+        """
+        Native = {'a' : 1, 'b' : {'a' : 2, 'b' : 0.1, 'c' : [3, 4]},
+                'c' : [{'a' : 5, 'b' : 1.3}, {'a' : True, 'b' : -2}]}
+        objTest = DeepStruct.unpackJSON(json.dumps(Native))
+        self.assertEqual(objTest.getNative(), DeepStruct(Native).getNative())
+        self.assertEqual(objTest.b.b, ctypes.c_float(0.1).value)
+        self.assertEqual(objTest.c[1].a, ctypes.c_short(True).value)
+        self.assertIs(type(objTest.c[1].a), int)
+        self.assertIsInstance(objTest.c[1].b, float)
+        objTest = ComplexStruct.unpackJSON(json.dumps({'a' : 1, 'b' : 0.7,
+                                'c' : {'a' : 3, 'b' : 4.0, 'c' : [5, 6, 7]}}))
+        self.assertEqual(objTest.b, ctypes.c_float(0.7).value)
+        self.assertIsInstance(objTest.c.c, BaseDynamicArray)
+        
+        class FloatArray(SerDynamicArray):
+            _ElementType = ctypes.c_float
+        
+        Native = [random.random() for _ in range(100)]
+        objTest = FloatArray.unpackJSON(json.dumps(Native))
+        self.assertEqual(objTest.getNative(), FloatArray(Native).getNative())
+        for Data, Value in (('7', 7), ('65535', 65535), ('true', 1)):
+            objTest = T_UINT16.unpackJSON(Data)
+            self.assertIs(type(objTest.Value), int)
+            self.assertEqual(objTest.Value, Value)
+    
+    def test_Errors(self):
+        """
+        Checks that the incompatible values and structures are detected,
+        including the out of range values of the SerNumber classes.
+        
+        Version 1.1.0.0
+        """
+        for Data in ({'a' : 'x', 'b' : 1.0}, {'a' : 1},
+                        {'a' : 1, 'b' : 2.0, 'c' : 3}, {'a' : 1, 'b' : [1]}):
+            with self.assertRaises(ValueError):
+                BaseStruct.unpackJSON(json.dumps(Data))
+        with self.assertRaises(TypeError):
+            BaseStruct.unpackJSON(json.dumps([1, 2.0]))
+        for Data in ([[1, 2], [3, 4]], [[1, 2], [3, 4], [5, 'x']],
+                                                [[1, 2], [3, 4], {'a' : 1}]):
+            with self.assertRaises(ValueError):
+                ArrayArray.unpackJSON(json.dumps(Data))
+        Data = [{'a' : Index, 'b' : 1.0} for Index in range(10)]
+        Data[7]['b'] = 'x'
+        with self.assertRaises(ValueError):
+            NestedDynamicArray.unpackJSON(json.dumps(Data))
+        with self.assertRaises(ValueError):
+            BaseDynamicArray.unpackJSON(json.dumps([1, 2, 3.5]))
+        with self.assertRaises(TypeError):
+            BaseDynamicArray.unpackJSON(json.dumps({'a' : 1}))
+        for Data in ('"x"', '1.5', 'null', '[1]'):
+            with self.assertRaises(TypeError):
+                T_UINT16.unpackJSON(Data)
+        
+        class UINT8(SerNumber, BaseType = ctypes.c_uint8):
+            pass
+        
+        for Class, Data in ((UINT8, '300'), (UINT8, '-1'), (T_UINT16, '70000'),
+                                                            (T_UINT16, '-1')):
+            with self.assertRaises(ValueError):
+                Class.unpackJSON(Data)
+        self.assertEqual(UINT8.unpackJSON('300', Trusted = True).Value, 44)
+        Data = {'a' : 1, 'b' : {'a' : 2, 'b' : 0.5, 'c' : [3, 4]},
+                                    'c' : [{'a' : 5, 'b' : 1.5}, {'a' : 6}]}
+        with self.assertRaises(ValueError):
+            DeepStruct.unpackJSON(json.dumps(Data))
+
+class Test_BulkScalars(unittest.TestCase):
+    """
+    Test the bulk conversion of the scalar elements of the arrays, which must
+    produce exactly the same results as the per element conversion.
+    
+    Test ID: TEST-T-36C
+    
+    Covers requirement: REQ-FUN-36C
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 1.0.0.0
+        """
+        cls.Types = (ctypes.c_byte, ctypes.c_ubyte, ctypes.c_short,
+                    ctypes.c_ushort, ctypes.c_int, ctypes.c_uint,
+                    ctypes.c_long, ctypes.c_ulong, ctypes.c_longlong,
+                    ctypes.c_ulonglong, ctypes.c_float, ctypes.c_double,
+                    ctypes.c_bool)
+    
+    def getValues(self, CType):
+        """
+        Helper method to generate the random values for the type.
+        
+        Version 1.0.0.0
+        """
+        if CType in (ctypes.c_float, ctypes.c_double):
+            Result = [random.uniform(-1.0E6, 1.0E6) for _ in range(20)]
+        elif CType is ctypes.c_bool:
+            Result = [random.choice((True, False)) for _ in range(20)]
+        else:
+            Bits = 8 * ctypes.sizeof(CType)
+            if CType(-1).value < 0:
+                Limits = (- 2**(Bits - 1), 2**(Bits - 1) - 1)
+            else:
+                Limits = (0, 2**Bits - 1)
+            Result = [random.randint(*Limits) for _ in range(20)]
+        return Result
+    
+    def test_Equivalence(self):
+        """
+        Checks that the created, packed and unpacked data matches the per
+        element conversion using the ctypes.
+        
+        Version 1.0.0.0
+        """
+        for CType in self.Types:
+            
+            class FixedArray(SerArray):
+                _ElementType = CType
+                _Length = 10
+            
+            class DynamicArray(SerDynamicArray):
+                _ElementType = CType
+            
+            Values = self.getValues(CType)
+            Expected = [CType(Value).value for Value in Values]
+            for ArrayClass in (FixedArray, DynamicArray):
+                objTest = ArrayClass(Values)
+                Length = len(objTest)
+                self.assertEqual(objTest.getNative(), Expected[:Length])
+                for Element in objTest.getNative():
+                    self.assertIsInstance(Element, type(Expected[0]))
+                for BigEndian in (None, True, False):
+                    Data = objTest.packBytes(BigEndian = BigEndian)
+                    self.assertEqual(Data, b''.join(
+                        Scalar2Bytes(Value, CType, BigEndian = BigEndian)
+                                            for Value in Expected[:Length]))
+                    objNew = ArrayClass.unpackBytes(Data,
+                                                        BigEndian = BigEndian)
+                    self.assertEqual(objNew.getNative(), Expected[:Length])
+                    Buffer = bytearray(len(Data) + 3)
+                    objTest.packInto(Buffer, 3, BigEndian = BigEndian)
+                    self.assertEqual(bytes(Buffer[3:]), Data)
+                objNew = ArrayClass.unpackJSON(json.dumps(Values[:Length]))
+                self.assertEqual(objNew.getNative(), Expected[:Length])
+            objTest = FixedArray(Values[:3])
+            self.assertEqual(objTest.getNative(),
+                                        Expected[:3] + [CType().value] * 7)
+            objTest = DynamicArray(FixedArray(Values))
+            self.assertEqual(objTest.getNative(), Expected[:10])
+    
+    def test_Wrapping(self):
+        """
+        Checks that the out of range values are wrapped / converted in the
+        same way as by the ctypes by the initialization method, whereas the
+        out of range integers are rejected by the de-serialization from JSON.
+        
+        Version 1.1.0.0
+        """
+        for CType, Values in ((ctypes.c_short, [1, 70000, -40000]),
+                                (ctypes.c_ubyte, [-1, 256, 3]),
+                                (ctypes.c_float, [1.0E40, 0.1, -3]),
+                                (ctypes.c_uint, [True, 2**33, -5])):
+            
+            class DynamicArray(SerDynamicArray):
+                _ElementType = CType
+            
+            Expected = [CType(Value).value for Value in Values]
+            objTest = DynamicArray(Values)
+            self.assertEqual(objTest.getNative(), Expected)
+            if CType is ctypes.c_float:
+                objTest = DynamicArray.unpackJSON(json.dumps(Values))
+                self.assertEqual(objTest.getNative(), Expected)
+            else:
+                with self.assertRaises(ValueError):
+                    DynamicArray.unpackJSON(json.dumps(Values))
+    
+    def test_Errors(self):
+        """
+        Checks that the incompatible values are still detected with the
+        element index in the error message.
+        
+        Version 1.0.0.0
+        """
+        for Values in ([1, 'x', 2], [1, 2.5], [None]):
+            with self.assertRaises(ValueError):
+                BaseDynamicArray(Values)
+            with self.assertRaises(ValueError):
+                BaseArray(Values)
+            with self.assertRaises(ValueError):
+                BaseDynamicArray.unpackJSON(json.dumps(Values))
+        with self.assertRaises(ValueError):
+            BaseDynamicArray.unpackBytes(b'\x00\x01\x02')
+
+class Test_CompactStorage(unittest.TestCase):
+    """
+    Test the storage of the elements of the arrays of the numeric C primitive
+    types in the typed arrays of the array module.
+    
+    Test ID: TEST-T-36D
+    
+    Covers requirement: REQ-FUN-36D
+    
+    Version 1.0.0.0
+    """
+    
+    def getStorage(self, objTest):
+        """
+        Helper method to obtain the internal storage of an array.
+        
+        Version 1.0.0.0
+        """
+        return SerArray._Data.__get__(objTest)
+    
+    def test_Storage(self):
+        """
+        Checks that all ways of creation of the arrays produce the compact
+        storage, and the nested arrays as well.
+        
+        Version 1.0.1.0
+        """
+        Data = BaseDynamicArray([1, 2, 3]).packBytes()
+        for objTest in (BaseArray(), BaseArray([1]), BaseArray([1, 2, 3]),
+                        BaseArray(BaseDynamicArray([1, 2])),
+                        BaseArray.unpackBytes(b'\x01\x00\x02\x00'),
+                        BaseArray.unpackJSON('[1, 2]'),
+                        BaseArray.unpackJSON('[1, 2]', Trusted = True),
+                        BaseArray.unpackFrom(b'\x00' * 6, 2)[0],
+                        BaseDynamicArray(), BaseDynamicArray([1, 70000]),
+                        BaseDynamicArray.unpackBytes(Data),
+                        BaseDynamicArray.unpackBytes(Data, BigEndian = True),
+                        BaseDynamicArray.unpackJSON('[1, 2, 3]')):
+            Storage = self.getStorage(objTest)
+            self.assertIsInstance(Storage, array.array)
+            self.assertEqual(Storage.itemsize, ctypes.sizeof(ctypes.c_short))
+        for objTest in BaseArray.iterUnpack(b'\x00' * 8):
+            self.assertIsInstance(self.getStorage(objTest), array.array)
+        objTest = ArrayArray.unpackBytes(b'\x00' * ArrayArray.getSize())
+        for Element in objTest:
+            self.assertIsInstance(self.getStorage(Element), array.array)
+        Data = ComplexStruct({'a' : 1, 'b' : 0.5,
+                                'c' : {'a' : 3, 'b' : 4.0, 'c' : [5, 6]}})
+        objTest = ComplexStruct.unpackBytes(Data.packBytes())
+        self.assertIsInstance(self.getStorage(objTest.c.c), array.array)
+        
+        class BoolArray(SerDynamicArray):
+            _ElementType = ctypes.c_bool
+        
+        objTest = BoolArray([True, 0, 1])
+        self.assertIsInstance(self.getStorage(objTest), list)
+        self.assertEqual(objTest.getNative(), [True, False, True])
+        objTest = BaseDynamicArray.unpackJSON('[1, 70000]', Trusted = True)
+        self.assertIsInstance(self.getStorage(objTest), array.array)
+        self.assertEqual(objTest.getNative(), [1, 4464])
+    
+    def test_Access(self):
+        """
+        Checks that the element access, iteration and native representation
+        are not affected by the storage.
+        
+        Version 1.0.0.0
+        """
+        
+        class FloatArray(SerDynamicArray):
+            _ElementType = ctypes.c_float
+        
+        objTest = FloatArray([0.1, 2, -3.5])
+        self.assertEqual(objTest[0], ctypes.c_float(0.1).value)
+        self.assertIsInstance(objTest[1], float)
+        objTest[1] = 1.0E40
+        self.assertEqual(objTest[1], ctypes.c_float(1.0E40).value)
+        Native = objTest.getNative()
+        self.assertIsInstance(Native, list)
+        self.assertEqual(Native, list(objTest))
+        self.assertEqual(json.loads(objTest.packJSON()), Native)
+        objTest = BaseDynamicArray([1, 2, 3])
+        objTest[0] = 70000
+        objTest[-1] = -40000
+        self.assertEqual(objTest.getNative(), [ctypes.c_short(70000).value, 2,
+                                                ctypes.c_short(-40000).value])
+        with self.assertRaises(TypeError):
+            objTest[1] = 'x'
+        with self.assertRaises(IndexError):
+            objTest[3] = 1
+        self.assertEqual(len(objTest), 3)
+        self.assertEqual(sum(objTest), sum(objTest.getNative()))
+
+class Test_Numpy(unittest.TestCase):
+    """
+    Test the export of the data structure as a NumPy data type and the zero
+    copy interpretation of the buffers as NumPy arrays.
+    
+    Test ID: TEST-T-36E
+    
+    Covers requirement: REQ-FUN-36E
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 1.0.0.0
+        """
+        cls.Native = {'a' : 1, 'b' : {'a' : 2, 'b' : 0.5, 'c' : [3, 4]},
+                        'c' : [{'a' : 5, 'b' : 1.5}, {'a' : -6, 'b' : 2.5}]}
+    
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_Dtype(self):
+        """
+        Checks the layout of the created NumPy data types.
+        
+        Version 1.0.0.0
+        """
+        for Class in (BaseStruct, BaseArray, NestedStruct, NestedArray,
+                                                    ArrayArray, DeepStruct):
+            for BigEndian in (None, True, False):
+                Dtype = Class.getNumpyDtype(BigEndian = BigEndian)
+                self.assertIsInstance(Dtype, numpy.dtype)
+                self.assertEqual(Dtype.itemsize, Class.getSize())
+                self.assertIs(Class.getNumpyDtype(BigEndian = BigEndian),
+                                                                        Dtype)
+        Dtype = DeepStruct.getNumpyDtype(BigEndian = True)
+        self.assertEqual(Dtype.names, ('a', 'b', 'c'))
+        self.assertEqual(Dtype['b'].names, ('a', 'b', 'c'))
+        self.assertEqual(Dtype['a'], numpy.dtype('>i2'))
+        self.assertEqual(Dtype['c'].shape, (2, ))
+        self.assertEqual(Dtype['c'].base['b'], numpy.dtype('>f4'))
+        self.assertEqual(BaseArray.getNumpyDtype(BigEndian = False),
+                                                numpy.dtype(('<i2', (2, ))))
+        self.assertEqual(BaseDynamicArray.getNumpyDtype(),
+                                                        numpy.dtype('=i2'))
+        self.assertEqual(NestedDynamicArray.getNumpyDtype(),
+                                                BaseStruct.getNumpyDtype())
+        for Class in (WideCharStruct, NestedDynamicStruct, ComplexStruct):
+            with self.assertRaises(TypeError):
+                Class.getNumpyDtype()
+    
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_Unpack(self):
+        """
+        Checks that the buffers are interpreted as the arrays of records
+        without copying, consistently with the unpackMany() method.
+        
+        Version 1.0.0.0
+        """
+        for BigEndian in (None, True, False):
+            Data = DeepStruct(self.Native).packBytes(BigEndian = BigEndian)
+            Data = bytearray(Data * 3)
+            Result = DeepStruct.unpackNumpy(Data, BigEndian = BigEndian)
+            self.assertEqual(Result.shape, (3, ))
+            Objects = DeepStruct.unpackMany(Data, BigEndian = BigEndian)
+            for Record, objTest in zip(Result, Objects):
+                self.assertEqual(Record['a'], objTest.a)
+                self.assertEqual(Record['b']['c'].tolist(),
+                                                objTest.b.c.getNative())
+                self.assertEqual(Record['c']['a'].tolist(),
+                                                    [objTest.c[0].a, -6])
+                self.assertEqual(Record['c']['b'].tolist(), [1.5, 2.5])
+            Result['a'][1] = 7
+            objTest = DeepStruct.unpackMany(Data, BigEndian = BigEndian)[1]
+            self.assertEqual(objTest.a, 7)
+        Data = BaseArray([1, 2]).packBytes() + BaseArray([3, 4]).packBytes()
+        Result = BaseArray.unpackNumpy(Data)
+        self.assertEqual(Result.tolist(), [[1, 2], [3, 4]])
+        self.assertFalse(Result.flags.writeable)
+        Data = BaseDynamicArray([1, 2, 3]).packBytes(BigEndian = True)
+        Result = BaseDynamicArray.unpackNumpy(Data, BigEndian = True)
+        self.assertEqual(Result.tolist(), [1, 2, 3])
+        self.assertEqual(BaseDynamicArray.unpackNumpy(b'').shape, (0, ))
+        Data = mmap.mmap(-1, 2 * BaseStruct.getSize())
+        Result = BaseStruct.unpackNumpy(Data)
+        self.assertEqual(Result['a'].tolist(), [0, 0])
+        del Result
+        Data.close()
+        with self.assertRaises(ValueError):
+            BaseStruct.unpackNumpy(b'\x00' * 7)
+        with self.assertRaises(ValueError):
+            BaseDynamicArray.unpackNumpy(b'\x00' * 3)
+        with self.assertRaises(TypeError):
+            BaseStruct.unpackNumpy('abcdef')
+        with self.assertRaises(TypeError):
+            WideCharStruct.unpackNumpy(b'')
+    
+    @unittest.skipUnless(numpy is None, 'NumPy is installed')
+    def test_Missing(self):
+        """
+        Checks that the NumPy export is reported as not available.
+        
+        Version 1.0.0.0
+        """
+        with self.assertRaises(ImportError):
+            BaseStruct.getNumpyDtype()
+        with self.assertRaises(ImportError):
+            BaseStruct.unpackNumpy(b'\x00' * 6)
+
+class Test_CTypeMirror(unittest.TestCase):
+    """
+    Test the generated packed ctypes structure and array types and the mapping
+    of the buffers onto their instances.
+    
+    Test ID: TEST-T-36F
+    
+    Covers requirement: REQ-FUN-36F
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 1.0.0.0
+        """
+        cls.Native = {'a' : 1, 'b' : {'a' : 2, 'b' : 0.5, 'c' : [3, 4]},
+                        'c' : [{'a' : 5, 'b' : 1.5}, {'a' : -6, 'b' : 2.5}]}
+    
+    def test_Types(self):
+        """
+        Checks the layout of the generated types and their caching.
+        
+        Version 1.0.0.0
+        """
+        for Class in (BaseStruct, BaseArray, NestedStruct, NestedArray,
+                                                    ArrayArray, DeepStruct):
+            for BigEndian in (None, True, False):
+                CType = Class.getCType(BigEndian = BigEndian)
+                self.assertEqual(ctypes.sizeof(CType), Class.getSize())
+                self.assertIs(Class.getCType(BigEndian = BigEndian), CType)
+        CType = DeepStruct.getCType(BigEndian = True)
+        self.assertTrue(issubclass(CType, ctypes.Structure))
+        self.assertEqual([Item[0] for Item in CType._fields_], ['a', 'b', 'c'])
+        self.assertIs(CType._fields_[1][1],
+                                    NestedStruct.getCType(BigEndian = True))
+        self.assertTrue(issubclass(BaseArray.getCType(), ctypes.Array))
+        self.assertEqual(BaseArray.getCType()._length_, 2)
+        CType = WideCharStruct.getCType(BigEndian = sys.byteorder == 'big')
+        self.assertEqual(ctypes.sizeof(CType), WideCharStruct.getSize())
+        with self.assertRaises(TypeError):
+            WideCharStruct.getCType(BigEndian = sys.byteorder != 'big')
+        for Class in (NestedDynamicStruct, BaseDynamicArray, ComplexStruct):
+            with self.assertRaises(TypeError):
+                Class.getCType()
+    
+    def test_Mapping(self):
+        """
+        Checks that the mapped instances read and write the buffer directly,
+        consistently with the bytes representation.
+        
+        Version 1.0.0.0
+        """
+        for BigEndian in (None, True, False):
+            Data = DeepStruct(self.Native).packBytes(BigEndian = BigEndian)
+            Buffer = bytearray(3) + bytearray(Data)
+            objMapped = DeepStruct.mapBuffer(Buffer, 3, BigEndian = BigEndian)
+            self.assertEqual(objMapped.a, 1)
+            self.assertEqual(list(objMapped.b.c), [3, 4])
+            self.assertEqual(objMapped.c[1].a, -6)
+            self.assertEqual(objMapped.c[1].b, 2.5)
+            self.assertEqual(bytes(objMapped), Data)
+            objMapped.a = 7
+            objMapped.b.c[0] = -300
+            objMapped.c[0].b = 0.25
+            objTest = DeepStruct.unpackBytes(Buffer[3:], BigEndian = BigEndian)
+            self.assertEqual(objTest.a, 7)
+            self.assertEqual(objTest.b.c[0], -300)
+            self.assertEqual(objTest.c[0].b, 0.25)
+            objTest = DeepStruct(self.Native)
+            objTest.packInto(Buffer, 3, BigEndian = BigEndian)
+            self.assertEqual(objMapped.a, 1)
+            del objMapped
+            Buffer = bytearray(BaseArray([1, -2]).packBytes(
+                                                        BigEndian = BigEndian))
+            objMapped = BaseArray.mapBuffer(Buffer, BigEndian = BigEndian)
+            self.assertEqual(list(objMapped), [1, -2])
+            del objMapped
+    
+    def test_Errors(self):
+        """
+        Checks that the improper buffers and offsets are detected.
+        
+        Version 1.0.0.0
+        """
+        Buffer = bytearray(BaseStruct.getSize() + 2)
+        for Offset in (-1, 3, 100):
+            with self.assertRaises(ValueError):
+                BaseStruct.mapBuffer(Buffer, Offset)
+        with self.assertRaises(TypeError):
+            BaseStruct.mapBuffer(Buffer, 1.0)
+        for Data in (bytes(Buffer), 'abcdefgh', 1):
+            with self.assertRaises(TypeError):
+                BaseStruct.mapBuffer(Data)
+        with self.assertRaises(TypeError):
+            BaseDynamicArray.mapBuffer(Buffer)
+        objMapped = BaseStruct.mapBuffer(Buffer, 2)
+        self.assertEqual(objMapped.a, 0)
+        del objMapped
+        Buffer.extend(b'\x00') #not exported anymore
+
+class Test_FieldAccess(unittest.TestCase):
+    """
+    Test the offsets table and the reading / overwriting of a single field
+    directly in the bytes representation of a struct.
+    
+    Test ID: TEST-T-370
+    
+    Covers requirement: REQ-FUN-370
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        
+        Version 1.0.0.0
+        """
+        cls.Native = {'a' : 1, 'b' : {'a' : 2, 'b' : 0.5, 'c' : [3, 4]},
+                        'c' : [{'a' : 5, 'b' : 1.5}, {'a' : -6, 'b' : 2.5}]}
+    
+    def test_Offsets(self):
+        """
+        Checks the offsets and sizes of the fields at all nesting levels.
+        
+        Version 1.0.0.0
+        """
+        Offsets = DeepStruct.getFieldOffsets()
+        self.assertEqual(list(Offsets), ['a', 'b', 'b.a', 'b.b', 'b.c', 'b.c.0',
+                                        'b.c.1', 'c', 'c.0', 'c.0.a', 'c.0.b',
+                                        'c.1', 'c.1.a', 'c.1.b'])
+        self.assertEqual(Offsets['a'], (0, 2))
+        self.assertEqual(Offsets['b'], (2, NestedStruct.getSize()))
+        self.assertEqual(Offsets['b.c.1'], (10, 2))
+        self.assertEqual(Offsets['c.1.b'], (20, 4))
+        Offsets['a'] = (1, 1)
+        self.assertEqual(DeepStruct.getFieldOffsets()['a'], (0, 2))
+        Offsets = ComplexStruct.getFieldOffsets()
+        self.assertEqual(Offsets['c'], (6, None))
+        self.assertEqual(Offsets['c.b'], (8, 4))
+        self.assertEqual(Offsets['c.c'], (12, None))
+        self.assertNotIn('c.c.0', Offsets)
+    
+    def test_Peek(self):
+        """
+        Checks that the fields are read consistently with the full
+        de-serialization, from the buffers holding only the required part.
+        
+        Version 1.0.0.0
+        """
+        objTest = DeepStruct(self.Native)
+        for BigEndian in (None, True, False):
+            Data = objTest.packBytes(BigEndian = BigEndian)
+            for Path, (Offset, Size) in DeepStruct.getFieldOffsets().items():
+                Value = DeepStruct.peekField(memoryview(Data)[:Offset + Size],
+                                                Path, BigEndian = BigEndian)
+                Expected = objTest
+                for Name in Path.split('.'):
+                    if Name.isdigit():
+                        Expected = Expected[int(Name)]
+                    else:
+                        Expected = getattr(Expected, Name)
+                if isinstance(Expected, (SerStruct, SerArray)):
+                    self.assertIsInstance(Value, type(Expected))
+                    self.assertEqual(Value.getNative(), Expected.getNative())
+                else:
+                    self.assertEqual(Value, Expected)
+        objTest = ComplexStruct({'a' : 1, 'b' : 0.5,
+                                'c' : {'a' : 3, 'b' : 4.0, 'c' : [5, 6, 7]}})
+        Data = objTest.packBytes()
+        self.assertEqual(ComplexStruct.peekField(Data, 'c.c').getNative(),
+                                                                    [5, 6, 7])
+        self.assertEqual(ComplexStruct.peekField(Data, 'c').getNative(),
+                                                objTest.c.getNative())
+        with self.assertRaises(ValueError):
+            ComplexStruct.peekField(Data[:-1], 'c.c')
+        with self.assertRaises(ValueError):
+            DeepStruct.peekField(b'\x00' * 21, 'c.1.b')
+        with self.assertRaises(AttributeError):
+            DeepStruct.peekField(Data, 'c.2')
+        with self.assertRaises(TypeError):
+            DeepStruct.peekField(Data, 1)
+        with self.assertRaises(TypeError):
+            DeepStruct.peekField('abc', 'a')
+    
+    def test_Patch(self):
+        """
+        Checks that only the addressed field is overwritten, and that the
+        values are checked and converted as by the assignment.
+        
+        Version 1.0.0.0
+        """
+        for BigEndian in (None, True, False):
+            Buffer = bytearray(DeepStruct(self.Native).packBytes(
+                                                        BigEndian = BigEndian))
+            DeepStruct.patchField(Buffer, 'c.1.a', 70000,
+                                                        BigEndian = BigEndian)
+            DeepStruct.patchField(Buffer, 'b.c', [8, 9], BigEndian = BigEndian)
+            DeepStruct.patchField(Buffer, 'c.0', BaseStruct({'a' : 7, 'b' : 0}),
+                                                        BigEndian = BigEndian)
+            Expected = DeepStruct(self.Native)
+            Expected.c[1].a = 70000
+            Expected.b.c[0] = 8
+            Expected.b.c[1] = 9
+            Expected.c[0].a = 7
+            Expected.c[0].b = 0
+            objTest = DeepStruct.unpackBytes(Buffer, BigEndian = BigEndian)
+            self.assertEqual(objTest.getNative(), Expected.getNative())
+        Buffer = bytearray(ComplexStruct({'a' : 1, 'b' : 0.5,
+                        'c' : {'a' : 3, 'b' : 4.0, 'c' : [5, 6]}}).packBytes())
+        ComplexStruct.patchField(Buffer, 'c.c', [7, 8])
+        self.assertEqual(ComplexStruct.unpackBytes(Buffer).c.c.getNative(),
+                                                                        [7, 8])
+        with self.assertRaises(ValueError):
+            ComplexStruct.patchField(Buffer, 'c.c', [7])
+        with self.assertRaises(TypeError):
+            DeepStruct.patchField(Buffer, 'a', 'x')
+        with self.assertRaises(ValueError):
+            DeepStruct.patchField(Buffer, 'b.c', [1, 'x'])
+        with self.assertRaises(TypeError):
+            DeepStruct.patchField(bytes(24), 'a', 1)
+        with self.assertRaises(ValueError):
+            DeepStruct.patchField(bytearray(20), 'c.1.b', 1.0)
+        with self.assertRaises(AttributeError):
+            DeepStruct.patchField(bytearray(24), 'd', 1)
+
+class Test_PackedCache(unittest.TestCase):
+    """
+    Test the caching of the bytes representation of the instances and its
+    invalidation by the modification of the instance or of a nested object.
+    
+    Test ID: TEST-T-371
+    
+    Covers requirement: REQ-FUN-371
+    
+    Version 1.0.0.0
+    """
+    
+    def checkPacked(self, objTest):
+        """
+        Helper method to compare the (cached) bytes representations of an
+        instance with the ones of its fresh copy in all byte orders.
+        
+        Version 1.0.0.0
+        """
+        for BigEndian in (None, True, False):
+            Expected = type(objTest)(objTest.getNative()).packBytes(
+                                                        BigEndian = BigEndian)
+            self.assertEqual(objTest.packBytes(BigEndian = BigEndian), Expected)
+    
+    def test_Reuse(self):
+        """
+        Checks that the same bytes object is returned for the repeated calls,
+        separately for each byte order.
+        
+        Version 1.0.0.0
+        """
+        for objTest in (DeepStruct({'a' : 1, 'c' : [{'b' : 1.5}]}),
+                        ComplexStruct({'c' : {'c' : [1, 2]}}),
+                        NestedDynamicArray([{'a' : 1}]), BaseArray([1, 2]),
+                        T_UINT16(3)):
+            Native = objTest.packBytes()
+            BigEndian = objTest.packBytes(BigEndian = True)
+            LittleEndian = objTest.packBytes(BigEndian = 0)
+            self.assertIs(objTest.packBytes(), Native)
+            self.assertIs(objTest.packBytes(BigEndian = 1), BigEndian)
+            self.assertIs(objTest.packBytes(BigEndian = False), LittleEndian)
+            self.assertNotEqual(BigEndian, LittleEndian)
+    
+    def test_Invalidation(self):
+        """
+        Checks that any assignment to a field / element / value, at any
+        nesting level, invalidates the cache of all enclosing objects.
+        
+        Version 1.0.0.0
+        """
+        objTest = DeepStruct()
+        Nested = objTest.c[1]
+        self.checkPacked(objTest)
+        objTest.a = 1
+        self.checkPacked(objTest)
+        objTest.b.c[0] = 2
+        self.checkPacked(objTest)
+        Nested.b = 1.5
+        self.checkPacked(objTest)
+        self.checkPacked(Nested)
+        objTest.c[0].a = 3
+        self.checkPacked(objTest)
+        objCopy = DeepStruct.unpackBytes(objTest.packBytes())
+        self.assertEqual(objCopy.getNative(),
+                            {'a' : 1, 'b' : {'a' : 0, 'b' : 0, 'c' : [2, 0]},
+                            'c' : [{'a' : 3, 'b' : 0}, {'a' : 0, 'b' : 1.5}]})
+        objTest = ComplexStruct({'c' : {'c' : [1, 2]}})
+        self.checkPacked(objTest)
+        objTest.c.c[1] = 5
+        self.checkPacked(objTest)
+        objTest.c.a = 4
+        self.checkPacked(objTest)
+        objTest = ArrayArray([[1, 2], [3, 4], [5, 6]])
+        self.checkPacked(objTest)
+        objTest[2][0] = 7
+        self.checkPacked(objTest)
+        objTest = NestedDynamicArray([{'a' : 1}, {'a' : 2}])
+        self.checkPacked(objTest)
+        objTest[1].a = 3
+        self.checkPacked(objTest)
+        objTest = T_UINT16(3)
+        Packed = objTest.packBytes()
+        objTest.Value = 4
+        self.assertEqual(objTest.packBytes(), T_UINT16(4).packBytes())
+        self.assertNotEqual(objTest.packBytes(), Packed)
+        with self.assertRaises(TypeError):
+            objTest.Value = 'x'
+        self.assertEqual(objTest.packBytes(), T_UINT16(4).packBytes())
+    
+    def test_Unpacked(self):
+        """
+        Checks the invalidation of the cache of the instances created by the
+        de-serialization, including the lazy views.
+        
+        Version 1.0.0.0
+        """
+        Data = DeepStruct({'a' : 1, 'b' : {'c' : [2, 3]}}).packBytes()
+        for objTest in (DeepStruct.unpackBytes(Data), DeepStruct.view(Data),
+                        DeepStruct.unpackMany(Data * 2)[1],
+                        DeepStruct.unpackJSON(DeepStruct.unpackBytes(
+                                                        Data).packJSON())):
+            self.assertEqual(objTest.packBytes(), Data)
+            objTest.b.c[1] = 4
+            self.checkPacked(objTest)
+            self.assertNotEqual(objTest.packBytes(), Data)
+        objTest = DeepStruct.view(Data)
+        Nested = objTest.b
+        self.assertEqual(objTest.packBytes(), Data)
+        Nested.a = 5
+        self.checkPacked(objTest)
+        objCopy = DeepStruct(objTest)
+        self.assertEqual(objCopy.packBytes(), objTest.packBytes())
+        objCopy.b.a = 6
+        self.assertNotEqual(objCopy.packBytes(), objTest.packBytes())
+        self.checkPacked(objTest)
+
+class Test_PackedTemplate(unittest.TestCase):
+    """
+    Test the packed template mode of the structs: the persistent image is
+    patched in place by the assignments at any nesting level.
+    
+    Test ID: TEST-T-372
+    
+    Covers requirement: REQ-FUN-372
+    
+    Version 1.0.0.0
+    """
+    
+    def checkTemplate(self, objTest, BigEndian):
+        """
+        Helper method to compare the template image and the bytes
+        representations of an instance with the ones of its fresh copy.
+        
+        Version 1.0.0.0
+        """
+        Expected = type(objTest)(objTest.getNative()).packBytes(
+                                                        BigEndian = BigEndian)
+        Image = SerStruct._Packed.__get__(objTest).Template[0]
+        self.assertEqual(bytes(Image), Expected)
+        self.assertEqual(objTest.packBytes(BigEndian = BigEndian), Expected)
+        for Other in (None, True, False):
+            self.assertEqual(objTest.packBytes(BigEndian = Other),
+                    type(objTest)(objTest.getNative()).packBytes(
+                                                        BigEndian = Other))
+        return Image
+    
+    def test_Patching(self):
+        """
+        Checks that the same image is updated by the assignments to the
+        fields and elements at all nesting levels, in all byte orders.
+        
+        Version 1.0.0.0
+        """
+        for BigEndian in (None, True, False):
+            objTest = DeepStruct({'a' : 1, 'b' : {'b' : 0.5, 'c' : [2, 3]}})
+            objTest.enableTemplate(BigEndian = BigEndian)
+            Image = self.checkTemplate(objTest, BigEndian)
+            objTest.a = -4
+            objTest.b.b = 1.5
+            objTest.b.c[1] = 5
+            objTest.c[-1].a = 6
+            objTest.c[0].b = 2.5
+            self.assertIs(self.checkTemplate(objTest, BigEndian), Image)
+            objTest = ComplexStruct({'c' : {'c' : [1, 2, 3]}})
+            objTest.enableTemplate(BigEndian = BigEndian)
+            objTest.c.c[-2] = 7
+            objTest.c.a = 8
+            objTest.b = 0.25
+            self.checkTemplate(objTest, BigEndian)
+            objTest = WideCharStruct({'a' : 1, 'b' : 'x'})
+            objTest.enableTemplate(BigEndian = BigEndian)
+            objTest.b = 'y'
+            self.checkTemplate(objTest, BigEndian)
+        objTest = DeepStruct.view(DeepStruct({'a' : 1}).packBytes())
+        objTest.enableTemplate()
+        objTest.c[1].a = 2
+        self.checkTemplate(objTest, None)
+    
+    def test_Nested(self):
+        """
+        Checks the templates of an enclosing and of a nested struct at the
+        same time, as well as the replacement of a template.
+        
+        Version 1.0.0.0
+        """
+        objTest = DeepStruct()
+        Nested = objTest.b
+        objTest.enableTemplate(BigEndian = True)
+        Nested.enableTemplate(BigEndian = False)
+        Nested.c[0] = 1
+        objTest.b.a = 2
+        self.checkTemplate(objTest, True)
+        self.checkTemplate(Nested, False)
+        objTest.enableTemplate()
+        objTest.c[0].a = 3
+        self.checkTemplate(objTest, None)
+    
+    def test_Disable(self):
+        """
+        Checks that the image is dropped, and the instance is re-packed as
+        usual after that.
+        
+        Version 1.0.0.0
+        """
+        objTest = DeepStruct()
+        objTest.disableTemplate()
+        objTest.enableTemplate(BigEndian = True)
+        objTest.disableTemplate()
+        self.assertIsNone(SerStruct._Packed.__get__(objTest).Template)
+        objTest.b.c[1] = 3
+        self.assertEqual(objTest.packBytes(BigEndian = True),
+                DeepStruct(objTest.getNative()).packBytes(BigEndian = True))
+
+class Test_UnpackInto(unittest.TestCase):
+    """
+    Test the in place re-loading of the existing instances from the bytes
+    representation, and the pool of the re-usable instances.
+    
+    Test ID: TEST-T-373
+    
+    Covers requirement: REQ-FUN-373
+    
+    Version 1.0.0.0
+    """
+    
+    def test_Equivalence(self):
+        """
+        Checks that the re-loaded instance is equal to the one created by the
+        method unpackBytes() from the same data, in all byte orders.
+        
+        Version 1.0.0.0
+        """
+        Samples = (
+            (DeepStruct, {'a' : 1, 'b' : {'b' : 0.5, 'c' : [2, 3]},
+                                        'c' : [{'a' : 4}, {'b' : 1.5}]}),
+            (ComplexStruct, {'a' : -1, 'c' : {'b' : 2.5, 'c' : [1, 2, 3]}}),
+            (NestedDynamicArray, [{'a' : 1}, {'b' : 0.25}, {'a' : 2}]),
+            (DynamicArrayArray, [[1, 2], [3, 4]]),
+            (ArrayArray, [[1, 2], [3, 4], [5, 6]]),
+            (BaseDynamicArray, [1, -2, 3]),
+            (WideCharStruct, {'a' : 1, 'b' : 'x'}),
+            (T_UINT16, 513))
+        for ClassTest, Native in Samples:
+            for BigEndian in (None, True, False):
+                Data = ClassTest(Native).packBytes(BigEndian = BigEndian)
+                objTest = ClassTest()
+                Result = ClassTest.unpackInto(objTest, Data,
+                                                        BigEndian = BigEndian)
+                self.assertIs(Result, objTest)
+                self.assertEqual(objTest.getNative(), ClassTest.unpackBytes(
+                                Data, BigEndian = BigEndian).getNative())
+                self.assertEqual(objTest.packBytes(BigEndian = BigEndian),
+                                                                        Data)
+                ClassTest.unpackInto(objTest, bytearray(Data),
+                                                        BigEndian = BigEndian)
+                self.assertEqual(objTest.packBytes(BigEndian = BigEndian),
+                                                                        Data)
+        objTest = DeepStruct.view(DeepStruct().packBytes())
+        Data = DeepStruct(Samples[0][1]).packBytes()
+        DeepStruct.unpackInto(objTest, Data)
+        self.assertEqual(objTest.getNative(), Samples[0][1] | {
+                                    'c' : [{'a' : 4, 'b' : 0}, {'a' : 0,
+                                            'b' : 1.5}]} | {
+                                    'b' : {'a' : 0, 'b' : 0.5, 'c' : [2, 3]}})
+    
+    def test_NestedReused(self):
+        """
+        Checks that the nested objects are re-used rather than replaced.
+        
+        Version 1.0.0.0
+        """
+        objTest = DeepStruct()
+        Nested = objTest.b
+        Array = objTest.b.c
+        Element = objTest.c[1]
+        Data = DeepStruct({'a' : 1, 'b' : {'c' : [5, 6]},
+                                        'c' : [{}, {'a' : 7}]}).packBytes()
+        DeepStruct.unpackInto(objTest, Data)
+        self.assertIs(objTest.b, Nested)
+        self.assertIs(objTest.b.c, Array)
+        self.assertIs(objTest.c[1], Element)
+        self.assertEqual(Element.a, 7)
+        self.assertEqual(list(Array), [5, 6])
+    
+    def test_DynamicLength(self):
+        """
+        Checks the growth and the shrinking of the dynamic length arrays, with
+        and without the struct codec of the elements.
+        
+        Version 1.0.0.0
+        """
+        class WideDynamicArray(SerDynamicArray):
+            
+            _ElementType = WideCharStruct
+        
+        for ClassTest, Native in ((NestedDynamicArray, [{'a' : 1},
+                                    {'a' : 2, 'b' : 0.5}, {'a' : 3}]),
+                                (WideDynamicArray, [{'a' : 1, 'b' : 'x'},
+                                    {'a' : 2, 'b' : 'y'}, {'a' : 3}])):
+            objTest = ClassTest(Native[ : 1])
+            First = objTest[0]
+            ClassTest.unpackInto(objTest, ClassTest(Native).packBytes())
+            self.assertEqual(objTest.getNative(), ClassTest(Native).getNative())
+            self.assertIs(objTest[0], First)
+            Last = objTest[2]
+            ClassTest.unpackInto(objTest, ClassTest(Native[ : 2]).packBytes())
+            self.assertEqual(len(objTest), 2)
+            self.assertEqual(objTest.getNative(),
+                                        ClassTest(Native[ : 2]).getNative())
+            self.assertIs(objTest[0], First)
+            ClassTest.unpackInto(objTest, b'')
+            self.assertEqual(len(objTest), 0)
+            Last.a = 5 #no longer nested
+            self.assertEqual(objTest.packBytes(), b'')
+    
+    def test_SizeError(self):
+        """
+        Checks that the wrong data size raises ValueError, and the instance is
+        left unmodified.
+        
+        Version 1.0.0.0
+        """
+        Samples = (
+            (DeepStruct({'a' : 1, 'c' : [{'a' : 2}]}), [-1, 1]),
+            (ComplexStruct({'a' : 1, 'c' : {'a' : 2, 'c' : [1, 2]}}), [-1, 1]),
+            (NestedDynamicArray([{'a' : 1}]), [-1, 1]),
+            (BaseDynamicArray([1, 2]), [-1, 1]),
+            (BaseArray([1, 2]), [-2, 2]),
+            (T_UINT16(3), [-1, 1]))
+        for objTest, Deltas in Samples:
+            Data = objTest.packBytes()
+            Native = objTest.getNative()
+            for Delta in Deltas:
+                if Delta < 0:
+                    BadData = Data[ : Delta]
+                else:
+                    BadData = Data + b'\x00' * Delta
+                with self.assertRaises(ValueError):
+                    type(objTest).unpackInto(objTest, BadData)
+                self.assertEqual(objTest.getNative(), Native)
+                self.assertEqual(objTest.packBytes(), Data)
+        objTest = ComplexStruct()
+        with self.assertRaises(ValueError):
+            ComplexStruct.unpackInto(objTest, ComplexStruct.getMinSize() * b'1'
+                                                                        + b'2')
+        self.assertEqual(objTest.getNative(), ComplexStruct().getNative())
+    
+    def test_TypeError(self):
+        """
+        Checks that the improper instance or data type raises TypeError.
+        
+        Version 1.0.0.0
+        """
+        Data = BaseStruct().packBytes()
+        for objTest in (BaseStruct, NestedStruct(), 1, None, [1, 2]):
+            with self.assertRaises(TypeError):
+                BaseStruct.unpackInto(objTest, Data)
+        for BadData in (1, 'ab', [1, 2], None):
+            with self.assertRaises(TypeError):
+                BaseStruct.unpackInto(BaseStruct(), BadData)
+        with self.assertRaises(TypeError):
+            SerStruct.unpackInto(BaseStruct(), Data)
+    
+    def test_CacheInvalidation(self):
+        """
+        Checks that the cached bytes representations and the packed templates
+        of the instance itself and of the enclosing objects are updated.
+        
+        Version 1.0.0.0
+        """
+        for BigEndian in (None, True, False):
+            objTest = ComplexStruct({'c' : {'c' : [1, 2]}})
+            objTest.enableTemplate(BigEndian = BigEndian)
+            Nested = objTest.c
+            Nested.packBytes()
+            Array = Nested.c
+            BaseDynamicArray.unpackInto(Array,
+                BaseDynamicArray([3, 4, 5]).packBytes(BigEndian = BigEndian),
+                                                        BigEndian = BigEndian)
+            Expected = ComplexStruct(objTest.getNative())
+            self.assertEqual(objTest.c.getNative()['c'], [3, 4, 5])
+            for Other in (None, True, False):
+                self.assertEqual(objTest.packBytes(BigEndian = Other),
+                                    Expected.packBytes(BigEndian = Other))
+                self.assertEqual(Nested.packBytes(BigEndian = Other),
+                                    Expected.c.packBytes(BigEndian = Other))
+            self.assertEqual(bytes(
+                            SerStruct._Packed.__get__(objTest).Template[0]),
+                                    Expected.packBytes(BigEndian = BigEndian))
+            objTest = DeepStruct({'c' : [{'a' : 1}]})
+            objTest.enableTemplate(BigEndian = BigEndian)
+            Element = objTest.c[1]
+            BaseStruct.unpackInto(Element, BaseStruct({'a' : 2,
+                            'b' : 0.5}).packBytes(BigEndian = BigEndian),
+                                                        BigEndian = BigEndian)
+            self.assertEqual(bytes(
+                            SerStruct._Packed.__get__(objTest).Template[0]),
+                            DeepStruct(objTest.getNative()).packBytes(
+                                                        BigEndian = BigEndian))
+            DeepStruct.unpackInto(objTest, DeepStruct().packBytes())
+            Element.a = 3
+            self.assertEqual(objTest.packBytes(), DeepStruct({'c' : [{},
+                                                    {'a' : 3}]}).packBytes())
+    
+    def test_Pool(self):
+        """
+        Checks the acquisition and the release of the pooled instances.
+        
+        Version 1.0.0.0
+        """
+        class PooledStruct(NestedStruct):
+            
+            _PoolSize = 2
+        
+        objTest = NestedStruct.acquire()
+        self.assertIsInstance(objTest, NestedStruct)
+        NestedStruct.release(objTest) #pooling is disabled by default
+        self.assertIsNot(NestedStruct.acquire(), objTest)
+        Instances = [PooledStruct.acquire() for _ in range(3)]
+        for Item in Instances:
+            PooledStruct.release(Item)
+        self.assertIs(PooledStruct.acquire(), Instances[1])
+        self.assertIs(PooledStruct.acquire(), Instances[0])
+        objTest = PooledStruct.acquire()
+        self.assertNotIn(objTest, Instances)
+        PooledStruct.release(objTest)
+        Data = PooledStruct({'a' : 1, 'c' : [2, 3]}).packBytes()
+        objTest = PooledStruct.unpackInto(PooledStruct.acquire(), Data)
+        self.assertEqual(objTest.packBytes(), Data)
+        with self.assertRaises(TypeError):
+            PooledStruct.release(NestedStruct())
+        with self.assertRaises(TypeError):
+            NestedStruct.release(objTest)
+        objTest = PooledStruct()
+        objTest.packBytes() #the nested objects are linked now
+        with self.assertRaises(ValueError):
+            BaseArray.release(objTest.c)
+        PooledStruct.release(PooledStruct())
+        PooledStruct.release(PooledStruct())
+        PooledStruct.release(PooledStruct()) #pool is full - dropped
+    
+    def test_PoolPersistence(self):
+        """
+        Checks that the pooled instances survive the definition of a new class
+        and the changes of the class attributes.
+        
+        Version 1.0.0.0
+        """
+        class PooledStruct(NestedStruct):
+            
+            _PoolSize = 4
+        
+        objTest = PooledStruct()
+        PooledStruct.release(objTest)
+        
+        class TempStruct(SerStruct):
+            _Fields = (
+                ('a', ctypes.c_int),
+            )
+        
+        self.assertIs(PooledStruct.acquire(), objTest)
+        PooledStruct.release(objTest)
+        PooledStruct._PoolSize = 4
+        self.assertIs(PooledStruct.acquire(), objTest)
+        self.assertEqual(TempStruct.getSize(), 4)
+
+class Test_ScalarHelpers(unittest.TestCase):
+    """
+    Test the scalar conversion helper functions backed by the precompiled
+    struct.Struct objects against the reference ctypes conversion, as well as
+    their bulk variants.
+    
+    Test ID: TEST-T-374
+    
+    Covers requirement: REQ-FUN-374
+    
+    Version 1.0.0.0
+    """
+    
+    CTypes = (ctypes.c_byte, ctypes.c_ubyte, ctypes.c_short, ctypes.c_ushort,
+                ctypes.c_int, ctypes.c_uint, ctypes.c_long, ctypes.c_ulong,
+                ctypes.c_longlong, ctypes.c_ulonglong, ctypes.c_float,
+                ctypes.c_double, ctypes.c_bool, ctypes.c_char, ctypes.c_wchar)
+    
+    Values = (0, 1, -1, 127, 128, 255, -129, 70000, -70000, 2**31, 2**32 + 5,
+                2**63, -2**63, True, 1.5, -2.25, 1e300, b'a', 'x', None)
+    
+    def getReference(self, Value, CType, BigEndian):
+        """
+        Helper method to obtain the bytes representation of a value via the
+        ctypes object of the (swapped) type.
+        
+        Version 1.0.0.0
+        """
+        if BigEndian is None:
+            CastType = CType
+        elif BigEndian:
+            CastType = getattr(CType, '__ctype_be__', CType)
+        else:
+            CastType = getattr(CType, '__ctype_le__', CType)
+        return bytes(CastType(Value)), CastType
+    
+    def test_Scalar(self):
+        """
+        Checks the conversion of the single values in all byte orders,
+        including the ctypes specific conversions, e.g. the wrapping of the
+        integers out of range, and the errors.
+        
+        Version 1.0.0.0
+        """
+        for CType in self.CTypes:
+            for BigEndian in (None, True, False):
+                for Value in self.Values:
+                    try:
+                        Expected, CastType = self.getReference(Value, CType,
+                                                                    BigEndian)
+                    except Exception as err:
+                        with self.assertRaises(type(err)):
+                            Scalar2Bytes(Value, CType, BigEndian = BigEndian)
+                        continue
+                    Data = Scalar2Bytes(Value, CType, BigEndian = BigEndian)
+                    self.assertEqual(Data, Expected)
+                    self.assertEqual(Bytes2Scalar(Data, CType,
+                                                    BigEndian = BigEndian),
+                                        CastType.from_buffer_copy(Data).value)
+                    self.assertEqual(Bytes2Scalar(Data + b'\x01', CType,
+                                                    BigEndian = BigEndian),
+                                        CastType.from_buffer_copy(Data).value)
+                    with self.assertRaises(ValueError):
+                        Bytes2Scalar(Data[ : -1], CType, BigEndian = BigEndian)
+        self.assertEqual(Scalar2Bytes(70000, ctypes.c_short, BigEndian = 1),
+                                                                    b'\x11\x70')
+        self.assertEqual(Scalar2Bytes(1, ctypes.c_int, BigEndian = 0),
+                                                        b'\x01\x00\x00\x00')
+    
+    def test_Sequence(self):
+        """
+        Checks the bulk conversion functions against the single value ones.
+        
+        Version 1.0.0.0
+        """
+        Samples = ((ctypes.c_short, [1, -2, 70000]),
+                    (ctypes.c_uint, [1, 2**32 + 1]),
+                    (ctypes.c_float, [1.5, 2, 0.1]),
+                    (ctypes.c_double, [1.5, -1e300]),
+                    (ctypes.c_bool, [0, 2, True]),
+                    (ctypes.c_char, [b'a', b'b', 1]),
+                    (ctypes.c_wchar, ['x', 'y']),
+                    (ctypes.c_short, []))
+        for CType, Values in Samples:
+            Size = ctypes.sizeof(CType)
+            for BigEndian in (None, True, False):
+                Data = Scalars2Bytes(Values, CType, BigEndian = BigEndian)
+                self.assertIsInstance(Data, bytes)
+                self.assertEqual(Data, b''.join(Scalar2Bytes(Value, CType,
+                                                        BigEndian = BigEndian)
+                                                        for Value in Values))
+                Result = Bytes2Scalars(Data, CType, BigEndian = BigEndian)
+                self.assertIsInstance(Result, list)
+                self.assertEqual(Result, [Bytes2Scalar(
+                                    Data[Offset : Offset + Size], CType,
+                                                        BigEndian = BigEndian)
+                                for Offset in range(0, len(Data), Size)])
+                self.assertEqual(Bytes2Scalars(memoryview(bytearray(Data)),
+                                        CType, BigEndian = BigEndian), Result)
+        with self.assertRaises(ValueError):
+            Bytes2Scalars(b'abc', ctypes.c_short)
+        with self.assertRaises(TypeError):
+            Scalars2Bytes([1, 'a'], ctypes.c_short)
+
+class Test_GeneratedCode(unittest.TestCase):
+    """
+    Test the functions generated per class, which are used together with the
+    compiled struct codecs, and their source code.
+    
+    Test ID: TEST-T-375
+    
+    Covers requirement: REQ-FUN-375
+    
+    Version 1.0.0.0
+    """
+    
+    def test_Source(self):
+        """
+        Checks that the source is generated only for the classes processed by
+        the compiled struct codecs, and it is cached.
+        
+        Version 1.0.0.0
+        """
+        for ClassTest in (BaseStruct, DeepStruct, ArrayArray, NestedArray):
+            Source = ClassTest.getGeneratedSource()
+            self.assertIsInstance(Source, str)
+            self.assertIn(f'def leaves_{ClassTest.__name__}(', Source)
+            self.assertIn(f'def build_{ClassTest.__name__}(', Source)
+            self.assertIn(f'def native_{ClassTest.__name__}(', Source)
+            self.assertIs(ClassTest.getGeneratedSource(), Source)
+        for ClassTest in (NestedDynamicStruct, BaseDynamicArray,
+                                WideCharStruct, ComplexStruct, T_UINT16,
+                                SerNULL):
+            self.assertIsNone(ClassTest.getGeneratedSource())
+        for ClassTest in (BadStruct2, BadStruct6, BadArray1, BadArray3):
+            with self.assertRaises(TypeError):
+                ClassTest.getGeneratedSource()
+    
+    def test_RoundTrip(self):
+        """
+        Checks the packing and unpacking of the classes with the unrolled and
+        looped nested arrays, as well as with the field names, which are not
+        usable as attributes in the source code.
+        
+        Version 1.0.0.0
+        """
+        class LongArray(SerArray):
+            
+            _ElementType = BaseStruct
+            
+            _Length = 12
+        
+        class KeywordStruct(SerStruct):
+            
+            _Fields = (
+                ('class', ctypes.c_short),
+                ('b', LongArray),
+                ('if', BaseArray)
+            )
+        
+        Native = {'class' : 1, 'if' : [2, -3],
+                    'b' : [{'a' : Index, 'b' : Index / 2}
+                                                    for Index in range(12)]}
+        for BigEndian in (None, True, False):
+            objTest = KeywordStruct(Native)
+            Data = objTest.packBytes(BigEndian = BigEndian)
+            Expected = b''.join([
+                        Scalar2Bytes(1, ctypes.c_short, BigEndian = BigEndian),
+                        b''.join(BaseStruct(Item).packBytes(
+                                                        BigEndian = BigEndian)
+                                                    for Item in Native['b']),
+                        BaseArray([2, -3]).packBytes(BigEndian = BigEndian)])
+            self.assertEqual(Data, Expected)
+            objNew = KeywordStruct.unpackBytes(Data, BigEndian = BigEndian)
+            self.assertIsInstance(objNew.b, LongArray)
+            self.assertIsInstance(objNew.b[11], BaseStruct)
+            self.assertEqual(objNew.getNative(), Native)
+            self.assertEqual(KeywordStruct.unpackJSON(objNew.packJSON(
+                                                        )).getNative(), Native)
+            objNew.b[11].a = 5
+            self.assertEqual(objNew.b[11].packBytes(BigEndian = BigEndian),
+                BaseStruct({'a' : 5, 'b' : 5.5}).packBytes(
+                                                        BigEndian = BigEndian))
+            Buffer = bytearray(len(Data) + 2)
+            LongArray(Native['b']).packInto(Buffer, 2, BigEndian = BigEndian)
+            self.assertEqual(bytes(Buffer[2 : 2 + 12 * 6]),
+                                                        Data[2 : 2 + 12 * 6])
+            Records = list(LongArray.iterUnpack(Data[2 : 2 + 12 * 6] * 2,
+                                                        BigEndian = BigEndian))
+            self.assertEqual(len(Records), 2)
+            self.assertEqual(Records[1].getNative(), Native['b'])
+        self.assertIn("_getattr(obj, 'class')",
+                                        KeywordStruct.getGeneratedSource())
+    
+    def test_LazyView(self):
+        """
+        Checks that the generated code decodes a lazy view entirely, and
+        releases the wrapped buffer.
+        
+        Version 1.0.0.0
+        """
+        Native = {'a' : 1, 'b' : {'a' : 2, 'b' : 0.5, 'c' : [3, 4]},
+                                        'c' : [{'a' : 5, 'b' : 1.5}, {'a' : 6,
+                                                                'b' : 2.5}]}
+        Buffer = bytearray(DeepStruct(Native).packBytes())
+        objTest = DeepStruct.view(Buffer)
+        self.assertEqual(objTest.packBytes(), bytes(Buffer))
+        Buffer.extend(b'\x00') #no exported views remain
+        self.assertEqual(objTest.getNative(), Native)
+    
+    def test_ClassChange(self):
+        """
+        Checks that the code is re-generated after a change of the class.
+        
+        Version 1.0.0.0
+        """
+        class ChangedArray(SerArray):
+            
+            _ElementType = ctypes.c_short
+            
+            _Length = 2
+        
+        Source = ChangedArray.getGeneratedSource()
+        self.assertIn("_array('h', v[0 : 2])", Source)
+        ChangedArray._Length = 3
+        self.assertIn("_array('h', v[0 : 3])",
+                                            ChangedArray.getGeneratedSource())
+        self.assertEqual(ChangedArray([1, 2, 3]).packBytes(),
+                    b''.join(Scalar2Bytes(Item, ctypes.c_short)
+                                                    for Item in (1, 2, 3)))
+
+class Test_JSONValidators(unittest.TestCase):
+    """
+    Test the generated validators of the JSON data, which are used by the
+    _checkObjectContent() method and by the de-serialization from JSON.
+    
+    Test ID: TEST-T-376
+    
+    Covers requirement: REQ-FUN-376
+    
+    Version 1.0.0.0
+    """
+    
+    def test_Valid(self):
+        """
+        Checks that the matching data passes the check.
+        
+        Version 1.0.0.0
+        """
+        Native = {'a' : 1, 'b' : {'a' : 2, 'b' : 0.5, 'c' : [3, 4]},
+                                        'c' : [{'a' : 5, 'b' : 1}, {'a' : 6,
+                                                                'b' : 2.5}]}
+        self.assertIsNone(DeepStruct._checkObjectContent(Native))
+        self.assertTrue(DeepStruct._getValidator()(Native))
+        self.assertIs(DeepStruct._getValidator(), DeepStruct._getValidator())
+        for Class, Native in ((BaseArray, [-32768, 32767]),
+                                (BaseDynamicArray, []),
+                                (BaseDynamicArray, [True, 2, 3]),
+                                (ArrayArray, [[1, 2], [3, 4], [5, 6]]),
+                                (DynamicArrayArray, [[1, 2]]),
+                                (NestedDynamicArray, [{'a' : 1, 'b' : 2}]),
+                                (ComplexStruct, {'a' : 1, 'b' : 2.0,
+                                    'c' : {'a' : 1, 'b' : 2, 'c' : [1]}}),
+                                (WideCharStruct, {'a' : 1, 'b' : 'x'})):
+            self.assertIsNone(Class._checkObjectContent(Native))
+            self.assertTrue(Class._getValidator()(Native))
+    
+    def test_Range(self):
+        """
+        Checks that the out of range integer values are rejected, unlike the
+        ctypes, which wraps them.
+        
+        Version 1.0.0.0
+        """
+        for CType, Good, Bad in (
+                        (ctypes.c_int8, [-128, 127], [-129, 128]),
+                        (ctypes.c_uint8, [0, 255], [-1, 256]),
+                        (ctypes.c_int16, [-2**15, 2**15 - 1], [-2**15 - 1]),
+                        (ctypes.c_uint32, [0, 2**32 - 1], [2**32, -5]),
+                        (ctypes.c_int64, [-2**63, 2**63 - 1], [2**63]),
+                        (ctypes.c_uint64, [2**64 - 1], [2**64, -1]),
+                        (ctypes.c_bool, [True, False, 0, 1], [2, -1])):
+            
+            class TestStruct(SerStruct):
+                _Fields = (('a', CType), )
+            
+            class TestArray(SerDynamicArray):
+                _ElementType = CType
+            
+            for Value in Good:
+                TestStruct._checkObjectContent({'a' : Value})
+                TestArray._checkObjectContent([Value, Value])
+                self.assertEqual(TestStruct.unpackJSON(json.dumps(
+                            {'a' : Value})).a, CType(Value).value)
+            for Value in Bad:
+                with self.assertRaises(ValueError):
+                    TestStruct._checkObjectContent({'a' : Value})
+                with self.assertRaises(ValueError):
+                    TestArray._checkObjectContent([Good[0], Value])
+                with self.assertRaises(ValueError):
+                    TestStruct.unpackJSON(json.dumps({'a' : Value}))
+                with self.assertRaises(ValueError):
+                    TestArray.unpackJSON(json.dumps([Value]))
+                self.assertEqual(TestStruct({'a' : Value}).a,
+                                                        CType(Value).value)
+    
+    def test_Types(self):
+        """
+        Checks that the values of the incompatible types are rejected.
+        
+        Version 1.0.0.0
+        """
+        for Value in (1.0, '1', None, [1], {'a' : 1}):
+            with self.assertRaises(ValueError):
+                BaseStruct._checkObjectContent({'a' : Value, 'b' : 1.0})
+            with self.assertRaises(ValueError):
+                BaseDynamicArray._checkObjectContent([1, Value])
+        for Value in ('1', None, [1.0]):
+            with self.assertRaises(ValueError):
+                BaseStruct._checkObjectContent({'a' : 1, 'b' : Value})
+        for Value in ('xy', 1, None):
+            with self.assertRaises(ValueError):
+                WideCharStruct._checkObjectContent({'a' : 1, 'b' : Value})
+        for Class, Value in ((BaseStruct, [1, 2.0]), (BaseArray, {'a' : 1}),
+                                (BaseDynamicArray, (1, 2)), (DeepStruct, None)):
+            with self.assertRaises(TypeError):
+                Class._checkObjectContent(Value)
+            self.assertFalse(Class._getValidator()(Value))
+    
+    def test_Structure(self):
+        """
+        Checks that the mismatch of the structure is located and reported.
+        
+        Version 1.0.0.0
+        """
+        Native = {'a' : 1, 'b' : {'a' : 2, 'b' : 0.5, 'c' : [3, 4]},
+                                        'c' : [{'a' : 5, 'b' : 1.5}, {'a' : 6,
+                                                                'b' : 2.5}]}
+        for Path, Value in ((('b', 'c'), [3, 4, 5]), (('b', 'c'), [3]),
+                            (('c', 1, 'a'), 70000), (('c', 1), {'a' : 1}),
+                            (('b', ), {'a' : 2, 'b' : 0.5, 'c' : [3, 4],
+                                                                'd' : 1})):
+            Data = json.loads(json.dumps(Native))
+            Target = Data
+            for Key in Path[:-1]:
+                Target = Target[Key]
+            Target[Path[-1]] = Value
+            with self.assertRaises(ValueError) as Context:
+                DeepStruct._checkObjectContent(Data)
+            self.assertIn(f'at key {Path[0]}', str(Context.exception))
+            self.assertFalse(DeepStruct._getValidator()(Data))
+        with self.assertRaises(ValueError):
+            DeepStruct._checkObjectContent({'a' : 1, 'b' : Native['b']})
+        with self.assertRaises(ValueError):
+            DeepStruct._checkObjectContent(dict(Native, d = 1))
+        with self.assertRaises(ValueError):
+            BaseArray._checkObjectContent([1, 2, 3])
+        with self.assertRaises(ValueError) as Context:
+            NestedDynamicArray._checkObjectContent([{'a' : 1, 'b' : 2},
+                                                        {'a' : 1, 'c' : 2}])
+        self.assertIn('at index 1', str(Context.exception))
+    
+    def test_ClassChange(self):
+        """
+        Checks that the validator is re-generated after a change of the class.
+        
+        Version 1.0.0.0
+        """
+        class ChangedArray(SerArray):
+            
+            _ElementType = ctypes.c_short
+            
+            _Length = 2
+        
+        self.assertTrue(ChangedArray._getValidator()([1, 2]))
+        ChangedArray._Length = 3
+        self.assertFalse(ChangedArray._getValidator()([1, 2]))
+        self.assertTrue(ChangedArray._getValidator()([1, 2, 3]))
+        ChangedArray._ElementType = ctypes.c_ubyte
+        self.assertFalse(ChangedArray._getValidator()([1, 2, 300]))
+
+class Test_JSONLines(unittest.TestCase):
+    """
+    Test the streaming export and import of the objects in the JSON Lines
+    format.
+    
+    Test ID: TEST-T-377
+    
+    Covers requirement: REQ-FUN-377
+    
+    Version 1.0.0.0
+    """
+    
+    def test_RoundTrip(self):
+        """
+        Checks that the records are written one per line exactly as returned
+        by the packJSON() method, and are read back.
+        
+        Version 1.0.0.0
+        """
+        Natives = [{'a' : Index, 'b' : {'a' : 2, 'b' : 0.5, 'c' : [3, 4]},
+                                        'c' : [{'a' : 5, 'b' : 1.5}, {'a' : 6,
+                                                                'b' : 2.5}]}
+                                                for Index in range(600)]
+        Objects = [DeepStruct(Native) for Native in Natives]
+        File = io.StringIO()
+        self.assertEqual(dumpJSONLines(iter(Objects), File), 600)
+        Lines = File.getvalue().splitlines()
+        self.assertEqual(Lines, [Object.packJSON() for Object in Objects])
+        File.seek(0)
+        Result = DeepStruct.loadJSONLines(File)
+        self.assertNotIsInstance(Result, list)
+        for Index, Object in enumerate(Result):
+            self.assertIsInstance(Object, DeepStruct)
+            self.assertEqual(Object.getNative(), Natives[Index])
+        self.assertEqual(Index, 599)
+        File = io.StringIO()
+        self.assertEqual(dumpJSONLines([], File), 0)
+        self.assertEqual(File.getvalue(), '')
+        for Class, Native in ((BaseDynamicArray, [1, 2, 3]),
+                                (BaseDynamicArray, []),
+                                (ComplexStruct, {'a' : 1, 'b' : 2.0,
+                                    'c' : {'a' : 1, 'b' : 2, 'c' : [1]}}),
+                                (T_UINT16, 5), (SerNULL, None)):
+            File = io.StringIO()
+            dumpJSONLines([Class(Native)] * 3, File)
+            File.seek(0)
+            for Trusted in (None, True, False):
+                File.seek(0)
+                Result = [Item.getNative() for Item in Class.loadJSONLines(
+                                                    File, Trusted = Trusted)]
+                self.assertEqual(Result, [Native] * 3)
+    
+    def test_Streaming(self):
+        """
+        Checks that the lines are consumed lazily, the empty lines are
+        skipped, and the binary mode files are supported for both reading and
+        writing.
+        
+        Version 1.1.0.0
+        """
+        Lines = (f'[{Index}, {Index + 1}]\n' for Index in itertools.count())
+        Result = BaseArray.loadJSONLines(Lines)
+        for Index, Object in zip(range(5), Result):
+            self.assertEqual(Object.getNative(), [Index, Index + 1])
+        self.assertEqual(next(Lines), '[5, 6]\n')
+        File = io.BytesIO(b'[1, 2]\n\n  \n[3, 4]')
+        self.assertEqual([Object.getNative()
+                            for Object in BaseArray.loadJSONLines(File)],
+                                                            [[1, 2], [3, 4]])
+        Objects = (BaseArray([Index, 0]) for Index in itertools.count())
+        File = io.StringIO()
+        dumpJSONLines(itertools.islice(Objects, 10), File)
+        self.assertEqual(next(Objects).getNative(), [10, 0])
+        Objects = [WideCharStruct({'a' : Index, 'b' : '\u00e9'})
+                                                    for Index in range(600)]
+        File = io.BytesIO()
+        self.assertEqual(dumpJSONLines(Objects, File), 600)
+        self.assertEqual(File.getvalue().decode('utf-8').splitlines(),
+                                [Object.packJSON() for Object in Objects])
+        File.seek(0)
+        self.assertEqual([Object.getNative() for Object in
+                                        WideCharStruct.loadJSONLines(File)],
+                                [Object.getNative() for Object in Objects])
+        with tempfile.TemporaryDirectory() as Folder:
+            Path = os.path.join(Folder, 'records.jsonl.gz')
+            with gzip.open(Path, 'wb') as File:
+                dumpJSONLines(Objects[:3], File)
+            with gzip.open(Path, 'rb') as File:
+                self.assertEqual([Object.getNative() for Object in
+                                        WideCharStruct.loadJSONLines(File)],
+                                [Object.getNative() for Object in Objects[:3]])
+    
+    def test_Errors(self):
+        """
+        Checks the improper arguments and records, including the line number
+        in the error message.
+        
+        Version 1.0.0.0
+        """
+        with self.assertRaises(TypeError):
+            dumpJSONLines([BaseArray([1, 2])], 'file.jsonl')
+        File = io.StringIO()
+        with self.assertRaises(TypeError):
+            dumpJSONLines([BaseArray([1, 2]), [3, 4]], File)
+        self.assertEqual(File.getvalue(), '[1, 2]\n')
+        with self.assertRaises(TypeError):
+            BaseArray.loadJSONLines(1)
+        with self.assertRaises(TypeError):
+            BadStruct6.loadJSONLines(io.StringIO(''))
+        for Lines, Error in ((['[1, 2]', '\n', '[1, 2'], ValueError),
+                                (['[1, 2]', '\n', '[1, 2, 3]'], ValueError),
+                                (['[1, 2]', '\n', '[1, 70000]'], ValueError),
+                                (['[1, 2]', '\n', '{"a" : 1}'], TypeError),
+                                (['[1, 2]', '', 3], TypeError)):
+            Result = BaseArray.loadJSONLines(Lines)
+            self.assertEqual(next(Result).getNative(), [1, 2])
+            with self.assertRaises(Error) as Context:
+                next(Result)
+            if not isinstance(Lines[2], int):
+                self.assertIn('line 3', str(Context.exception))
+
+class Test_Streams(unittest.TestCase):
+    """
+    Test the chunked reading and writing of the dynamic arrays from / into
+    the file-like objects.
+    
+    Test ID: TEST-T-378
+    
+    Covers requirement: REQ-FUN-378
+    
+    Version 1.0.0.0
+    """
+    
+    class SlowReader:
+        """
+        Binary stream returning at most 5 bytes per read() call.
+        
+        Version 1.0.0.0
+        """
+        
+        def __init__(self, Data):
+            self.Stream = io.BytesIO(Data)
+            self.Calls = 0
+        
+        def read(self, Size = -1):
+            self.Calls += 1
+            return self.Stream.read(min(Size, 5))
+    
+    def test_RoundTrip(self):
+        """
+        Checks that the written data is the same as returned by packBytes(),
+        and that it is read back element by element, for the scalar and
+        nested elements types, in all byte orders and with any chunk size.
+        
+        Version 1.0.0.0
+        """
+        
+        class WideCharArray(SerDynamicArray):
+            _ElementType = WideCharStruct
+        
+        class CharArray(SerDynamicArray):
+            _ElementType = ctypes.c_char
+        
+        for Class, Native in ((BaseDynamicArray, list(range(-500, 500))),
+                (NestedDynamicArray, [{'a' : Index, 'b' : Index / 2}
+                                                for Index in range(300)]),
+                (DynamicArrayArray, [[Index, -Index] for Index in range(50)]),
+                (WideCharArray, [{'a' : Index, 'b' : chr(65 + Index % 26)}
+                                                for Index in range(100)]),
+                (CharArray, [bytes([Index % 256]) for Index in range(300)]),
+                (BaseDynamicArray, [])):
+            objTest = Class(Native)
+            for BigEndian in (None, True, False):
+                if Class is WideCharArray and not (BigEndian is None):
+                    continue
+                for ChunkSize in (1, 7, 64, 65536):
+                    objTest = Class(Native)
+                    File = io.BytesIO()
+                    Result = objTest.writeToStream(File, ChunkSize,
+                                                        BigEndian = BigEndian)
+                    Data = File.getvalue()
+                    self.assertEqual(Result, len(Data))
+                    self.assertEqual(Data,
+                                    objTest.packBytes(BigEndian = BigEndian))
+                    File.seek(0)
+                    Elements = list(Class.iterFromStream(File, ChunkSize,
+                                                        BigEndian = BigEndian))
+                    self.assertEqual(Class(Elements).getNative(), Native)
+                    File = io.BytesIO()
+                    objTest.writeToStream(File, ChunkSize,
+                                                        BigEndian = BigEndian)
+                    self.assertEqual(File.getvalue(), Data) #cached bytes
+    
+    def test_Incremental(self):
+        """
+        Checks that the elements are yielded as the chunks are read, and that
+        the short reads are handled.
+        
+        Version 1.0.0.0
+        """
+        Native = list(range(1000))
+        Data = BaseDynamicArray(Native).packBytes()
+        Reader = self.SlowReader(Data)
+        Result = BaseDynamicArray.iterFromStream(Reader, 8)
+        self.assertEqual(Reader.Calls, 0)
+        self.assertEqual(next(Result), 0)
+        self.assertLess(Reader.Calls, 3)
+        self.assertEqual([0] + list(Result), Native)
+        Reader = self.SlowReader(NestedDynamicArray([{'a' : 1, 'b' : 2.5}] * 7
+                                                                ).packBytes())
+        self.assertEqual([Element.getNative() for Element in
+                            NestedDynamicArray.iterFromStream(Reader, 100)],
+                                                    [{'a' : 1, 'b' : 2.5}] * 7)
+        Elements = list(BaseDynamicArray.iterFromStream(io.BytesIO(b'')))
+        self.assertEqual(Elements, [])
+    
+    def test_Errors(self):
+        """
+        Checks the improper arguments, including the streams opened in the
+        text mode, and the incomplete last element.
+        
+        Version 1.1.0.0
+        """
+        objTest = BaseDynamicArray([1, 2])
+        for Value in (1, 'file', None, io.StringIO()):
+            with self.assertRaises(TypeError):
+                BaseDynamicArray.iterFromStream(Value)
+            with self.assertRaises(TypeError):
+                objTest.writeToStream(Value)
+        with self.assertRaises(TypeError):
+            BaseDynamicArray().writeToStream(io.StringIO())
+        Stream = io.TextIOWrapper(io.BytesIO(objTest.packBytes()))
+        with self.assertRaises(TypeError):
+            BaseDynamicArray.iterFromStream(Stream)
+        with self.assertRaises(TypeError):
+            objTest.writeToStream(Stream)
+        for Value in (1.0, '1', None, True):
+            with self.assertRaises(TypeError):
+                BaseDynamicArray.iterFromStream(io.BytesIO(), Value)
+            with self.assertRaises(TypeError):
+                objTest.writeToStream(io.BytesIO(), Value)
+        for Value in (0, -1):
+            with self.assertRaises(ValueError):
+                BaseDynamicArray.iterFromStream(io.BytesIO(), Value)
+            with self.assertRaises(ValueError):
+                objTest.writeToStream(io.BytesIO(), Value)
+        with self.assertRaises(TypeError):
+            BadDynamicArray1.iterFromStream(io.BytesIO())
+        Result = BaseDynamicArray.iterFromStream(io.BytesIO(
+                                            objTest.packBytes() + b'\x01'), 2)
+        self.assertEqual(next(Result), 1)
+        self.assertEqual(next(Result), 2)
+        with self.assertRaises(ValueError):
+            next(Result)
+
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_SerNULL)
@@ -2728,10 +5636,43 @@ TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_SerDynamicArray)
 TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_BadDeclarion)
 TestSuite6= unittest.TestLoader().loadTestsFromTestCase(Test_BytesSerialization)
 TestSuite7 = unittest.TestLoader().loadTestsFromTestCase(Test_SerNumber)
+TestSuite8 = unittest.TestLoader().loadTestsFromTestCase(Test_CompiledCodec)
+TestSuite9 = unittest.TestLoader().loadTestsFromTestCase(Test_DefinitionCache)
+TestSuite10 = unittest.TestLoader().loadTestsFromTestCase(Test_BufferAPI)
+TestSuite11 = unittest.TestLoader().loadTestsFromTestCase(Test_BatchUnpack)
+TestSuite12 = unittest.TestLoader().loadTestsFromTestCase(Test_Columns)
+TestSuite13 = unittest.TestLoader().loadTestsFromTestCase(Test_LazyView)
+TestSuite14 = unittest.TestLoader().loadTestsFromTestCase(Test_Slots)
+TestSuite15 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_AttributeAccess)
+TestSuite16 = unittest.TestLoader().loadTestsFromTestCase(Test_NestedUnpack)
+TestSuite17 = unittest.TestLoader().loadTestsFromTestCase(Test_Trusted)
+TestSuite18 = unittest.TestLoader().loadTestsFromTestCase(Test_JSONBuild)
+TestSuite19 = unittest.TestLoader().loadTestsFromTestCase(Test_BulkScalars)
+TestSuite20 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_CompactStorage)
+TestSuite21 = unittest.TestLoader().loadTestsFromTestCase(Test_Numpy)
+TestSuite22 = unittest.TestLoader().loadTestsFromTestCase(Test_CTypeMirror)
+TestSuite23 = unittest.TestLoader().loadTestsFromTestCase(Test_FieldAccess)
+TestSuite24 = unittest.TestLoader().loadTestsFromTestCase(Test_PackedCache)
+TestSuite25 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_PackedTemplate)
+TestSuite26 = unittest.TestLoader().loadTestsFromTestCase(Test_UnpackInto)
+TestSuite27 = unittest.TestLoader().loadTestsFromTestCase(Test_ScalarHelpers)
+TestSuite28 = unittest.TestLoader().loadTestsFromTestCase(Test_GeneratedCode)
+TestSuite29 = unittest.TestLoader().loadTestsFromTestCase(Test_JSONValidators)
+TestSuite30 = unittest.TestLoader().loadTestsFromTestCase(Test_JSONLines)
+TestSuite31 = unittest.TestLoader().loadTestsFromTestCase(Test_Streams)
 
 TestSuite = unittest.TestSuite()
 TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4, TestSuite5,
-                    TestSuite6, TestSuite7])
+                    TestSuite6, TestSuite7, TestSuite8, TestSuite9,
+                    TestSuite10, TestSuite11, TestSuite12, TestSuite13,
+                    TestSuite14, TestSuite15, TestSuite16, TestSuite17,
+                    TestSuite18, TestSuite19, TestSuite20, TestSuite21,
+                    TestSuite22, TestSuite23, TestSuite24, TestSuite25,
+                    TestSuite26, TestSuite27, TestSuite28, TestSuite29,
+                    TestSuite30, TestSuite31])
 
 if __name__ == "__main__":
     sys.stdout.write(